@@ -7,7 +7,7 @@ import json
 import sqlite3
 from datetime import datetime
 
-from app.persistence.history import HistoryRepository
+from app.persistence.history import HistoryRepository, merge_visible
 from app.transport.ingestion import AccountReadModel
 
 
@@ -59,9 +59,10 @@ class HistoryAnalyticsSource:
 
             account = AccountReadModel(view_revision=int(head[0]))
             chat_rows = connection.execute(
-                """SELECT chat_id,platform_user_id,display_name,upstream_updated_at
-                     FROM account_chats
-                    WHERE creator_account_id=? AND is_deleted=0 ORDER BY chat_id""",
+                f"""SELECT c.chat_id,c.platform_user_id,c.display_name,c.upstream_updated_at
+                     FROM account_chats c
+                    WHERE c.creator_account_id=? AND c.is_deleted=0 AND {merge_visible('c')}
+                    ORDER BY c.chat_id""",
                 (creator_account_id,),
             ).fetchall()
             for row in chat_rows:
@@ -75,12 +76,12 @@ class HistoryAnalyticsSource:
                 }
 
             messages = connection.execute(
-                """SELECT chat_id,message_id,text,sent_at,direction,
-                          winning_stream_epoch,winning_source_seq
-                     FROM account_messages
-                    WHERE creator_account_id=? AND is_deleted=0
-                    ORDER BY chat_id,sent_at,winning_stream_epoch,
-                             winning_source_seq,message_id""",
+                f"""SELECT m.chat_id,m.message_id,m.text,m.sent_at,m.direction,
+                          m.winning_stream_epoch,m.winning_source_seq
+                     FROM account_messages m
+                    WHERE m.creator_account_id=? AND m.is_deleted=0 AND {merge_visible('m')}
+                    ORDER BY m.chat_id,m.sent_at,m.winning_stream_epoch,
+                             m.winning_source_seq,m.message_id""",
                 (creator_account_id,),
             ).fetchall()
             ordinals: dict[str, int] = {}
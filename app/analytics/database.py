@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from app.persistence.database import ProjectionsSQLite
 from app.persistence.migrations import MigrationRunner
+from app.persistence.sharding import ShardRouter
 from app.analytics.opaque_refs import normalize_account_ref
 
+if TYPE_CHECKING:
+    from app.persistence.backup import BackupManifest, BackupThrottle
+
 
 GenerationStatus = Literal[
     "building", "validated", "activation_pending", "active", "retired"
@@ -136,6 +141,108 @@ class ProjectionsDatabase(ProjectionsSQLite):
             return version, row["schema_identity"], row["store_id"], witness
 
 
+class ShardedProjectionsDatabase:
+    """Projections files split by the canonical shard router.
+
+    An account's generations live beside its canonical shard, so one
+    account's graph publish or rebuild only locks and grows its own shard's
+    WAL. Shards migrate on first open.
+    """
+
+    PROJECTIONS_FILE = "analytics-projections.sqlite3"
+
+    def __init__(
+        self,
+        router: ShardRouter,
+        *,
+        busy_timeout_ms: int = 5_000,
+        migrations_dir: str | Path | None = None,
+    ) -> None:
+        self.router = router
+        self.busy_timeout_ms = busy_timeout_ms
+        self.migrations_dir = migrations_dir
+        self._shards: dict[str, ProjectionsDatabase] = {}
+        self._opening: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def for_account(self, creator_account_id: str) -> ProjectionsDatabase:
+        return self.shard(self.router.shard_for(creator_account_id))
+
+    def shard(self, name: str) -> ProjectionsDatabase:
+        path = self.router.directory(name) / self.PROJECTIONS_FILE
+        with self._lock:
+            database = self._shards.get(name)
+            if database is not None:
+                return database
+            opening = self._opening.setdefault(name, threading.Lock())
+        # Migrating a shard on open only holds up callers of that shard.
+        with opening:
+            with self._lock:
+                database = self._shards.get(name)
+            if database is not None:
+                return database
+            database = ProjectionsDatabase(
+                path,
+                busy_timeout_ms=self.busy_timeout_ms,
+                migrations_dir=self.migrations_dir,
+            )
+            with self._lock:
+                self._shards[name] = database
+                self._opening.pop(name, None)
+        return database
+
+    def migrate(self) -> list[str]:
+        """Open every shard holding a projections file; return the shard names."""
+        shards = [
+            name
+            for name in self.router.existing_shards()
+            if (self.router.directory(name) / self.PROJECTIONS_FILE).exists()
+        ]
+        for name in shards:
+            self.shard(name)
+        return shards
+
+    def active_generation(self, creator_account_id: str) -> ProjectionGeneration | None:
+        return self.for_account(creator_account_id).active_generation(creator_account_id)
+
+    def active_generations(self) -> dict[str, ProjectionGeneration]:
+        """List every active generation across all shards by account partition."""
+        active: dict[str, ProjectionGeneration] = {}
+        for name in self.migrate():
+            with self.shard(name).read() as connection:
+                for row in connection.execute(
+                    """
+                    SELECT * FROM projection_generations
+                    WHERE status = 'active' ORDER BY creator_account_id
+                    """
+                ):
+                    active[row["creator_account_id"]] = generation_from_row(row)
+        return active
+
+    def backup(
+        self,
+        destination: str | Path,
+        *,
+        overwrite: bool = False,
+        throttle: BackupThrottle | None = None,
+    ) -> dict[str, BackupManifest]:
+        """Back up each shard's projections file under ``destination/<shard>``."""
+        # The backup module validates projections through the projection
+        # store, which imports this module.
+        from app.persistence.backup import backup_projections_database
+
+        root = Path(destination)
+        return {
+            name: backup_projections_database(
+                self.shard(name),
+                root / name / self.PROJECTIONS_FILE,
+                overwrite=overwrite,
+                throttle=throttle,
+            )
+            for name in self.migrate()
+        }
+
+
 def generation_from_row(row) -> ProjectionGeneration:
     return ProjectionGeneration(
         generation_id=row["generation_id"],
@@ -79,7 +79,7 @@ class SQLiteGraphReader:
         generation_id = self._active_generation_id(partition_key)
         if generation_id is None:
             return None
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             row = connection.execute(
                 """
                 SELECT canonical_revision FROM projection_generations
@@ -99,7 +99,7 @@ class SQLiteGraphReader:
         generation_id = self._active_generation_id(partition_key)
         if generation_id is None:
             return None
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             row = connection.execute(
                 """
                 SELECT * FROM graph_nodes
@@ -119,7 +119,7 @@ class SQLiteGraphReader:
         generation_id = self._active_generation_id(partition_key)
         if generation_id is None:
             return None
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             row = connection.execute(
                 """
                 SELECT * FROM graph_edges
@@ -139,7 +139,7 @@ class SQLiteGraphReader:
         generation_id = self._active_generation_id(partition_key)
         if generation_id is None:
             return []
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             result = [
                 _node(row)
                 for row in connection.execute(
@@ -162,7 +162,7 @@ class SQLiteGraphReader:
         generation_id = self._active_generation_id(partition_key)
         if generation_id is None:
             return []
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             result = [
                 _edge(row)
                 for row in connection.execute(
@@ -328,7 +328,7 @@ class SQLiteGraphReader:
         relation_values = sorted(item.value for item in effective)
         kind_values = sorted(item.value for item in bounds.node_kinds)
         try:
-            with self.database.read() as connection:
+            with self.database.read_only() as connection:
                 self._install_progress_handler(connection, deadline, cancellation_check)
                 root = connection.execute(
                     """
@@ -685,7 +685,7 @@ class SQLiteGraphReader:
         examined_edges: set[str] = set()
         truncated = False
         materialized = 0
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             self._install_progress_handler(connection, deadline, cancellation_check)
             root_nodes = self._nodes_by_ids(
                 connection,
@@ -986,7 +986,7 @@ class SQLiteGraphReader:
         marks = ",".join("?" for _ in kinds)
         timeless = "OR occurred_at IS NULL" if bounds.include_timeless else ""
         try:
-            with self.database.read() as connection:
+            with self.database.read_only() as connection:
                 self._install_progress_handler(connection, deadline, cancellation_check)
                 rows = connection.execute(
                 f"""
@@ -1180,7 +1180,7 @@ class SQLiteGraphReader:
         assert bounds.root_node_id is not None
         kinds = sorted(item.value for item in bounds.node_kinds)
         relations = sorted(item.value for item in bounds.edge_kinds)
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             self._install_progress_handler(connection, deadline, cancellation_check)
             root_row = connection.execute(
                 """
@@ -1431,7 +1431,7 @@ class SQLiteGraphReader:
     ) -> str | None:
         self._check_budget(deadline, cancellation_check)
         try:
-            with self.database.read() as connection:
+            with self.database.read_only() as connection:
                 self._install_progress_handler(connection, deadline, cancellation_check)
                 row = connection.execute(
                     """
@@ -1466,7 +1466,7 @@ class SQLiteGraphReader:
     ) -> None:
         self._check_budget(deadline, cancellation_check)
         try:
-            with self.database.transaction() as connection:
+            with self.database.transaction(lane="projection") as connection:
                 self._install_progress_handler(connection, deadline, cancellation_check)
                 self._check_budget(deadline, cancellation_check)
                 active = connection.execute(
@@ -1515,7 +1515,7 @@ class SQLiteGraphReader:
         parameter_hash: str,
     ) -> None:
         try:
-            with self.database.transaction() as connection:
+            with self.database.transaction(lane="projection") as connection:
                 connection.execute(
                     """
                     DELETE FROM graph_algorithm_metrics
@@ -1572,7 +1572,7 @@ class SQLiteGraphReader:
         deadline: float,
         cancellation_check: CancellationCheck | None,
     ) -> list[GraphNode]:
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             self._install_progress_handler(connection, deadline, cancellation_check)
             nodes = self._nodes_by_ids(
                 connection,
@@ -2156,7 +2156,7 @@ class SQLiteGraphGenerationWriter:
 
         with self.lease_session():
             self._check_heartbeat()
-            with self._write_gate:
+            with self._write_gate, self.database.writer("projection"):
                 self._check_heartbeat()
                 self._quiesce_heartbeat_for_terminal_transition()
                 connection = self.database.connect()
@@ -2219,7 +2219,7 @@ class SQLiteGraphGenerationWriter:
         now = _now()
         with self._write_gate:
             self._quiesce_heartbeat_for_terminal_transition()
-            with self.database.transaction() as connection:
+            with self.database.transaction(lane="projection") as connection:
                 updated = connection.execute(
                     """
                     UPDATE projection_generations SET status='retired', retired_at=?
@@ -2251,7 +2251,7 @@ class SQLiteGraphGenerationWriter:
         self._check_heartbeat()
         connection = self.database.connect()
         try:
-            with self._write_gate:
+            with self._write_gate, self.database.writer("projection"):
                 self._check_heartbeat()
                 connection.execute(
                     f"PRAGMA busy_timeout={max(1, int(self._lease_wait_hint_seconds() * 1_000))}"
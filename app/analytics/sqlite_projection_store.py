@@ -303,7 +303,7 @@ class SQLiteAnalyticsProjectionStore:
         generation_id = str(uuid4())
         now = _now()
         lease_expires = now + timedelta(seconds=self.lease_seconds)
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             active = connection.execute(
                 """
                 SELECT generation_id, canonical_revision
@@ -418,7 +418,7 @@ class SQLiteAnalyticsProjectionStore:
                 self.activation.prepare_publication_epoch_fence(
                     epoch, scheduler_owner_id, digest
                 )
-            with self.database.transaction() as connection:
+            with self.database.transaction(lane="projection") as connection:
                 connection.execute(
                     """
                     INSERT INTO projection_publication_epochs (
@@ -453,7 +453,7 @@ class SQLiteAnalyticsProjectionStore:
         self.activation.revoke_publication_epoch(
             publication_epoch, scheduler_owner_id, digest
         )
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             updated = connection.execute(
                 """
                 UPDATE projection_publication_epochs
@@ -547,7 +547,7 @@ class SQLiteAnalyticsProjectionStore:
         )
         self._checkpoint("canonical_intent_reserved", generation_id)
         pending_now = _now()
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             updated = connection.execute(
                 """
                 UPDATE projection_generations
@@ -616,7 +616,7 @@ class SQLiteAnalyticsProjectionStore:
                 self.activation.cancel(intent.intent_id)
             except ProjectionActivationConflict:
                 pass
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             updated = connection.execute(
                 """
                 UPDATE projection_generations
@@ -857,7 +857,7 @@ class SQLiteAnalyticsProjectionStore:
 
         partition_ref = validated_account_ref(partition_ref)
 
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             rows = connection.execute(
                 """
                 SELECT generation_id FROM projection_generations
@@ -880,7 +880,7 @@ class SQLiteAnalyticsProjectionStore:
 
     def _validate_and_mark_generation(self, generation_id: str) -> None:
         self._validate_persisted_generation(generation_id, allow_building=True)
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             values = recompute_generation(connection, generation_id)
             updated = connection.execute(
                 """
@@ -1020,7 +1020,7 @@ class SQLiteAnalyticsProjectionStore:
             raise ProjectionActivationConflict("canonical identity changed")
         self._validate_persisted_generation(generation_id)
         now = _timestamp(_now())
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             candidate = connection.execute(
                 """
                 SELECT * FROM projection_generations
@@ -1132,7 +1132,7 @@ class SQLiteAnalyticsProjectionStore:
     def _attach_intent(
         self, generation_id: str, intent: ProjectionActivationIntent
     ) -> None:
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             connection.execute(
                 """
                 UPDATE projection_generations
@@ -1330,7 +1330,7 @@ class SQLiteAnalyticsProjectionStore:
         *,
         owner_dead: bool,
     ) -> bool:
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             now = _now()
             clauses = [
                 "generation_id=?",
@@ -1367,7 +1367,7 @@ class SQLiteAnalyticsProjectionStore:
             return updated.rowcount == 1
 
     def _retire(self, generation_id: str, *, allow_active: bool = False) -> None:
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             statuses = "('building','validated','activation_pending','active')" if allow_active else "('building','validated','activation_pending')"
             connection.execute(
                 f"""
@@ -1,9 +1,9 @@
-"""Authenticated history settings and stable projection message pages."""
+"""Authenticated history settings and stable projection conversation and message pages."""
 
 from __future__ import annotations
 
 import json
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
@@ -18,21 +18,23 @@ from app.api.security import (
 from app.core.config import settings
 from app.models.history import (
     AgentPairingResponse,
+    ConversationListResponse,
+    ConversationTailsResponse,
     HistorySettingsResponse,
     MessagePageResponse,
     UpdateHistorySettingsRequest,
 )
 from app.persistence.history import ProjectionCursorStale
-from app.services.paging_cursor import (
-    InvalidMessageCursor,
-    MessageCursor,
-    MessageCursorCodec,
-)
+from app.services.message_paging import MessagePageNotFound, MessagePagingService
+from app.services.paging_cursor import InvalidMessageCursor, MessageCursorCodec
 from app.transport.manager import transport_manager
 
 
 router = APIRouter(prefix="/api/v1", tags=["History"])
 cursor_codec = MessageCursorCodec(settings.security_signing_secret.get_secret_value())
+message_paging = MessagePagingService(
+    cursor_codec, read_ahead=settings.history_page_read_ahead
+)
 
 
 def _public_settings(document: dict[str, Any]) -> HistorySettingsResponse:
@@ -85,6 +87,58 @@ def create_agent_pairing(
     return AgentPairingResponse(pairing_ticket=ticket, expires_at=expires_at)
 
 
+@router.get("/conversations", response_model=ConversationListResponse)
+def list_conversations(
+    response: Response,
+    order: Literal["recent", "unread", "name"] = "recent",
+    after: str | None = Query(None),
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    unread: bool = False,
+    direction: Literal["inbound", "outbound"] | None = None,
+    name_prefix: Annotated[str | None, Query(min_length=1, max_length=100)] = None,
+    context: AuthContext = Depends(get_auth_context),
+) -> ConversationListResponse:
+    response.headers["Cache-Control"] = "no-store"
+    try:
+        document = message_paging.conversations(
+            transport_manager.projection_for(context.creator_account_id),
+            context.creator_account_id,
+            order=order,
+            after=after,
+            limit=limit,
+            unread_only=unread,
+            direction=direction,
+            name_prefix=name_prefix,
+        )
+    except MessagePageNotFound as error:
+        raise HTTPException(status_code=503, detail="projection_unavailable") from error
+    except InvalidMessageCursor as error:
+        raise HTTPException(status_code=400, detail="cursor_invalid") from error
+    except ProjectionCursorStale as error:
+        raise HTTPException(status_code=409, detail="cursor_stale") from error
+    return ConversationListResponse.model_validate_json(json.dumps(document))
+
+
+@router.get("/conversations/tails", response_model=ConversationTailsResponse)
+def get_conversation_tails(
+    response: Response,
+    conversation_id: Annotated[list[str], Query(min_length=1, max_length=50)],
+    limit: Annotated[int, Query(ge=1, le=20)] = 3,
+    context: AuthContext = Depends(get_auth_context),
+) -> ConversationTailsResponse:
+    response.headers["Cache-Control"] = "no-store"
+    try:
+        document = message_paging.tails(
+            transport_manager.projection_for(context.creator_account_id),
+            context.creator_account_id,
+            conversation_id,
+            limit=limit,
+        )
+    except MessagePageNotFound as error:
+        raise HTTPException(status_code=503, detail="projection_unavailable") from error
+    return ConversationTailsResponse.model_validate_json(json.dumps(document))
+
+
 @router.get(
     "/conversations/{conversation_id}/messages",
     response_model=MessagePageResponse,
@@ -97,72 +151,21 @@ def get_message_page(
     context: AuthContext = Depends(get_auth_context),
 ) -> MessagePageResponse:
     response.headers["Cache-Control"] = "no-store"
-    if not transport_manager.projection.conversation_exists(
-        context.creator_account_id, conversation_id
-    ):
-        raise HTTPException(status_code=404, detail="Conversation was not found")
-
-    cursor = None
-    if before is not None:
-        try:
-            cursor = cursor_codec.decode(before)
-        except InvalidMessageCursor as error:
-            raise HTTPException(status_code=400, detail="cursor_invalid") from error
-        if (
-            cursor.account_id != context.creator_account_id
-            or cursor.conversation_id != conversation_id
-        ):
-            raise HTTPException(status_code=400, detail="cursor_invalid")
-
     try:
-        items, has_more, generation = transport_manager.projection.message_rows(
+        document = message_paging.page(
+            transport_manager.projection_for(context.creator_account_id),
             context.creator_account_id,
             conversation_id,
-            before=None if cursor is None else (cursor.sent_at, cursor.message_id),
+            before=before,
             limit=limit,
-            expected_generation=(
-                None if cursor is None else cursor.projection_generation
-            ),
-            expected_revision=None if cursor is None else cursor.projection_revision,
         )
+    except MessagePageNotFound as error:
+        raise HTTPException(status_code=404, detail="Conversation was not found") from error
+    except InvalidMessageCursor as error:
+        raise HTTPException(status_code=400, detail="cursor_invalid") from error
     except ProjectionCursorStale as error:
         raise HTTPException(status_code=409, detail="cursor_stale") from error
-    except LookupError as error:
-        raise HTTPException(status_code=503, detail="projection_unavailable") from error
-
-    older_cursor = None
-    if has_more and items:
-        oldest = items[0]
-        older_cursor = cursor_codec.encode(
-            MessageCursor(
-                account_id=context.creator_account_id,
-                conversation_id=conversation_id,
-                projection_generation=generation["generation_id"],
-                projection_revision=generation["projected_revision"],
-                sent_at=oldest["sent_at"],
-                message_id=oldest["message_id"],
-            )
-        )
-
-    projection = transport_manager.projection.state(context.creator_account_id)
-    if projection["projected_revision"] != generation["projected_revision"]:
-        raise HTTPException(status_code=409, detail="cursor_stale")
-    return MessagePageResponse.model_validate_json(
-        json.dumps({
-            "creator_account_id": context.creator_account_id,
-            "conversation_id": conversation_id,
-            "projection_generation": generation["generation_id"],
-            "read_revision": generation["read_revision"],
-            "generated_at": generation["generated_at"],
-            "items": items,
-            "older_cursor": older_cursor,
-            "has_older_stored_items": has_more,
-            "conversation_coverage": transport_manager.history.conversation_coverage(
-                context.creator_account_id, conversation_id
-            ),
-            "projection": projection,
-        })
-    )
+    return MessagePageResponse.model_validate_json(json.dumps(document))
 
 
 @router.get("/settings/history", response_model=HistorySettingsResponse)
@@ -170,8 +173,9 @@ def get_history_settings(
     response: Response,
     context: AuthContext = Depends(get_auth_context),
 ) -> HistorySettingsResponse:
+    history = transport_manager.history_for(context.creator_account_id)
     return _settings_response(
-        transport_manager.history.history_settings(context.creator_account_id),
+        history.history_settings(context.creator_account_id),
         response,
     )
 
@@ -189,7 +193,8 @@ async def update_history_settings(
     verify_same_origin(request)
     verify_csrf_token(context, csrf)
     expected_revision = _expected_revision(if_match)
-    current = transport_manager.history.history_settings(context.creator_account_id)
+    history = transport_manager.history_for(context.creator_account_id)
+    current = history.history_settings(context.creator_account_id)
     consent_revision = current["consent_revision"]
     authorized_platform_creator_id = current["authorized_platform_creator_id"]
     if settings_request.accept_consent:
@@ -209,7 +214,7 @@ async def update_history_settings(
     ):
         raise HTTPException(status_code=422, detail="Consent is required to start historical sync")
     try:
-        updated = transport_manager.history.update_history_settings(
+        updated = history.update_history_settings(
             context.creator_account_id,
             expected_revision=expected_revision,
             values={
@@ -233,7 +238,7 @@ async def update_history_settings(
     except LookupError as error:
         raise HTTPException(status_code=409, detail=str(error)) from error
     return _settings_response(
-        transport_manager.history.history_settings(context.creator_account_id),
+        history.history_settings(context.creator_account_id),
         response,
     )
 
@@ -250,9 +255,10 @@ async def revoke_history_settings(
     verify_same_origin(request)
     verify_csrf_token(context, csrf)
     expected_revision = _expected_revision(if_match)
-    current = transport_manager.history.history_settings(context.creator_account_id)
+    history = transport_manager.history_for(context.creator_account_id)
+    current = history.history_settings(context.creator_account_id)
     try:
-        updated = transport_manager.history.update_history_settings(
+        updated = history.update_history_settings(
             context.creator_account_id,
             expected_revision=expected_revision,
             values={
@@ -276,6 +282,6 @@ async def revoke_history_settings(
     except LookupError as error:
         raise HTTPException(status_code=409, detail=str(error)) from error
     return _settings_response(
-        transport_manager.history.history_settings(context.creator_account_id),
+        history.history_settings(context.creator_account_id),
         response,
     )
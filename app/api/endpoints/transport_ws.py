@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import sqlite3
 from datetime import datetime
@@ -23,10 +24,12 @@ from pydantic import ValidationError
 from app.core.config import settings
 from app.protocol import (
     AGENT_TO_BRAIN_ADAPTER,
+    BRIDGE_JSON_ENCODING,
     BRIDGE_TO_BRAIN_ADAPTER,
     AgentConfigDocumentResponse,
     AgentConfigGetRequest,
     MAX_SNAPSHOT_FRAME_BYTES,
+    negotiate_bridge_encoding,
 )
 from app.persistence.history import InvariantViolation
 from app.utils.logger import logger
@@ -55,6 +58,7 @@ AGENT_TYPES = {
     "command.result",
 }
 BRIDGE_TYPES = {"bridge.hello", "state.resync"}
+BRIDGE_DRAIN_SECONDS = 2.0
 KNOWN_SERVER_TYPES = {
     "agent.session",
     "bridge.session",
@@ -241,7 +245,13 @@ async def _handle_agent_message(websocket: WebSocket, lease: AgentLease, message
 
     if message.type in {"ingest.snapshot", "ingest.delta"}:
         try:
-            if message.type == "ingest.snapshot":
+            if message.type == "ingest.snapshot" and message.payload.frame_kind == "commit":
+                # The sliced snapshot merge yields its write lock between
+                # slices; keep the event loop free for other sockets meanwhile.
+                outcome = await asyncio.to_thread(
+                    transport_manager.ingest_snapshot, lease, message.payload
+                )
+            elif message.type == "ingest.snapshot":
                 outcome = transport_manager.ingest_snapshot(lease, message.payload)
             else:
                 outcome = transport_manager.ingest_delta(lease, message.payload)
@@ -521,7 +531,8 @@ def _identity_matches_bridge(message: Any, binding: BridgeBinding) -> bool:
 
 
 async def _bridge_socket(websocket: WebSocket) -> None:
-    await websocket.accept()
+    encoding = negotiate_bridge_encoding(websocket.scope.get("subprotocols", ()))
+    await websocket.accept(subprotocol=None if encoding is None else encoding.subprotocol)
     binding: BridgeBinding | None = None
     try:
         raw = await websocket.receive_text()
@@ -570,9 +581,11 @@ async def _bridge_socket(websocket: WebSocket) -> None:
             principal_id=principal_id,
             creator_account_id=account_id,
             bridge_session_id=hello.payload.bridge_session_id,
+            encoding=encoding or BRIDGE_JSON_ENCODING,
+            snapshot_parts="state.snapshot.parts" in hello.payload.capabilities,
         )
-        await transport_manager.send_bridge(
-            websocket,
+        await transport_manager.queue_bridge(
+            binding,
             "bridge.session",
             {
                 "connection_id": str(binding.connection_id),
@@ -583,17 +596,15 @@ async def _bridge_socket(websocket: WebSocket) -> None:
             },
             correlation_id=hello.message_id,
         )
-        await transport_manager.send_bridge(
-            websocket, "state.snapshot", transport_manager.state_snapshot_payload(account_id)
-        )
-        await transport_manager.send_bridge(
-            websocket, "presence.state", transport_manager.presence_state_payload(account_id)
+        await transport_manager.queue_bridge_snapshot(binding)
+        await transport_manager.queue_bridge(
+            binding, "presence.state", transport_manager.presence_state_payload(account_id)
         )
-        await transport_manager.send_bridge(
-            websocket, "agent.state", transport_manager.agent_state_payload(account_id)
+        await transport_manager.queue_bridge(
+            binding, "agent.state", transport_manager.agent_state_payload(account_id)
         )
-        await transport_manager.send_bridge(
-            websocket, "system.state", transport_manager.system_state_payload(account_id)
+        await transport_manager.queue_bridge(
+            binding, "system.state", transport_manager.system_state_payload(account_id)
         )
         # A fresh bind (reload / deep-link) that lands while durable projection work
         # is still pending would otherwise be stranded on the stale bind-time
@@ -609,6 +620,8 @@ async def _bridge_socket(websocket: WebSocket) -> None:
             except ValidationError:
                 code, message_id, detail = _classify_validation_error(raw, "bridge")
                 fatal = code in {"unsupported_version", "wrong_role"}
+                # Keep the error ordered after frames already queued for this Bridge.
+                await transport_manager.drain_bridge(binding, timeout=BRIDGE_DRAIN_SECONDS)
                 await _protocol_error(
                     websocket,
                     "bridge",
@@ -621,6 +634,7 @@ async def _bridge_socket(websocket: WebSocket) -> None:
                     return
                 continue
             if message.type == "bridge.hello":
+                await transport_manager.drain_bridge(binding, timeout=BRIDGE_DRAIN_SECONDS)
                 await _protocol_error(
                     websocket,
                     "bridge",
@@ -631,6 +645,7 @@ async def _bridge_socket(websocket: WebSocket) -> None:
                 )
                 return
             if not _identity_matches_bridge(message, binding):
+                await transport_manager.drain_bridge(binding, timeout=BRIDGE_DRAIN_SECONDS)
                 await _protocol_error(
                     websocket,
                     "bridge",
@@ -640,12 +655,20 @@ async def _bridge_socket(websocket: WebSocket) -> None:
                     fatal=True,
                 )
                 return
+            if message.type == "state.subscribe":
+                await transport_manager.subscribe_bridge(
+                    binding, message.payload, correlation_id=message.message_id
+                )
+                continue
             # Projection activation and resynchronization use bounded v2 snapshots.
-            await transport_manager.send_bridge(
-                websocket,
-                "state.snapshot",
-                transport_manager.state_snapshot_payload(binding.creator_account_id),
-                correlation_id=message.message_id,
+            await transport_manager.queue_bridge_snapshot(
+                binding, correlation_id=message.message_id
+            )
+            # A resync is also the Bridge's request for a full presence refresh.
+            await transport_manager.queue_bridge(
+                binding,
+                "presence.state",
+                transport_manager.presence_state_payload(binding.creator_account_id),
             )
     except WebSocketDisconnect:
         pass
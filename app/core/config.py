@@ -33,6 +33,23 @@ class Settings(BaseSettings):
     # projection store below are different schemas and must never share a
     # file; a shared file causes a migration checksum error on open.
     analytics_projection_database_path: Path = Path("analytics-projections.sqlite3")
+    # "process" advances history projections in a supervised child process so
+    # large catch-ups never hold the GIL the WebSocket event loop needs.
+    projection_worker_mode: Literal["thread", "process"] = "thread"
+    # "account" gives every creator account its own canonical, projection and
+    # analytics files under canonical_shard_root; "hash" spreads accounts over
+    # canonical_shard_buckets fixed shards. Installation configuration and
+    # commands stay in canonical_database_path. Changing the mode or bucket
+    # count strands existing shards.
+    canonical_shard_mode: Literal["none", "account", "hash"] = "none"
+    canonical_shard_root: Path = Path("shards")
+    canonical_shard_buckets: int = Field(default=16, gt=0, le=9999)
+    # Each message page range read also fetches the next page, so scrolling a
+    # long conversation costs one indexed read per two pages.
+    history_page_read_ahead: bool = True
+    # Raw ingest events and expired snapshot staging older than this are
+    # folded or purged once canonical merge and projection have consumed them.
+    ingest_retention_days: int = Field(default=30, gt=0)
     security_signing_secret: SecretStr = SecretStr(
         "onlyfans-local-development-signing-secret"
     )
@@ -76,6 +93,14 @@ class Settings(BaseSettings):
             )
         if self.websocket_bind_host not in {"127.0.0.1", "localhost", "::1"}:
             raise ValueError("The local Brain runtime must bind to a loopback host")
+        if self.canonical_shard_mode != "none" and (
+            self.canonical_persistence_backend != "sqlite"
+            or self.projection_worker_mode != "thread"
+        ):
+            raise ValueError(
+                "Sharded canonical storage requires the sqlite backend and the "
+                "thread projection worker"
+            )
         if self.websocket_auth_mode == "local_session":
             bootstrap = self.local_session_bootstrap_token.get_secret_value()
             if (
@@ -0,0 +1,76 @@
+"""Keyed deadline scheduling for process-local expiry sweeps.
+
+Leases, presence TTLs, and command deadlines register one deadline per key.
+Rescheduling a key replaces its deadline and cancellation forgets it; both are
+O(log n) and leave the superseded heap entry to be discarded lazily. A sweep
+pops only due keys, so its cost follows the number of expired items rather
+than the number of tracked ones.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Hashable
+from datetime import datetime
+from typing import Generic, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+# Superseded entries are compacted once they outnumber live ones this much.
+_COMPACT_SLACK = 64
+
+
+class DeadlineScheduler(Generic[K]):
+    """Min-heap of keyed deadlines with replacement and lazy cancellation."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime, int, K]] = []
+        self._entries: dict[K, tuple[datetime, int]] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def schedule(self, key: K, deadline: datetime) -> None:
+        """Register ``key`` to fall due at ``deadline``, replacing any earlier one."""
+        sequence = next(self._sequence)
+        self._entries[key] = (deadline, sequence)
+        heapq.heappush(self._heap, (deadline, sequence, key))
+        if len(self._heap) > 2 * len(self._entries) + _COMPACT_SLACK:
+            self._heap = [
+                (entry_deadline, entry_sequence, entry_key)
+                for entry_key, (entry_deadline, entry_sequence) in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def cancel(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def deadline(self, key: K) -> datetime | None:
+        entry = self._entries.get(key)
+        return None if entry is None else entry[0]
+
+    def next_deadline(self) -> datetime | None:
+        heap = self._heap
+        while heap and self._entries.get(heap[0][2]) != heap[0][:2]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, now: datetime) -> list[K]:
+        """Remove and return every key due at ``now``, earliest first."""
+        due: list[K] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, sequence, key = heapq.heappop(heap)
+            if self._entries.get(key) == (deadline, sequence):
+                del self._entries[key]
+                due.append(key)
+        return due
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._entries.clear()
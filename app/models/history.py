@@ -8,6 +8,7 @@ from pydantic import Field
 
 from app.protocol.common import (
     ConversationCoverage,
+    ConversationSummary,
     MessageView,
     NonEmptyString,
     NonNegativeInt,
@@ -58,6 +59,35 @@ class MessagePageResponse(StrictModel):
     projection: ProjectionState
 
 
+class ConversationTail(StrictModel):
+    conversation_id: NonEmptyString
+    items: list[MessageView]
+    older_cursor: str | None
+    has_older_stored_items: bool
+
+
+class ConversationTailsResponse(StrictModel):
+    creator_account_id: NonEmptyString
+    projection_generation: NonEmptyString
+    read_revision: NonNegativeInt
+    generated_at: Timestamp
+    conversations: list[ConversationTail]
+    missing_conversation_ids: list[NonEmptyString]
+    projection: ProjectionState
+
+
+class ConversationListResponse(StrictModel):
+    creator_account_id: NonEmptyString
+    projection_generation: NonEmptyString
+    read_revision: NonNegativeInt
+    generated_at: Timestamp
+    order: Literal["recent", "unread", "name"]
+    items: list[ConversationSummary]
+    next_cursor: str | None
+    has_more: bool
+    projection: ProjectionState
+
+
 class AgentPairingResponse(StrictModel):
     pairing_ticket: NonEmptyString
     expires_at: Timestamp
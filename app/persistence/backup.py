@@ -6,11 +6,12 @@ import json
 import hashlib
 import os
 import sqlite3
+import time
 from contextlib import ExitStack, contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Literal
 from uuid import uuid4
 
 from app.analytics.graph_store import GraphReferentialIntegrityError
@@ -35,6 +36,20 @@ from app.persistence.projection_activation import _sqlite_identity
 
 HighWaterReader = Callable[[sqlite3.Connection], dict[str, Any]]
 
+# Pages hashed together as one entry of the external page manifest (1 MiB at
+# the default 4 KiB page size).
+BACKUP_PAGES_PER_CHUNK = 256
+_LEGACY_MANIFEST_KEYS = frozenset({
+    "store_name",
+    "schema_version",
+    "high_water",
+    "canonical_witnesses",
+    "created_at",
+    "file_sha256",
+    "integrity_limitation",
+})
+_PAGED_MANIFEST_KEYS = _LEGACY_MANIFEST_KEYS | {"page_size", "pages_per_chunk", "chunk_sha256"}
+
 
 class SQLiteBackupError(RuntimeError):
     """Raised when backup or restore validation fails without exposing content."""
@@ -48,6 +63,61 @@ class BackupManifest:
     canonical_witnesses: list[dict[str, Any]]
     created_at: datetime
     file_sha256: str
+    page_size: int | None = None
+    pages_per_chunk: int | None = None
+    chunk_sha256: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class BackupThrottle:
+    """How much of the live database one backup step copies, and how fast.
+
+    Each step holds the source only for ``pages_per_step`` pages; between
+    steps writers proceed. ``bytes_per_second`` caps copy and hash reads.
+    """
+
+    pages_per_step: int = 1024
+    bytes_per_second: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.pages_per_step < 1:
+            raise ValueError("pages_per_step must be positive")
+        if self.bytes_per_second is not None and self.bytes_per_second < 1:
+            raise ValueError("bytes_per_second must be positive")
+
+
+@dataclass(frozen=True, slots=True)
+class BackupProgress:
+    phase: Literal["copy", "hash", "verify", "transfer"]
+    completed_pages: int
+    total_pages: int
+
+
+@dataclass(frozen=True, slots=True)
+class IncrementalCopy:
+    manifest: BackupManifest
+    chunks_copied: int
+    chunks_total: int
+
+
+BackupProgressCallback = Callable[[BackupProgress], None]
+
+
+class _Pacer:
+    """Sleep just long enough to keep cumulative reads under a byte budget."""
+
+    def __init__(self, bytes_per_second: int | None) -> None:
+        self.bytes_per_second = bytes_per_second
+        self.started = time.monotonic()
+        self.consumed = 0
+
+    def advance(self, byte_count: int) -> None:
+        self.consumed += byte_count
+        if self.bytes_per_second is None:
+            return
+        delay = self.consumed / self.bytes_per_second - (time.monotonic() - self.started)
+        if delay > 0:
+            time.sleep(delay)
 
 
 @dataclass(frozen=True, slots=True)
@@ -97,6 +167,8 @@ def backup_canonical_database(
     destination: str | Path,
     *,
     overwrite: bool = False,
+    throttle: BackupThrottle | None = None,
+    progress: BackupProgressCallback | None = None,
 ) -> BackupManifest:
     return create_online_backup(
         database,
@@ -104,6 +176,8 @@ def backup_canonical_database(
         store_name="canonical",
         high_water_reader=_canonical_high_water,
         overwrite=overwrite,
+        throttle=throttle,
+        progress=progress,
     )
 
 
@@ -112,6 +186,8 @@ def backup_projections_database(
     destination: str | Path,
     *,
     overwrite: bool = False,
+    throttle: BackupThrottle | None = None,
+    progress: BackupProgressCallback | None = None,
 ) -> BackupManifest:
     return create_online_backup(
         database,
@@ -119,6 +195,8 @@ def backup_projections_database(
         store_name="projections",
         high_water_reader=_projections_high_water,
         overwrite=overwrite,
+        throttle=throttle,
+        progress=progress,
     )
 
 
@@ -129,7 +207,17 @@ def create_online_backup(
     store_name: str,
     high_water_reader: HighWaterReader,
     overwrite: bool = False,
+    throttle: BackupThrottle | None = None,
+    progress: BackupProgressCallback | None = None,
 ) -> BackupManifest:
+    """Copy the live database page-stepped from one read snapshot and publish it.
+
+    The source read transaction spans the high-water read and every step, so
+    concurrent writers never restart the copy and the copied rows match the
+    recorded high water. The published file is hashed once, streaming, into
+    both the whole-file digest and the per-chunk page manifest.
+    """
+    throttle = throttle or BackupThrottle()
     destination_candidate = _path_identity(destination).path
     temporary_candidate = destination_candidate.with_name(
         f".{destination_candidate.name}.{uuid4().hex}.tmp"
@@ -156,14 +244,27 @@ def create_online_backup(
         with LocalSQLite.exclusive_lifecycle(destination_path):
             _require_exclusive(destination_path)
             with database.read() as source:
+                source.execute("BEGIN")
                 source_high_water = high_water_reader(source)
                 witnesses = _witnesses(source) if store_name == "canonical" else []
                 schema_version = int(source.execute("PRAGMA user_version").fetchone()[0])
+                page_size = int(source.execute("PRAGMA page_size").fetchone()[0])
                 target = sqlite3.connect(temporary)
                 target.row_factory = sqlite3.Row
+                pacer = _Pacer(throttle.bytes_per_second)
+
+                def _stepped(_status: int, remaining: int, total: int) -> None:
+                    pacer.advance(
+                        (total - remaining) * page_size - pacer.consumed
+                    )
+                    if progress is not None:
+                        progress(BackupProgress("copy", total - remaining, total))
+
                 try:
                     apply_private_file_security(temporary)
-                    source.backup(target)
+                    source.backup(
+                        target, pages=throttle.pages_per_step, progress=_stepped
+                    )
                     target.commit()
                 finally:
                     target.close()
@@ -205,7 +306,14 @@ def create_online_backup(
             finally:
                 verification.close()
             sync_file(temporary)
-            digest = file_sha256(temporary)
+            digest, chunks = _page_hashes(
+                temporary,
+                page_size=page_size,
+                pages_per_chunk=BACKUP_PAGES_PER_CHUNK,
+                phase="hash",
+                progress=progress,
+                pacer=_Pacer(throttle.bytes_per_second),
+            )
             manifest = BackupManifest(
                 store_name=store_name,
                 schema_version=schema_version,
@@ -213,6 +321,9 @@ def create_online_backup(
                 canonical_witnesses=witnesses,
                 created_at=created_at,
                 file_sha256=digest,
+                page_size=page_size,
+                pages_per_chunk=BACKUP_PAGES_PER_CHUNK,
+                chunk_sha256=chunks,
             )
             _write_external_manifest(temporary_manifest, manifest)
             os.replace(temporary, destination_path)
@@ -239,35 +350,31 @@ def create_online_backup(
 
 
 def verify_backup(
-    backup_path: str | Path, *, expected_store: str | None = None
+    backup_path: str | Path,
+    *,
+    expected_store: str | None = None,
+    progress: BackupProgressCallback | None = None,
 ) -> BackupManifest:
+    """Verify a backup against its external manifest, failing closed.
+
+    Paged manifests are checked chunk by chunk while the file streams, so a
+    damaged backup is rejected at its first differing chunk.
+    """
     try:
         path = _path_identity(backup_path).path
-        manifest_path = _path_identity(_manifest_path(path)).path
-        external = json.loads(manifest_path.read_text(encoding="utf-8"))
-        manifest = BackupManifest(
-            store_name=str(external["store_name"]),
-            schema_version=int(external["schema_version"]),
-            high_water=dict(external["high_water"]),
-            canonical_witnesses=list(external["canonical_witnesses"]),
-            created_at=datetime.fromisoformat(external["created_at"]),
-            file_sha256=str(external["file_sha256"]),
-        )
-        if set(external) != {
-            "store_name",
-            "schema_version",
-            "high_water",
-            "canonical_witnesses",
-            "created_at",
-            "file_sha256",
-            "integrity_limitation",
-        }:
-            raise SQLiteBackupError("external backup manifest is invalid")
-        if external["integrity_limitation"] != (
-            "SHA-256 detects accidental or uncoordinated changes; it is not authenticity."
-        ):
-            raise SQLiteBackupError("backup integrity limitation is missing")
-        if file_sha256(path) != manifest.file_sha256:
+        manifest = _read_external_manifest(_path_identity(_manifest_path(path)).path)
+        if manifest.page_size is None or manifest.pages_per_chunk is None:
+            digest = file_sha256(path)
+        else:
+            digest, _ = _page_hashes(
+                path,
+                page_size=manifest.page_size,
+                pages_per_chunk=manifest.pages_per_chunk,
+                phase="verify",
+                progress=progress,
+                expected=manifest.chunk_sha256,
+            )
+        if digest != manifest.file_sha256:
             raise SQLiteBackupError("external backup hash differs")
         if expected_store is not None and manifest.store_name != expected_store:
             raise SQLiteBackupError("backup store type differs")
@@ -315,6 +422,98 @@ def verify_backup(
         raise SQLiteBackupError("backup verification failed") from error
 
 
+def refresh_backup_copy(
+    backup_path: str | Path,
+    copy_path: str | Path,
+    *,
+    throttle: BackupThrottle | None = None,
+    progress: BackupProgressCallback | None = None,
+) -> IncrementalCopy:
+    """Bring a second copy of a backup up to date by writing only changed chunks.
+
+    The copy's own page manifest says which chunks it already holds. It is
+    removed before any byte is written, so an interrupted refresh leaves a copy
+    that fails verification and is copied in full next time. The refreshed
+    copy is verified against the source manifest before it is reported.
+    """
+    throttle = throttle or BackupThrottle()
+    source_candidate = _path_identity(backup_path).path
+    copy_candidate = _path_identity(copy_path).path
+    paths = _identity_preflight(
+        copy_source=source_candidate,
+        copy_source_manifest=_manifest_path(source_candidate),
+        copy_destination=copy_candidate,
+        copy_destination_manifest=_manifest_path(copy_candidate),
+    )
+    source_path = paths["copy_source"]
+    copy = paths["copy_destination"]
+    copy_manifest = paths["copy_destination_manifest"]
+    manifest = verify_backup(source_path, progress=progress)
+    if manifest.page_size is None or manifest.pages_per_chunk is None:
+        raise SQLiteBackupError("backup has no page manifest")
+    copy.parent.mkdir(parents=True, exist_ok=True)
+    held: list[str] = []
+    try:
+        with LocalSQLite.exclusive_lifecycle(copy):
+            # Verification leaves the read-only sidecars behind; only open
+            # connections make the copy unsafe to patch.
+            if LocalSQLite.open_connection_count(copy):
+                raise SQLiteBackupError("backup copy has open application connections")
+            if copy.exists() and copy_manifest.exists():
+                try:
+                    previous = _read_external_manifest(copy_manifest)
+                except (SQLiteBackupError, OSError, KeyError, TypeError, ValueError):
+                    previous = None
+                if (
+                    previous is not None
+                    and previous.page_size == manifest.page_size
+                    and previous.pages_per_chunk == manifest.pages_per_chunk
+                ):
+                    held = previous.chunk_sha256
+            copy_manifest.unlink(missing_ok=True)
+            sync_directory(copy.parent)
+            if not copy.exists():
+                descriptor = os.open(copy, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                os.close(descriptor)
+            apply_private_file_security(copy)
+            chunk_bytes = manifest.page_size * manifest.pages_per_chunk
+            total_pages = os.path.getsize(source_path) // manifest.page_size
+            pacer = _Pacer(throttle.bytes_per_second)
+            copied = 0
+            with open(source_path, "rb") as source, open(copy, "r+b") as target:
+                for index, digest in enumerate(manifest.chunk_sha256):
+                    if index < len(held) and held[index] == digest:
+                        continue
+                    source.seek(index * chunk_bytes)
+                    block = source.read(chunk_bytes)
+                    target.seek(index * chunk_bytes)
+                    target.write(block)
+                    copied += 1
+                    pacer.advance(len(block))
+                    if progress is not None:
+                        progress(BackupProgress(
+                            "transfer",
+                            min(total_pages, (index + 1) * manifest.pages_per_chunk),
+                            total_pages,
+                        ))
+                target.truncate(os.path.getsize(source_path))
+                target.flush()
+                os.fsync(target.fileno())
+            _write_external_manifest(copy_manifest, manifest)
+            sync_directory(copy.parent)
+        if verify_backup(copy, expected_store=manifest.store_name) != manifest:
+            raise SQLiteBackupError("backup copy differs from its source")
+    except SQLiteBackupError:
+        raise
+    except (OSError, PrivateFileSecurityError, SQLiteConfigurationError) as error:
+        raise SQLiteBackupError("backup copy failed") from error
+    return IncrementalCopy(
+        manifest=manifest,
+        chunks_copied=copied,
+        chunks_total=len(manifest.chunk_sha256),
+    )
+
+
 def restore_backup(
     backup_path: str | Path,
     destination: str | Path,
@@ -907,8 +1106,74 @@ def _manifest_path(path: Path) -> Path:
     return path.with_name(path.name + ".manifest.json")
 
 
+def _page_hashes(
+    path: Path,
+    *,
+    page_size: int,
+    pages_per_chunk: int,
+    phase: Literal["hash", "verify"],
+    progress: BackupProgressCallback | None = None,
+    expected: list[str] | None = None,
+    pacer: _Pacer | None = None,
+) -> tuple[str, list[str]]:
+    """Hash a file once, streaming, into its digest and per-chunk page digests.
+
+    With ``expected`` the read stops at the first chunk that differs.
+    """
+    chunk_bytes = page_size * pages_per_chunk
+    total_pages = os.path.getsize(path) // page_size
+    digest = hashlib.sha256()
+    chunks: list[str] = []
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(chunk_bytes), b""):
+            digest.update(block)
+            chunk = hashlib.sha256(block).hexdigest()
+            if expected is not None and (
+                len(chunks) >= len(expected) or expected[len(chunks)] != chunk
+            ):
+                raise SQLiteBackupError("external backup hash differs")
+            chunks.append(chunk)
+            if pacer is not None:
+                pacer.advance(len(block))
+            if progress is not None:
+                progress(BackupProgress(
+                    phase, min(total_pages, len(chunks) * pages_per_chunk), total_pages
+                ))
+    if expected is not None and len(chunks) != len(expected):
+        raise SQLiteBackupError("external backup hash differs")
+    return digest.hexdigest(), chunks
+
+
+def _read_external_manifest(path: Path) -> BackupManifest:
+    external = json.loads(path.read_text(encoding="utf-8"))
+    if set(external) not in (_LEGACY_MANIFEST_KEYS, _PAGED_MANIFEST_KEYS):
+        raise SQLiteBackupError("external backup manifest is invalid")
+    if external["integrity_limitation"] != (
+        "SHA-256 detects accidental or uncoordinated changes; it is not authenticity."
+    ):
+        raise SQLiteBackupError("backup integrity limitation is missing")
+    paged = set(external) == _PAGED_MANIFEST_KEYS
+    if paged and (
+        int(external["page_size"]) < 1
+        or int(external["pages_per_chunk"]) < 1
+        or not all(isinstance(item, str) for item in external["chunk_sha256"])
+    ):
+        raise SQLiteBackupError("external backup manifest is invalid")
+    return BackupManifest(
+        store_name=str(external["store_name"]),
+        schema_version=int(external["schema_version"]),
+        high_water=dict(external["high_water"]),
+        canonical_witnesses=list(external["canonical_witnesses"]),
+        created_at=datetime.fromisoformat(external["created_at"]),
+        file_sha256=str(external["file_sha256"]),
+        page_size=int(external["page_size"]) if paged else None,
+        pages_per_chunk=int(external["pages_per_chunk"]) if paged else None,
+        chunk_sha256=list(external["chunk_sha256"]) if paged else [],
+    )
+
+
 def _write_external_manifest(path: Path, manifest: BackupManifest) -> None:
-    payload = {
+    payload: dict[str, Any] = {
         "store_name": manifest.store_name,
         "schema_version": manifest.schema_version,
         "high_water": manifest.high_water,
@@ -919,6 +1184,12 @@ def _write_external_manifest(path: Path, manifest: BackupManifest) -> None:
             "SHA-256 detects accidental or uncoordinated changes; it is not authenticity."
         ),
     }
+    if manifest.page_size is not None:
+        payload.update(
+            page_size=manifest.page_size,
+            pages_per_chunk=manifest.pages_per_chunk,
+            chunk_sha256=manifest.chunk_sha256,
+        )
     descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
     try:
         apply_private_file_security(path)
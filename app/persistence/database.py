@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import shutil
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
-from threading import RLock
-from typing import Iterator
+from threading import Condition, RLock
+from typing import Iterator, Literal
 
 from app.persistence.private_files import (
     PrivateFileSecurityError,
@@ -19,9 +24,73 @@ class SQLiteConfigurationError(RuntimeError):
     """Raised when SQLite cannot provide the required durability profile."""
 
 
+WriteLane = Literal["ingest", "projection", "maintenance"]
+# Waiting writers are admitted lowest number first, FIFO within a lane.
+WRITE_LANES: dict[str, int] = {"ingest": 0, "projection": 1, "maintenance": 2}
+READ_ONLY_MMAP_BYTES = 256 * 1024 * 1024
+READ_ONLY_CACHE_KIB = 64 * 1024
+_AUTO_VACUUM_MODES: dict[str, int] = {"NONE": 0, "FULL": 1, "INCREMENTAL": 2}
+
+
 _CONNECTION_COUNTS: dict[Path, int] = {}
 _CONNECTION_COUNTS_LOCK = RLock()
 _LIFECYCLE_LOCKS: dict[Path, RLock] = {}
+# Monotonic open time of each tracked connection, so maintenance can name the
+# age of the oldest in-process reader when a checkpoint cannot complete.
+_CONNECTION_OPENED: dict[Path, dict[int, float]] = {}
+# Rows written by bulk merges and rebuilds since maintenance last optimized.
+_BULK_WRITES: dict[Path, int] = {}
+
+
+class _WriterQueue:
+    """Admit one writer of this process per database file, highest lane first.
+
+    Writers queue here instead of contending inside SQLite, so in-process
+    writes never spin through busy retries; the wait is bounded by the
+    database's busy timeout and fails exactly like SQLite's own lock wait.
+    The owning thread may re-enter.
+    """
+
+    def __init__(self) -> None:
+        self._condition = Condition()
+        self._waiting: list[tuple[int, int]] = []
+        self._tickets = itertools.count()
+        self._owner: int | None = None
+        self._depth = 0
+
+    def acquire(self, lane: WriteLane, timeout: float) -> None:
+        thread = threading.get_ident()
+        with self._condition:
+            if self._owner == thread:
+                self._depth += 1
+                return
+            ticket = (WRITE_LANES[lane], next(self._tickets))
+            heapq.heappush(self._waiting, ticket)
+            deadline = time.monotonic() + timeout
+            try:
+                while self._owner is not None or self._waiting[0] != ticket:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise sqlite3.OperationalError("database is locked")
+                    self._condition.wait(remaining)
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._owner = thread
+            self._depth = 1
+
+    def release(self) -> None:
+        with self._condition:
+            self._depth -= 1
+            if not self._depth:
+                self._owner = None
+                self._condition.notify_all()
+
+
+_WRITER_QUEUES: dict[Path, _WriterQueue] = {}
 
 
 class _TrackedConnection(sqlite3.Connection):
@@ -36,6 +105,11 @@ class _TrackedConnection(sqlite3.Connection):
                     _CONNECTION_COUNTS[self._tracked_path] = remaining
                 else:
                     _CONNECTION_COUNTS.pop(self._tracked_path, None)
+                opened = _CONNECTION_OPENED.get(self._tracked_path)
+                if opened is not None:
+                    opened.pop(id(self), None)
+                    if not opened:
+                        _CONNECTION_OPENED.pop(self._tracked_path, None)
             self._tracking_closed = True
         super().close()
 
@@ -44,6 +118,9 @@ class LocalSQLite:
     """Open independently scoped connections with the accepted SQLite profile."""
 
     store_name = "local"
+    # Applied to a new, empty file; an existing file keeps its mode until
+    # :meth:`convert_auto_vacuum` rebuilds it.
+    auto_vacuum: str | None = None
 
     def __init__(self, path: str | Path, *, busy_timeout_ms: int = 5_000) -> None:
         if busy_timeout_ms < 0:
@@ -55,25 +132,38 @@ class LocalSQLite:
         self.busy_timeout_ms = busy_timeout_ms
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
-    def connect(self) -> sqlite3.Connection:
+    def _open(self, target: str | Path, *, uri: bool = False) -> sqlite3.Connection:
         with _CONNECTION_COUNTS_LOCK:
             lifecycle = _LIFECYCLE_LOCKS.setdefault(self.path, RLock())
         with lifecycle:
             connection = sqlite3.connect(
-                self.path,
+                target,
                 timeout=self.busy_timeout_ms / 1000,
                 isolation_level=None,
                 check_same_thread=False,
                 factory=_TrackedConnection,
+                uri=uri,
             )
             connection._tracked_path = self.path
             with _CONNECTION_COUNTS_LOCK:
                 _CONNECTION_COUNTS[self.path] = (
                     _CONNECTION_COUNTS.get(self.path, 0) + 1
                 )
+                _CONNECTION_OPENED.setdefault(self.path, {})[id(connection)] = (
+                    time.monotonic()
+                )
         connection.row_factory = sqlite3.Row
+        return connection
+
+    def connect(self) -> sqlite3.Connection:
+        connection = self._open(self.path)
         try:
             connection.execute(f"PRAGMA busy_timeout = {self.busy_timeout_ms}")
+            if (
+                self.auto_vacuum is not None
+                and connection.execute("PRAGMA page_count").fetchone()[0] == 0
+            ):
+                connection.execute(f"PRAGMA auto_vacuum = {self.auto_vacuum}")
             journal_mode = connection.execute("PRAGMA journal_mode = WAL").fetchone()[0]
             if str(journal_mode).lower() != "wal":
                 raise SQLiteConfigurationError(
@@ -95,6 +185,32 @@ class LocalSQLite:
             connection.close()
             raise
 
+    def connect_read_only(self) -> sqlite3.Connection:
+        """Open a connection that cannot write, sized for concurrent readers.
+
+        The file is opened ``mode=ro`` with ``query_only`` set, so a reader can
+        neither take the write lock nor create temporary tables; reads map the
+        file and keep a larger page cache than writers need.
+        """
+        if not self.path.exists():
+            raise SQLiteConfigurationError(f"{self.store_name} SQLite file does not exist")
+        connection = self._open(f"{self.path.as_uri()}?mode=ro", uri=True)
+        try:
+            connection.execute(f"PRAGMA busy_timeout = {self.busy_timeout_ms}")
+            connection.execute("PRAGMA query_only = ON")
+            connection.execute(f"PRAGMA mmap_size = {READ_ONLY_MMAP_BYTES}")
+            connection.execute(f"PRAGMA cache_size = -{READ_ONLY_CACHE_KIB}")
+            journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            if str(journal_mode).lower() != "wal":
+                raise SQLiteConfigurationError(
+                    f"{self.store_name} SQLite is not in WAL mode: {journal_mode!r}"
+                )
+            self._restrict_permissions()
+            return connection
+        except Exception:
+            connection.close()
+            raise
+
     @contextmanager
     def read(self) -> Iterator[sqlite3.Connection]:
         connection = self.connect()
@@ -104,22 +220,49 @@ class LocalSQLite:
             connection.close()
 
     @contextmanager
-    def transaction(self, *, immediate: bool = True) -> Iterator[sqlite3.Connection]:
-        connection = self.connect()
+    def read_only(self) -> Iterator[sqlite3.Connection]:
+        connection = self.connect_read_only()
         try:
-            connection.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
-            # BEGIN IMMEDIATE forces WAL/SHM creation before caller-controlled
-            # values are written, so their DACL/mode can be verified first.
-            self._restrict_permissions()
             yield connection
-            connection.commit()
-            self._restrict_permissions()
-        except BaseException:
-            connection.rollback()
-            raise
         finally:
             connection.close()
 
+    @contextmanager
+    def writer(self, lane: WriteLane = "ingest") -> Iterator[None]:
+        """Hold this process's single write slot for the file.
+
+        Every write of the process goes through here, directly or through
+        :meth:`transaction`; a higher lane is admitted before a lower one
+        that queued earlier.
+        """
+        with _CONNECTION_COUNTS_LOCK:
+            queue = _WRITER_QUEUES.setdefault(self.path, _WriterQueue())
+        queue.acquire(lane, self.busy_timeout_ms / 1000)
+        try:
+            yield
+        finally:
+            queue.release()
+
+    @contextmanager
+    def transaction(
+        self, *, immediate: bool = True, lane: WriteLane = "ingest"
+    ) -> Iterator[sqlite3.Connection]:
+        with self.writer(lane):
+            connection = self.connect()
+            try:
+                connection.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+                # BEGIN IMMEDIATE forces WAL/SHM creation before caller-controlled
+                # values are written, so their DACL/mode can be verified first.
+                self._restrict_permissions()
+                yield connection
+                connection.commit()
+                self._restrict_permissions()
+            except BaseException:
+                connection.rollback()
+                raise
+            finally:
+                connection.close()
+
     def validate_integrity(self) -> None:
         with self.read() as connection:
             result = connection.execute("PRAGMA integrity_check").fetchone()[0]
@@ -133,6 +276,56 @@ class LocalSQLite:
                     f"{self.store_name} SQLite foreign-key check failed: {violations!r}"
                 )
 
+    def incremental_vacuum(self, pages: int) -> int:
+        """Return up to ``pages`` free pages to the filesystem and report how many.
+
+        Only a file created in incremental auto-vacuum mode can shrink this
+        way; other files keep freed pages on the freelist for reuse.
+        """
+        if pages < 1:
+            raise ValueError("pages must be positive")
+        with self.read() as connection:
+            if connection.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                return 0
+            before = int(connection.execute("PRAGMA freelist_count").fetchone()[0])
+            if not before:
+                return 0
+            # The pragma frees one page per step; a script runs it to completion
+            # as one short autocommit write.
+            with self.writer("maintenance"):
+                connection.executescript(f"PRAGMA incremental_vacuum({int(pages)})")
+            return before - int(connection.execute("PRAGMA freelist_count").fetchone()[0])
+
+    def convert_auto_vacuum(self, *, min_free_bytes: int = 0) -> bool:
+        """Rebuild a file created before this store chose its auto-vacuum mode.
+
+        The mode of an existing file only changes through a full ``VACUUM``,
+        which rewrites it under the write lock, so the rebuild waits until at
+        least ``min_free_bytes`` sit on the freelist and the filesystem has
+        room for the copy. It happens once; returns whether it happened now.
+        """
+        if self.auto_vacuum is None:
+            return False
+        with self.read() as connection:
+            if (
+                connection.execute("PRAGMA auto_vacuum").fetchone()[0]
+                == _AUTO_VACUUM_MODES[self.auto_vacuum]
+            ):
+                return False
+            page_size = int(connection.execute("PRAGMA page_size").fetchone()[0])
+            page_count = int(connection.execute("PRAGMA page_count").fetchone()[0])
+            free_pages = int(connection.execute("PRAGMA freelist_count").fetchone()[0])
+            if free_pages * page_size < min_free_bytes:
+                return False
+            # VACUUM stages a full copy and logs the rebuilt file to the WAL.
+            if shutil.disk_usage(self.path.parent).free < 2 * page_count * page_size:
+                return False
+            with self.writer("maintenance"):
+                connection.executescript(
+                    f"PRAGMA auto_vacuum = {self.auto_vacuum}; VACUUM"
+                )
+        return True
+
     def _restrict_permissions(self) -> None:
         for candidate in (
             self.path,
@@ -147,6 +340,30 @@ class LocalSQLite:
                         f"{self.store_name} SQLite private-file security failed"
                     ) from error
 
+    def note_bulk_write(self, rows: int) -> None:
+        """Record rows a bulk merge or rebuild wrote, for planner maintenance."""
+        if rows > 0:
+            with _CONNECTION_COUNTS_LOCK:
+                _BULK_WRITES[self.path] = _BULK_WRITES.get(self.path, 0) + rows
+
+    def take_bulk_writes(self) -> int:
+        """Return and clear the rows recorded since the last call."""
+        with _CONNECTION_COUNTS_LOCK:
+            return _BULK_WRITES.pop(self.path, 0)
+
+    @staticmethod
+    def oldest_connection_age(path: str | Path) -> float | None:
+        """Seconds the oldest open connection of this process has been held."""
+        try:
+            target = reject_path_aliases(path)
+        except PrivateFileSecurityError:
+            return None
+        with _CONNECTION_COUNTS_LOCK:
+            opened = _CONNECTION_OPENED.get(target)
+            if not opened:
+                return None
+            return time.monotonic() - min(opened.values())
+
     @staticmethod
     def open_connection_count(path: str | Path) -> int:
         try:
@@ -178,9 +395,13 @@ class CanonicalSQLite(LocalSQLite):
     """Authoritative canonical database using full durability settings."""
 
     store_name = "canonical"
+    # Retention deletes old ingest rows; incremental mode lets the space go
+    # back to the filesystem in bounded steps.
+    auto_vacuum = "INCREMENTAL"
 
 
 class ProjectionsSQLite(LocalSQLite):
     """Disposable projections database using the accepted full-sync topology."""
 
     store_name = "projections"
+    auto_vacuum = "INCREMENTAL"
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, replace
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Literal
+from typing import Callable, Literal
 
 from app.analytics.canonical_source import HistoryAnalyticsSource
+from app.persistence.backup import BackupManifest, BackupThrottle, backup_canonical_database
 from app.persistence.database import CanonicalSQLite
 from app.persistence.history import HistoryRepository, ProjectionRepository
 from app.persistence.migrations import MigrationRunner
@@ -18,6 +20,7 @@ from app.persistence.repositories import (
     SQLiteAgentConfigRepository,
     SQLiteCommandRepository,
 )
+from app.persistence.sharding import DEFAULT_SHARD_BUCKETS, ShardMode, ShardRouter
 from app.services.agent_configuration import (
     AgentConfigRepository,
     InMemoryAgentConfigRepository,
@@ -39,6 +42,9 @@ class CanonicalRepositories:
     ingestion: HistoryAnalyticsSource
     projection_activation: SQLiteProjectionActivationRepository
     temporary_directory: TemporaryDirectory[str] | None = None
+    # Set for a shard, whose analytics projections live beside its canonical
+    # file; ``None`` keeps the configured analytics projections file.
+    analytics_projection_path: Path | None = None
 
 
 def create_canonical_repositories(
@@ -86,3 +92,133 @@ def create_canonical_repositories(
         projection_activation=SQLiteProjectionActivationRepository(database),
         temporary_directory=temporary_directory,
     )
+
+
+class ShardedCanonicalRepositories:
+    """Canonical repositories split into per-account or hash-bucket file sets.
+
+    Each shard is a directory holding its own canonical and projection files,
+    so a snapshot merge or rebuild for one account never takes a write lock,
+    or grows a WAL, that another shard's accounts wait on. Shards open, and
+    run their migrations, on first use; nothing here spans shards except the
+    administrative listing and backup, which visit each shard in turn.
+    """
+
+    CANONICAL_FILE = "canonical.sqlite3"
+    PROJECTION_FILE = "projections.sqlite3"
+    ANALYTICS_PROJECTION_FILE = "analytics-projections.sqlite3"
+
+    def __init__(
+        self,
+        router: ShardRouter,
+        *,
+        migrations_dir: str | Path | None = None,
+        busy_timeout_ms: int = 5_000,
+    ) -> None:
+        self.router = router
+        self.migrations_dir = migrations_dir
+        self.busy_timeout_ms = busy_timeout_ms
+        self._shards: dict[str, CanonicalRepositories] = {}
+        self._opening: dict[str, threading.Lock] = {}
+        self._listeners: list[Callable[[str, CanonicalRepositories], None]] = []
+        self._lock = threading.Lock()
+
+    def for_account(self, account_id: str) -> CanonicalRepositories:
+        return self.shard(self.router.shard_for(account_id))
+
+    def shard(self, name: str) -> CanonicalRepositories:
+        directory = self.router.directory(name)
+        with self._lock:
+            repositories = self._shards.get(name)
+            if repositories is not None:
+                return repositories
+            opening = self._opening.setdefault(name, threading.Lock())
+        # Opening migrates the shard's files, so only callers of that shard
+        # wait on it; every other shard stays reachable meanwhile.
+        with opening:
+            with self._lock:
+                repositories = self._shards.get(name)
+            if repositories is not None:
+                return repositories
+            repositories = create_canonical_repositories(
+                "sqlite",
+                canonical_path=directory / self.CANONICAL_FILE,
+                projection_path=directory / self.PROJECTION_FILE,
+                migrations_dir=self.migrations_dir,
+                busy_timeout_ms=self.busy_timeout_ms,
+            )
+            repositories = replace(
+                repositories,
+                analytics_projection_path=directory / self.ANALYTICS_PROJECTION_FILE,
+            )
+            with self._lock:
+                self._shards[name] = repositories
+                self._opening.pop(name, None)
+                listeners = list(self._listeners)
+            for listener in listeners:
+                listener(name, repositories)
+        return repositories
+
+    def add_open_listener(
+        self, listener: Callable[[str, CanonicalRepositories], None]
+    ) -> None:
+        """Call ``listener`` for every shard open now and each one opened later."""
+        with self._lock:
+            self._listeners.append(listener)
+            opened = list(self._shards.items())
+        for name, repositories in opened:
+            listener(name, repositories)
+
+    def migrate(self) -> list[str]:
+        """Open every shard on disk, migrating each; return the shard names."""
+        shards = self.router.existing_shards()
+        for name in shards:
+            self.shard(name)
+        return shards
+
+    def account_shards(self) -> dict[str, str]:
+        """List every account held on disk, mapped to the shard holding it."""
+        return {
+            account_id: name
+            for name in self.migrate()
+            for account_id in self.shard(name).history.account_ids()
+        }
+
+    def backup(
+        self,
+        destination: str | Path,
+        *,
+        overwrite: bool = False,
+        throttle: BackupThrottle | None = None,
+    ) -> dict[str, BackupManifest]:
+        """Back up each shard's canonical file under ``destination/<shard>``.
+
+        Shards are copied one after another, each from its own read snapshot;
+        projection files are rebuilt from canonical state and are not copied.
+        """
+        root = Path(destination)
+        return {
+            name: backup_canonical_database(
+                self.shard(name).database,
+                root / name / self.CANONICAL_FILE,
+                overwrite=overwrite,
+                throttle=throttle,
+            )
+            for name in self.migrate()
+        }
+
+
+def create_sharded_canonical_repositories(
+    root: str | Path,
+    *,
+    mode: ShardMode = "account",
+    buckets: int = DEFAULT_SHARD_BUCKETS,
+    migrations_dir: str | Path | None = None,
+    busy_timeout_ms: int = 5_000,
+) -> ShardedCanonicalRepositories:
+    """Create the sharded canonical layout under ``root``, one directory per shard."""
+    return ShardedCanonicalRepositories(
+        ShardRouter(Path(root), mode, buckets),
+        migrations_dir=migrations_dir,
+        busy_timeout_ms=busy_timeout_ms,
+    )
@@ -6,10 +6,11 @@ import hashlib
 import json
 import os
 import sqlite3
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
 from uuid import UUID, uuid4
 
 from app.persistence.database import CanonicalSQLite, LocalSQLite
@@ -19,6 +20,7 @@ from app.persistence.projection_pipeline import (
     CanonicalProjectionMessage,
     DeterministicProjectionPipeline,
     ProjectionPipeline,
+    message_source_hash,
 )
 
 
@@ -42,6 +44,92 @@ def _iso(value: datetime | str) -> str:
     return value.isoformat()
 
 
+# Entities staged by an unpublished snapshot merge carry its merge epoch and
+# stay invisible; publishing flips one snapshot_merges row, after which the
+# epoch is settled back to NULL in bounded slices.
+def merge_visible(alias: str) -> str:
+    """SQL predicate selecting rows of ``alias`` that readers may observe."""
+    return f"""({alias}.merge_epoch IS NULL OR {alias}.merge_epoch IN (
+        SELECT e.merge_epoch FROM snapshot_merges e
+         WHERE e.creator_account_id={alias}.creator_account_id
+           AND e.state IN ('published', 'settled')
+    ))"""
+
+
+def _window(column: str) -> str:
+    # Keyset window (cursor, upper]; bind (cursor, cursor, upper, upper).
+    return f"(? IS NULL OR {column}>?) AND (? IS NULL OR {column}<=?)"
+
+
+@dataclass(frozen=True, slots=True)
+class AccountTotals:
+    chat_count: int
+    message_count: int
+    inbound_count: int
+    outbound_count: int
+    first_sent_at: str | None
+    last_sent_at: str | None
+
+
+def account_totals(connection: sqlite3.Connection, account_id: str) -> AccountTotals:
+    """Visible chat and message totals without scanning the account's rows.
+
+    Triggers maintain counters over settled rows; the rows of a published
+    merge that is still settling are added from the pending-merge indexes.
+    """
+    counters = connection.execute(
+        """SELECT chat_count,message_count,inbound_count,outbound_count
+             FROM account_message_counters WHERE creator_account_id=?""",
+        (account_id,),
+    ).fetchone() or (0, 0, 0, 0)
+    settling = """merge_epoch IS NOT NULL AND merge_epoch IN (
+        SELECT merge_epoch FROM snapshot_merges
+         WHERE creator_account_id=? AND state IN ('published', 'settled')
+    )"""
+    messages = connection.execute(
+        f"""SELECT COUNT(*),SUM(direction='inbound'),SUM(direction='outbound')
+              FROM account_messages
+             WHERE creator_account_id=? AND is_deleted=0 AND {settling}""",
+        (account_id, account_id),
+    ).fetchone()
+    chats = connection.execute(
+        f"""SELECT COUNT(*) FROM account_chats
+             WHERE creator_account_id=? AND is_deleted=0 AND {settling}""",
+        (account_id, account_id),
+    ).fetchone()
+    observed = [
+        connection.execute(
+            f"""SELECT m.sent_at FROM account_messages m
+                 WHERE m.creator_account_id=? AND m.is_deleted=0 AND {merge_visible('m')}
+                 ORDER BY m.sent_at {order} LIMIT 1""",
+            (account_id,),
+        ).fetchone()
+        for order in ("ASC", "DESC")
+    ]
+    return AccountTotals(
+        chat_count=int(counters[0]) + int(chats[0]),
+        message_count=int(counters[1]) + int(messages[0]),
+        inbound_count=int(counters[2]) + int(messages[1] or 0),
+        outbound_count=int(counters[3]) + int(messages[2] or 0),
+        first_sent_at=None if observed[0] is None else str(observed[0][0]),
+        last_sent_at=None if observed[1] is None else str(observed[1][0]),
+    )
+
+
+SNAPSHOT_MERGE_SLICE_ROWS = 2000
+SNAPSHOT_MERGE_LEASE_SECONDS = 60
+INGEST_RETENTION_DAYS = 30
+RETENTION_BATCH_ROWS = 500
+_MERGE_FOLLOWING_PHASE = {
+    "chat_membership": "message_membership",
+    "message_membership": "prune_chat_membership",
+    "prune_chat_membership": "prune_message_membership",
+    "prune_message_membership": "purge",
+    "purge": "settle",
+    "settle": "done",
+}
+
+
 def _staged_chat(record: dict[str, Any]) -> tuple[Any, ...]:
     if record["tombstone"]:
         return (record["chat_id"], 1, None, None, None, None, None)
@@ -78,6 +166,47 @@ def _staged_message(record: dict[str, Any]) -> tuple[Any, ...]:
     )
 
 
+@dataclass(frozen=True, slots=True)
+class StagedChunk:
+    """One snapshot chunk reduced to its staging rows and chunk fingerprint."""
+
+    chunk_index: int
+    entity_kind: str
+    fingerprint: str
+    rows: list[tuple[Any, ...]]
+    largest_record_bytes: int
+
+
+def staged_chunk(chunk_index: int, entity_kind: str, records: list[dict[str, Any]]) -> StagedChunk:
+    """Serialize each normalized record once and derive every staging hash from it.
+
+    The fingerprint is byte-identical to hashing ``{"entity_kind", "records"}``
+    because canonical JSON of the list is the comma-joined canonical records.
+    """
+    texts = [_json(record) for record in records]
+    document = '{"entity_kind":' + _json(entity_kind) + ',"records":[' + ",".join(texts) + "]}"
+    fingerprint = "sha256:" + hashlib.sha256(document.encode("utf-8")).hexdigest()
+    if entity_kind == "chat":
+        rows = [
+            (staged[0], chunk_index, text, *staged[1:])
+            for record, text in zip(records, texts)
+            for staged in (_staged_chat(record),)
+        ]
+    elif entity_kind == "message":
+        rows = [
+            (staged[0], staged[1], chunk_index, text, *staged[2:])
+            for record, text in zip(records, texts)
+            for staged in (_staged_message(record),)
+        ]
+    else:
+        rows = [
+            ("sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest(), chunk_index, index, text)
+            for index, text in enumerate(texts)
+        ]
+    largest = max((len(text.encode("utf-8")) for text in texts), default=0)
+    return StagedChunk(chunk_index, entity_kind, fingerprint, rows, largest)
+
+
 @dataclass(frozen=True, slots=True)
 class StreamKey:
     creator_account_id: str
@@ -109,11 +238,36 @@ class InvariantViolation(ValueError):
     pass
 
 
+@dataclass(slots=True)
+class RetentionCounts:
+    """Rows one retention batch folded or purged."""
+
+    folded_events: int = 0
+    purged_staging_rows: int = 0
+    purged_uploads: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.folded_events + self.purged_staging_rows + self.purged_uploads
+
+
 class HistoryRepository:
     """All acknowledged source effects commit through this repository."""
 
-    def __init__(self, database: CanonicalSQLite) -> None:
+    def __init__(
+        self,
+        database: CanonicalSQLite,
+        *,
+        merge_slice_rows: int = SNAPSHOT_MERGE_SLICE_ROWS,
+        merge_lease_seconds: float = SNAPSHOT_MERGE_LEASE_SECONDS,
+    ) -> None:
+        if merge_slice_rows < 1:
+            raise ValueError("merge_slice_rows must be positive")
+        if merge_lease_seconds <= 0:
+            raise ValueError("merge_lease_seconds must be positive")
         self.database = database
+        self.merge_slice_rows = merge_slice_rows
+        self.merge_lease_seconds = merge_lease_seconds
 
     def reset(self) -> None:
         """Remove v2 history state while retaining configuration and command audit data."""
@@ -129,7 +283,12 @@ class HistoryRepository:
                 "entity_tombstones",
                 "account_messages",
                 "account_chats",
+                "conversation_message_counters",
+                "account_message_counters",
                 "committed_snapshots",
+                "snapshot_merge_actions",
+                "snapshot_merges",
+                "raw_ingest_folds",
                 "raw_ingest_events",
                 "snapshot_coverage_records",
                 "snapshot_message_records",
@@ -326,131 +485,133 @@ class HistoryRepository:
         self._require_stream_identity(key, payload)
         if len(_json(payload.model_dump(mode="json")).encode("utf-8")) > 512 * 1024:
             raise InvariantViolation("snapshot frame exceeds 512 KiB")
+        chunk = staged_chunk(payload.chunk_index, payload.entity_kind, payload.records)
         now = _iso(utc_now())
-        records = payload.records
-        fingerprint = _hash({"entity_kind": payload.entity_kind, "records": records})
         with self.database.transaction() as connection:
-            upload = connection.execute(
-                """SELECT chunk_count,next_chunk_index,state,last_entity_kind FROM snapshot_uploads
-                   WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
-                     AND snapshot_id=?""",
-                (*key.sql(), str(payload.snapshot_id)),
-            ).fetchone()
-            checkpoint = self._current_checkpoint(connection, key) or 0
-            if upload is None:
-                return IngestResult("rejected", checkpoint, snapshot_id=payload.snapshot_id,
-                                    code="snapshot_incomplete", detail="snapshot begin is missing")
-            existing = connection.execute(
-                """SELECT fingerprint FROM snapshot_chunks
-                   WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
-                     AND snapshot_id=? AND chunk_index=?""",
-                (*key.sql(), str(payload.snapshot_id), payload.chunk_index),
-            ).fetchone()
-            if existing is not None:
-                if existing[0] != fingerprint:
-                    return IngestResult("rejected", checkpoint, snapshot_id=payload.snapshot_id,
-                                        code="chunk_conflict", detail="chunk index was reused with different records")
-                return IngestResult("duplicate", checkpoint, snapshot_id=payload.snapshot_id,
-                                    next_expected_chunk_index=int(upload[1]),
-                                    snapshot_committed=upload[2] == "committed")
-            if upload[2] == "committed":
-                return IngestResult("rejected", checkpoint, snapshot_id=payload.snapshot_id,
-                                    next_expected_chunk_index=int(upload[1]),
-                                    snapshot_committed=True, code="chunk_conflict",
-                                    detail="committed snapshot has no matching chunk fingerprint")
-            if payload.chunk_index != int(upload[1]) or payload.chunk_index >= int(upload[0]):
-                return IngestResult("gap", checkpoint, snapshot_id=payload.snapshot_id,
-                                    next_expected_chunk_index=int(upload[1]), code="sequence_gap",
-                                    retryable=True, detail=f"expected snapshot chunk {upload[1]}")
-            kind_order = {"chat": 0, "message": 1, "coverage_evidence": 2}
-            if upload[3] is not None and kind_order[payload.entity_kind] < kind_order[str(upload[3])]:
-                return IngestResult(
-                    "rejected",
-                    checkpoint,
-                    snapshot_id=payload.snapshot_id,
-                    next_expected_chunk_index=int(upload[1]),
-                    code="invariant_failed",
-                    detail="snapshot chunks must be ordered chat, message, coverage_evidence",
-                )
-            connection.execute(
-                """INSERT INTO snapshot_chunks(
-                       creator_account_id,agent_installation_id,agent_stream_id,snapshot_id,
-                       chunk_index,entity_kind,record_count,fingerprint,committed_at
-                   ) VALUES (?,?,?,?,?,?,?,?,?)""",
-                (*key.sql(), str(payload.snapshot_id), payload.chunk_index,
-                 payload.entity_kind, len(records), fingerprint, now),
-            )
-            try:
-                if payload.entity_kind == "chat":
-                    connection.executemany(
-                        """INSERT INTO snapshot_chat_records(
-                               creator_account_id,agent_installation_id,agent_stream_id,snapshot_id,
-                               chat_id,chunk_index,record_json,is_tombstone,record_kind,
-                               platform_user_id,display_name,upstream_updated_at,content_hash
-                           ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                        [
-                            (
-                                *key.sql(),
-                                str(payload.snapshot_id),
-                                staged[0],
-                                payload.chunk_index,
-                                _json(record),
-                                *staged[1:],
-                            )
-                            for record in records
-                            for staged in (_staged_chat(record),)
-                        ],
-                    )
-                elif payload.entity_kind == "message":
-                    connection.executemany(
-                        """INSERT INTO snapshot_message_records(
-                               creator_account_id,agent_installation_id,agent_stream_id,snapshot_id,
-                               message_id,chat_id,chunk_index,record_json,is_tombstone,
-                               sender_platform_user_id,text,sent_at,direction,
-                               upstream_updated_at,content_hash
-                           ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                        [
-                            (
-                                *key.sql(),
-                                str(payload.snapshot_id),
-                                staged[0],
-                                staged[1],
-                                payload.chunk_index,
-                                _json(record),
-                                *staged[2:],
-                            )
-                            for record in records
-                            for staged in (_staged_message(record),)
-                        ],
-                    )
-                else:
-                    connection.executemany(
-                        """INSERT INTO snapshot_coverage_records(
-                               creator_account_id,agent_installation_id,agent_stream_id,snapshot_id,
-                               evidence_id,chunk_index,record_index,record_json
-                           ) VALUES (?,?,?,?,?,?,?,?)""",
-                        [(*key.sql(), str(payload.snapshot_id), _hash(record),
-                          payload.chunk_index, index, _json(record))
-                         for index, record in enumerate(records)],
-                    )
-            except sqlite3.IntegrityError as error:
-                raise InvariantViolation("snapshot contains a duplicate entity identifier") from error
-            counts_column = {
-                "chat": "received_chats",
-                "message": "received_messages",
-                "coverage_evidence": "received_coverage_evidence",
-            }[payload.entity_kind]
-            connection.execute(
-                f"""UPDATE snapshot_uploads
-                    SET next_chunk_index=next_chunk_index+1,
-                        last_entity_kind=?,
-                        {counts_column}={counts_column}+?
-                    WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
-                      AND snapshot_id=?""",
-                (payload.entity_kind, len(records), *key.sql(), str(payload.snapshot_id)),
+            return self._stage_chunk(connection, key, payload.snapshot_id, chunk, now)
+
+    def add_snapshot_chunks(
+        self, key: StreamKey, snapshot_id: UUID, chunks: list[StagedChunk]
+    ) -> list[IngestResult]:
+        """Stage consecutive chunks of one snapshot in a single write transaction.
+
+        Used by the offline importer; each chunk is checked exactly as
+        ``add_snapshot_chunk`` would, and staging stops after the first chunk
+        that is neither accepted nor a duplicate.
+        """
+        now = _iso(utc_now())
+        results: list[IngestResult] = []
+        with self.database.transaction() as connection:
+            for chunk in chunks:
+                results.append(self._stage_chunk(connection, key, snapshot_id, chunk, now))
+                if results[-1].status not in {"accepted", "duplicate"}:
+                    break
+        return results
+
+    def _stage_chunk(
+        self,
+        connection: sqlite3.Connection,
+        key: StreamKey,
+        snapshot_id: UUID,
+        chunk: StagedChunk,
+        now: str,
+    ) -> IngestResult:
+        scope = (*key.sql(), str(snapshot_id))
+        upload = connection.execute(
+            """SELECT chunk_count,next_chunk_index,state,last_entity_kind FROM snapshot_uploads
+               WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
+                 AND snapshot_id=?""",
+            scope,
+        ).fetchone()
+        checkpoint = self._current_checkpoint(connection, key) or 0
+        if upload is None:
+            return IngestResult("rejected", checkpoint, snapshot_id=snapshot_id,
+                                code="snapshot_incomplete", detail="snapshot begin is missing")
+        existing = connection.execute(
+            """SELECT fingerprint FROM snapshot_chunks
+               WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
+                 AND snapshot_id=? AND chunk_index=?""",
+            (*scope, chunk.chunk_index),
+        ).fetchone()
+        if existing is not None:
+            if existing[0] != chunk.fingerprint:
+                return IngestResult("rejected", checkpoint, snapshot_id=snapshot_id,
+                                    code="chunk_conflict", detail="chunk index was reused with different records")
+            return IngestResult("duplicate", checkpoint, snapshot_id=snapshot_id,
+                                next_expected_chunk_index=int(upload[1]),
+                                snapshot_committed=upload[2] == "committed")
+        if upload[2] == "committed":
+            return IngestResult("rejected", checkpoint, snapshot_id=snapshot_id,
+                                next_expected_chunk_index=int(upload[1]),
+                                snapshot_committed=True, code="chunk_conflict",
+                                detail="committed snapshot has no matching chunk fingerprint")
+        if chunk.chunk_index != int(upload[1]) or chunk.chunk_index >= int(upload[0]):
+            return IngestResult("gap", checkpoint, snapshot_id=snapshot_id,
+                                next_expected_chunk_index=int(upload[1]), code="sequence_gap",
+                                retryable=True, detail=f"expected snapshot chunk {upload[1]}")
+        kind_order = {"chat": 0, "message": 1, "coverage_evidence": 2}
+        if upload[3] is not None and kind_order[chunk.entity_kind] < kind_order[str(upload[3])]:
+            return IngestResult(
+                "rejected",
+                checkpoint,
+                snapshot_id=snapshot_id,
+                next_expected_chunk_index=int(upload[1]),
+                code="invariant_failed",
+                detail="snapshot chunks must be ordered chat, message, coverage_evidence",
             )
-            return IngestResult("accepted", checkpoint, snapshot_id=payload.snapshot_id,
-                                next_expected_chunk_index=payload.chunk_index + 1)
+        connection.execute(
+            """INSERT INTO snapshot_chunks(
+                   creator_account_id,agent_installation_id,agent_stream_id,snapshot_id,
+                   chunk_index,entity_kind,record_count,fingerprint,committed_at
+               ) VALUES (?,?,?,?,?,?,?,?,?)""",
+            (*scope, chunk.chunk_index, chunk.entity_kind, len(chunk.rows), chunk.fingerprint, now),
+        )
+        try:
+            if chunk.entity_kind == "chat":
+                connection.executemany(
+                    """INSERT INTO snapshot_chat_records(
+                           creator_account_id,agent_installation_id,agent_stream_id,snapshot_id,
+                           chat_id,chunk_index,record_json,is_tombstone,record_kind,
+                           platform_user_id,display_name,upstream_updated_at,content_hash
+                       ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+                    [(*scope, *row) for row in chunk.rows],
+                )
+            elif chunk.entity_kind == "message":
+                connection.executemany(
+                    """INSERT INTO snapshot_message_records(
+                           creator_account_id,agent_installation_id,agent_stream_id,snapshot_id,
+                           message_id,chat_id,chunk_index,record_json,is_tombstone,
+                           sender_platform_user_id,text,sent_at,direction,
+                           upstream_updated_at,content_hash
+                       ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+                    [(*scope, *row) for row in chunk.rows],
+                )
+            else:
+                connection.executemany(
+                    """INSERT INTO snapshot_coverage_records(
+                           creator_account_id,agent_installation_id,agent_stream_id,snapshot_id,
+                           evidence_id,chunk_index,record_index,record_json
+                       ) VALUES (?,?,?,?,?,?,?,?)""",
+                    [(*scope, *row) for row in chunk.rows],
+                )
+        except sqlite3.IntegrityError as error:
+            raise InvariantViolation("snapshot contains a duplicate entity identifier") from error
+        counts_column = {
+            "chat": "received_chats",
+            "message": "received_messages",
+            "coverage_evidence": "received_coverage_evidence",
+        }[chunk.entity_kind]
+        connection.execute(
+            f"""UPDATE snapshot_uploads
+                SET next_chunk_index=next_chunk_index+1,
+                    last_entity_kind=?,
+                    {counts_column}={counts_column}+?
+                WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
+                  AND snapshot_id=?""",
+            (chunk.entity_kind, len(chunk.rows), *scope),
+        )
+        return IngestResult("accepted", checkpoint, snapshot_id=snapshot_id,
+                            next_expected_chunk_index=chunk.chunk_index + 1)
 
     @staticmethod
     def _canonical_revision(connection: sqlite3.Connection, account_id: str, now: str) -> int:
@@ -478,12 +639,14 @@ class HistoryRepository:
             return False
         content_hash = _hash(chat)
         row = connection.execute(
-            """SELECT record_kind,platform_user_id,upstream_updated_at,content_hash,is_deleted
+            f"""SELECT record_kind,platform_user_id,upstream_updated_at,content_hash,is_deleted
                FROM account_chats
-               WHERE creator_account_id=? AND chat_id=?""",
+               WHERE creator_account_id=? AND chat_id=? AND {merge_visible('account_chats')}""",
             (account_id, chat["chat_id"]),
         ).fetchone()
         incoming_full = chat["record_kind"] == "full"
+        # A chat staged by an unpublished snapshot merge is not yet canonical;
+        # the live write overwrites and publishes it.
         should_write = row is None
         if row is not None:
             if row[4]:
@@ -519,7 +682,7 @@ class HistoryRepository:
                        display_name=excluded.display_name,upstream_updated_at=excluded.upstream_updated_at,
                        content_hash=excluded.content_hash,winning_stream_epoch=excluded.winning_stream_epoch,
                        winning_source_seq=excluded.winning_source_seq,winning_event_id=excluded.winning_event_id,
-                       is_deleted=0,updated_at=excluded.updated_at""",
+                       is_deleted=0,updated_at=excluded.updated_at,merge_epoch=NULL""",
                 (account_id, chat["chat_id"], chat["record_kind"], chat.get("platform_user_id"),
                  chat.get("display_name"), chat.get("updated_at"), content_hash, epoch, source_seq,
                  event_id, now),
@@ -534,7 +697,8 @@ class HistoryRepository:
         if self._tombstoned(connection, account_id, "message", message["message_id"]):
             return False
         parent = connection.execute(
-            "SELECT is_deleted FROM account_chats WHERE creator_account_id=? AND chat_id=?",
+            f"""SELECT is_deleted FROM account_chats
+               WHERE creator_account_id=? AND chat_id=? AND {merge_visible('account_chats')}""",
             (account_id, message["chat_id"]),
         ).fetchone()
         if parent is None or parent[0]:
@@ -543,14 +707,22 @@ class HistoryRepository:
         clean.pop("record_kind", None)
         content_hash = _hash(clean)
         row = connection.execute(
-            """SELECT content_hash,upstream_updated_at,is_deleted FROM account_messages
-               WHERE creator_account_id=? AND message_id=?""",
+            f"""SELECT m.content_hash,m.upstream_updated_at,m.is_deleted,
+                       NOT {merge_visible('m')}
+                  FROM account_messages m
+                 WHERE m.creator_account_id=? AND m.message_id=?""",
             (account_id, message["message_id"]),
         ).fetchone()
+        # A copy staged by an unpublished snapshot merge is overwritten and
+        # published by the live write; a conflicting staged copy then fails
+        # the snapshot publish instead of this delta.
         if row is not None:
-            if row[2] or row[0] == content_hash:
+            if row[2]:
                 return False
-            raise InvariantViolation("immutable message identifier has conflicting content")
+            if not row[3]:
+                if row[0] == content_hash:
+                    return False
+                raise InvariantViolation("immutable message identifier has conflicting content")
         connection.execute(
             """INSERT INTO account_messages(
                    creator_account_id,message_id,chat_id,sender_platform_user_id,text,sent_at,direction,
@@ -563,7 +735,8 @@ class HistoryRepository:
                    upstream_updated_at=excluded.upstream_updated_at,content_hash=excluded.content_hash,
                    winning_stream_epoch=excluded.winning_stream_epoch,
                    winning_source_seq=excluded.winning_source_seq,
-                   winning_event_id=excluded.winning_event_id,is_deleted=0,updated_at=excluded.updated_at""",
+                   winning_event_id=excluded.winning_event_id,is_deleted=0,updated_at=excluded.updated_at,
+                   merge_epoch=NULL""",
             (account_id, message["message_id"], message["chat_id"],
              message["sender_platform_user_id"], message["text"], message["sent_at"],
              message["direction"], message.get("upstream_updated_at"), content_hash,
@@ -616,6 +789,13 @@ class HistoryRepository:
         chat_id: str | None, epoch: int, source_seq: int, event_id: str | None, now: str,
     ) -> bool:
         if kind == "message":
+            # The live tombstone wins over a copy staged by an unpublished merge.
+            connection.execute(
+                f"""DELETE FROM account_messages AS m
+                    WHERE m.creator_account_id=? AND m.message_id=?
+                      AND NOT {merge_visible('m')}""",
+                (account_id, entity_id),
+            )
             canonical_message = connection.execute(
                 """SELECT chat_id FROM account_messages
                    WHERE creator_account_id=? AND message_id=?""",
@@ -652,232 +832,129 @@ class HistoryRepository:
         return existing is None
 
     @staticmethod
-    def _merge_staged_snapshot_entities(
+    def _staged_chat_checks(
         connection: sqlite3.Connection,
-        key: StreamKey,
-        snapshot_id: str,
-        *,
-        epoch: int,
-        source_seq: int,
-        now: str,
-    ) -> bool:
-        """Validate and merge one staged snapshot with set-based SQLite work."""
-        scope = (*key.sql(), snapshot_id)
-        account_id = key.creator_account_id
-        invalid_chat = connection.execute(
-            """SELECT 1 FROM snapshot_chat_records
-               WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
-                 AND snapshot_id=?
-                 AND (is_tombstone IS NULL OR (
-                     is_tombstone=0 AND (
-                         record_kind IS NULL OR content_hash IS NULL OR (
-                             record_kind='full' AND (
-                                 platform_user_id IS NULL OR upstream_updated_at IS NULL
+        scope: tuple[str, str, str, str],
+        window: tuple[str | None, ...],
+    ) -> None:
+        """Reject incomplete staged chats and chat identity/version conflicts."""
+        invalid = connection.execute(
+            f"""SELECT 1 FROM snapshot_chat_records s
+               WHERE s.creator_account_id=? AND s.agent_installation_id=?
+                 AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.chat_id')}
+                 AND (s.is_tombstone IS NULL OR (
+                     s.is_tombstone=0 AND (
+                         s.record_kind IS NULL OR s.content_hash IS NULL OR (
+                             s.record_kind='full' AND (
+                                 s.platform_user_id IS NULL OR s.upstream_updated_at IS NULL
                              )
                          )
                      )
                  )) LIMIT 1""",
-            scope,
-        ).fetchone()
-        invalid_message = connection.execute(
-            """SELECT 1 FROM snapshot_message_records
-               WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
-                 AND snapshot_id=?
-                 AND (is_tombstone IS NULL OR (
-                     is_tombstone=0 AND (
-                         sender_platform_user_id IS NULL OR text IS NULL OR sent_at IS NULL
-                         OR direction IS NULL OR content_hash IS NULL
-                     )
-                 )) LIMIT 1""",
-            scope,
+            (*scope, *window),
         ).fetchone()
-        if invalid_chat is not None or invalid_message is not None:
+        if invalid is not None:
             raise InvariantViolation("snapshot staging material is incomplete or obsolete")
-
         platform_conflict = connection.execute(
-            """SELECT 1
+            f"""SELECT 1
                  FROM snapshot_chat_records s
                  JOIN account_chats c
                    ON c.creator_account_id=s.creator_account_id AND c.chat_id=s.chat_id
                 WHERE s.creator_account_id=? AND s.agent_installation_id=?
-                  AND s.agent_stream_id=? AND s.snapshot_id=? AND s.is_tombstone=0
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.chat_id')}
+                  AND s.is_tombstone=0 AND {merge_visible('c')}
                   AND c.is_deleted=0 AND c.platform_user_id IS NOT NULL
                   AND s.platform_user_id IS NOT NULL
                   AND c.platform_user_id<>s.platform_user_id
                 LIMIT 1""",
-            scope,
+            (*scope, *window),
         ).fetchone()
         if platform_conflict is not None:
             raise InvariantViolation("chat platform identity conflicts with canonical identity")
-        chat_version_conflict = connection.execute(
-            """SELECT 1
+        version_conflict = connection.execute(
+            f"""SELECT 1
                  FROM snapshot_chat_records s
                  JOIN account_chats c
                    ON c.creator_account_id=s.creator_account_id AND c.chat_id=s.chat_id
                 WHERE s.creator_account_id=? AND s.agent_installation_id=?
-                  AND s.agent_stream_id=? AND s.snapshot_id=? AND s.is_tombstone=0
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.chat_id')}
+                  AND s.is_tombstone=0 AND {merge_visible('c')}
                   AND c.is_deleted=0 AND c.record_kind='full' AND s.record_kind='full'
                   AND c.upstream_updated_at=s.upstream_updated_at
                   AND c.content_hash<>s.content_hash
                 LIMIT 1""",
-            scope,
+            (*scope, *window),
         ).fetchone()
-        if chat_version_conflict is not None:
+        if version_conflict is not None:
             raise InvariantViolation("chat version has conflicting content")
 
-        connection.execute("DROP TABLE IF EXISTS temp.snapshot_changed_chats")
-        connection.execute(
-            "CREATE TEMP TABLE snapshot_changed_chats(chat_id TEXT PRIMARY KEY) WITHOUT ROWID"
-        )
-        connection.execute(
-            """INSERT INTO snapshot_changed_chats(chat_id)
-               SELECT s.chat_id
-                 FROM snapshot_chat_records s
-                 LEFT JOIN account_chats c
-                   ON c.creator_account_id=s.creator_account_id AND c.chat_id=s.chat_id
-                 LEFT JOIN entity_tombstones t
-                   ON t.creator_account_id=s.creator_account_id
-                  AND t.entity_kind='chat' AND t.entity_id=s.chat_id
-                WHERE s.creator_account_id=? AND s.agent_installation_id=?
-                  AND s.agent_stream_id=? AND s.snapshot_id=? AND s.is_tombstone=0
-                  AND t.entity_id IS NULL
-                  AND (
-                      c.chat_id IS NULL OR (
-                          c.is_deleted=0 AND c.content_hash<>s.content_hash AND (
-                              (c.record_kind='placeholder' AND s.record_kind='full') OR
-                              (c.record_kind='full' AND s.record_kind='full'
-                               AND s.upstream_updated_at>c.upstream_updated_at)
-                          )
-                      )
-                  )""",
-            scope,
-        )
-        changed_chat_count = int(
-            connection.execute("SELECT COUNT(*) FROM snapshot_changed_chats").fetchone()[0]
-        )
-
-        chat_tombstones = connection.execute(
-            """INSERT OR IGNORE INTO entity_tombstones(
-                   creator_account_id,entity_kind,entity_id,chat_id,stream_epoch,
-                   source_seq,event_id,deleted_at
-               )
-               SELECT ?, 'chat', chat_id, chat_id, ?, ?, NULL, ?
-                 FROM snapshot_chat_records
-                WHERE creator_account_id=? AND agent_installation_id=?
-                  AND agent_stream_id=? AND snapshot_id=? AND is_tombstone=1""",
-            (account_id, epoch, source_seq, now, *scope),
-        ).rowcount
-        connection.execute(
-            """UPDATE account_chats SET is_deleted=1,updated_at=?
-                WHERE creator_account_id=? AND chat_id IN (
-                    SELECT chat_id FROM snapshot_chat_records
-                     WHERE creator_account_id=? AND agent_installation_id=?
-                       AND agent_stream_id=? AND snapshot_id=? AND is_tombstone=1
-                )""",
-            (now, account_id, *scope),
-        )
-        connection.execute(
-            """UPDATE account_messages SET is_deleted=1,updated_at=?
-                WHERE creator_account_id=? AND chat_id IN (
-                    SELECT chat_id FROM snapshot_chat_records
-                     WHERE creator_account_id=? AND agent_installation_id=?
-                       AND agent_stream_id=? AND snapshot_id=? AND is_tombstone=1
-                )""",
-            (now, account_id, *scope),
-        )
-        connection.execute(
-            """INSERT INTO account_chats(
-                   creator_account_id,chat_id,record_kind,platform_user_id,display_name,
-                   upstream_updated_at,content_hash,winning_stream_epoch,winning_source_seq,
-                   winning_event_id,is_deleted,updated_at
-               )
-               SELECT ?,s.chat_id,s.record_kind,s.platform_user_id,s.display_name,
-                      s.upstream_updated_at,s.content_hash,?,?,NULL,0,?
-                 FROM snapshot_chat_records s
-                 JOIN snapshot_changed_chats x ON x.chat_id=s.chat_id
-                WHERE s.creator_account_id=? AND s.agent_installation_id=?
-                  AND s.agent_stream_id=? AND s.snapshot_id=?
-               ON CONFLICT(creator_account_id,chat_id) DO UPDATE SET
-                   record_kind=excluded.record_kind,
-                   platform_user_id=excluded.platform_user_id,
-                   display_name=excluded.display_name,
-                   upstream_updated_at=excluded.upstream_updated_at,
-                   content_hash=excluded.content_hash,
-                   winning_stream_epoch=excluded.winning_stream_epoch,
-                   winning_source_seq=excluded.winning_source_seq,
-                   winning_event_id=NULL,is_deleted=0,updated_at=excluded.updated_at""",
-            (account_id, epoch, source_seq, now, *scope),
-        )
-
-        coverage_invalidated = connection.execute(
-            """UPDATE coverage_generations
-                  SET state='superseded',reason_code='new_conversation_discovered'
-                WHERE creator_account_id=? AND state='complete'
-                  AND generation_id=(
-                      SELECT active_generation_id FROM account_coverage_heads
-                       WHERE creator_account_id=?
-                  )
-                  AND EXISTS (
-                      SELECT 1 FROM snapshot_changed_chats x
-                       WHERE NOT EXISTS (
-                           SELECT 1 FROM coverage_members m
-                            WHERE m.creator_account_id=?
-                              AND m.generation_id=coverage_generations.generation_id
-                              AND m.conversation_id=x.chat_id
-                       )
-                  )""",
-            (account_id, account_id, account_id),
-        ).rowcount
-        if coverage_invalidated:
-            connection.execute(
-                """UPDATE account_coverage_heads
-                      SET coverage_revision=coverage_revision+1,updated_at=?
-                    WHERE creator_account_id=?""",
-                (now, account_id),
-            )
-
-        tombstone_parent_conflict = connection.execute(
-            """SELECT 1
-                 FROM snapshot_message_records s
-                 JOIN account_messages m
-                   ON m.creator_account_id=s.creator_account_id AND m.message_id=s.message_id
-                WHERE s.creator_account_id=? AND s.agent_installation_id=?
-                  AND s.agent_stream_id=? AND s.snapshot_id=? AND s.is_tombstone=1
-                  AND m.chat_id<>s.chat_id LIMIT 1""",
-            scope,
+    @staticmethod
+    def _staged_message_checks(
+        connection: sqlite3.Connection,
+        scope: tuple[str, str, str, str],
+        window: tuple[str | None, ...],
+        merge_epoch: int,
+    ) -> None:
+        """Reject incomplete, orphaned or conflicting staged messages."""
+        invalid = connection.execute(
+            f"""SELECT 1 FROM snapshot_message_records s
+               WHERE s.creator_account_id=? AND s.agent_installation_id=?
+                 AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.message_id')}
+                 AND (s.is_tombstone IS NULL OR (
+                     s.is_tombstone=0 AND (
+                         s.sender_platform_user_id IS NULL OR s.text IS NULL
+                         OR s.sent_at IS NULL OR s.direction IS NULL
+                         OR s.content_hash IS NULL
+                     )
+                 )) LIMIT 1""",
+            (*scope, *window),
         ).fetchone()
-        prior_tombstone_conflict = connection.execute(
-            """SELECT 1
+        if invalid is not None:
+            raise InvariantViolation("snapshot staging material is incomplete or obsolete")
+        tombstone_conflict = connection.execute(
+            f"""SELECT 1
                  FROM snapshot_message_records s
-                 JOIN entity_tombstones t
+                 LEFT JOIN account_messages m
+                   ON m.creator_account_id=s.creator_account_id AND m.message_id=s.message_id
+                  AND {merge_visible('m')}
+                 LEFT JOIN entity_tombstones t
                    ON t.creator_account_id=s.creator_account_id
                   AND t.entity_kind='message' AND t.entity_id=s.message_id
                 WHERE s.creator_account_id=? AND s.agent_installation_id=?
-                  AND s.agent_stream_id=? AND s.snapshot_id=? AND s.is_tombstone=1
-                  AND t.chat_id<>s.chat_id LIMIT 1""",
-            scope,
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.message_id')}
+                  AND s.is_tombstone=1 AND (m.chat_id<>s.chat_id OR t.chat_id<>s.chat_id)
+                LIMIT 1""",
+            (*scope, *window),
         ).fetchone()
-        if tombstone_parent_conflict is not None or prior_tombstone_conflict is not None:
+        if tombstone_conflict is not None:
             raise InvariantViolation("message tombstone conflicts with canonical conversation")
-
+        # The chat phase has already recorded this snapshot's chat tombstones,
+        # so a message inside a chat the snapshot deletes is an orphan too.
         orphan = connection.execute(
-            """SELECT 1
+            f"""SELECT 1
                  FROM snapshot_message_records s
                  LEFT JOIN entity_tombstones t
                    ON t.creator_account_id=s.creator_account_id
                   AND t.entity_kind='message' AND t.entity_id=s.message_id
                  LEFT JOIN account_chats c
                    ON c.creator_account_id=s.creator_account_id AND c.chat_id=s.chat_id
+                 LEFT JOIN snapshot_merge_actions a
+                   ON a.creator_account_id=s.creator_account_id AND a.merge_epoch=?
+                  AND a.entity_kind='chat' AND a.entity_id=s.chat_id AND a.action='tombstone'
                 WHERE s.creator_account_id=? AND s.agent_installation_id=?
-                  AND s.agent_stream_id=? AND s.snapshot_id=? AND s.is_tombstone=0
-                  AND t.entity_id IS NULL AND (c.chat_id IS NULL OR c.is_deleted=1)
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.message_id')}
+                  AND s.is_tombstone=0 AND t.entity_id IS NULL
+                  AND (
+                      c.chat_id IS NULL OR c.is_deleted=1 OR a.entity_id IS NOT NULL
+                      OR NOT ({merge_visible('c')} OR c.merge_epoch=?)
+                  )
                 LIMIT 1""",
-            scope,
+            (merge_epoch, *scope, *window, merge_epoch),
         ).fetchone()
         if orphan is not None:
             raise InvariantViolation("message references an unknown or deleted chat")
         immutable_conflict = connection.execute(
-            """SELECT 1
+            f"""SELECT 1
                  FROM snapshot_message_records s
                  JOIN account_messages m
                    ON m.creator_account_id=s.creator_account_id AND m.message_id=s.message_id
@@ -885,62 +962,145 @@ class HistoryRepository:
                    ON t.creator_account_id=s.creator_account_id
                   AND t.entity_kind='message' AND t.entity_id=s.message_id
                 WHERE s.creator_account_id=? AND s.agent_installation_id=?
-                  AND s.agent_stream_id=? AND s.snapshot_id=? AND s.is_tombstone=0
-                  AND t.entity_id IS NULL AND m.is_deleted=0 AND m.content_hash<>s.content_hash
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.message_id')}
+                  AND s.is_tombstone=0 AND t.entity_id IS NULL AND {merge_visible('m')}
+                  AND m.is_deleted=0 AND m.content_hash<>s.content_hash
                 LIMIT 1""",
-            scope,
+            (*scope, *window),
         ).fetchone()
         if immutable_conflict is not None:
             raise InvariantViolation("immutable message identifier has conflicting content")
 
-        message_inserts = connection.execute(
-            """INSERT INTO account_messages(
-                   creator_account_id,message_id,chat_id,sender_platform_user_id,text,sent_at,
-                   direction,upstream_updated_at,content_hash,winning_stream_epoch,
-                   winning_source_seq,winning_event_id,is_deleted,updated_at
+    @classmethod
+    def _merge_chat_slice(
+        cls,
+        connection: sqlite3.Connection,
+        scope: tuple[str, str, str, str],
+        window: tuple[str | None, ...],
+        merge_epoch: int,
+        now: str,
+    ) -> int:
+        """Check one chat window, record its updates/tombstones, stage new chats."""
+        cls._staged_chat_checks(connection, scope, window)
+        connection.execute(
+            f"""INSERT OR IGNORE INTO snapshot_merge_actions(
+                   creator_account_id,merge_epoch,entity_kind,entity_id,chat_id,action
                )
-               SELECT ?,s.message_id,s.chat_id,s.sender_platform_user_id,s.text,s.sent_at,
-                      s.direction,s.upstream_updated_at,s.content_hash,?,?,NULL,0,?
-                 FROM snapshot_message_records s
-                 LEFT JOIN account_messages m
-                   ON m.creator_account_id=s.creator_account_id AND m.message_id=s.message_id
+               SELECT s.creator_account_id,?,'chat',s.chat_id,s.chat_id,'tombstone'
+                 FROM snapshot_chat_records s
+                WHERE s.creator_account_id=? AND s.agent_installation_id=?
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.chat_id')}
+                  AND s.is_tombstone=1""",
+            (merge_epoch, *scope, *window),
+        )
+        connection.execute(
+            f"""INSERT OR IGNORE INTO snapshot_merge_actions(
+                   creator_account_id,merge_epoch,entity_kind,entity_id,chat_id,action
+               )
+               SELECT s.creator_account_id,?,'chat',s.chat_id,s.chat_id,'update'
+                 FROM snapshot_chat_records s
+                 JOIN account_chats c
+                   ON c.creator_account_id=s.creator_account_id AND c.chat_id=s.chat_id
                  LEFT JOIN entity_tombstones t
                    ON t.creator_account_id=s.creator_account_id
-                  AND t.entity_kind='message' AND t.entity_id=s.message_id
+                  AND t.entity_kind='chat' AND t.entity_id=s.chat_id
                 WHERE s.creator_account_id=? AND s.agent_installation_id=?
-                  AND s.agent_stream_id=? AND s.snapshot_id=? AND s.is_tombstone=0
-                  AND m.message_id IS NULL AND t.entity_id IS NULL""",
-            (account_id, epoch, source_seq, now, *scope),
-        ).rowcount
-        message_tombstones = connection.execute(
-            """INSERT OR IGNORE INTO entity_tombstones(
-                   creator_account_id,entity_kind,entity_id,chat_id,stream_epoch,
-                   source_seq,event_id,deleted_at
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.chat_id')}
+                  AND s.is_tombstone=0 AND t.entity_id IS NULL AND {merge_visible('c')}
+                  AND c.is_deleted=0 AND c.content_hash<>s.content_hash AND (
+                      (c.record_kind='placeholder' AND s.record_kind='full') OR
+                      (c.record_kind='full' AND s.record_kind='full'
+                       AND s.upstream_updated_at>c.upstream_updated_at)
+                  )""",
+            (merge_epoch, *scope, *window),
+        )
+        return connection.execute(
+            f"""INSERT INTO account_chats(
+                   creator_account_id,chat_id,record_kind,platform_user_id,display_name,
+                   upstream_updated_at,content_hash,winning_stream_epoch,winning_source_seq,
+                   winning_event_id,is_deleted,updated_at,merge_epoch
                )
-               SELECT ?, 'message', message_id, chat_id, ?, ?, NULL, ?
-                 FROM snapshot_message_records
-                WHERE creator_account_id=? AND agent_installation_id=?
-                  AND agent_stream_id=? AND snapshot_id=? AND is_tombstone=1""",
-            (account_id, epoch, source_seq, now, *scope),
+               SELECT s.creator_account_id,s.chat_id,s.record_kind,s.platform_user_id,
+                      s.display_name,s.upstream_updated_at,s.content_hash,
+                      e.stream_epoch,u.through_seq,NULL,0,?,?
+                 FROM snapshot_chat_records s
+                 JOIN snapshot_uploads u
+                   ON u.creator_account_id=s.creator_account_id
+                  AND u.agent_installation_id=s.agent_installation_id
+                  AND u.agent_stream_id=s.agent_stream_id
+                  AND u.snapshot_id=s.snapshot_id
+                 JOIN stream_epochs e
+                   ON e.creator_account_id=s.creator_account_id
+                  AND e.agent_installation_id=s.agent_installation_id
+                  AND e.agent_stream_id=s.agent_stream_id
+                 LEFT JOIN account_chats c
+                   ON c.creator_account_id=s.creator_account_id AND c.chat_id=s.chat_id
+                 LEFT JOIN entity_tombstones t
+                   ON t.creator_account_id=s.creator_account_id
+                  AND t.entity_kind='chat' AND t.entity_id=s.chat_id
+                WHERE s.creator_account_id=? AND s.agent_installation_id=?
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.chat_id')}
+                  AND s.is_tombstone=0 AND c.chat_id IS NULL AND t.entity_id IS NULL""",
+            (now, merge_epoch, *scope, *window),
         ).rowcount
+
+    @classmethod
+    def _merge_message_slice(
+        cls,
+        connection: sqlite3.Connection,
+        scope: tuple[str, str, str, str],
+        window: tuple[str | None, ...],
+        merge_epoch: int,
+        now: str,
+    ) -> int:
+        """Check one message window, record its tombstones, stage new messages."""
+        cls._staged_message_checks(connection, scope, window, merge_epoch)
         connection.execute(
-            """UPDATE account_messages SET is_deleted=1,updated_at=?
-                WHERE creator_account_id=? AND message_id IN (
-                    SELECT message_id FROM snapshot_message_records
-                     WHERE creator_account_id=? AND agent_installation_id=?
-                       AND agent_stream_id=? AND snapshot_id=? AND is_tombstone=1
-                )""",
-            (now, account_id, *scope),
-        )
-        return any(
-            (
-                changed_chat_count,
-                chat_tombstones,
-                coverage_invalidated,
-                message_inserts,
-                message_tombstones,
-            )
+            f"""INSERT OR IGNORE INTO snapshot_merge_actions(
+                   creator_account_id,merge_epoch,entity_kind,entity_id,chat_id,action
+               )
+               SELECT s.creator_account_id,?,'message',s.message_id,s.chat_id,'tombstone'
+                 FROM snapshot_message_records s
+                WHERE s.creator_account_id=? AND s.agent_installation_id=?
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.message_id')}
+                  AND s.is_tombstone=1""",
+            (merge_epoch, *scope, *window),
         )
+        return connection.execute(
+            f"""INSERT INTO account_messages(
+                   creator_account_id,message_id,chat_id,sender_platform_user_id,text,
+                   sent_at,direction,upstream_updated_at,content_hash,
+                   winning_stream_epoch,winning_source_seq,winning_event_id,
+                   is_deleted,updated_at,merge_epoch
+               )
+               SELECT s.creator_account_id,s.message_id,s.chat_id,
+                      s.sender_platform_user_id,s.text,s.sent_at,s.direction,
+                      s.upstream_updated_at,s.content_hash,
+                      e.stream_epoch,u.through_seq,NULL,0,?,?
+                 FROM snapshot_message_records s
+                 JOIN snapshot_uploads u
+                   ON u.creator_account_id=s.creator_account_id
+                  AND u.agent_installation_id=s.agent_installation_id
+                  AND u.agent_stream_id=s.agent_stream_id
+                  AND u.snapshot_id=s.snapshot_id
+                 JOIN stream_epochs e
+                   ON e.creator_account_id=s.creator_account_id
+                  AND e.agent_installation_id=s.agent_installation_id
+                  AND e.agent_stream_id=s.agent_stream_id
+                 JOIN account_chats c
+                   ON c.creator_account_id=s.creator_account_id AND c.chat_id=s.chat_id
+                  AND c.is_deleted=0 AND ({merge_visible('c')} OR c.merge_epoch=?)
+                 LEFT JOIN account_messages m
+                   ON m.creator_account_id=s.creator_account_id
+                  AND m.message_id=s.message_id
+                 LEFT JOIN entity_tombstones t
+                   ON t.creator_account_id=s.creator_account_id
+                  AND t.entity_kind='message' AND t.entity_id=s.message_id
+                WHERE s.creator_account_id=? AND s.agent_installation_id=?
+                  AND s.agent_stream_id=? AND s.snapshot_id=? AND {_window('s.message_id')}
+                  AND s.is_tombstone=0 AND m.message_id IS NULL AND t.entity_id IS NULL""",
+            (now, merge_epoch, merge_epoch, *scope, *window),
+        ).rowcount
 
     def _record_entity_conflict(
         self,
@@ -1075,153 +1235,658 @@ class HistoryRepository:
             )
 
     def commit_snapshot(self, key: StreamKey, payload: Any) -> IngestResult:
+        """Merge a staged snapshot in bounded slices, then publish it atomically.
+
+        Each slice is its own short write transaction, so live deltas and
+        projection catch-up interleave with a large merge instead of waiting
+        behind it. Progress is durable in ``snapshot_merges``; the open merge
+        is owned through a renewable lease, and a replayed commit resumes from
+        the recorded cursor once no other live worker holds it.
+        """
+        self._require_stream_identity(key, payload)
+        snapshot_id = str(payload.snapshot_id)
+        outcome = self._drive_snapshot_merge(key, snapshot_id, int(payload.chunk_count))
+        self.complete_snapshot_merges(key.creator_account_id)
+        return outcome
+
+    def _drive_snapshot_merge(
+        self, key: StreamKey, snapshot_id: str, chunk_count: int
+    ) -> IngestResult:
+        owner = uuid4().hex
         try:
-            return self._commit_snapshot(key, payload)
+            outcome, merge_epoch = self._open_snapshot_merge(
+                key, snapshot_id, chunk_count, owner
+            )
+            if outcome is not None:
+                return outcome
+            while self._merge_snapshot_slice(key, snapshot_id, merge_epoch, owner):
+                time.sleep(0)
+            return self._publish_snapshot_merge(
+                key, snapshot_id, chunk_count, merge_epoch, owner
+            )
         except InvariantViolation as error:
-            self._record_snapshot_conflicts(key, str(payload.snapshot_id), str(error))
+            self._abort_snapshot_merge(key.creator_account_id, owner)
+            self._record_snapshot_conflicts(key, snapshot_id, str(error))
+            raise
+        except sqlite3.IntegrityError:
+            self._abort_snapshot_merge(key.creator_account_id, owner)
+            raise
+        except BaseException:
+            # Keep the durable cursor, but let a retry take the merge over now.
+            self._release_snapshot_merge(key.creator_account_id, owner)
             raise
 
-    def _commit_snapshot(self, key: StreamKey, payload: Any) -> IngestResult:
-        self._require_stream_identity(key, payload)
-        now = _iso(utc_now())
-        with self.database.transaction() as connection:
-            upload = connection.execute(
-                """SELECT through_seq,chunk_count,next_chunk_index,expected_chats,expected_messages,
-                          expected_coverage_evidence,received_chats,received_messages,
-                          received_coverage_evidence,state,starting_checkpoint
-                   FROM snapshot_uploads WHERE creator_account_id=? AND agent_installation_id=?
-                     AND agent_stream_id=? AND snapshot_id=?""",
-                (*key.sql(), str(payload.snapshot_id)),
-            ).fetchone()
-            checkpoint = self._current_checkpoint(connection, key) or 0
-            if upload is None:
-                return IngestResult("rejected", checkpoint, snapshot_id=payload.snapshot_id,
-                                    code="snapshot_incomplete", detail="snapshot begin is missing")
-            if int(payload.chunk_count) != int(upload[1]):
-                return IngestResult("rejected", checkpoint, snapshot_id=payload.snapshot_id,
-                                    next_expected_chunk_index=int(upload[2]), code="chunk_conflict",
-                                    detail="snapshot commit chunk_count conflicts with begin")
-            if upload[9] == "committed":
-                return IngestResult("duplicate", checkpoint, snapshot_id=payload.snapshot_id,
-                                    next_expected_chunk_index=int(upload[2]), snapshot_committed=True)
-            current_checkpoint = self._current_checkpoint(connection, key)
-            if current_checkpoint != upload[10]:
-                return IngestResult(
-                    "rejected",
-                    0 if current_checkpoint is None else current_checkpoint,
-                    snapshot_id=payload.snapshot_id,
-                    next_expected_chunk_index=int(upload[2]),
-                    code="invariant_failed",
-                    detail="stream checkpoint changed while snapshot was staged",
-                )
-            if (
-                int(upload[1]) != int(upload[2])
-                or int(upload[3]) != int(upload[6])
-                or int(upload[4]) != int(upload[7])
-                or int(upload[5]) != int(upload[8])
-            ):
-                return IngestResult("rejected", checkpoint, snapshot_id=payload.snapshot_id,
-                                    next_expected_chunk_index=int(upload[2]), code="snapshot_incomplete",
-                                    detail="snapshot chunks or record counts are incomplete")
-            through_seq = int(upload[0])
-            if through_seq < checkpoint:
-                return IngestResult("rejected", checkpoint, snapshot_id=payload.snapshot_id,
-                                    code="invariant_failed", detail="snapshot through_seq is behind checkpoint")
-            epoch = self._ensure_stream(connection, key, now)
-            changed = self._merge_staged_snapshot_entities(
-                connection,
-                key,
-                str(payload.snapshot_id),
-                epoch=epoch,
-                source_seq=through_seq,
-                now=now,
+    def _snapshot_commit_preflight(
+        self,
+        connection: sqlite3.Connection,
+        key: StreamKey,
+        snapshot_id: str,
+        chunk_count: int,
+    ) -> tuple[IngestResult | None, Any]:
+        upload = connection.execute(
+            """SELECT through_seq,chunk_count,next_chunk_index,expected_chats,expected_messages,
+                      expected_coverage_evidence,received_chats,received_messages,
+                      received_coverage_evidence,state,starting_checkpoint
+               FROM snapshot_uploads WHERE creator_account_id=? AND agent_installation_id=?
+                 AND agent_stream_id=? AND snapshot_id=?""",
+            (*key.sql(), snapshot_id),
+        ).fetchone()
+        checkpoint = self._current_checkpoint(connection, key) or 0
+        snapshot_uuid = UUID(snapshot_id)
+        if upload is None:
+            return IngestResult("rejected", checkpoint, snapshot_id=snapshot_uuid,
+                                code="snapshot_incomplete", detail="snapshot begin is missing"), None
+        if chunk_count != int(upload[1]):
+            return IngestResult("rejected", checkpoint, snapshot_id=snapshot_uuid,
+                                next_expected_chunk_index=int(upload[2]), code="chunk_conflict",
+                                detail="snapshot commit chunk_count conflicts with begin"), upload
+        if upload[9] == "committed":
+            return IngestResult("duplicate", checkpoint, snapshot_id=snapshot_uuid,
+                                next_expected_chunk_index=int(upload[2]), snapshot_committed=True), upload
+        current_checkpoint = self._current_checkpoint(connection, key)
+        if current_checkpoint != upload[10]:
+            return IngestResult(
+                "rejected",
+                0 if current_checkpoint is None else current_checkpoint,
+                snapshot_id=snapshot_uuid,
+                next_expected_chunk_index=int(upload[2]),
+                code="invariant_failed",
+                detail="stream checkpoint changed while snapshot was staged",
+            ), upload
+        if (
+            int(upload[1]) != int(upload[2])
+            or int(upload[3]) != int(upload[6])
+            or int(upload[4]) != int(upload[7])
+            or int(upload[5]) != int(upload[8])
+        ):
+            return IngestResult("rejected", checkpoint, snapshot_id=snapshot_uuid,
+                                next_expected_chunk_index=int(upload[2]), code="snapshot_incomplete",
+                                detail="snapshot chunks or record counts are incomplete"), upload
+        if int(upload[0]) < checkpoint:
+            return IngestResult("rejected", checkpoint, snapshot_id=snapshot_uuid,
+                                code="invariant_failed", detail="snapshot through_seq is behind checkpoint"), upload
+        return None, upload
+
+    def _merge_lease(self, now: datetime) -> str:
+        return _iso(now + timedelta(seconds=self.merge_lease_seconds))
+
+    @staticmethod
+    def _merge_busy(connection: sqlite3.Connection, key: StreamKey, snapshot_id: str) -> IngestResult:
+        return IngestResult(
+            "rejected",
+            HistoryRepository._current_checkpoint(connection, key) or 0,
+            snapshot_id=UUID(snapshot_id),
+            code="invariant_failed",
+            retryable=True,
+            detail="another worker holds this account's snapshot merge",
+        )
+
+    def _open_snapshot_merge(
+        self, key: StreamKey, snapshot_id: str, chunk_count: int, owner: str
+    ) -> tuple[IngestResult | None, int]:
+        """Take over this upload's merge or start one under a fresh merge epoch."""
+        now = utc_now()
+        stamp = _iso(now)
+        account_id = key.creator_account_id
+        scope = (*key.sql(), snapshot_id)
+        with self.database.transaction() as connection:
+            outcome, _upload = self._snapshot_commit_preflight(
+                connection, key, snapshot_id, chunk_count
+            )
+            current = connection.execute(
+                """SELECT merge_epoch,agent_installation_id,agent_stream_id,snapshot_id,
+                          lease_expires_at
+                   FROM snapshot_merges WHERE creator_account_id=? AND state='merging'""",
+                (account_id,),
+            ).fetchone()
+            if current is not None and current[4] is not None and (
+                datetime.fromisoformat(str(current[4])) > now
+            ):
+                return outcome or self._merge_busy(connection, key, snapshot_id), 0
+            if current is not None and (
+                outcome is not None or tuple(current[1:4]) != scope[1:]
+            ):
+                # The lease lapsed: its worker is gone and the staged rows are void.
+                self._discard_snapshot_merge(connection, account_id, int(current[0]), stamp)
+                current = None
+            if outcome is not None:
+                return outcome, 0
+            if current is not None:
+                connection.execute(
+                    """UPDATE snapshot_merges SET owner=?,lease_expires_at=?,updated_at=?
+                       WHERE creator_account_id=? AND merge_epoch=?""",
+                    (owner, self._merge_lease(now), stamp, account_id, int(current[0])),
+                )
+                return None, int(current[0])
+            merge_epoch = int(
+                connection.execute(
+                    """SELECT COALESCE(MAX(merge_epoch),0)+1 FROM snapshot_merges
+                       WHERE creator_account_id=?""",
+                    (account_id,),
+                ).fetchone()[0]
+            )
+            connection.execute(
+                """INSERT INTO snapshot_merges(
+                       creator_account_id,merge_epoch,agent_installation_id,agent_stream_id,
+                       snapshot_id,state,phase,cursor,owner,lease_expires_at,started_at,updated_at
+                   ) VALUES (?,?,?,?,?,'merging','chats',NULL,?,?,?,?)""",
+                (account_id, merge_epoch, *scope[1:], owner, self._merge_lease(now), stamp, stamp),
+            )
+            return None, merge_epoch
+
+    def _slice_upper(
+        self,
+        connection: sqlite3.Connection,
+        table: str,
+        column: str,
+        where: str,
+        params: tuple[Any, ...],
+        cursor: str | None,
+    ) -> str | None:
+        """Upper key of the next keyset window, or None when it reaches the end."""
+        bound = connection.execute(
+            f"""SELECT {column} FROM {table}
+                WHERE {where} AND (? IS NULL OR {column}>?)
+                ORDER BY {column} LIMIT 1 OFFSET ?""",
+            (*params, cursor, cursor, self.merge_slice_rows - 1),
+        ).fetchone()
+        return None if bound is None else str(bound[0])
+
+    def _merge_snapshot_slice(
+        self, key: StreamKey, snapshot_id: str, merge_epoch: int, owner: str
+    ) -> bool:
+        """Check and stage one bounded window; return whether more remain.
+
+        Slices only insert entities absent from canonical state, tagged with
+        ``merge_epoch`` so readers ignore them until the merge publishes.
+        Updates and tombstones are recorded as merge actions for the publish
+        transaction. Each slice renews the owner's lease.
+        """
+        now = utc_now()
+        stamp = _iso(now)
+        account_id = key.creator_account_id
+        scope = (*key.sql(), snapshot_id)
+        with self.database.transaction() as connection:
+            row = connection.execute(
+                """SELECT phase,cursor FROM snapshot_merges
+                   WHERE creator_account_id=? AND merge_epoch=? AND state='merging'
+                     AND owner=?""",
+                (account_id, merge_epoch, owner),
+            ).fetchone()
+            if row is None or row[0] not in {"chats", "messages"}:
+                return False
+            phase, cursor = str(row[0]), row[1]
+            table, id_column = (
+                ("snapshot_chat_records", "chat_id")
+                if phase == "chats"
+                else ("snapshot_message_records", "message_id")
+            )
+            upper = self._slice_upper(
+                connection,
+                table,
+                id_column,
+                """creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
+                   AND snapshot_id=?""",
+                scope,
+                cursor,
+            )
+            window = (cursor, cursor, upper, upper)
+            if phase == "chats":
+                written = self._merge_chat_slice(connection, scope, window, merge_epoch, stamp)
+                next_phase = "chats" if upper is not None else "messages"
+            else:
+                written = self._merge_message_slice(connection, scope, window, merge_epoch, stamp)
+                next_phase = "messages" if upper is not None else "publish"
+            counter = "merged_chats" if phase == "chats" else "merged_messages"
+            connection.execute(
+                f"""UPDATE snapshot_merges
+                       SET phase=?,cursor=?,{counter}={counter}+?,
+                           slice_count=slice_count+1,lease_expires_at=?,updated_at=?
+                     WHERE creator_account_id=? AND merge_epoch=?""",
+                (next_phase, upper, written, self._merge_lease(now), stamp,
+                 account_id, merge_epoch),
+            )
+            return next_phase != "publish"
+
+    def _publish_snapshot_merge(
+        self,
+        key: StreamKey,
+        snapshot_id: str,
+        chunk_count: int,
+        merge_epoch: int,
+        owner: str,
+    ) -> IngestResult:
+        """Flip a fully sliced merge visible and apply its recorded actions.
+
+        The transaction is bounded by the snapshot's chat updates, tombstones
+        and coverage evidence, not by its message count. Stream membership,
+        staging cleanup and settling follow in resumable slices.
+        """
+        now = _iso(utc_now())
+        account_id = key.creator_account_id
+        scope = (*key.sql(), snapshot_id)
+        actions = (account_id, merge_epoch)
+        with self.database.transaction() as connection:
+            merge = connection.execute(
+                """SELECT phase,owner,merged_chats,merged_messages FROM snapshot_merges
+                   WHERE creator_account_id=? AND merge_epoch=? AND state='merging'""",
+                actions,
+            ).fetchone()
+            if merge is None or merge[1] != owner or merge[0] != "publish":
+                return self._merge_busy(connection, key, snapshot_id)
+            self.database.note_bulk_write(int(merge[2]) + int(merge[3]))
+            outcome, upload = self._snapshot_commit_preflight(
+                connection, key, snapshot_id, chunk_count
+            )
+            if outcome is not None:
+                self._discard_snapshot_merge(connection, account_id, merge_epoch, now)
+                return outcome
+            through_seq = int(upload[0])
+            epoch = self._ensure_stream(connection, key, now)
+            # Publishing first makes this epoch's staged chats visible to the
+            # coverage evidence applied below.
+            connection.execute(
+                """UPDATE snapshot_merges
+                      SET state='published',phase='chat_membership',cursor=NULL,
+                          owner=NULL,lease_expires_at=NULL,updated_at=?,published_at=?
+                    WHERE creator_account_id=? AND merge_epoch=?""",
+                (now, now, *actions),
+            )
+            updated_chats = connection.execute(
+                """INSERT INTO account_chats(
+                       creator_account_id,chat_id,record_kind,platform_user_id,display_name,
+                       upstream_updated_at,content_hash,winning_stream_epoch,winning_source_seq,
+                       winning_event_id,is_deleted,updated_at
+                   )
+                   SELECT s.creator_account_id,s.chat_id,s.record_kind,s.platform_user_id,
+                          s.display_name,s.upstream_updated_at,s.content_hash,?,?,NULL,0,?
+                     FROM snapshot_merge_actions a
+                     JOIN snapshot_chat_records s
+                       ON s.creator_account_id=a.creator_account_id AND s.chat_id=a.entity_id
+                    WHERE a.creator_account_id=? AND a.merge_epoch=? AND a.entity_kind='chat'
+                      AND a.action='update' AND s.agent_installation_id=?
+                      AND s.agent_stream_id=? AND s.snapshot_id=?
+                   ON CONFLICT(creator_account_id,chat_id) DO UPDATE SET
+                       record_kind=excluded.record_kind,
+                       platform_user_id=excluded.platform_user_id,
+                       display_name=excluded.display_name,
+                       upstream_updated_at=excluded.upstream_updated_at,
+                       content_hash=excluded.content_hash,
+                       winning_stream_epoch=excluded.winning_stream_epoch,
+                       winning_source_seq=excluded.winning_source_seq,
+                       winning_event_id=NULL,is_deleted=0,updated_at=excluded.updated_at
+                   WHERE account_chats.is_deleted=0
+                     AND account_chats.content_hash<>excluded.content_hash AND (
+                         (account_chats.record_kind='placeholder' AND excluded.record_kind='full')
+                         OR (account_chats.record_kind='full' AND excluded.record_kind='full'
+                             AND excluded.upstream_updated_at>account_chats.upstream_updated_at)
+                     )""",
+                (epoch, through_seq, now, *actions, *scope[1:]),
+            ).rowcount
+            tombstones = 0
+            for kind in ("chat", "message"):
+                tombstones += connection.execute(
+                    """INSERT OR IGNORE INTO entity_tombstones(
+                           creator_account_id,entity_kind,entity_id,chat_id,stream_epoch,
+                           source_seq,event_id,deleted_at
+                       )
+                       SELECT creator_account_id,entity_kind,entity_id,chat_id,?,?,NULL,?
+                         FROM snapshot_merge_actions
+                        WHERE creator_account_id=? AND merge_epoch=? AND entity_kind=?
+                          AND action='tombstone'""",
+                    (epoch, through_seq, now, *actions, kind),
+                ).rowcount
+            connection.execute(
+                """UPDATE account_chats SET is_deleted=1,updated_at=?
+                    WHERE creator_account_id=? AND chat_id IN (
+                        SELECT entity_id FROM snapshot_merge_actions
+                         WHERE creator_account_id=? AND merge_epoch=? AND entity_kind='chat'
+                           AND action='tombstone'
+                    )""",
+                (now, account_id, *actions),
             )
+            connection.execute(
+                """UPDATE account_messages SET is_deleted=1,updated_at=?
+                    WHERE creator_account_id=? AND (
+                        chat_id IN (
+                            SELECT entity_id FROM snapshot_merge_actions
+                             WHERE creator_account_id=? AND merge_epoch=?
+                               AND entity_kind='chat' AND action='tombstone'
+                        ) OR message_id IN (
+                            SELECT entity_id FROM snapshot_merge_actions
+                             WHERE creator_account_id=? AND merge_epoch=?
+                               AND entity_kind='message' AND action='tombstone'
+                        )
+                    )""",
+                (now, account_id, *actions, *actions),
+            )
+            coverage_invalidated = connection.execute(
+                """UPDATE coverage_generations
+                      SET state='superseded',reason_code='new_conversation_discovered'
+                    WHERE creator_account_id=? AND state='complete'
+                      AND generation_id=(
+                          SELECT active_generation_id FROM account_coverage_heads
+                           WHERE creator_account_id=?
+                      )
+                      AND EXISTS (
+                          SELECT 1 FROM (
+                              SELECT chat_id FROM account_chats
+                               WHERE creator_account_id=? AND merge_epoch=?
+                              UNION ALL
+                              SELECT entity_id FROM snapshot_merge_actions
+                               WHERE creator_account_id=? AND merge_epoch=?
+                                 AND entity_kind='chat' AND action='update'
+                          ) x
+                          WHERE NOT EXISTS (
+                              SELECT 1 FROM coverage_members m
+                               WHERE m.creator_account_id=?
+                                 AND m.generation_id=coverage_generations.generation_id
+                                 AND m.conversation_id=x.chat_id
+                          )
+                      )""",
+                (account_id, account_id, *actions, *actions, account_id),
+            ).rowcount
+            if coverage_invalidated:
+                connection.execute(
+                    """UPDATE account_coverage_heads
+                          SET coverage_revision=coverage_revision+1,updated_at=?
+                        WHERE creator_account_id=?""",
+                    (now, account_id),
+                )
             coverage_changed = False
             for row in connection.execute(
                 """SELECT record_json FROM snapshot_coverage_records
                    WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
                      AND snapshot_id=? ORDER BY chunk_index,record_index""",
-                (*key.sql(), str(payload.snapshot_id)),
+                scope,
             ):
                 evidence = json.loads(row[0])
-                coverage_changed |= self._apply_coverage(
-                    connection, key.creator_account_id, evidence, now
+                coverage_changed |= self._apply_coverage(connection, account_id, evidence, now)
+            changed = any(
+                (
+                    merge[2],
+                    merge[3],
+                    updated_chats,
+                    tombstones,
+                    coverage_invalidated,
+                    coverage_changed,
                 )
-            changed |= coverage_changed
+            )
             revision = None
             if changed:
-                revision = self._canonical_revision(connection, key.creator_account_id, now)
+                revision = self._canonical_revision(connection, account_id, now)
                 connection.execute(
                     """INSERT INTO projection_work(
                            creator_account_id,canonical_revision,work_kind,conversation_id,created_at
                        ) VALUES (?,?, 'reseed', NULL, ?)""",
-                    (key.creator_account_id, revision, now),
+                    (account_id, revision, now),
                 )
             connection.execute(
                 """INSERT INTO committed_snapshots(
                        creator_account_id,agent_installation_id,agent_stream_id,snapshot_id,
                        through_seq,chat_count,message_count,coverage_evidence_count,committed_at
                    ) VALUES (?,?,?,?,?,?,?,?,?)""",
-                (*key.sql(), str(payload.snapshot_id), through_seq, int(upload[3]),
-                 int(upload[4]), int(upload[5]), now),
-            )
-            # A snapshot replaces this source stream's provenance membership,
-            # while canonical account entities remain merge-only.
-            connection.execute(
-                """DELETE FROM stream_message_membership
-                   WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?""",
-                key.sql(),
-            )
-            connection.execute(
-                """DELETE FROM stream_chat_membership
-                   WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?""",
-                key.sql(),
-            )
-            connection.execute(
-                """INSERT INTO stream_chat_membership(
-                       creator_account_id,agent_installation_id,agent_stream_id,chat_id,
-                       observed_source_seq
-                   ) SELECT creator_account_id,agent_installation_id,agent_stream_id,chat_id,?
-                     FROM snapshot_chat_records
-                    WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
-                      AND snapshot_id=? AND json_extract(record_json,'$.tombstone')=0""",
-                (through_seq, *key.sql(), str(payload.snapshot_id)),
-            )
-            connection.execute(
-                """INSERT INTO stream_message_membership(
-                       creator_account_id,agent_installation_id,agent_stream_id,message_id,chat_id,
-                       observed_source_seq
-                   ) SELECT creator_account_id,agent_installation_id,agent_stream_id,message_id,chat_id,?
-                     FROM snapshot_message_records
-                    WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
-                      AND snapshot_id=? AND json_extract(record_json,'$.tombstone')=0""",
-                (through_seq, *key.sql(), str(payload.snapshot_id)),
+                (*scope, through_seq, int(upload[3]), int(upload[4]), int(upload[5]), now),
             )
             self._advance_checkpoint(connection, key, through_seq, now)
             connection.execute(
                 """UPDATE snapshot_uploads SET state='committed',committed_at=?
                    WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
                      AND snapshot_id=?""",
-                (now, *key.sql(), str(payload.snapshot_id)),
-            )
-            connection.execute(
-                """DELETE FROM snapshot_chat_records WHERE creator_account_id=?
-                   AND agent_installation_id=? AND agent_stream_id=? AND snapshot_id=?""",
-                (*key.sql(), str(payload.snapshot_id)),
+                (now, *scope),
             )
+            return IngestResult("accepted", through_seq, snapshot_id=UUID(snapshot_id),
+                                next_expected_chunk_index=int(upload[2]), snapshot_committed=True,
+                                canonical_revision=revision)
+
+    def _abort_snapshot_merge(self, account_id: str, owner: str) -> None:
+        now = _iso(utc_now())
+        with self.database.transaction() as connection:
+            for (merge_epoch,) in connection.execute(
+                """SELECT merge_epoch FROM snapshot_merges
+                   WHERE creator_account_id=? AND state='merging' AND owner=?""",
+                (account_id, owner),
+            ).fetchall():
+                self._discard_snapshot_merge(connection, account_id, int(merge_epoch), now)
+
+    def _release_snapshot_merge(self, account_id: str, owner: str) -> None:
+        with self.database.transaction() as connection:
             connection.execute(
-                """DELETE FROM snapshot_message_records WHERE creator_account_id=?
-                   AND agent_installation_id=? AND agent_stream_id=? AND snapshot_id=?""",
-                (*key.sql(), str(payload.snapshot_id)),
+                """UPDATE snapshot_merges SET owner=NULL,lease_expires_at=NULL
+                   WHERE creator_account_id=? AND state='merging' AND owner=?""",
+                (account_id, owner),
             )
+
+    @staticmethod
+    def _discard_snapshot_merge(
+        connection: sqlite3.Connection, account_id: str, merge_epoch: int, now: str
+    ) -> None:
+        connection.execute(
+            "DELETE FROM account_messages WHERE creator_account_id=? AND merge_epoch=?",
+            (account_id, merge_epoch),
+        )
+        connection.execute(
+            "DELETE FROM account_chats WHERE creator_account_id=? AND merge_epoch=?",
+            (account_id, merge_epoch),
+        )
+        connection.execute(
+            "DELETE FROM snapshot_merge_actions WHERE creator_account_id=? AND merge_epoch=?",
+            (account_id, merge_epoch),
+        )
+        connection.execute(
+            """UPDATE snapshot_merges
+                  SET state='aborted',phase='done',cursor=NULL,owner=NULL,
+                      lease_expires_at=NULL,updated_at=?
+               WHERE creator_account_id=? AND merge_epoch=? AND state='merging'""",
+            (now, account_id, merge_epoch),
+        )
+
+    def recover_snapshot_merges(self) -> int:
+        """Resume merges whose worker died, then finish every published merge.
+
+        Called on startup. An interrupted merge is only taken over once its
+        lease has lapsed; rejections are recorded exactly as on the live path.
+        """
+        with self.database.read() as connection:
+            interrupted = connection.execute(
+                """SELECT m.creator_account_id,m.agent_installation_id,m.agent_stream_id,
+                          m.snapshot_id,u.chunk_count
+                     FROM snapshot_merges m
+                     JOIN snapshot_uploads u
+                       ON u.creator_account_id=m.creator_account_id
+                      AND u.agent_installation_id=m.agent_installation_id
+                      AND u.agent_stream_id=m.agent_stream_id
+                      AND u.snapshot_id=m.snapshot_id
+                    WHERE m.state='merging'
+                    ORDER BY m.creator_account_id""",
+            ).fetchall()
+        for account_id, installation_id, stream_id, snapshot_id, chunk_count in interrupted:
+            key = StreamKey(str(account_id), UUID(str(installation_id)), UUID(str(stream_id)))
+            try:
+                self._drive_snapshot_merge(key, str(snapshot_id), int(chunk_count))
+            except (InvariantViolation, sqlite3.IntegrityError):
+                # Conflicts were recorded and the merge discarded; the Agent's
+                # replayed commit receives the same rejection.
+                continue
+        return self.complete_snapshot_merges()
+
+    def complete_snapshot_merges(self, account_id: str | None = None) -> int:
+        """Finish published merges: stream membership, staging purge, settling.
+
+        Every step is an idempotent bounded slice, so this is safe to repeat
+        after a crash. Returns the number of merges brought to ``settled``.
+        """
+        with self.database.read() as connection:
+            pending = connection.execute(
+                """SELECT creator_account_id,merge_epoch FROM snapshot_merges
+                   WHERE state='published' AND (? IS NULL OR creator_account_id=?)
+                   ORDER BY creator_account_id,merge_epoch""",
+                (account_id, account_id),
+            ).fetchall()
+        for owner, merge_epoch in pending:
+            while self._complete_snapshot_merge_slice(str(owner), int(merge_epoch)):
+                time.sleep(0)
+        return len(pending)
+
+    def _complete_snapshot_merge_slice(self, account_id: str, merge_epoch: int) -> bool:
+        now = _iso(utc_now())
+        limit = self.merge_slice_rows
+        with self.database.transaction() as connection:
+            row = connection.execute(
+                """SELECT m.phase,m.cursor,m.agent_installation_id,m.agent_stream_id,
+                          m.snapshot_id,u.through_seq
+                     FROM snapshot_merges m
+                     JOIN snapshot_uploads u
+                       ON u.creator_account_id=m.creator_account_id
+                      AND u.agent_installation_id=m.agent_installation_id
+                      AND u.agent_stream_id=m.agent_stream_id
+                      AND u.snapshot_id=m.snapshot_id
+                    WHERE m.creator_account_id=? AND m.merge_epoch=? AND m.state='published'""",
+                (account_id, merge_epoch),
+            ).fetchone()
+            if row is None:
+                return False
+            phase, cursor = str(row[0]), row[1]
+            stream = (account_id, str(row[2]), str(row[3]))
+            scope = (*stream, str(row[4]))
+            through_seq = int(row[5])
+            staged_scope = """creator_account_id=? AND agent_installation_id=?
+                              AND agent_stream_id=? AND snapshot_id=?"""
+            stream_scope = """creator_account_id=? AND agent_installation_id=?
+                              AND agent_stream_id=?"""
+            upper: str | None = None
+            if phase == "chat_membership":
+                upper = self._slice_upper(
+                    connection, "snapshot_chat_records", "chat_id", staged_scope, scope, cursor
+                )
+                connection.execute(
+                    f"""INSERT INTO stream_chat_membership(
+                           creator_account_id,agent_installation_id,agent_stream_id,chat_id,
+                           observed_source_seq
+                       )
+                       SELECT creator_account_id,agent_installation_id,agent_stream_id,chat_id,?
+                         FROM snapshot_chat_records
+                        WHERE {staged_scope} AND is_tombstone=0 AND {_window('chat_id')}
+                       ON CONFLICT(creator_account_id,agent_installation_id,agent_stream_id,chat_id)
+                       DO UPDATE SET observed_source_seq=excluded.observed_source_seq
+                       WHERE stream_chat_membership.observed_source_seq
+                             <= excluded.observed_source_seq""",
+                    (through_seq, *scope, cursor, cursor, upper, upper),
+                )
+            elif phase == "message_membership":
+                upper = self._slice_upper(
+                    connection, "snapshot_message_records", "message_id", staged_scope, scope, cursor
+                )
+                connection.execute(
+                    f"""INSERT INTO stream_message_membership(
+                           creator_account_id,agent_installation_id,agent_stream_id,message_id,
+                           chat_id,observed_source_seq
+                       )
+                       SELECT creator_account_id,agent_installation_id,agent_stream_id,
+                              message_id,chat_id,?
+                         FROM snapshot_message_records
+                        WHERE {staged_scope} AND is_tombstone=0 AND {_window('message_id')}
+                       ON CONFLICT(creator_account_id,agent_installation_id,agent_stream_id,message_id)
+                       DO UPDATE SET chat_id=excluded.chat_id,
+                                     observed_source_seq=excluded.observed_source_seq
+                       WHERE stream_message_membership.observed_source_seq
+                             <= excluded.observed_source_seq""",
+                    (through_seq, *scope, cursor, cursor, upper, upper),
+                )
+            elif phase in {"prune_chat_membership", "prune_message_membership"}:
+                # A snapshot replaces this stream's provenance membership up to
+                # its through_seq; later live deltas keep their rows.
+                table, staged, column = (
+                    ("stream_chat_membership", "snapshot_chat_records", "chat_id")
+                    if phase == "prune_chat_membership"
+                    else ("stream_message_membership", "snapshot_message_records", "message_id")
+                )
+                upper = self._slice_upper(connection, table, column, stream_scope, stream, cursor)
+                connection.execute(
+                    f"""DELETE FROM {table}
+                        WHERE {stream_scope} AND {_window(column)} AND observed_source_seq<=?
+                          AND NOT EXISTS (
+                              SELECT 1 FROM {staged} s
+                               WHERE s.creator_account_id=? AND s.agent_installation_id=?
+                                 AND s.agent_stream_id=? AND s.snapshot_id=?
+                                 AND s.{column}={table}.{column} AND s.is_tombstone=0
+                          )""",
+                    (*stream, cursor, cursor, upper, upper, through_seq, *scope),
+                )
+            elif phase == "purge":
+                budget = limit
+                for table in (
+                    "snapshot_chat_records",
+                    "snapshot_message_records",
+                    "snapshot_coverage_records",
+                ):
+                    if budget:
+                        budget -= connection.execute(
+                            f"""DELETE FROM {table} WHERE rowid IN (
+                                    SELECT rowid FROM {table} WHERE {staged_scope} LIMIT ?
+                                )""",
+                            (*scope, budget),
+                        ).rowcount
+                if budget:
+                    connection.execute(
+                        """DELETE FROM snapshot_merge_actions
+                           WHERE creator_account_id=? AND merge_epoch=?""",
+                        (account_id, merge_epoch),
+                    )
+                else:
+                    upper = "more"
+            elif phase == "settle":
+                # Published rows are already visible; settling only keeps the
+                # visibility predicate cheap.
+                budget = limit
+                for table, column in (("account_messages", "message_id"), ("account_chats", "chat_id")):
+                    if budget:
+                        budget -= connection.execute(
+                            f"""UPDATE {table} SET merge_epoch=NULL
+                                WHERE creator_account_id=? AND {column} IN (
+                                    SELECT {column} FROM {table}
+                                     WHERE creator_account_id=? AND merge_epoch=? LIMIT ?
+                                )""",
+                            (account_id, account_id, merge_epoch, budget),
+                        ).rowcount
+                if not budget:
+                    upper = "more"
+            next_phase = phase if upper is not None else _MERGE_FOLLOWING_PHASE[phase]
             connection.execute(
-                """DELETE FROM snapshot_coverage_records WHERE creator_account_id=?
-                   AND agent_installation_id=? AND agent_stream_id=? AND snapshot_id=?""",
-                (*key.sql(), str(payload.snapshot_id)),
+                """UPDATE snapshot_merges
+                      SET phase=?,cursor=?,updated_at=?,
+                          state=CASE WHEN ?='done' THEN 'settled' ELSE state END
+                    WHERE creator_account_id=? AND merge_epoch=?""",
+                (
+                    next_phase,
+                    upper if phase not in {"purge", "settle"} else None,
+                    now,
+                    next_phase,
+                    account_id,
+                    merge_epoch,
+                ),
             )
-            return IngestResult("accepted", through_seq, snapshot_id=payload.snapshot_id,
-                                next_expected_chunk_index=int(upload[2]), snapshot_committed=True,
-                                canonical_revision=revision)
+            return next_phase != "done"
 
     def _apply_coverage(
         self, connection: sqlite3.Connection, account_id: str, evidence: dict[str, Any], now: str
@@ -1298,7 +1963,9 @@ class HistoryRepository:
             if generation[2] is not None:
                 raise InvariantViolation("inventory membership is frozen after inventory.ended")
             chat = connection.execute(
-                "SELECT 1 FROM account_chats WHERE creator_account_id=? AND chat_id=? AND is_deleted=0",
+                f"""SELECT 1 FROM account_chats
+                   WHERE creator_account_id=? AND chat_id=? AND is_deleted=0
+                     AND {merge_visible('account_chats')}""",
                 (account_id, conversation_id),
             ).fetchone()
             if chat is None:
@@ -1433,6 +2100,8 @@ class HistoryRepository:
                                         detail="event_id was reused with different content")
                 return IngestResult("duplicate", checkpoint)
             if payload.source_seq <= checkpoint:
+                # Events folded by retention have no row left; their sequence
+                # is behind the checkpoint, so a redelivery is a duplicate.
                 sequence_owner = connection.execute(
                     """SELECT event_id FROM raw_ingest_events
                        WHERE creator_account_id=? AND agent_installation_id=?
@@ -1528,12 +2197,21 @@ class HistoryRepository:
             revision = None
             if changed:
                 revision = self._canonical_revision(connection, key.creator_account_id, now)
+                work_scope, message_id = "conversation", None
+                if kind == "chat.upsert":
+                    work_scope = "summary"
+                elif kind == "message.upsert":
+                    work_scope, message_id = "message_upsert", change["message"]["message_id"]
+                elif kind == "message.delete":
+                    work_scope, message_id = "message_tombstone", change["message_id"]
                 connection.execute(
                     """INSERT INTO projection_work(
-                           creator_account_id,canonical_revision,work_kind,conversation_id,created_at
-                       ) VALUES (?,?,?,?,?)""",
+                           creator_account_id,canonical_revision,work_kind,conversation_id,created_at,
+                           work_scope,message_id
+                       ) VALUES (?,?,?,?,?,?,?)""",
                     (key.creator_account_id, revision,
-                     "coverage" if kind == "coverage.observed" else "entity", conversation_id, now),
+                     "coverage" if kind == "coverage.observed" else "entity", conversation_id, now,
+                     work_scope, message_id),
                 )
             if payload.acquisition_origin == "passive":
                 expires = _iso(utc_now() + timedelta(seconds=120))
@@ -1550,6 +2228,279 @@ class HistoryRepository:
             self._advance_checkpoint(connection, key, payload.source_seq, now)
             return IngestResult("accepted", payload.source_seq, canonical_revision=revision)
 
+    def account_ids(self) -> list[str]:
+        with self.database.read() as connection:
+            return [
+                str(row[0])
+                for row in connection.execute(
+                    "SELECT creator_account_id FROM account_heads ORDER BY creator_account_id"
+                )
+            ]
+
+    def reconcile_message_counters(self, account_id: str) -> int:
+        """Recount one account's maintained counters and repair any drift.
+
+        Conversations are recounted in short batched transactions so ingest
+        interleaves with the audit; each repair adjusts the account row in the
+        same transaction. Returns the number of counter rows repaired.
+        """
+        repaired = 0
+        cursor: str | None = None
+        while True:
+            with self.database.transaction(lane="maintenance") as connection:
+                rows = connection.execute(
+                    """SELECT c.chat_id,COUNT(m.message_id),
+                              COALESCE(SUM(m.direction='inbound'),0),
+                              COALESCE(SUM(m.direction='outbound'),0),
+                              COALESCE(SUM(length(CAST(m.text AS BLOB))),0),
+                              k.message_count,k.inbound_count,k.outbound_count,k.text_bytes
+                         FROM account_chats c
+                         LEFT JOIN account_messages m
+                           ON m.creator_account_id=c.creator_account_id AND m.chat_id=c.chat_id
+                          AND m.is_deleted=0 AND m.merge_epoch IS NULL
+                         LEFT JOIN conversation_message_counters k
+                           ON k.creator_account_id=c.creator_account_id AND k.chat_id=c.chat_id
+                        WHERE c.creator_account_id=? AND (? IS NULL OR c.chat_id>?)
+                        GROUP BY c.chat_id ORDER BY c.chat_id LIMIT ?""",
+                    (account_id, cursor, cursor, CONVERSATION_BATCH_SIZE),
+                ).fetchall()
+                for row in rows:
+                    actual = tuple(int(value) for value in row[1:5])
+                    stored = tuple(int(value or 0) for value in row[5:9])
+                    if actual == stored:
+                        continue
+                    repaired += 1
+                    connection.execute(
+                        """INSERT INTO conversation_message_counters(
+                               creator_account_id,chat_id,message_count,inbound_count,
+                               outbound_count,text_bytes
+                           ) VALUES (?,?,?,?,?,?)
+                           ON CONFLICT(creator_account_id,chat_id) DO UPDATE SET
+                               message_count=excluded.message_count,
+                               inbound_count=excluded.inbound_count,
+                               outbound_count=excluded.outbound_count,
+                               text_bytes=excluded.text_bytes""",
+                        (account_id, str(row[0]), *actual),
+                    )
+                    drift = tuple(a - b for a, b in zip(actual, stored))
+                    connection.execute(
+                        """INSERT INTO account_message_counters(
+                               creator_account_id,message_count,inbound_count,
+                               outbound_count,text_bytes
+                           ) VALUES (?,?,?,?,?)
+                           ON CONFLICT(creator_account_id) DO UPDATE SET
+                               message_count=message_count+excluded.message_count,
+                               inbound_count=inbound_count+excluded.inbound_count,
+                               outbound_count=outbound_count+excluded.outbound_count,
+                               text_bytes=text_bytes+excluded.text_bytes""",
+                        (account_id, *drift),
+                    )
+            if len(rows) < CONVERSATION_BATCH_SIZE:
+                break
+            cursor = str(rows[-1][0])
+        with self.database.transaction(lane="maintenance") as connection:
+            actual_account = connection.execute(
+                """SELECT (SELECT COUNT(*) FROM account_chats
+                            WHERE creator_account_id=? AND is_deleted=0 AND merge_epoch IS NULL),
+                          COALESCE(SUM(message_count),0),COALESCE(SUM(inbound_count),0),
+                          COALESCE(SUM(outbound_count),0),COALESCE(SUM(text_bytes),0)
+                     FROM conversation_message_counters WHERE creator_account_id=?""",
+                (account_id, account_id),
+            ).fetchone()
+            stored_account = connection.execute(
+                """SELECT chat_count,message_count,inbound_count,outbound_count,text_bytes
+                     FROM account_message_counters WHERE creator_account_id=?""",
+                (account_id,),
+            ).fetchone()
+            if stored_account is None or tuple(stored_account) != tuple(actual_account):
+                repaired += 1
+                connection.execute(
+                    """INSERT INTO account_message_counters(
+                           creator_account_id,chat_count,message_count,inbound_count,
+                           outbound_count,text_bytes
+                       ) VALUES (?,?,?,?,?,?)
+                       ON CONFLICT(creator_account_id) DO UPDATE SET
+                           chat_count=excluded.chat_count,
+                           message_count=excluded.message_count,
+                           inbound_count=excluded.inbound_count,
+                           outbound_count=excluded.outbound_count,
+                           text_bytes=excluded.text_bytes""",
+                    (account_id, *actual_account),
+                )
+        return repaired
+
+    def compact_ingest_history(
+        self,
+        *,
+        horizon: timedelta = timedelta(days=INGEST_RETENTION_DAYS),
+        now: datetime | None = None,
+        limit: int = RETENTION_BATCH_ROWS,
+    ) -> RetentionCounts:
+        """Fold or purge at most ``limit`` expired ingest rows in one short transaction.
+
+        Raw delta events committed before ``horizon`` are folded into the
+        stream's ``raw_ingest_folds`` summary once canonical truth and the
+        projection both hold them: the account has no open snapshot merge and
+        no projection work older than the event is still pending. Staging
+        uploads abandoned before the horizon, and committed uploads a later
+        committed snapshot of the same stream superseded, are purged together
+        with their chunks and records. Callers repeat until nothing is left.
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        cutoff = _iso((now or utc_now()) - horizon)
+        stamp = _iso(now or utc_now())
+        counts = RetentionCounts()
+        with self.database.transaction(lane="maintenance") as connection:
+            streams = connection.execute(
+                """SELECT c.creator_account_id,c.agent_installation_id,c.agent_stream_id,
+                          c.committed_source_seq,
+                          (SELECT w.created_at FROM projection_work w
+                            WHERE w.creator_account_id=c.creator_account_id
+                              AND w.completed_at IS NULL
+                            ORDER BY w.work_id LIMIT 1)
+                     FROM ingest_checkpoints c
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM snapshot_merges m
+                         WHERE m.creator_account_id=c.creator_account_id
+                           AND m.state IN ('merging', 'published')
+                    )
+                    ORDER BY c.creator_account_id,c.agent_installation_id,c.agent_stream_id"""
+            ).fetchall()
+            for stream in streams:
+                budget = limit - counts.total
+                if not budget:
+                    break
+                acknowledged = cutoff if stream[4] is None else min(cutoff, str(stream[4]))
+                counts.folded_events += self._fold_raw_events(
+                    connection, tuple(stream[:3]), int(stream[3]), acknowledged, stamp, budget
+                )
+            expired = connection.execute(
+                """SELECT u.creator_account_id,u.agent_installation_id,u.agent_stream_id,
+                          u.snapshot_id,u.state
+                     FROM snapshot_uploads u
+                    WHERE u.created_at<? AND (
+                          u.state='staging'
+                          OR EXISTS (
+                              SELECT 1 FROM snapshot_uploads n
+                               WHERE n.creator_account_id=u.creator_account_id
+                                 AND n.agent_installation_id=u.agent_installation_id
+                                 AND n.agent_stream_id=u.agent_stream_id
+                                 AND n.state='committed' AND n.committed_at>u.committed_at
+                          )
+                      )
+                      AND NOT EXISTS (
+                          SELECT 1 FROM snapshot_merges m
+                           WHERE m.creator_account_id=u.creator_account_id
+                             AND m.agent_installation_id=u.agent_installation_id
+                             AND m.agent_stream_id=u.agent_stream_id
+                             AND m.snapshot_id=u.snapshot_id
+                             AND m.state IN ('merging', 'published')
+                      )
+                    ORDER BY u.created_at LIMIT ?""",
+                (cutoff, limit),
+            ).fetchall()
+            for upload in expired:
+                if counts.total >= limit:
+                    break
+                self._purge_snapshot_upload(connection, tuple(upload[:4]), limit, counts)
+        return counts
+
+    @staticmethod
+    def _fold_raw_events(
+        connection: sqlite3.Connection,
+        stream: tuple[str, str, str],
+        checkpoint: int,
+        acknowledged: str,
+        now: str,
+        limit: int,
+    ) -> int:
+        rows = connection.execute(
+            """SELECT source_seq,event_id,fingerprint,committed_at FROM raw_ingest_events
+                WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
+                  AND source_seq<=?
+                ORDER BY source_seq LIMIT ?""",
+            (*stream, checkpoint, limit),
+        ).fetchall()
+        # Fold strictly in source order, stopping at the first event that is
+        # too recent, so the chained digest never skips an event.
+        folded = []
+        for row in rows:
+            if str(row[3]) >= acknowledged:
+                break
+            folded.append(row)
+        if not folded:
+            return 0
+        previous = connection.execute(
+            """SELECT folded_digest,folded_event_count,first_committed_at FROM raw_ingest_folds
+                WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?""",
+            stream,
+        ).fetchone()
+        digest = _hash([
+            None if previous is None else previous[0],
+            [[int(row[0]), str(row[1]), str(row[2])] for row in folded],
+        ])
+        through_seq = int(folded[-1][0])
+        connection.execute(
+            """INSERT INTO raw_ingest_folds(
+                   creator_account_id,agent_installation_id,agent_stream_id,folded_through_seq,
+                   folded_event_count,folded_digest,first_committed_at,last_committed_at,folded_at
+               ) VALUES (?,?,?,?,?,?,?,?,?)
+               ON CONFLICT(creator_account_id,agent_installation_id,agent_stream_id)
+               DO UPDATE SET folded_through_seq=excluded.folded_through_seq,
+                             folded_event_count=folded_event_count+excluded.folded_event_count,
+                             folded_digest=excluded.folded_digest,
+                             last_committed_at=excluded.last_committed_at,
+                             folded_at=excluded.folded_at""",
+            (
+                *stream, through_seq, len(folded), digest,
+                str(folded[0][3]) if previous is None else str(previous[2]),
+                str(folded[-1][3]), now,
+            ),
+        )
+        connection.execute(
+            """DELETE FROM raw_ingest_events
+                WHERE creator_account_id=? AND agent_installation_id=? AND agent_stream_id=?
+                  AND source_seq<=?""",
+            (*stream, through_seq),
+        )
+        return len(folded)
+
+    @staticmethod
+    def _purge_snapshot_upload(
+        connection: sqlite3.Connection,
+        scope: tuple[str, str, str, str],
+        limit: int,
+        counts: RetentionCounts,
+    ) -> None:
+        staged_scope = (
+            "creator_account_id=? AND agent_installation_id=? AND agent_stream_id=? "
+            "AND snapshot_id=?"
+        )
+        # Records and chunks go first in bounded slices; the upload row (and
+        # the merge rows cascading from it) only once nothing is left under it.
+        for table in (
+            "snapshot_chat_records",
+            "snapshot_message_records",
+            "snapshot_coverage_records",
+            "snapshot_chunks",
+        ):
+            budget = limit - counts.total
+            if budget <= 0:
+                return
+            deleted = connection.execute(
+                f"""DELETE FROM {table} WHERE rowid IN (
+                        SELECT rowid FROM {table} WHERE {staged_scope} LIMIT ?
+                    )""",
+                (*scope, budget),
+            ).rowcount
+            counts.purged_staging_rows += deleted
+            if deleted == budget:
+                return
+        counts.purged_uploads += connection.execute(
+            f"DELETE FROM snapshot_uploads WHERE {staged_scope}", scope
+        ).rowcount
+
     def account_revision(self, account_id: str) -> tuple[int, int]:
         with self.database.read() as connection:
             row = connection.execute(
@@ -1755,60 +2706,219 @@ class HistoryRepository:
 
 
 class ProjectionCursorStale(ValueError):
-    """Raised when a page cursor targets a projection generation that is no longer active."""
+    """Raised when a page cursor or snapshot stream targets a generation no longer active."""
 
 
 PROJECTION_BATCH_SIZE = 256
 CONVERSATION_BATCH_SIZE = 64
 
 
-def _quarantine_projection_files(path: Path) -> None:
-    """Move a projection database and its WAL/SHM sidecars aside for rebuild.
+def _projection_work_level(work_kind: str, work_scope: str) -> int:
+    """Rank work by how much of a conversation it rebuilds.
 
-    Requires no open connections to the path; raises otherwise.
+    0 refreshes the summary, 1 applies summary or point message changes,
+    2 diffs the whole conversation.
     """
-    nonce = uuid4().hex
-    with LocalSQLite.exclusive_lifecycle(path) as target:
-        for suffix in ("", "-wal", "-shm"):
-            source = Path(f"{target}{suffix}")
-            if source.exists():
-                os.replace(
-                    source,
-                    target.with_name(f".{target.name}.{nonce}.quarantine{suffix}"),
-                )
+    if work_kind == "coverage":
+        return 0
+    if work_kind == "entity" and work_scope != "conversation":
+        return 1
+    return 2
 
 
-class ProjectionRepository:
-    """Disposable generation-based read models built from canonical account truth."""
+def _projection_message(row: sqlite3.Row | tuple[Any, ...]) -> CanonicalProjectionMessage:
+    return CanonicalProjectionMessage(
+        conversation_id=str(row[0]),
+        message_id=str(row[1]),
+        sender_platform_user_id=str(row[2]),
+        text=str(row[3]),
+        sent_at=str(row[4]),
+        direction=row[5],
+    )
 
-    def __init__(
-        self,
-        database: CanonicalSQLite,
-        canonical: HistoryRepository,
-        *,
-        pipeline: ProjectionPipeline | None = None,
-    ) -> None:
-        self.database = database
-        self.canonical = canonical
-        self.pipeline = pipeline or DeterministicProjectionPipeline()
 
-    @classmethod
-    def create(
-        cls,
-        path: str | Path,
-        canonical: HistoryRepository,
-        *,
-        pipeline: ProjectionPipeline | None = None,
-    ) -> "ProjectionRepository":
-        migrations_dir = Path(__file__).with_name("projection_sql")
+@dataclass(slots=True)
+class MessageWriteCounts:
+    """Messages one generation re-projected versus skipped as unchanged."""
 
-        def _open() -> CanonicalSQLite:
-            database = CanonicalSQLite(path)
-            MigrationRunner(
-                database,
-                migrations_dir=migrations_dir,
-                lock_path=database.path.parent / ".projection-migration.lock",
-                backups_dir=database.path.parent / "projection-backups",
+    written: int = 0
+    skipped: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectionMessagePage:
+    """One message page and the generation state it was read under.
+
+    ``items`` is ``None`` when the caller asked only to resolve the page.
+    ``read_ahead`` holds the following page's items and ``has_more`` when the
+    same range read covered it.
+    """
+
+    generation: dict[str, Any]
+    projection: dict[str, Any]
+    items: list[dict[str, Any]] | None
+    has_more: bool
+    read_ahead: tuple[list[dict[str, Any]], bool] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectionMessageTails:
+    """Latest messages of several conversations read from one generation.
+
+    ``tails`` maps each requested conversation present in the generation to
+    its newest items, oldest first, and whether older messages exist.
+    """
+
+    generation: dict[str, Any]
+    projection: dict[str, Any]
+    tails: dict[str, tuple[list[dict[str, Any]], bool]]
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectionConversationPage:
+    """One keyset page of conversation summaries read from one generation.
+
+    ``next_after`` is the sort key of the last item when more items follow.
+    """
+
+    generation: dict[str, Any]
+    projection: dict[str, Any]
+    items: list[dict[str, Any]]
+    next_after: tuple[Any, ...] | None
+
+
+# Sort keys, direction and index of each conversation listing order. Every key
+# of one order runs the same direction, so the keyset predicate is one
+# row-value range on the index.
+CONVERSATION_ORDERS: dict[str, tuple[tuple[str, ...], bool, str]] = {
+    "recent": (("last_message_at", "conversation_id"), True, "conversation_summaries_recent"),
+    "unread": (
+        ("unread_count", "last_message_at", "conversation_id"),
+        True,
+        "conversation_summaries_unread",
+    ),
+    "name": (("display_name", "conversation_id"), False, "conversation_summaries_name"),
+}
+
+
+class ProjectionSnapshotStream:
+    """A full snapshot of one projection generation read in conversation-id order.
+
+    ``payload`` is the snapshot document with an empty conversation list;
+    ``parts`` yields its summaries at most ``part_size`` at a time. Peak memory
+    follows the part size rather than the account. Each part is its own short
+    read transaction, so a slow consumer never pins a WAL snapshot; a part is
+    only yielded if the generation was still the active one after it was read,
+    and ``parts`` raises ``ProjectionCursorStale`` once it is superseded.
+    """
+
+    def __init__(
+        self,
+        repository: "ProjectionRepository",
+        account_id: str,
+        projection_slot: int | None,
+        authority: dict[str, Any] | None,
+        payload: dict[str, Any],
+        *,
+        part_size: int,
+    ) -> None:
+        self.payload = payload
+        self.view_revision = int(payload["view_revision"])
+        self.parts = self._read_parts(
+            repository, account_id, projection_slot, authority, part_size
+        )
+
+    @staticmethod
+    def _read_parts(
+        repository: "ProjectionRepository",
+        account_id: str,
+        projection_slot: int | None,
+        authority: dict[str, Any] | None,
+        part_size: int,
+    ) -> Iterator[list[dict[str, Any]]]:
+        if projection_slot is None or authority is None:
+            return
+        # Only the head row is read while it still names this view revision.
+        cache = {account_id: (int(authority["read_revision"]), authority)}
+        after = ""
+        while True:
+            with repository.database.read_only() as connection:
+                connection.execute("BEGIN")
+                account = repository._readable_projection_account(
+                    connection, account_id, authority
+                )
+                if account is None or int(account[5]) != projection_slot:
+                    raise ProjectionCursorStale(authority["generation_id"])
+                rows = connection.execute(
+                    """SELECT conversation_id,document_json FROM conversation_summaries
+                        WHERE creator_account_id=? AND projection_slot=?
+                          AND conversation_id>?
+                        ORDER BY conversation_id LIMIT ?""",
+                    (account_id, projection_slot, after, part_size),
+                ).fetchall()
+            # An active slot is never written; it is only rebuilt or folded
+            # into after activation moves on, so a part read while the
+            # generation was still active afterwards is a consistent slice.
+            if repository._projection_authority(account_id, cache=cache)[1] != authority:
+                raise ProjectionCursorStale(authority["generation_id"])
+            if not rows:
+                return
+            after = str(rows[-1][0])
+            yield [json.loads(row[1]) for row in rows]
+            if len(rows) < part_size:
+                return
+
+    def close(self) -> None:
+        self.parts.close()
+
+
+def _quarantine_projection_files(path: Path) -> None:
+    """Move a projection database and its WAL/SHM sidecars aside for rebuild.
+
+    Requires no open connections to the path; raises otherwise.
+    """
+    nonce = uuid4().hex
+    with LocalSQLite.exclusive_lifecycle(path) as target:
+        for suffix in ("", "-wal", "-shm"):
+            source = Path(f"{target}{suffix}")
+            if source.exists():
+                os.replace(
+                    source,
+                    target.with_name(f".{target.name}.{nonce}.quarantine{suffix}"),
+                )
+
+
+class ProjectionRepository:
+    """Disposable generation-based read models built from canonical account truth."""
+
+    def __init__(
+        self,
+        database: CanonicalSQLite,
+        canonical: HistoryRepository,
+        *,
+        pipeline: ProjectionPipeline | None = None,
+    ) -> None:
+        self.database = database
+        self.canonical = canonical
+        self.pipeline = pipeline or DeterministicProjectionPipeline()
+
+    @classmethod
+    def create(
+        cls,
+        path: str | Path,
+        canonical: HistoryRepository,
+        *,
+        pipeline: ProjectionPipeline | None = None,
+    ) -> "ProjectionRepository":
+        migrations_dir = Path(__file__).with_name("projection_sql")
+
+        def _open() -> CanonicalSQLite:
+            database = CanonicalSQLite(path)
+            MigrationRunner(
+                database,
+                migrations_dir=migrations_dir,
+                lock_path=database.path.parent / ".projection-migration.lock",
+                backups_dir=database.path.parent / "projection-backups",
             ).run()
             return database
 
@@ -1825,6 +2935,8 @@ class ProjectionRepository:
 
     def reset(self) -> None:
         with self.database.transaction() as connection:
+            connection.execute("DELETE FROM projection_slot_overrides")
+            connection.execute("DELETE FROM projection_slot_overlays")
             connection.execute("DELETE FROM projection_work_applied")
             connection.execute("DELETE FROM projection_change_log")
             connection.execute("DELETE FROM projection_analytics")
@@ -1836,10 +2948,18 @@ class ProjectionRepository:
             connection.execute("DELETE FROM projection_accounts")
 
     def _projection_authority(
-        self, account_id: str
+        self,
+        account_id: str,
+        *,
+        cache: dict[str, tuple[int, dict[str, Any]]] | None = None,
     ) -> tuple[int, dict[str, Any] | None]:
-        """Read the canonical activation pointer that makes a projection generation visible."""
-        with self.canonical.database.read() as connection:
+        """Read the canonical activation pointer that makes a projection generation visible.
+
+        ``cache`` maps accounts to the authority last resolved for a view
+        revision; while the head still names that view revision only the head
+        row is read.
+        """
+        with self.canonical.database.read_only() as connection:
             connection.execute("BEGIN")
             head = connection.execute(
                 """SELECT canonical_revision,view_revision FROM account_heads
@@ -1848,6 +2968,10 @@ class ProjectionRepository:
             ).fetchone()
             if head is None:
                 return 0, None
+            if cache is not None:
+                cached = cache.get(account_id)
+                if cached is not None and cached[0] == int(head[1]):
+                    return int(head[0]), cached[1]
             intent = connection.execute(
                 """SELECT generation_id,target_canonical_revision,
                           activated_view_revision,projection_committed_at
@@ -1859,12 +2983,15 @@ class ProjectionRepository:
             ).fetchone()
         if intent is None or intent[0] is None or intent[2] is None:
             return int(head[0]), None
-        return int(head[0]), {
+        authority = {
             "generation_id": str(intent[0]),
             "projected_revision": int(intent[1]),
             "read_revision": int(intent[2]),
             "generated_at": intent[3],
         }
+        if cache is not None:
+            cache[account_id] = (int(head[1]), authority)
+        return int(head[0]), authority
 
     @staticmethod
     def _readable_projection_account(
@@ -1928,7 +3055,7 @@ class ProjectionRepository:
 
     def state(self, account_id: str) -> dict[str, Any]:
         canonical_revision, authority = self._projection_authority(account_id)
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             connection.execute("BEGIN")
             raw_account = connection.execute(
                 "SELECT 1 FROM projection_accounts WHERE creator_account_id=?",
@@ -1958,7 +3085,7 @@ class ProjectionRepository:
 
     def active_generation(self, account_id: str) -> dict[str, Any] | None:
         _, authority = self._projection_authority(account_id)
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             connection.execute("BEGIN")
             row = self._readable_projection_account(connection, account_id, authority)
         if row is None:
@@ -2020,7 +3147,7 @@ class ProjectionRepository:
     def _ensure_activation_intent(
         self, account_id: str, target_revision: int, now: str
     ) -> None:
-        with self.canonical.database.transaction() as connection:
+        with self.canonical.database.transaction(lane="projection") as connection:
             connection.execute(
                 """INSERT OR IGNORE INTO projection_activation_intents(
                        creator_account_id,target_canonical_revision,state,requested_at
@@ -2038,7 +3165,7 @@ class ProjectionRepository:
         committed_at: str,
     ) -> None:
         """Converge the canonical activation intent after projection commit/restart."""
-        with self.canonical.database.transaction() as connection:
+        with self.canonical.database.transaction(lane="projection") as connection:
             head = connection.execute(
                 "SELECT view_revision FROM account_heads WHERE creator_account_id=?",
                 (account_id,),
@@ -2185,6 +3312,110 @@ class ProjectionRepository:
             ),
         )
 
+    @staticmethod
+    def _delete_projection_messages(
+        connection: sqlite3.Connection,
+        account_id: str,
+        projection_slot: int,
+        message_ids: list[str],
+    ) -> None:
+        if not message_ids:
+            return
+        placeholders = ",".join("?" for _ in message_ids)
+        parameters = (account_id, projection_slot, *message_ids)
+        # Edges cascade from their message node, analysis from its message.
+        connection.execute(
+            f"""DELETE FROM projection_lpg_nodes
+                WHERE creator_account_id=? AND projection_slot=? AND node_kind='message'
+                  AND entity_id IN ({placeholders})""",
+            parameters,
+        )
+        connection.execute(
+            f"""DELETE FROM projection_messages
+                WHERE creator_account_id=? AND projection_slot=?
+                  AND message_id IN ({placeholders})""",
+            parameters,
+        )
+
+    def _apply_message_batch(
+        self,
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        projection_slot: int,
+        conversations: list[CanonicalProjectionConversation],
+        canonical: list[CanonicalProjectionMessage],
+        counts: MessageWriteCounts,
+    ) -> None:
+        """Write the canonical messages whose source hash differs from the slot's.
+
+        A message already in the slot with the same ``source_hash`` and
+        pipeline version is left untouched.
+        """
+        message_placeholders = ",".join("?" for _ in canonical)
+        stored = {
+            str(row[0]): str(row[1])
+            for row in projection_connection.execute(
+                f"""SELECT message_id,source_hash FROM projection_message_analysis
+                     WHERE creator_account_id=? AND projection_slot=?
+                       AND message_id IN ({message_placeholders})
+                       AND json_extract(document_json,'$.pipeline_version')=?""",
+                (
+                    account_id,
+                    projection_slot,
+                    *(item.message_id for item in canonical),
+                    self.pipeline.pipeline_version,
+                ),
+            )
+        }
+        messages = [
+            item
+            for item in canonical
+            if stored.get(item.message_id) != message_source_hash(item)
+        ]
+        counts.skipped += len(canonical) - len(messages)
+        counts.written += len(messages)
+        if not messages:
+            return
+        self._delete_projection_messages(
+            projection_connection,
+            account_id,
+            projection_slot,
+            [item.message_id for item in messages],
+        )
+        batch = self.pipeline.project(conversations, messages)
+        analysis_by_message = {
+            item.message_id: item for item in batch.analyses
+        }
+        if (
+            len(analysis_by_message) != len(batch.analyses)
+            or set(analysis_by_message) != {item.message_id for item in messages}
+        ):
+            raise RuntimeError(
+                "projection pipeline did not analyze each canonical message exactly once"
+            )
+        projection_connection.executemany(
+            """INSERT INTO projection_messages(
+                   creator_account_id,projection_slot,conversation_id,message_id,text,sent_at,
+                   direction,sentiment
+               ) VALUES (?,?,?,?,?,?,?,?)""",
+            (
+                (
+                    account_id,
+                    projection_slot,
+                    item.conversation_id,
+                    item.message_id,
+                    item.text,
+                    item.sent_at,
+                    item.direction,
+                    analysis_by_message[item.message_id].sentiment,
+                )
+                for item in messages
+            ),
+        )
+        self._insert_pipeline_material(
+            projection_connection, account_id, projection_slot, batch
+        )
+
     def _project_conversation_entities(
         self,
         canonical_connection: sqlite3.Connection,
@@ -2192,7 +3423,13 @@ class ProjectionRepository:
         account_id: str,
         projection_slot: int,
         conversations: list[CanonicalProjectionConversation],
+        counts: MessageWriteCounts,
     ) -> None:
+        """Diff whole conversations against canonical truth.
+
+        Changed messages are replaced and messages no longer in canonical
+        truth are removed; unchanged messages are skipped.
+        """
         if not conversations:
             return
         self._insert_pipeline_material(
@@ -2203,59 +3440,121 @@ class ProjectionRepository:
         )
         conversation_ids = [item.conversation_id for item in conversations]
         placeholders = ",".join("?" for _ in conversation_ids)
+        projection_connection.execute(
+            """CREATE TEMP TABLE IF NOT EXISTS projection_current_messages(
+                   message_id TEXT PRIMARY KEY
+               ) WITHOUT ROWID"""
+        )
+        projection_connection.execute("DELETE FROM temp.projection_current_messages")
         cursor = canonical_connection.execute(
-            f"""SELECT chat_id,message_id,sender_platform_user_id,text,sent_at,direction
-                  FROM account_messages
-                 WHERE creator_account_id=? AND is_deleted=0
-                   AND chat_id IN ({placeholders})
-                 ORDER BY chat_id,sent_at,message_id""",
+            f"""SELECT m.chat_id,m.message_id,m.sender_platform_user_id,m.text,m.sent_at,m.direction
+                  FROM account_messages m
+                 WHERE m.creator_account_id=? AND m.is_deleted=0 AND {merge_visible('m')}
+                   AND m.chat_id IN ({placeholders})
+                 ORDER BY m.chat_id,m.sent_at,m.message_id""",
             (account_id, *conversation_ids),
         )
         while rows := cursor.fetchmany(PROJECTION_BATCH_SIZE):
-            messages = [
-                CanonicalProjectionMessage(
-                    conversation_id=str(row[0]),
-                    message_id=str(row[1]),
-                    sender_platform_user_id=str(row[2]),
-                    text=str(row[3]),
-                    sent_at=str(row[4]),
-                    direction=row[5],
+            canonical = [_projection_message(row) for row in rows]
+            projection_connection.executemany(
+                "INSERT INTO temp.projection_current_messages(message_id) VALUES (?)",
+                ((item.message_id,) for item in canonical),
+            )
+            self._apply_message_batch(
+                projection_connection,
+                account_id,
+                projection_slot,
+                conversations,
+                canonical,
+                counts,
+            )
+        removed = [
+            str(row[0])
+            for row in projection_connection.execute(
+                f"""SELECT message_id FROM projection_messages
+                     WHERE creator_account_id=? AND projection_slot=?
+                       AND conversation_id IN ({placeholders})
+                       AND message_id NOT IN (
+                           SELECT message_id FROM temp.projection_current_messages
+                       )""",
+                (account_id, projection_slot, *conversation_ids),
+            )
+        ]
+        for start in range(0, len(removed), PROJECTION_BATCH_SIZE):
+            self._delete_projection_messages(
+                projection_connection,
+                account_id,
+                projection_slot,
+                removed[start : start + PROJECTION_BATCH_SIZE],
+            )
+        counts.written += len(removed)
+
+    def _project_message_changes(
+        self,
+        canonical_connection: sqlite3.Connection,
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        projection_slot: int,
+        conversations: list[CanonicalProjectionConversation],
+        message_ids: list[str],
+        counts: MessageWriteCounts,
+    ) -> None:
+        """Apply point message work as single-row writes.
+
+        Each named message is re-read from canonical truth: a live message is
+        upserted if its source hash changed, a tombstoned one is removed. The
+        rest of the conversation is not read.
+        """
+        if not conversations:
+            return
+        self._insert_pipeline_material(
+            projection_connection,
+            account_id,
+            projection_slot,
+            self.pipeline.project(conversations, []),
+        )
+        for start in range(0, len(message_ids), PROJECTION_BATCH_SIZE):
+            chunk = message_ids[start : start + PROJECTION_BATCH_SIZE]
+            placeholders = ",".join("?" for _ in chunk)
+            canonical = [
+                _projection_message(row)
+                for row in canonical_connection.execute(
+                    f"""SELECT m.chat_id,m.message_id,m.sender_platform_user_id,m.text,
+                               m.sent_at,m.direction
+                          FROM account_messages m
+                         WHERE m.creator_account_id=? AND m.is_deleted=0
+                           AND {merge_visible('m')} AND m.message_id IN ({placeholders})
+                         ORDER BY m.chat_id,m.sent_at,m.message_id""",
+                    (account_id, *chunk),
                 )
-                for row in rows
             ]
-            batch = self.pipeline.project(conversations, messages)
-            analysis_by_message = {
-                item.message_id: item for item in batch.analyses
-            }
-            if (
-                len(analysis_by_message) != len(batch.analyses)
-                or set(analysis_by_message) != {item.message_id for item in messages}
-            ):
-                raise RuntimeError(
-                    "projection pipeline did not analyze each canonical message exactly once"
+            if canonical:
+                self._apply_message_batch(
+                    projection_connection,
+                    account_id,
+                    projection_slot,
+                    conversations,
+                    canonical,
+                    counts,
                 )
-            projection_connection.executemany(
-                """INSERT INTO projection_messages(
-                       creator_account_id,projection_slot,conversation_id,message_id,text,sent_at,
-                       direction,sentiment
-                   ) VALUES (?,?,?,?,?,?,?,?)""",
-                (
-                    (
-                        account_id,
-                        projection_slot,
-                        item.conversation_id,
-                        item.message_id,
-                        item.text,
-                        item.sent_at,
-                        item.direction,
-                        analysis_by_message[item.message_id].sentiment,
-                    )
-                    for item in messages
-                ),
-            )
-            self._insert_pipeline_material(
-                projection_connection, account_id, projection_slot, batch
+            live = {item.message_id for item in canonical}
+            gone = [message_id for message_id in chunk if message_id not in live]
+            if not gone:
+                continue
+            gone_placeholders = ",".join("?" for _ in gone)
+            removed = [
+                str(row[0])
+                for row in projection_connection.execute(
+                    f"""SELECT message_id FROM projection_messages
+                         WHERE creator_account_id=? AND projection_slot=?
+                           AND message_id IN ({gone_placeholders})""",
+                    (account_id, projection_slot, *gone),
+                )
+            ]
+            self._delete_projection_messages(
+                projection_connection, account_id, projection_slot, removed
             )
+            counts.written += len(removed)
 
     def _write_conversation_summaries(
         self,
@@ -2272,24 +3571,19 @@ class ProjectionRepository:
             return
         ids = [str(row[0]) for row in chat_rows]
         placeholders = ",".join("?" for _ in ids)
-        latest_by_chat = {
-            str(row[0]): row[1:]
-            for row in projection_connection.execute(
-                f"""WITH ranked AS (
-                        SELECT conversation_id,message_id,text,sent_at,direction,sentiment,
-                               ROW_NUMBER() OVER (
-                                   PARTITION BY conversation_id
-                                   ORDER BY sent_at DESC,message_id DESC
-                               ) AS position
-                           FROM projection_messages
-                          WHERE creator_account_id=? AND projection_slot=?
-                            AND conversation_id IN ({placeholders})
-                    )
-                    SELECT conversation_id,message_id,text,sent_at,direction,sentiment
-                      FROM ranked WHERE position=1""",
-                (account_id, projection_slot, *ids),
-            )
-        }
+        # One projection_messages_page probe per conversation, so the cost does
+        # not grow with conversation length.
+        latest_by_chat = {}
+        for conversation_id in ids:
+            latest = projection_connection.execute(
+                """SELECT message_id,text,sent_at,direction,sentiment
+                     FROM projection_messages
+                    WHERE creator_account_id=? AND projection_slot=? AND conversation_id=?
+                    ORDER BY sent_at DESC,message_id DESC LIMIT 1""",
+                (account_id, projection_slot, conversation_id),
+            ).fetchone()
+            if latest is not None:
+                latest_by_chat[conversation_id] = latest
         members: dict[str, sqlite3.Row] = {}
         if active_generation is not None:
             members = {
@@ -2303,7 +3597,7 @@ class ProjectionRepository:
                     (account_id, active_generation, *ids),
                 )
             }
-        documents: list[tuple[str, int, str, str]] = []
+        documents: list[tuple[Any, ...]] = []
         for chat in chat_rows:
             conversation_id = str(chat[0])
             latest = latest_by_chat.get(conversation_id)
@@ -2328,13 +3622,27 @@ class ProjectionRepository:
                     generation_closed_at=generation_closed_at,
                 ),
             }
-            documents.append((account_id, projection_slot, conversation_id, _json(document)))
+            documents.append((
+                account_id,
+                projection_slot,
+                conversation_id,
+                _json(document),
+                document["last_message_at"] or "",
+                document["display_name"] or "",
+                document["unread_count"],
+                None if latest is None else latest[3],
+            ))
         projection_connection.executemany(
             """INSERT INTO conversation_summaries(
-                   creator_account_id,projection_slot,conversation_id,document_json
-               ) VALUES (?,?,?,?)
+                   creator_account_id,projection_slot,conversation_id,document_json,
+                   last_message_at,display_name,unread_count,latest_direction
+               ) VALUES (?,?,?,?,?,?,?,?)
                ON CONFLICT(creator_account_id,projection_slot,conversation_id) DO UPDATE SET
-                   document_json=excluded.document_json""",
+                   document_json=excluded.document_json,
+                   last_message_at=excluded.last_message_at,
+                   display_name=excluded.display_name,
+                   unread_count=excluded.unread_count,
+                   latest_direction=excluded.latest_direction""",
             documents,
         )
 
@@ -2349,21 +3657,56 @@ class ProjectionRepository:
         *,
         active_generation: str | None,
         generation_closed_at: str | None,
+        counts: MessageWriteCounts,
+        message_changes: dict[str, list[str]] | None = None,
     ) -> None:
-        self._delete_projection_conversations(
-            projection_connection, account_id, projection_slot, rebuild_ids
-        )
+        """Project touched conversations into the slot.
+
+        ``rebuild_ids`` are diffed whole against canonical truth.
+        ``message_changes`` maps conversations with only point work to the
+        messages it named; every other conversation refreshes its summary.
+        """
         if not conversation_ids:
             return
         placeholders = ",".join("?" for _ in conversation_ids)
         chat_rows = canonical_connection.execute(
             f"""SELECT chat_id,platform_user_id,display_name
                   FROM account_chats
-                 WHERE creator_account_id=? AND is_deleted=0
+                 WHERE creator_account_id=? AND is_deleted=0 AND {merge_visible('account_chats')}
                    AND chat_id IN ({placeholders}) ORDER BY chat_id""",
             (account_id, *conversation_ids),
         ).fetchall()
+        live = {str(row[0]) for row in chat_rows}
+        # Live conversations are diffed message by message; only conversations
+        # gone from canonical truth are dropped wholesale.
+        point = message_changes or {}
+        self._delete_projection_conversations(
+            projection_connection,
+            account_id,
+            projection_slot,
+            [
+                conversation_id
+                for conversation_id in (*rebuild_ids, *point)
+                if conversation_id not in live
+            ],
+        )
         rebuild = set(rebuild_ids)
+        if point:
+            # Point work assumes the slot already holds the conversation; one
+            # it does not hold yet is built whole.
+            point_placeholders = ",".join("?" for _ in point)
+            present = {
+                str(row[0])
+                for row in projection_connection.execute(
+                    f"""SELECT conversation_id FROM conversation_summaries
+                         WHERE creator_account_id=? AND projection_slot=?
+                           AND conversation_id IN ({point_placeholders})""",
+                    (account_id, projection_slot, *point),
+                )
+            }
+            rebuild.update(
+                conversation_id for conversation_id in point if conversation_id not in present
+            )
         conversations = [
             CanonicalProjectionConversation(str(row[0]), row[1], row[2])
             for row in chat_rows
@@ -2388,6 +3731,25 @@ class ProjectionRepository:
             account_id,
             projection_slot,
             conversations,
+            counts,
+        )
+        point_conversations = [
+            CanonicalProjectionConversation(str(row[0]), row[1], row[2])
+            for row in chat_rows
+            if str(row[0]) in point and str(row[0]) not in rebuild
+        ]
+        self._project_message_changes(
+            canonical_connection,
+            projection_connection,
+            account_id,
+            projection_slot,
+            point_conversations,
+            [
+                message_id
+                for conversation in point_conversations
+                for message_id in point[conversation.conversation_id]
+            ],
+            counts,
         )
         self._write_conversation_summaries(
             canonical_connection,
@@ -2399,104 +3761,288 @@ class ProjectionRepository:
             generation_closed_at=generation_closed_at,
         )
 
-    @staticmethod
-    def _clear_projection_slot(
-        connection: sqlite3.Connection, account_id: str, projection_slot: int
-    ) -> None:
-        for table in (
-            "projection_lpg_edges",
-            "projection_lpg_nodes",
-            "projection_message_analysis",
-            "projection_messages",
-            "conversation_summaries",
-        ):
-            connection.execute(
-                f"DELETE FROM {table} WHERE creator_account_id=? AND projection_slot=?",
-                (account_id, projection_slot),
-            )
-        connection.execute(
-            """DELETE FROM projection_analytics
-                WHERE creator_account_id=? AND projection_slot=?""",
-            (account_id, projection_slot),
-        )
-
     @classmethod
-    def _clone_projection_slot(
+    def _fold_projection_conversations(
         cls,
         connection: sqlite3.Connection,
         account_id: str,
         source_slot: int,
         target_slot: int,
+        conversation_ids: list[str],
     ) -> None:
-        """Seed the second slot with one bounded-memory, set-based SQLite copy."""
-        cls._clear_projection_slot(connection, account_id, target_slot)
+        """Replace the target slot's copy of each conversation with the source slot's."""
+        if not conversation_ids:
+            return
+        cls._delete_projection_conversations(
+            connection, account_id, target_slot, conversation_ids
+        )
+        placeholders = ",".join("?" for _ in conversation_ids)
+        parameters = (target_slot, account_id, source_slot, *conversation_ids)
         connection.execute(
-            """INSERT INTO conversation_summaries(
-                   creator_account_id,projection_slot,conversation_id,document_json
-               ) SELECT creator_account_id,?,conversation_id,document_json
+            f"""INSERT INTO conversation_summaries(
+                   creator_account_id,projection_slot,conversation_id,document_json,
+                   last_message_at,display_name,unread_count,latest_direction
+               ) SELECT creator_account_id,?,conversation_id,document_json,
+                        last_message_at,display_name,unread_count,latest_direction
                    FROM conversation_summaries
-                  WHERE creator_account_id=? AND projection_slot=?""",
-            (target_slot, account_id, source_slot),
+                  WHERE creator_account_id=? AND projection_slot=?
+                    AND conversation_id IN ({placeholders})""",
+            parameters,
         )
         connection.execute(
-            """INSERT INTO projection_messages(
+            f"""INSERT INTO projection_messages(
                    creator_account_id,projection_slot,conversation_id,message_id,text,sent_at,
                    direction,sentiment
                ) SELECT creator_account_id,?,conversation_id,message_id,text,sent_at,
                         direction,sentiment
                    FROM projection_messages
-                  WHERE creator_account_id=? AND projection_slot=?""",
-            (target_slot, account_id, source_slot),
+                  WHERE creator_account_id=? AND projection_slot=?
+                    AND conversation_id IN ({placeholders})""",
+            parameters,
         )
         connection.execute(
-            """INSERT INTO projection_message_analysis(
+            f"""INSERT INTO projection_message_analysis(
                    creator_account_id,projection_slot,conversation_id,message_id,source_hash,
                    analysis_status,sentiment,analyzer_id,document_json
                ) SELECT creator_account_id,?,conversation_id,message_id,source_hash,
                         analysis_status,sentiment,analyzer_id,document_json
                    FROM projection_message_analysis
-                  WHERE creator_account_id=? AND projection_slot=?""",
-            (target_slot, account_id, source_slot),
+                  WHERE creator_account_id=? AND projection_slot=?
+                    AND conversation_id IN ({placeholders})""",
+            parameters,
         )
         connection.execute(
-            """INSERT INTO projection_lpg_nodes(
+            f"""INSERT INTO projection_lpg_nodes(
                    creator_account_id,projection_slot,conversation_id,node_id,node_kind,entity_id,
                    document_json
                ) SELECT creator_account_id,?,conversation_id,node_id,node_kind,entity_id,
                         document_json
                    FROM projection_lpg_nodes
-                  WHERE creator_account_id=? AND projection_slot=?""",
-            (target_slot, account_id, source_slot),
+                  WHERE creator_account_id=? AND projection_slot=?
+                    AND conversation_id IN ({placeholders})""",
+            parameters,
         )
         connection.execute(
-            """INSERT INTO projection_lpg_edges(
+            f"""INSERT INTO projection_lpg_edges(
                    creator_account_id,projection_slot,conversation_id,edge_id,source_node_id,
                    target_node_id,relationship,document_json
                ) SELECT creator_account_id,?,conversation_id,edge_id,source_node_id,
                         target_node_id,relationship,document_json
                    FROM projection_lpg_edges
-                  WHERE creator_account_id=? AND projection_slot=?""",
-            (target_slot, account_id, source_slot),
+                  WHERE creator_account_id=? AND projection_slot=?
+                    AND conversation_id IN ({placeholders})""",
+            parameters,
         )
         connection.execute(
-            """INSERT INTO projection_analytics(
-                   creator_account_id,projection_slot,document_json
-               ) SELECT creator_account_id,?,document_json
-                   FROM projection_analytics
-                  WHERE creator_account_id=? AND projection_slot=?""",
-            (target_slot, account_id, source_slot),
+            f"""DELETE FROM projection_slot_overrides
+                WHERE creator_account_id=? AND projection_slot=?
+                  AND conversation_id IN ({placeholders})""",
+            (account_id, target_slot, *conversation_ids),
         )
+
+    @classmethod
+    def _fold_projection_messages(
+        cls,
+        connection: sqlite3.Connection,
+        account_id: str,
+        source_slot: int,
+        target_slot: int,
+        conversation_id: str,
+    ) -> None:
+        """Copy one conversation's summary, node and overridden messages."""
+        conversation_parameters = (target_slot, account_id, source_slot, conversation_id)
         connection.execute(
-            """INSERT OR IGNORE INTO projection_work_applied(
-                   creator_account_id,projection_slot,work_id,applied_at
-               ) SELECT creator_account_id,?,work_id,applied_at
-                   FROM projection_work_applied
-                  WHERE creator_account_id=? AND projection_slot=?""",
-            (target_slot, account_id, source_slot),
+            """INSERT INTO conversation_summaries(
+                   creator_account_id,projection_slot,conversation_id,document_json,
+                   last_message_at,display_name,unread_count,latest_direction
+               ) SELECT creator_account_id,?,conversation_id,document_json,
+                        last_message_at,display_name,unread_count,latest_direction
+                   FROM conversation_summaries
+                  WHERE creator_account_id=? AND projection_slot=? AND conversation_id=?
+               ON CONFLICT(creator_account_id,projection_slot,conversation_id) DO UPDATE SET
+                   document_json=excluded.document_json,
+                   last_message_at=excluded.last_message_at,
+                   display_name=excluded.display_name,
+                   unread_count=excluded.unread_count,
+                   latest_direction=excluded.latest_direction""",
+            conversation_parameters,
         )
+        connection.execute(
+            """INSERT INTO projection_lpg_nodes(
+                   creator_account_id,projection_slot,conversation_id,node_id,node_kind,entity_id,
+                   document_json
+               ) SELECT creator_account_id,?,conversation_id,node_id,node_kind,entity_id,
+                        document_json
+                   FROM projection_lpg_nodes
+                  WHERE creator_account_id=? AND projection_slot=? AND conversation_id=?
+                    AND node_kind='conversation'
+               ON CONFLICT(creator_account_id,projection_slot,node_id) DO UPDATE SET
+                   document_json=excluded.document_json""",
+            conversation_parameters,
+        )
+        while message_ids := [
+            str(row[0])
+            for row in connection.execute(
+                """SELECT message_id FROM projection_slot_message_overrides
+                    WHERE creator_account_id=? AND projection_slot=? AND conversation_id=?
+                    ORDER BY message_id LIMIT ?""",
+                (account_id, target_slot, conversation_id, PROJECTION_BATCH_SIZE),
+            )
+        ]:
+            cls._delete_projection_messages(connection, account_id, target_slot, message_ids)
+            placeholders = ",".join("?" for _ in message_ids)
+            parameters = (target_slot, account_id, source_slot, *message_ids)
+            connection.execute(
+                f"""INSERT INTO projection_messages(
+                       creator_account_id,projection_slot,conversation_id,message_id,text,
+                       sent_at,direction,sentiment
+                   ) SELECT creator_account_id,?,conversation_id,message_id,text,sent_at,
+                            direction,sentiment
+                       FROM projection_messages
+                      WHERE creator_account_id=? AND projection_slot=?
+                        AND message_id IN ({placeholders})""",
+                parameters,
+            )
+            connection.execute(
+                f"""INSERT INTO projection_message_analysis(
+                       creator_account_id,projection_slot,conversation_id,message_id,source_hash,
+                       analysis_status,sentiment,analyzer_id,document_json
+                   ) SELECT creator_account_id,?,conversation_id,message_id,source_hash,
+                            analysis_status,sentiment,analyzer_id,document_json
+                       FROM projection_message_analysis
+                      WHERE creator_account_id=? AND projection_slot=?
+                        AND message_id IN ({placeholders})""",
+                parameters,
+            )
+            connection.execute(
+                f"""INSERT INTO projection_lpg_nodes(
+                       creator_account_id,projection_slot,conversation_id,node_id,node_kind,
+                       entity_id,document_json
+                   ) SELECT creator_account_id,?,conversation_id,node_id,node_kind,entity_id,
+                            document_json
+                       FROM projection_lpg_nodes
+                      WHERE creator_account_id=? AND projection_slot=? AND node_kind='message'
+                        AND entity_id IN ({placeholders})""",
+                parameters,
+            )
+            connection.execute(
+                f"""INSERT INTO projection_lpg_edges(
+                       creator_account_id,projection_slot,conversation_id,edge_id,source_node_id,
+                       target_node_id,relationship,document_json
+                   ) SELECT e.creator_account_id,?,e.conversation_id,e.edge_id,e.source_node_id,
+                            e.target_node_id,e.relationship,e.document_json
+                       FROM projection_lpg_edges e
+                       JOIN projection_lpg_nodes n
+                         ON n.creator_account_id=e.creator_account_id
+                        AND n.projection_slot=e.projection_slot
+                        AND n.node_id=e.target_node_id
+                      WHERE e.creator_account_id=? AND e.projection_slot=?
+                        AND n.node_kind='message' AND n.entity_id IN ({placeholders})""",
+                parameters,
+            )
+            connection.execute(
+                f"""DELETE FROM projection_slot_message_overrides
+                    WHERE creator_account_id=? AND projection_slot=? AND conversation_id=?
+                      AND message_id IN ({placeholders})""",
+                (account_id, target_slot, conversation_id, *message_ids),
+            )
+        connection.execute(
+            """DELETE FROM projection_slot_overrides
+                WHERE creator_account_id=? AND projection_slot=? AND conversation_id=?""",
+            (account_id, target_slot, conversation_id),
+        )
+
+    @classmethod
+    def _fold_projection_overlay(
+        cls,
+        connection: sqlite3.Connection,
+        account_id: str,
+        source_slot: int,
+        target_slot: int,
+        *,
+        limit: int | None = None,
+    ) -> int:
+        """Copy up to ``limit`` overridden conversations into the target slot."""
+        folded = 0
+        while limit is None or folded < limit:
+            batch = CONVERSATION_BATCH_SIZE if limit is None else min(
+                CONVERSATION_BATCH_SIZE, limit - folded
+            )
+            # A partial override of a conversation the target does not hold
+            # yet has nothing to patch, so it is copied whole.
+            rows = connection.execute(
+                """SELECT o.conversation_id,
+                          o.whole_conversation OR NOT EXISTS (
+                              SELECT 1 FROM conversation_summaries s
+                               WHERE s.creator_account_id=o.creator_account_id
+                                 AND s.projection_slot=o.projection_slot
+                                 AND s.conversation_id=o.conversation_id
+                          )
+                     FROM projection_slot_overrides o
+                    WHERE o.creator_account_id=? AND o.projection_slot=?
+                    ORDER BY o.conversation_id LIMIT ?""",
+                (account_id, target_slot, batch),
+            ).fetchall()
+            if not rows:
+                break
+            cls._fold_projection_conversations(
+                connection,
+                account_id,
+                source_slot,
+                target_slot,
+                [str(row[0]) for row in rows if row[1]],
+            )
+            for row in rows:
+                if not row[1]:
+                    cls._fold_projection_messages(
+                        connection, account_id, source_slot, target_slot, str(row[0])
+                    )
+            folded += len(rows)
+        return folded
+
+    def compact_overlays(
+        self, account_id: str, *, limit: int = CONVERSATION_BATCH_SIZE
+    ) -> int:
+        """Fold part of the lagging slot's overlay forward and return how much.
+
+        Each call is one short write transaction, so an idle caller can bring
+        the lagging slot level with the active one between catch-ups without
+        holding the writer for the whole account. Only a slot lagging behind
+        the canonically active generation is touched; a committed generation
+        still awaiting activation is never modified.
+        """
+        _, authority = self._projection_authority(account_id)
+        if authority is None:
+            return 0
+        with self.database.transaction(lane="maintenance") as connection:
+            overlay = connection.execute(
+                """SELECT o.projection_slot,o.source_slot
+                     FROM projection_slot_overlays o
+                     JOIN projection_accounts s
+                       ON s.creator_account_id=o.creator_account_id
+                      AND s.projection_slot=o.source_slot
+                      AND s.projected_revision=o.through_revision
+                    WHERE o.creator_account_id=? AND s.generation_id=?""",
+                (account_id, authority["generation_id"]),
+            ).fetchone()
+            if overlay is None:
+                return 0
+            return self._fold_projection_overlay(
+                connection, account_id, int(overlay[1]), int(overlay[0]), limit=limit
+            )
 
     def catch_up(self, account_id: str) -> dict[str, Any] | None:
         """Replay durable work into the inactive slot, then canonically activate it."""
+        if self.advance(account_id) is None:
+            return None
+        return self.snapshot(account_id)
+
+    def advance(self, account_id: str) -> int | None:
+        """Activate the next projection generation and return its view revision.
+
+        Unlike :meth:`catch_up` no snapshot is rendered, so callers that only
+        publish the changed conversations never read the whole slot.
+        """
         canonical_connection = self.canonical.database.connect()
         try:
             canonical_connection.execute("BEGIN")
@@ -2528,14 +4074,7 @@ class ProjectionRepository:
             ).fetchone()
             active_generation_id = None if activated is None else activated[0]
 
-            with self.database.read() as connection:
-                slots = connection.execute(
-                    """SELECT generation_id,projected_revision,read_revision,generated_at,
-                              status,projection_slot
-                         FROM projection_accounts WHERE creator_account_id=?
-                        ORDER BY projection_slot""",
-                    (account_id,),
-                ).fetchall()
+            slots, overlays = self._projection_slots(account_id)
             active_projection = next(
                 (
                     row
@@ -2574,7 +4113,7 @@ class ProjectionRepository:
                         read_revision=int(committed[2]),
                         committed_at=str(committed[3]),
                     )
-                    return self.snapshot(account_id)
+                    return int(committed[2])
 
             if target_revision is None:
                 canonical_connection.rollback()
@@ -2590,8 +4129,16 @@ class ProjectionRepository:
             base_projection = next(
                 (row for row in slots if int(row[5]) == build_slot), None
             )
-            seed_from_active = base_projection is None and active_projection is not None
-            if seed_from_active:
+            overlay = overlays.get(build_slot)
+            fold_from_active = active_projection is not None and (
+                base_projection is None
+                or (
+                    overlay is not None
+                    and overlay[0] == active_slot
+                    and overlay[1] == int(active_projection[1])
+                )
+            )
+            if fold_from_active:
                 base_revision = int(active_projection[1])
             else:
                 base_revision = 0 if base_projection is None else int(base_projection[1])
@@ -2604,247 +4151,114 @@ class ProjectionRepository:
                       AND canonical_revision<=?""",
                 (account_id, base_revision, target_revision),
             ).fetchone()
-            full_reseed = (base_projection is None and not seed_from_active) or bool(replay[0])
+            full_reseed = (base_projection is None and active_projection is None) or bool(
+                replay[0]
+            )
             has_global_coverage = bool(replay[1])
 
             now = _iso(utc_now())
             self._ensure_activation_intent(account_id, target_revision, now)
             generation_id = str(uuid4())
             next_view = current_view + 1
-            coverage_head = canonical_connection.execute(
-                """SELECT active_generation_id FROM account_coverage_heads
-                   WHERE creator_account_id=?""",
-                (account_id,),
-            ).fetchone()
-            active_generation = None if coverage_head is None else coverage_head[0]
-            generation_closed_at = None
-            coverage_state = None
-            if active_generation is not None:
-                generation = canonical_connection.execute(
-                    """SELECT state,closed_at FROM coverage_generations
-                       WHERE creator_account_id=? AND generation_id=?""",
-                    (account_id, active_generation),
-                ).fetchone()
-                if generation is not None:
-                    coverage_state = str(generation[0])
-                    generation_closed_at = generation[1]
+            active_generation, coverage_state, generation_closed_at = (
+                self._coverage_generation(canonical_connection, account_id)
+            )
 
-            with self.database.transaction() as projection_connection:
-                projection_connection.execute(
-                    """DELETE FROM projection_change_log
-                        WHERE creator_account_id=? AND projection_slot=?
-                          AND read_revision>=?""",
-                    (account_id, build_slot, next_view),
+            with self.database.transaction(lane="projection") as projection_connection:
+                self._open_build_slot(
+                    projection_connection,
+                    account_id,
+                    build_slot,
+                    generation_id=generation_id,
+                    target_revision=target_revision,
+                    next_view=next_view,
+                    now=now,
                 )
-                projection_connection.execute(
-                    """INSERT INTO projection_accounts(
-                           creator_account_id,projection_slot,generation_id,projected_revision,
-                           read_revision,generated_at,status
-                       ) VALUES (?,?,?,?,?,?,'current')
-                       ON CONFLICT(creator_account_id,projection_slot) DO UPDATE SET
-                           generation_id=excluded.generation_id,
-                           projected_revision=excluded.projected_revision,
-                           read_revision=excluded.read_revision,
-                           generated_at=excluded.generated_at,status='current'""",
-                    (
-                        account_id,
-                        build_slot,
-                        generation_id,
-                        target_revision,
-                        next_view,
-                        now,
-                    ),
+                self._catch_up_from_active(
+                    projection_connection,
+                    account_id,
+                    build_slot,
+                    active_slot,
+                    base_projection=base_projection,
+                    base_revision=base_revision,
+                    fold_from_active=fold_from_active and not full_reseed,
                 )
-                projection_connection.execute(
-                    "DROP TABLE IF EXISTS temp.projection_touched_conversations"
+                self._collect_projection_work(
+                    canonical_connection,
+                    projection_connection,
+                    account_id,
+                    build_slot,
+                    base_revision=base_revision,
+                    target_revision=target_revision,
+                    now=now,
                 )
-                if seed_from_active and not full_reseed:
-                    self._clone_projection_slot(
+                counts = MessageWriteCounts()
+                if full_reseed:
+                    self._reseed_conversations(
+                        canonical_connection,
                         projection_connection,
                         account_id,
-                        int(active_projection[5]),
                         build_slot,
+                        active_generation=active_generation,
+                        generation_closed_at=generation_closed_at,
+                        counts=counts,
                     )
-                projection_connection.execute(
-                    """CREATE TEMP TABLE projection_touched_conversations(
-                           conversation_id TEXT PRIMARY KEY,
-                           rebuild_entities INTEGER NOT NULL CHECK (rebuild_entities IN (0,1))
-                       ) WITHOUT ROWID"""
-                )
-                cursor = canonical_connection.execute(
-                    """SELECT work_id,work_kind,conversation_id
-                       FROM projection_work
-                      WHERE creator_account_id=? AND canonical_revision>?
-                        AND canonical_revision<=? ORDER BY work_id""",
-                    (account_id, base_revision, target_revision),
-                )
-                while rows := cursor.fetchmany(PROJECTION_BATCH_SIZE):
-                    projection_connection.executemany(
-                        """INSERT OR IGNORE INTO projection_work_applied(
-                               creator_account_id,projection_slot,work_id,applied_at
-                           ) VALUES (?,?,?,?)""",
-                        [
-                            (account_id, build_slot, int(row[0]), now)
-                            for row in rows
-                        ],
-                    )
-                    projection_connection.executemany(
-                        """INSERT INTO projection_touched_conversations(
-                               conversation_id,rebuild_entities
-                           ) VALUES (?,?)
-                           ON CONFLICT(conversation_id) DO UPDATE SET
-                               rebuild_entities=MAX(
-                                   rebuild_entities,excluded.rebuild_entities
-                               )""",
-                        [
-                            (str(row[2]), 1 if row[1] in {"entity", "reseed"} else 0)
-                            for row in rows
-                            if row[2] is not None
-                        ],
-                    )
-
-                if full_reseed:
-                    self._clear_projection_slot(
-                        projection_connection, account_id, build_slot
-                    )
-                    chat_cursor = canonical_connection.execute(
-                        """SELECT chat_id FROM account_chats
-                           WHERE creator_account_id=? AND is_deleted=0 ORDER BY chat_id""",
-                        (account_id,),
-                    )
-                    while chat_rows := chat_cursor.fetchmany(CONVERSATION_BATCH_SIZE):
-                        ids = [str(row[0]) for row in chat_rows]
-                        self._process_conversation_ids(
-                            canonical_connection,
-                            projection_connection,
-                            account_id,
-                            build_slot,
-                            ids,
-                            ids,
-                            active_generation=active_generation,
-                            generation_closed_at=generation_closed_at,
-                        )
                     change_kind = "reseed"
                 else:
-                    touched_cursor = projection_connection.execute(
-                        """SELECT conversation_id,rebuild_entities
-                           FROM projection_touched_conversations ORDER BY conversation_id"""
+                    self._project_touched_conversations(
+                        canonical_connection,
+                        projection_connection,
+                        account_id,
+                        build_slot,
+                        active_generation=active_generation,
+                        generation_closed_at=generation_closed_at,
+                        counts=counts,
                     )
-                    while touched := touched_cursor.fetchmany(CONVERSATION_BATCH_SIZE):
-                        ids = [str(row[0]) for row in touched]
-                        rebuild_ids = [str(row[0]) for row in touched if int(row[1])]
-                        self._process_conversation_ids(
+                    change_kind = "incremental"
+                    if has_global_coverage:
+                        self._refresh_conversation_coverage(
                             canonical_connection,
                             projection_connection,
                             account_id,
                             build_slot,
-                            ids,
-                            rebuild_ids,
                             active_generation=active_generation,
                             generation_closed_at=generation_closed_at,
+                            counts=counts,
                         )
-                    change_kind = "incremental"
-                    if has_global_coverage:
-                        chat_cursor = canonical_connection.execute(
-                            """SELECT chat_id FROM account_chats
-                               WHERE creator_account_id=? AND is_deleted=0 ORDER BY chat_id""",
-                            (account_id,),
-                        )
-                        while chat_rows := chat_cursor.fetchmany(CONVERSATION_BATCH_SIZE):
-                            ids = [str(row[0]) for row in chat_rows]
-                            self._process_conversation_ids(
-                                canonical_connection,
-                                projection_connection,
-                                account_id,
-                                build_slot,
-                                ids,
-                                [],
-                                active_generation=active_generation,
-                                generation_closed_at=generation_closed_at,
-                            )
                         change_kind = "coverage_refresh"
-
-                counts = canonical_connection.execute(
-                    """SELECT COUNT(*),SUM(direction='inbound'),SUM(direction='outbound'),
-                              MIN(sent_at),MAX(sent_at)
-                       FROM account_messages
-                      WHERE creator_account_id=? AND is_deleted=0""",
-                    (account_id,),
-                ).fetchone()
-                chat_count = int(
-                    canonical_connection.execute(
-                        """SELECT COUNT(*) FROM account_chats
-                           WHERE creator_account_id=? AND is_deleted=0""",
-                        (account_id,),
-                    ).fetchone()[0]
-                )
-                observed_range = {"start": counts[3], "end": counts[4]}
-                basis = "complete" if coverage_state == "complete" else "synced_subset"
-                complete_range = dict(observed_range) if basis == "complete" else None
-                total_messages = int(counts[0] or 0)
-                analytics = {
-                    "total_conversations": self._metric(
-                        chat_count, basis=basis, observed_range=observed_range,
-                        complete_range=complete_range, sample_size=chat_count, as_of=now,
-                        projection_revision=target_revision,
-                    ),
-                    "total_messages": self._metric(
-                        total_messages, basis=basis, observed_range=observed_range,
-                        complete_range=complete_range, sample_size=total_messages, as_of=now,
-                        projection_revision=target_revision,
-                    ),
-                    "inbound_messages": self._metric(
-                        int(counts[1] or 0), basis=basis, observed_range=observed_range,
-                        complete_range=complete_range, sample_size=total_messages, as_of=now,
-                        projection_revision=target_revision,
-                    ),
-                    "outbound_messages": self._metric(
-                        int(counts[2] or 0), basis=basis, observed_range=observed_range,
-                        complete_range=complete_range, sample_size=total_messages, as_of=now,
-                        projection_revision=target_revision,
-                    ),
-                }
-                projection_connection.execute(
-                    """INSERT INTO projection_analytics(
-                           creator_account_id,projection_slot,document_json
-                       ) VALUES (?,?,?)
-                       ON CONFLICT(creator_account_id,projection_slot) DO UPDATE SET
-                           document_json=excluded.document_json""",
-                    (account_id, build_slot, _json(analytics)),
-                )
-                touched_count = int(
-                    projection_connection.execute(
-                        "SELECT COUNT(*) FROM projection_touched_conversations"
-                    ).fetchone()[0]
+                self._write_projection_analytics(
+                    canonical_connection,
+                    projection_connection,
+                    account_id,
+                    build_slot,
+                    coverage_state=coverage_state,
+                    target_revision=target_revision,
+                    now=now,
                 )
-                touched_ids = None
-                if touched_count <= 100:
-                    touched_ids = [
-                        str(row[0])
-                        for row in projection_connection.execute(
-                            """SELECT conversation_id
-                               FROM projection_touched_conversations ORDER BY conversation_id"""
-                        )
-                    ]
-                projection_connection.execute(
-                    """INSERT INTO projection_change_log(
-                           creator_account_id,projection_slot,read_revision,generation_id,
-                           projected_revision,change_kind,touched_conversations_json,committed_at
-                       ) VALUES (?,?,?,?,?,?,?,?)""",
-                    (
+                if active_slot is not None:
+                    self._record_active_slot_overlay(
+                        projection_connection,
                         account_id,
                         build_slot,
-                        next_view,
-                        generation_id,
-                        target_revision,
-                        change_kind,
-                        _json({"count": touched_count, "conversation_ids": touched_ids}),
-                        now,
-                    ),
+                        active_slot,
+                        target_revision=target_revision,
+                        whole_account=full_reseed or has_global_coverage,
+                    )
+                self._log_projection_change(
+                    projection_connection,
+                    account_id,
+                    build_slot,
+                    generation_id=generation_id,
+                    target_revision=target_revision,
+                    next_view=next_view,
+                    now=now,
+                    change_kind=change_kind,
+                    counts=counts,
                 )
             canonical_connection.rollback()
         finally:
             canonical_connection.close()
+        self.database.note_bulk_write(counts.written)
 
         self._activate_committed_projection(
             account_id,
@@ -2853,11 +4267,525 @@ class ProjectionRepository:
             read_revision=next_view,
             committed_at=now,
         )
-        return self.snapshot(account_id)
+        return next_view
+
+    def _projection_slots(
+        self, account_id: str
+    ) -> tuple[list[sqlite3.Row], dict[int, tuple[int, int]]]:
+        """Return the account's slot rows and each lagging slot's (source, through)."""
+        with self.database.read() as connection:
+            slots = connection.execute(
+                """SELECT generation_id,projected_revision,read_revision,generated_at,
+                          status,projection_slot
+                     FROM projection_accounts WHERE creator_account_id=?
+                    ORDER BY projection_slot""",
+                (account_id,),
+            ).fetchall()
+            overlays = {
+                int(row[0]): (int(row[1]), int(row[2]))
+                for row in connection.execute(
+                    """SELECT projection_slot,source_slot,through_revision
+                         FROM projection_slot_overlays WHERE creator_account_id=?""",
+                    (account_id,),
+                )
+            }
+        return slots, overlays
+
+    @staticmethod
+    def _coverage_generation(
+        canonical_connection: sqlite3.Connection, account_id: str
+    ) -> tuple[str | None, str | None, str | None]:
+        """Return the active coverage generation, its state and when it closed."""
+        coverage_head = canonical_connection.execute(
+            """SELECT active_generation_id FROM account_coverage_heads
+               WHERE creator_account_id=?""",
+            (account_id,),
+        ).fetchone()
+        active_generation = None if coverage_head is None else coverage_head[0]
+        if active_generation is None:
+            return None, None, None
+        generation = canonical_connection.execute(
+            """SELECT state,closed_at FROM coverage_generations
+               WHERE creator_account_id=? AND generation_id=?""",
+            (account_id, active_generation),
+        ).fetchone()
+        if generation is None:
+            return active_generation, None, None
+        return active_generation, str(generation[0]), generation[1]
+
+    def _open_build_slot(
+        self,
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        build_slot: int,
+        *,
+        generation_id: str,
+        target_revision: int,
+        next_view: int,
+        now: str,
+    ) -> None:
+        """Claim the build slot for a new generation, dropping its abandoned log."""
+        projection_connection.execute(
+            """DELETE FROM projection_change_log
+                WHERE creator_account_id=? AND projection_slot=?
+                  AND read_revision>=?""",
+            (account_id, build_slot, next_view),
+        )
+        projection_connection.execute(
+            """INSERT INTO projection_accounts(
+                   creator_account_id,projection_slot,generation_id,projected_revision,
+                   read_revision,generated_at,status
+               ) VALUES (?,?,?,?,?,?,'current')
+               ON CONFLICT(creator_account_id,projection_slot) DO UPDATE SET
+                   generation_id=excluded.generation_id,
+                   projected_revision=excluded.projected_revision,
+                   read_revision=excluded.read_revision,
+                   generated_at=excluded.generated_at,status='current'""",
+            (
+                account_id,
+                build_slot,
+                generation_id,
+                target_revision,
+                next_view,
+                now,
+            ),
+        )
+
+    def _catch_up_from_active(
+        self,
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        build_slot: int,
+        active_slot: int | None,
+        *,
+        base_projection: sqlite3.Row | None,
+        base_revision: int,
+        fold_from_active: bool,
+    ) -> None:
+        """Bring the build slot level with the active generation copy-on-write.
+
+        Conversations the active generation wrote since this slot was built
+        are copied from it, and only work after the active generation runs
+        through the pipeline. A missing slot is seeded the same way with
+        every conversation.
+        """
+        if fold_from_active:
+            if base_projection is None:
+                projection_connection.execute(
+                    """INSERT INTO projection_slot_overlays(
+                           creator_account_id,projection_slot,source_slot,
+                           through_revision
+                       ) VALUES (?,?,?,?)""",
+                    (account_id, build_slot, active_slot, base_revision),
+                )
+                projection_connection.execute(
+                    """INSERT INTO projection_slot_overrides(
+                           creator_account_id,projection_slot,conversation_id
+                       ) SELECT creator_account_id,?,conversation_id
+                           FROM conversation_summaries
+                          WHERE creator_account_id=? AND projection_slot=?""",
+                    (build_slot, account_id, active_slot),
+                )
+            self._fold_projection_overlay(
+                projection_connection, account_id, active_slot, build_slot
+            )
+            projection_connection.execute(
+                """INSERT OR IGNORE INTO projection_work_applied(
+                       creator_account_id,projection_slot,work_id,applied_at
+                   ) SELECT creator_account_id,?,work_id,applied_at
+                       FROM projection_work_applied
+                      WHERE creator_account_id=? AND projection_slot=?
+                        AND work_id>(
+                            SELECT COALESCE(MAX(work_id),0)
+                              FROM projection_work_applied
+                             WHERE creator_account_id=? AND projection_slot=?
+                        )""",
+                (build_slot, account_id, active_slot, account_id, build_slot),
+            )
+        projection_connection.execute(
+            """DELETE FROM projection_slot_overlays
+                WHERE creator_account_id=? AND projection_slot=?""",
+            (account_id, build_slot),
+        )
+
+    @staticmethod
+    def _collect_projection_work(
+        canonical_connection: sqlite3.Connection,
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        build_slot: int,
+        *,
+        base_revision: int,
+        target_revision: int,
+        now: str,
+    ) -> None:
+        """Mark the work being applied and stage the conversations and messages it touches.
+
+        ``temp.projection_touched_conversations`` holds each conversation's
+        projection level; ``temp.projection_touched_messages`` names the
+        messages of point work so they can be written individually.
+        """
+        projection_connection.execute(
+            "DROP TABLE IF EXISTS temp.projection_touched_conversations"
+        )
+        projection_connection.execute(
+            "DROP TABLE IF EXISTS temp.projection_touched_messages"
+        )
+        projection_connection.execute(
+            """CREATE TEMP TABLE projection_touched_conversations(
+                   conversation_id TEXT PRIMARY KEY,
+                   projection_level INTEGER NOT NULL CHECK (projection_level IN (0,1,2))
+               ) WITHOUT ROWID"""
+        )
+        projection_connection.execute(
+            """CREATE TEMP TABLE projection_touched_messages(
+                   conversation_id TEXT NOT NULL,
+                   message_id TEXT NOT NULL,
+                   PRIMARY KEY (conversation_id, message_id)
+               ) WITHOUT ROWID"""
+        )
+        cursor = canonical_connection.execute(
+            """SELECT work_id,work_kind,conversation_id,work_scope,message_id
+               FROM projection_work
+              WHERE creator_account_id=? AND canonical_revision>?
+                AND canonical_revision<=? ORDER BY work_id""",
+            (account_id, base_revision, target_revision),
+        )
+        while rows := cursor.fetchmany(PROJECTION_BATCH_SIZE):
+            projection_connection.executemany(
+                """INSERT OR IGNORE INTO projection_work_applied(
+                       creator_account_id,projection_slot,work_id,applied_at
+                   ) VALUES (?,?,?,?)""",
+                [
+                    (account_id, build_slot, int(row[0]), now)
+                    for row in rows
+                ],
+            )
+            projection_connection.executemany(
+                """INSERT INTO projection_touched_conversations(
+                       conversation_id,projection_level
+                   ) VALUES (?,?)
+                   ON CONFLICT(conversation_id) DO UPDATE SET
+                       projection_level=MAX(
+                           projection_level,excluded.projection_level
+                       )""",
+                [
+                    (str(row[2]), _projection_work_level(row[1], row[3]))
+                    for row in rows
+                    if row[2] is not None
+                ],
+            )
+            projection_connection.executemany(
+                """INSERT OR IGNORE INTO projection_touched_messages(
+                       conversation_id,message_id
+                   ) VALUES (?,?)""",
+                [
+                    (str(row[2]), str(row[4]))
+                    for row in rows
+                    if row[2] is not None and row[4] is not None
+                ],
+            )
+
+    def _reseed_conversations(
+        self,
+        canonical_connection: sqlite3.Connection,
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        build_slot: int,
+        *,
+        active_generation: str | None,
+        generation_closed_at: str | None,
+        counts: MessageWriteCounts,
+    ) -> None:
+        """Diff every live conversation against whatever the slot already holds.
+
+        Unchanged messages are not rewritten; conversations no longer live are
+        removed from the slot.
+        """
+        projection_connection.execute(
+            """CREATE TEMP TABLE IF NOT EXISTS projection_live_conversations(
+                   conversation_id TEXT PRIMARY KEY
+               ) WITHOUT ROWID"""
+        )
+        projection_connection.execute(
+            "DELETE FROM temp.projection_live_conversations"
+        )
+        chat_cursor = canonical_connection.execute(
+            f"""SELECT chat_id FROM account_chats
+               WHERE creator_account_id=? AND is_deleted=0 AND {merge_visible('account_chats')}
+               ORDER BY chat_id""",
+            (account_id,),
+        )
+        while chat_rows := chat_cursor.fetchmany(CONVERSATION_BATCH_SIZE):
+            ids = [str(row[0]) for row in chat_rows]
+            projection_connection.executemany(
+                """INSERT INTO temp.projection_live_conversations(conversation_id)
+                   VALUES (?)""",
+                ((conversation_id,) for conversation_id in ids),
+            )
+            self._process_conversation_ids(
+                canonical_connection,
+                projection_connection,
+                account_id,
+                build_slot,
+                ids,
+                ids,
+                active_generation=active_generation,
+                generation_closed_at=generation_closed_at,
+                counts=counts,
+            )
+        stale_cursor = projection_connection.execute(
+            """SELECT conversation_id FROM conversation_summaries
+                WHERE creator_account_id=? AND projection_slot=?
+                  AND conversation_id NOT IN (
+                      SELECT conversation_id FROM temp.projection_live_conversations
+                  )""",
+            (account_id, build_slot),
+        )
+        stale_ids = [str(row[0]) for row in stale_cursor]
+        for start in range(0, len(stale_ids), CONVERSATION_BATCH_SIZE):
+            self._delete_projection_conversations(
+                projection_connection,
+                account_id,
+                build_slot,
+                stale_ids[start : start + CONVERSATION_BATCH_SIZE],
+            )
+
+    def _project_touched_conversations(
+        self,
+        canonical_connection: sqlite3.Connection,
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        build_slot: int,
+        *,
+        active_generation: str | None,
+        generation_closed_at: str | None,
+        counts: MessageWriteCounts,
+    ) -> None:
+        """Apply the staged work, rebuilding whole conversations only where required.
+
+        Conversations with only point work have just their named messages
+        written; the rest are diffed whole against canonical truth.
+        """
+        touched_cursor = projection_connection.execute(
+            """SELECT conversation_id,projection_level
+               FROM projection_touched_conversations ORDER BY conversation_id"""
+        )
+        while touched := touched_cursor.fetchmany(CONVERSATION_BATCH_SIZE):
+            ids = [str(row[0]) for row in touched]
+            rebuild_ids = [str(row[0]) for row in touched if int(row[1]) == 2]
+            message_changes: dict[str, list[str]] = {
+                str(row[0]): [] for row in touched if int(row[1]) == 1
+            }
+            if message_changes:
+                placeholders = ",".join("?" for _ in message_changes)
+                for row in projection_connection.execute(
+                    f"""SELECT conversation_id,message_id
+                          FROM projection_touched_messages
+                         WHERE conversation_id IN ({placeholders})
+                         ORDER BY conversation_id,message_id""",
+                    tuple(message_changes),
+                ):
+                    message_changes[str(row[0])].append(str(row[1]))
+            self._process_conversation_ids(
+                canonical_connection,
+                projection_connection,
+                account_id,
+                build_slot,
+                ids,
+                rebuild_ids,
+                active_generation=active_generation,
+                generation_closed_at=generation_closed_at,
+                counts=counts,
+                message_changes=message_changes,
+            )
+
+    def _refresh_conversation_coverage(
+        self,
+        canonical_connection: sqlite3.Connection,
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        build_slot: int,
+        *,
+        active_generation: str | None,
+        generation_closed_at: str | None,
+        counts: MessageWriteCounts,
+    ) -> None:
+        """Re-render every live conversation's summary after account-wide coverage work."""
+        chat_cursor = canonical_connection.execute(
+            f"""SELECT chat_id FROM account_chats
+               WHERE creator_account_id=? AND is_deleted=0 AND {merge_visible('account_chats')}
+               ORDER BY chat_id""",
+            (account_id,),
+        )
+        while chat_rows := chat_cursor.fetchmany(CONVERSATION_BATCH_SIZE):
+            ids = [str(row[0]) for row in chat_rows]
+            self._process_conversation_ids(
+                canonical_connection,
+                projection_connection,
+                account_id,
+                build_slot,
+                ids,
+                [],
+                active_generation=active_generation,
+                generation_closed_at=generation_closed_at,
+                counts=counts,
+            )
+
+    def _write_projection_analytics(
+        self,
+        canonical_connection: sqlite3.Connection,
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        build_slot: int,
+        *,
+        coverage_state: str | None,
+        target_revision: int,
+        now: str,
+    ) -> None:
+        """Write the slot's account metrics from the maintained message counters."""
+        totals = account_totals(canonical_connection, account_id)
+        chat_count = totals.chat_count
+        observed_range = {"start": totals.first_sent_at, "end": totals.last_sent_at}
+        basis = "complete" if coverage_state == "complete" else "synced_subset"
+        complete_range = dict(observed_range) if basis == "complete" else None
+        total_messages = totals.message_count
+        analytics = {
+            "total_conversations": self._metric(
+                chat_count, basis=basis, observed_range=observed_range,
+                complete_range=complete_range, sample_size=chat_count, as_of=now,
+                projection_revision=target_revision,
+            ),
+            "total_messages": self._metric(
+                total_messages, basis=basis, observed_range=observed_range,
+                complete_range=complete_range, sample_size=total_messages, as_of=now,
+                projection_revision=target_revision,
+            ),
+            "inbound_messages": self._metric(
+                totals.inbound_count, basis=basis, observed_range=observed_range,
+                complete_range=complete_range, sample_size=total_messages, as_of=now,
+                projection_revision=target_revision,
+            ),
+            "outbound_messages": self._metric(
+                totals.outbound_count, basis=basis, observed_range=observed_range,
+                complete_range=complete_range, sample_size=total_messages, as_of=now,
+                projection_revision=target_revision,
+            ),
+        }
+        projection_connection.execute(
+            """INSERT INTO projection_analytics(
+                   creator_account_id,projection_slot,document_json
+               ) VALUES (?,?,?)
+               ON CONFLICT(creator_account_id,projection_slot) DO UPDATE SET
+                   document_json=excluded.document_json""",
+            (account_id, build_slot, _json(analytics)),
+        )
+
+    @staticmethod
+    def _record_active_slot_overlay(
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        build_slot: int,
+        active_slot: int,
+        *,
+        target_revision: int,
+        whole_account: bool,
+    ) -> None:
+        """Record what the active slot now lags this generation by, for a later fold."""
+        projection_connection.execute(
+            """INSERT INTO projection_slot_overlays(
+                   creator_account_id,projection_slot,source_slot,through_revision
+               ) VALUES (?,?,?,?)
+               ON CONFLICT(creator_account_id,projection_slot) DO UPDATE SET
+                   source_slot=excluded.source_slot,
+                   through_revision=excluded.through_revision""",
+            (account_id, active_slot, build_slot, target_revision),
+        )
+        if whole_account:
+            projection_connection.execute(
+                """INSERT INTO projection_slot_overrides(
+                       creator_account_id,projection_slot,conversation_id
+                   ) SELECT DISTINCT creator_account_id,?,conversation_id
+                       FROM conversation_summaries
+                      WHERE creator_account_id=? AND projection_slot IN (?,?)
+                   ON CONFLICT(creator_account_id,projection_slot,conversation_id)
+                   DO UPDATE SET whole_conversation=1""",
+                (active_slot, account_id, active_slot, build_slot),
+            )
+        else:
+            # Conversations with only point or summary work fold
+            # just their summary, node and named messages.
+            projection_connection.execute(
+                """INSERT INTO projection_slot_overrides(
+                       creator_account_id,projection_slot,conversation_id,
+                       whole_conversation
+                   ) SELECT ?,?,conversation_id,projection_level=2
+                       FROM projection_touched_conversations WHERE true
+                   ON CONFLICT(creator_account_id,projection_slot,conversation_id)
+                   DO UPDATE SET whole_conversation=MAX(
+                       whole_conversation,excluded.whole_conversation
+                   )""",
+                (account_id, active_slot),
+            )
+            projection_connection.execute(
+                """INSERT OR IGNORE INTO projection_slot_message_overrides(
+                       creator_account_id,projection_slot,conversation_id,message_id
+                   ) SELECT ?,?,conversation_id,message_id
+                       FROM projection_touched_messages""",
+                (account_id, active_slot),
+            )
+
+    @staticmethod
+    def _log_projection_change(
+        projection_connection: sqlite3.Connection,
+        account_id: str,
+        build_slot: int,
+        *,
+        generation_id: str,
+        target_revision: int,
+        next_view: int,
+        now: str,
+        change_kind: str,
+        counts: MessageWriteCounts,
+    ) -> None:
+        """Append the generation's change-log entry that delta publishing reads."""
+        touched_count = int(
+            projection_connection.execute(
+                "SELECT COUNT(*) FROM projection_touched_conversations"
+            ).fetchone()[0]
+        )
+        touched_ids = None
+        if touched_count <= 100:
+            touched_ids = [
+                str(row[0])
+                for row in projection_connection.execute(
+                    """SELECT conversation_id
+                       FROM projection_touched_conversations ORDER BY conversation_id"""
+                )
+            ]
+        projection_connection.execute(
+            """INSERT INTO projection_change_log(
+                   creator_account_id,projection_slot,read_revision,generation_id,
+                   projected_revision,change_kind,touched_conversations_json,committed_at,
+                   messages_written,messages_skipped
+               ) VALUES (?,?,?,?,?,?,?,?,?,?)""",
+            (
+                account_id,
+                build_slot,
+                next_view,
+                generation_id,
+                target_revision,
+                change_kind,
+                _json({"count": touched_count, "conversation_ids": touched_ids}),
+                now,
+                counts.written,
+                counts.skipped,
+            ),
+        )
 
     def conversation_exists(self, account_id: str, conversation_id: str) -> bool:
         _, authority = self._projection_authority(account_id)
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             connection.execute("BEGIN")
             account = self._readable_projection_account(connection, account_id, authority)
             if account is None:
@@ -2880,7 +4808,7 @@ class ProjectionRepository:
         expected_revision: int | None = None,
     ) -> tuple[list[dict[str, Any]], bool, dict[str, Any]]:
         _, authority = self._projection_authority(account_id)
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             connection.execute("BEGIN")
             account = self._readable_projection_account(connection, account_id, authority)
             if account is None:
@@ -2923,21 +4851,322 @@ class ProjectionRepository:
             "generated_at": account[3],
         }
 
-    def snapshot(self, account_id: str) -> dict[str, Any]:
+    def message_page(
+        self,
+        account_id: str,
+        conversation_id: str,
+        *,
+        before: tuple[str, str] | None,
+        limit: int,
+        expected_generation: str | None = None,
+        expected_revision: int | None = None,
+        fetch_rows: bool = True,
+        read_ahead: bool = False,
+        authority_cache: dict[str, tuple[int, dict[str, Any]]] | None = None,
+    ) -> ProjectionMessagePage | None:
+        """Resolve a conversation page inside one projection read transaction.
+
+        Returns ``None`` when no generation is readable or the conversation is
+        not in it. With ``read_ahead`` the range read also covers the next
+        page, which the caller can serve without touching SQLite again.
+        """
+        canonical_revision, authority = self._projection_authority(
+            account_id, cache=authority_cache
+        )
+        with self.database.read_only() as connection:
+            connection.execute("BEGIN")
+            account = self._readable_projection_account(connection, account_id, authority)
+            if account is None and authority_cache is not None and account_id in authority_cache:
+                # A cached pointer outlived its generation (a reset store, say);
+                # resolve it afresh against this same read snapshot.
+                authority_cache.pop(account_id, None)
+                canonical_revision, authority = self._projection_authority(
+                    account_id, cache=authority_cache
+                )
+                account = self._readable_projection_account(connection, account_id, authority)
+            if account is None:
+                return None
+            projection_slot = int(account[5])
+            if connection.execute(
+                """SELECT 1 FROM conversation_summaries
+                   WHERE creator_account_id=? AND projection_slot=?
+                     AND conversation_id=?""",
+                (account_id, projection_slot, conversation_id),
+            ).fetchone() is None:
+                return None
+            if (
+                (expected_generation is not None and account[0] != expected_generation)
+                or (expected_revision is not None and int(account[1]) != expected_revision)
+            ):
+                raise ProjectionCursorStale("cursor_stale")
+            rows: list[sqlite3.Row] = []
+            if fetch_rows:
+                parameters: list[Any] = [account_id, projection_slot, conversation_id]
+                predicate = ""
+                if before is not None:
+                    predicate = " AND (sent_at < ? OR (sent_at = ? AND message_id < ?))"
+                    parameters.extend([before[0], before[0], before[1]])
+                parameters.append(limit * (2 if read_ahead else 1) + 1)
+                rows = connection.execute(
+                    f"""SELECT message_id,text,sent_at,direction,sentiment
+                        FROM projection_messages
+                        WHERE creator_account_id=? AND projection_slot=?
+                          AND conversation_id=? {predicate}
+                        ORDER BY sent_at DESC,message_id DESC LIMIT ?""",
+                    parameters,
+                ).fetchall()
+
+        def _items(selected: list[sqlite3.Row]) -> list[dict[str, Any]]:
+            return [
+                {
+                    "message_id": row[0],
+                    "text": row[1],
+                    "sent_at": row[2],
+                    "direction": row[3],
+                    "sentiment": row[4],
+                }
+                for row in reversed(selected)
+            ]
+
+        has_more = len(rows) > limit
+        following = rows[limit : 2 * limit]
+        return ProjectionMessagePage(
+            generation={
+                "generation_id": account[0],
+                "projected_revision": int(account[1]),
+                "read_revision": int(account[2]),
+                "generated_at": account[3],
+            },
+            projection=self._projection_state_document(
+                canonical_revision, account, missing_reason="projection_missing"
+            ),
+            items=_items(rows[:limit]) if fetch_rows else None,
+            has_more=has_more,
+            read_ahead=(
+                (_items(following), len(rows) > 2 * limit)
+                if fetch_rows and read_ahead and following
+                else None
+            ),
+        )
+
+    def message_tails(
+        self,
+        account_id: str,
+        conversation_ids: list[str],
+        *,
+        limit: int,
+        authority_cache: dict[str, tuple[int, dict[str, Any]]] | None = None,
+    ) -> ProjectionMessageTails | None:
+        """Read the newest ``limit`` messages of each conversation in one query.
+
+        Every conversation gets its own ``LIMIT`` range read on
+        ``projection_messages_page``, joined with ``UNION ALL`` so a long
+        thread never costs more than its tail. Returns ``None`` when no
+        generation is readable.
+        """
+        canonical_revision, authority = self._projection_authority(
+            account_id, cache=authority_cache
+        )
+        with self.database.read_only() as connection:
+            connection.execute("BEGIN")
+            account = self._readable_projection_account(connection, account_id, authority)
+            if account is None and authority_cache is not None and account_id in authority_cache:
+                authority_cache.pop(account_id, None)
+                canonical_revision, authority = self._projection_authority(
+                    account_id, cache=authority_cache
+                )
+                account = self._readable_projection_account(connection, account_id, authority)
+            if account is None:
+                return None
+            projection_slot = int(account[5])
+            tails: dict[str, tuple[list[dict[str, Any]], bool]] = {}
+            rows: list[sqlite3.Row] = []
+            if conversation_ids:
+                placeholders = ",".join("?" for _ in conversation_ids)
+                present = {
+                    str(row[0])
+                    for row in connection.execute(
+                        f"""SELECT conversation_id FROM conversation_summaries
+                             WHERE creator_account_id=? AND projection_slot=?
+                               AND conversation_id IN ({placeholders})""",
+                        (account_id, projection_slot, *conversation_ids),
+                    )
+                }
+                tails = {
+                    conversation_id: ([], False)
+                    for conversation_id in conversation_ids
+                    if conversation_id in present
+                }
+            if tails:
+                per_conversation = """SELECT * FROM (
+                       SELECT conversation_id,message_id,text,sent_at,direction,sentiment
+                         FROM projection_messages INDEXED BY projection_messages_page
+                        WHERE creator_account_id=? AND projection_slot=? AND conversation_id=?
+                        ORDER BY sent_at DESC,message_id DESC LIMIT ?
+                   )"""
+                parameters: list[Any] = []
+                for conversation_id in tails:
+                    parameters.extend([account_id, projection_slot, conversation_id, limit + 1])
+                rows = connection.execute(
+                    " UNION ALL ".join(per_conversation for _ in tails), parameters
+                ).fetchall()
+        grouped: dict[str, list[sqlite3.Row]] = {}
+        for row in rows:
+            grouped.setdefault(str(row[0]), []).append(row)
+        for conversation_id, selected in grouped.items():
+            tails[conversation_id] = (
+                [
+                    {
+                        "message_id": row[1],
+                        "text": row[2],
+                        "sent_at": row[3],
+                        "direction": row[4],
+                        "sentiment": row[5],
+                    }
+                    for row in reversed(selected[:limit])
+                ],
+                len(selected) > limit,
+            )
+        return ProjectionMessageTails(
+            generation={
+                "generation_id": account[0],
+                "projected_revision": int(account[1]),
+                "read_revision": int(account[2]),
+                "generated_at": account[3],
+            },
+            projection=self._projection_state_document(
+                canonical_revision, account, missing_reason="projection_missing"
+            ),
+            tails=tails,
+        )
+
+    def conversation_page(
+        self,
+        account_id: str,
+        *,
+        order: str,
+        after: tuple[Any, ...] | None,
+        limit: int,
+        unread_only: bool = False,
+        direction: str | None = None,
+        name_prefix: str | None = None,
+        expected_generation: str | None = None,
+        expected_revision: int | None = None,
+        authority_cache: dict[str, tuple[int, dict[str, Any]]] | None = None,
+    ) -> ProjectionConversationPage | None:
+        """Read one sorted, filtered page of summaries on the order's index.
+
+        Sorting and filtering use the typed summary columns, so only the rows
+        on the page have their documents read. Returns ``None`` when no
+        generation is readable.
+        """
+        keys, descending, index = CONVERSATION_ORDERS[order]
+        canonical_revision, authority = self._projection_authority(
+            account_id, cache=authority_cache
+        )
+        with self.database.read_only() as connection:
+            connection.execute("BEGIN")
+            account = self._readable_projection_account(connection, account_id, authority)
+            if account is None and authority_cache is not None and account_id in authority_cache:
+                authority_cache.pop(account_id, None)
+                canonical_revision, authority = self._projection_authority(
+                    account_id, cache=authority_cache
+                )
+                account = self._readable_projection_account(connection, account_id, authority)
+            if account is None:
+                return None
+            if (
+                (expected_generation is not None and account[0] != expected_generation)
+                or (expected_revision is not None and int(account[1]) != expected_revision)
+            ):
+                raise ProjectionCursorStale("cursor_stale")
+            predicates = ["creator_account_id=?", "projection_slot=?"]
+            parameters: list[Any] = [account_id, int(account[5])]
+            if after is not None:
+                placeholders = ",".join("?" for _ in keys)
+                predicates.append(
+                    f"({','.join(keys)}) {'<' if descending else '>'} ({placeholders})"
+                )
+                parameters.extend(after)
+            if unread_only:
+                predicates.append("unread_count>0")
+            if direction is not None:
+                predicates.append("latest_direction=?")
+                parameters.append(direction)
+            if name_prefix:
+                escaped = (
+                    name_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                )
+                predicates.append("display_name LIKE ? ESCAPE '\\'")
+                parameters.append(f"{escaped}%")
+            parameters.append(limit + 1)
+            ordering = ",".join(f"{key}{' DESC' if descending else ''}" for key in keys)
+            rows = connection.execute(
+                f"""SELECT {','.join(keys)},document_json
+                      FROM conversation_summaries INDEXED BY {index}
+                     WHERE {' AND '.join(predicates)}
+                     ORDER BY {ordering} LIMIT ?""",
+                parameters,
+            ).fetchall()
+        selected = rows[:limit]
+        return ProjectionConversationPage(
+            generation={
+                "generation_id": account[0],
+                "projected_revision": int(account[1]),
+                "read_revision": int(account[2]),
+                "generated_at": account[3],
+            },
+            projection=self._projection_state_document(
+                canonical_revision, account, missing_reason="projection_missing"
+            ),
+            items=[json.loads(row[len(keys)]) for row in selected],
+            next_after=(
+                tuple(selected[-1][: len(keys)]) if len(rows) > limit and selected else None
+            ),
+        )
+
+    def snapshot(
+        self, account_id: str, *, conversation_ids: frozenset[str] | None = None
+    ) -> dict[str, Any]:
+        """Render the active generation, optionally limited to a conversation set."""
+        return self.versioned_snapshot(account_id, conversation_ids=conversation_ids)[0]
+
+    def versioned_snapshot(
+        self,
+        account_id: str,
+        *,
+        conversation_ids: frozenset[str] | None = None,
+        cached_version: tuple[str, int, int] | None = None,
+    ) -> tuple[dict[str, Any], tuple[str, int, int] | None]:
+        """Render a snapshot with the generation version its summaries came from.
+
+        The version is ``(generation_id, view_revision, projection_slot)``;
+        summaries of one version never change. When it equals
+        ``cached_version`` the summaries are not read and ``conversations`` is
+        left empty for the caller to fill from its cache. ``None`` means no
+        generation is readable.
+        """
         coverage = self.canonical.coverage(account_id)
         live = self.canonical.live_freshness(account_id)
         canonical_revision, authority = self._projection_authority(account_id)
-        with self.database.read() as connection:
+        with self.database.read_only() as connection:
             connection.execute("BEGIN")
-            raw_account = connection.execute(
-                "SELECT 1 FROM projection_accounts WHERE creator_account_id=?",
-                (account_id,),
-            ).fetchone()
-            account = self._readable_projection_account(connection, account_id, authority)
-            if account is None:
+            payload, account = self._snapshot_document(
+                connection,
+                account_id,
+                canonical_revision,
+                authority,
+                coverage=coverage,
+                live=live,
+            )
+            version = (
+                None
+                if account is None
+                else (str(account[0]), int(account[2]), int(account[5]))
+            )
+            if account is None or version == cached_version:
                 conversations = []
-                analytics_row = None
-            else:
+            elif conversation_ids is None:
                 conversations = [
                     json.loads(row[0])
                     for row in connection.execute(
@@ -2947,11 +5176,66 @@ class ProjectionRepository:
                         (account_id, int(account[5])),
                     )
                 ]
-                analytics_row = connection.execute(
-                    """SELECT document_json FROM projection_analytics
-                        WHERE creator_account_id=? AND projection_slot=?""",
-                    (account_id, int(account[5])),
-                ).fetchone()
+            else:
+                summaries = self._conversation_summaries(
+                    connection, account_id, int(account[5]), sorted(conversation_ids)
+                )
+                conversations = [summaries[key] for key in sorted(summaries)]
+        return {**payload, "conversations": conversations}, version
+
+    def snapshot_stream(
+        self, account_id: str, *, part_size: int = CONVERSATION_BATCH_SIZE
+    ) -> "ProjectionSnapshotStream":
+        """Open a full snapshot whose summaries are read ``part_size`` at a time.
+
+        The document is read now; each part is read later in a short
+        transaction of its own, anchored on the generation the document names.
+        """
+        coverage = self.canonical.coverage(account_id)
+        live = self.canonical.live_freshness(account_id)
+        canonical_revision, authority = self._projection_authority(account_id)
+        with self.database.read_only() as connection:
+            connection.execute("BEGIN")
+            payload, account = self._snapshot_document(
+                connection,
+                account_id,
+                canonical_revision,
+                authority,
+                coverage=coverage,
+                live=live,
+            )
+        return ProjectionSnapshotStream(
+            self,
+            account_id,
+            None if account is None else int(account[5]),
+            authority,
+            payload,
+            part_size=part_size,
+        )
+
+    def _snapshot_document(
+        self,
+        connection: sqlite3.Connection,
+        account_id: str,
+        canonical_revision: int,
+        authority: dict[str, Any] | None,
+        *,
+        coverage: dict[str, Any],
+        live: dict[str, Any],
+    ) -> tuple[dict[str, Any], sqlite3.Row | None]:
+        """Render a snapshot without conversations and return its generation row."""
+        raw_account = connection.execute(
+            "SELECT 1 FROM projection_accounts WHERE creator_account_id=?",
+            (account_id,),
+        ).fetchone()
+        account = self._readable_projection_account(connection, account_id, authority)
+        analytics_row = None
+        if account is not None:
+            analytics_row = connection.execute(
+                """SELECT document_json FROM projection_analytics
+                    WHERE creator_account_id=? AND projection_slot=?""",
+                (account_id, int(account[5])),
+            ).fetchone()
         projection = self._projection_state_document(
             canonical_revision,
             account,
@@ -2985,9 +5269,140 @@ class ProjectionRepository:
             "creator_account_id": account_id,
             "view_revision": 0 if account is None else int(account[2]),
             "generated_at": now if account is None else account[3],
-            "conversations": conversations,
+            "conversations": [],
             "analytics": analytics,
             "coverage": coverage,
             "projection": projection,
             "live_freshness": live,
+        }, account
+
+    @staticmethod
+    def _conversation_summaries(
+        connection: sqlite3.Connection,
+        account_id: str,
+        projection_slot: int,
+        conversation_ids: list[str],
+    ) -> dict[str, dict[str, Any]]:
+        summaries: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(conversation_ids), CONVERSATION_BATCH_SIZE):
+            batch = conversation_ids[start : start + CONVERSATION_BATCH_SIZE]
+            placeholders = ",".join("?" for _ in batch)
+            for row in connection.execute(
+                f"""SELECT conversation_id,document_json FROM conversation_summaries
+                    WHERE creator_account_id=? AND projection_slot=?
+                      AND conversation_id IN ({placeholders})""",
+                (account_id, projection_slot, *batch),
+            ):
+                summaries[str(row[0])] = json.loads(row[1])
+        return summaries
+
+    def state_delta(
+        self,
+        account_id: str,
+        after_view_revision: int,
+        *,
+        max_changes: int,
+        conversation_ids: frozenset[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Render the changes since ``after_view_revision`` as one state delta.
+
+        The change log of every activated generation in the range names the
+        conversations it rebuilt; only those summaries are read. ``None`` means
+        the range cannot be expressed as a delta (a reseed or global coverage
+        refresh, a revision without a log entry, or more than ``max_changes``
+        changes) and the caller must fall back to a full snapshot. With
+        ``conversation_ids`` only those conversations are considered.
+        """
+        coverage = self.canonical.coverage(account_id)
+        live = self.canonical.live_freshness(account_id)
+        canonical_revision, authority = self._projection_authority(account_id)
+        with self.database.read_only() as connection:
+            connection.execute("BEGIN")
+            account = self._readable_projection_account(connection, account_id, authority)
+            if account is None or int(account[2]) <= after_view_revision:
+                return None
+            view_revision = int(account[2])
+            entries = connection.execute(
+                """SELECT read_revision,generation_id,change_kind,touched_conversations_json
+                     FROM projection_change_log
+                    WHERE creator_account_id=? AND projection_slot IN (0,1)
+                      AND read_revision>? AND read_revision<=?
+                    ORDER BY read_revision""",
+                (account_id, after_view_revision, view_revision),
+            ).fetchall()
+            revisions = [int(entry[0]) for entry in entries]
+            if (
+                revisions != list(range(after_view_revision + 1, view_revision + 1))
+                or str(entries[-1][1]) != str(account[0])
+            ):
+                return None
+            touched: set[str] = set()
+            for entry in entries:
+                touched_ids = json.loads(entry[3])["conversation_ids"]
+                if entry[2] != "incremental" or touched_ids is None:
+                    return None
+                touched.update(touched_ids)
+            if conversation_ids is not None:
+                touched &= conversation_ids
+            # analytics, coverage, projection and live_freshness are replaced too.
+            if len(touched) + 4 > max_changes:
+                return None
+            ordered = sorted(touched)
+            summaries = self._conversation_summaries(
+                connection, account_id, int(account[5]), ordered
+            )
+            removed = [item for item in ordered if item not in summaries]
+            base = connection.execute(
+                """SELECT projection_slot FROM projection_accounts
+                    WHERE creator_account_id=? AND projection_slot=? AND read_revision=?""",
+                (account_id, 1 - int(account[5]), after_view_revision),
+            ).fetchone()
+            if removed and base is not None:
+                # The Bridge rejects deleting a conversation it never held, so
+                # drop ids the base generation did not render either.
+                placeholders = ",".join("?" for _ in removed)
+                held = {
+                    str(row[0])
+                    for row in connection.execute(
+                        f"""SELECT conversation_id FROM conversation_summaries
+                            WHERE creator_account_id=? AND projection_slot=?
+                              AND conversation_id IN ({placeholders})""",
+                        (account_id, int(base[0]), *removed),
+                    )
+                }
+                ordered = [item for item in ordered if item in summaries or item in held]
+            analytics_row = connection.execute(
+                """SELECT document_json FROM projection_analytics
+                    WHERE creator_account_id=? AND projection_slot=?""",
+                (account_id, int(account[5])),
+            ).fetchone()
+        if analytics_row is None:
+            return None
+        changes: list[dict[str, Any]] = [
+            {"type": "conversation.upsert", "conversation": summaries[conversation_id]}
+            if conversation_id in summaries
+            else {"type": "conversation.delete", "conversation_id": conversation_id}
+            for conversation_id in ordered
+        ]
+        changes.extend(
+            [
+                {"type": "analytics.replace", "analytics": json.loads(analytics_row[0])},
+                {"type": "coverage.replace", "coverage": coverage},
+                {
+                    "type": "projection.replace",
+                    "projection": self._projection_state_document(
+                        canonical_revision,
+                        account,
+                        missing_reason="projection_activation_pending",
+                    ),
+                },
+                {"type": "live_freshness.replace", "live_freshness": live},
+            ]
+        )
+        return {
+            "creator_account_id": account_id,
+            "base_view_revision": after_view_revision,
+            "view_revision": view_revision,
+            "committed_at": account[3],
+            "changes": changes,
         }
@@ -0,0 +1,433 @@
+"""Offline bulk import of exported Agent snapshot frames into canonical SQLite.
+
+Chunk frames bypass the protocol envelope models and per-chunk transactions:
+their records are normalized once, hashed from a single canonical
+serialization and bulk-inserted into staging, many chunks per write
+transaction, with the same per-record hashes and chunk fingerprints as the
+live path. Begin and commit frames are fully validated and go through
+``HistoryRepository``, so the merge, its verification and the resulting
+canonical rows and revisions are identical to the online path. Loading runs
+with ``synchronous=OFF`` and deferred secondary staging indexes, and ends with
+one durable WAL checkpoint plus fsync. The importer takes the canonical writer
+lock, so it refuses to run while a Brain has the database open.
+
+Exports are NDJSON (one ``ingest.snapshot`` envelope per line) or a JSON
+array of envelopes; both are read incrementally.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from app.persistence.database import (
+    CanonicalSQLite,
+    LocalSQLite,
+    SQLiteConfigurationError,
+)
+from app.persistence.history import (
+    HistoryRepository,
+    IngestResult,
+    InvariantViolation,
+    StagedChunk,
+    StreamKey,
+    staged_chunk,
+)
+from app.persistence.migrations import (
+    InstallationMigrationLock,
+    Migration,
+    MigrationError,
+    MigrationLockError,
+    MigrationRunner,
+    canonical_writer_lock,
+    load_migration_catalog,
+)
+from app.protocol import AGENT_TO_BRAIN_ADAPTER
+from app.protocol.common import (
+    MAX_SNAPSHOT_RECORD_BYTES,
+    MAX_SNAPSHOT_RECORDS_PER_CHUNK,
+)
+from app.protocol.payloads import normalize_snapshot_records
+
+
+IMPORT_MERGE_SLICE_ROWS = 50_000
+IMPORT_TRANSACTION_ROWS = 50_000
+IMPORT_READ_BYTES = 1 << 20
+DEFERRED_STAGING_INDEXES = ("snapshot_messages_by_chat",)
+_SNAPSHOT_ENTITY_KINDS = frozenset({"chat", "message", "coverage_evidence"})
+
+
+class ImportFailure(RuntimeError):
+    """Stable import failure that contains no canonical values or paths."""
+
+    def __init__(self, code: str, public_message: str) -> None:
+        self.code = code
+        self.public_message = public_message
+        super().__init__(public_message)
+
+
+class BulkLoadCanonicalSQLite(CanonicalSQLite):
+    """Canonical connections that skip fsync until the importer checkpoints."""
+
+    def connect(self) -> sqlite3.Connection:
+        connection = super().connect()
+        connection.execute("PRAGMA synchronous = OFF")
+        return connection
+
+
+@dataclass(slots=True)
+class ImportSummary:
+    frames: int = 0
+    snapshots_committed: int = 0
+    snapshots_duplicate: int = 0
+    records: int = 0
+    canonical_revisions: dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "snapshots_committed": self.snapshots_committed,
+            "snapshots_duplicate": self.snapshots_duplicate,
+            "records": self.records,
+            "canonical_revisions": dict(sorted(self.canonical_revisions.items())),
+        }
+
+
+class _DeferredIndexes:
+    """Drop secondary staging indexes while loading and rebuild them from migrations.
+
+    Definitions come from the checksummed migration catalog rather than from
+    the live schema, so an import killed between drop and restore is repaired
+    by ``restore()`` at the start of the next import.
+    """
+
+    def __init__(self, database: LocalSQLite, catalog: list[Migration]) -> None:
+        self.database = database
+        self.definitions: dict[str, str] = {}
+        for name in DEFERRED_STAGING_INDEXES:
+            pattern = re.compile(rf"CREATE\s+INDEX\s+{name}\b[^;]*", re.IGNORECASE)
+            for migration in catalog:
+                for match in pattern.finditer(migration.sql):
+                    self.definitions[name] = match.group(0)
+        self._dropped = False
+
+    def drop(self) -> None:
+        if self._dropped:
+            return
+        with self.database.transaction() as connection:
+            for name in self.definitions:
+                connection.execute(f"DROP INDEX IF EXISTS {name}")
+        self._dropped = True
+
+    def restore(self) -> None:
+        with self.database.transaction() as connection:
+            for name, definition in self.definitions.items():
+                present = connection.execute(
+                    "SELECT 1 FROM sqlite_schema WHERE type='index' AND name=?",
+                    (name,),
+                ).fetchone()
+                if present is None:
+                    connection.execute(definition)
+        self._dropped = False
+
+
+def _array_documents(handle: TextIO, buffer: str) -> Iterator[Any]:
+    """Decode the elements of a top-level JSON array one at a time."""
+    decoder = json.JSONDecoder()
+    position = buffer.index("[") + 1
+    while True:
+        while position < len(buffer) and (buffer[position].isspace() or buffer[position] == ","):
+            position += 1
+        if position == len(buffer):
+            buffer, position = handle.read(IMPORT_READ_BYTES), 0
+            if not buffer:
+                raise ValueError("JSON array export is truncated")
+            continue
+        if buffer[position] == "]":
+            return
+        try:
+            document, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            more = handle.read(IMPORT_READ_BYTES)
+            if not more:
+                raise
+            buffer, position = buffer[position:] + more, 0
+            continue
+        yield document
+
+
+def _frame_documents(path: Path) -> Iterator[Any]:
+    """Yield one decoded envelope per NDJSON line or per JSON array element."""
+    with open(path, encoding="utf-8") as handle:
+        head = handle.read(IMPORT_READ_BYTES)
+        if head.lstrip().startswith("["):
+            yield from _array_documents(handle, head)
+            return
+        handle.seek(0)
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _snapshot_documents(path: Path) -> Iterator[dict[str, Any]]:
+    try:
+        for document in _frame_documents(path):
+            if not isinstance(document, dict) or document.get("type") != "ingest.snapshot":
+                raise ImportFailure(
+                    "import_frame_invalid",
+                    "Import files may only contain ingest.snapshot frames.",
+                )
+            yield document
+    except ImportFailure:
+        raise
+    except ValueError as error:
+        raise ImportFailure(
+            "import_frame_invalid",
+            "An import frame is not a valid protocol-v2 snapshot frame.",
+        ) from error
+    except OSError as error:
+        raise ImportFailure(
+            "import_input_unreadable",
+            "An import file could not be read.",
+        ) from error
+
+
+def _validated_frame(document: dict[str, Any]) -> Any:
+    try:
+        return AGENT_TO_BRAIN_ADAPTER.validate_json(json.dumps(document)).payload
+    except (ValidationError, ValueError, TypeError) as error:
+        raise ImportFailure(
+            "import_frame_invalid",
+            "An import frame is not a valid protocol-v2 snapshot frame.",
+        ) from error
+
+
+def _chunk_frame(document: dict[str, Any]) -> tuple[StreamKey, UUID, StagedChunk]:
+    """Reduce a chunk envelope to staging rows without building protocol models.
+
+    Records are still normalized through the protocol record schema, because
+    hashes and fingerprints are defined over the normalized form.
+    """
+    try:
+        payload = document["payload"]
+        chunk_index = payload["chunk_index"]
+        entity_kind = payload["entity_kind"]
+        records = payload["records"]
+        if (
+            document.get("protocol_version") != "2"
+            or not isinstance(chunk_index, int)
+            or isinstance(chunk_index, bool)
+            or chunk_index < 0
+            or entity_kind not in _SNAPSHOT_ENTITY_KINDS
+            or not isinstance(records, list)
+            or not 1 <= len(records) <= MAX_SNAPSHOT_RECORDS_PER_CHUNK
+            or not isinstance(payload["creator_account_id"], str)
+            or not payload["creator_account_id"]
+        ):
+            raise ValueError("chunk frame fields are invalid")
+        key = StreamKey(
+            payload["creator_account_id"],
+            UUID(payload["agent_installation_id"]),
+            UUID(payload["agent_stream_id"]),
+        )
+        snapshot_id = UUID(payload["snapshot_id"])
+        chunk = staged_chunk(
+            chunk_index, entity_kind, normalize_snapshot_records(entity_kind, records)
+        )
+    except (KeyError, TypeError, ValueError, ValidationError) as error:
+        raise ImportFailure(
+            "import_frame_invalid",
+            "An import frame is not a valid protocol-v2 snapshot frame.",
+        ) from error
+    if chunk.largest_record_bytes > MAX_SNAPSHOT_RECORD_BYTES:
+        raise ImportFailure(
+            "import_frame_invalid",
+            "An import frame is not a valid protocol-v2 snapshot frame.",
+        )
+    return key, snapshot_id, chunk
+
+
+def _raise_rejected(result: IngestResult) -> None:
+    if result.status not in {"accepted", "duplicate"}:
+        raise ImportFailure(
+            f"import_{result.code or result.status}",
+            "A snapshot frame was rejected by canonical ingestion.",
+        )
+
+
+def _durable_checkpoint(database: CanonicalSQLite) -> None:
+    """Fold the unsynced WAL into the main file and fsync it before returning."""
+    with database.read() as connection:
+        busy, _log, _checkpointed = connection.execute(
+            "PRAGMA wal_checkpoint(TRUNCATE)"
+        ).fetchone()
+        if busy:
+            raise ImportFailure(
+                "import_checkpoint_blocked",
+                "Another connection prevented the final canonical checkpoint.",
+            )
+    descriptor = os.open(database.path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+    directory_flag = getattr(os, "O_DIRECTORY", None)
+    if directory_flag is not None:
+        directory = os.open(database.path.parent, os.O_RDONLY | directory_flag)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def import_history(
+    canonical_path: str | Path,
+    inputs: list[str | Path],
+    *,
+    migrations_dir: str | Path | None = None,
+    busy_timeout_ms: int = 5_000,
+    merge_slice_rows: int = IMPORT_MERGE_SLICE_ROWS,
+    transaction_rows: int = IMPORT_TRANSACTION_ROWS,
+) -> ImportSummary:
+    """Bulk-load exported snapshot frames into canonical SQLite offline."""
+    database = CanonicalSQLite(canonical_path, busy_timeout_ms=busy_timeout_ms)
+    with contextlib.ExitStack() as locks:
+        try:
+            locks.enter_context(canonical_writer_lock(database))
+        except MigrationLockError as error:
+            raise ImportFailure(
+                "import_brain_running",
+                "Stop the Brain before importing history offline.",
+            ) from error
+        runner = MigrationRunner(database, migrations_dir=migrations_dir)
+        runner.run()
+        locks.enter_context(InstallationMigrationLock(runner.lock_path))
+        return _import_frames(
+            database,
+            inputs,
+            catalog=load_migration_catalog(runner.migrations_dir),
+            busy_timeout_ms=busy_timeout_ms,
+            merge_slice_rows=merge_slice_rows,
+            transaction_rows=transaction_rows,
+        )
+
+
+def _import_frames(
+    database: CanonicalSQLite,
+    inputs: list[str | Path],
+    *,
+    catalog: list[Migration],
+    busy_timeout_ms: int,
+    merge_slice_rows: int,
+    transaction_rows: int,
+) -> ImportSummary:
+    bulk = BulkLoadCanonicalSQLite(database.path, busy_timeout_ms=busy_timeout_ms)
+    history = HistoryRepository(bulk, merge_slice_rows=merge_slice_rows)
+    deferred = _DeferredIndexes(bulk, catalog)
+    summary = ImportSummary()
+    pending: list[StagedChunk] = []
+    pending_target: tuple[StreamKey, UUID] | None = None
+
+    def stage_pending() -> None:
+        nonlocal pending_target
+        if pending_target is None:
+            return
+        key, snapshot_id = pending_target
+        chunks, pending_target = list(pending), None
+        pending.clear()
+        deferred.drop()
+        results = history.add_snapshot_chunks(key, snapshot_id, chunks)
+        for chunk, result in zip(chunks, results):
+            if result.status == "accepted":
+                summary.records += len(chunk.rows)
+        _raise_rejected(results[-1])
+
+    # Repair indexes left dropped by an import that was killed mid-load.
+    deferred.restore()
+    try:
+        for path in inputs:
+            for document in _snapshot_documents(Path(path)):
+                summary.frames += 1
+                frame = document.get("payload")
+                if isinstance(frame, dict) and frame.get("frame_kind") == "chunk":
+                    key, snapshot_id, chunk = _chunk_frame(document)
+                    if pending_target != (key, snapshot_id):
+                        stage_pending()
+                    pending_target = (key, snapshot_id)
+                    pending.append(chunk)
+                    if sum(len(item.rows) for item in pending) >= transaction_rows:
+                        stage_pending()
+                    continue
+                stage_pending()
+                payload = _validated_frame(document)
+                key = StreamKey(
+                    str(payload.creator_account_id),
+                    payload.agent_installation_id,
+                    payload.agent_stream_id,
+                )
+                if payload.frame_kind == "begin":
+                    result = history.begin_snapshot(key, payload)
+                else:
+                    deferred.restore()
+                    result = history.commit_snapshot(key, payload)
+                    if result.status == "accepted":
+                        summary.snapshots_committed += 1
+                        summary.canonical_revisions[key.creator_account_id] = (
+                            history.account_revision(key.creator_account_id)[0]
+                        )
+                    elif result.snapshot_committed:
+                        summary.snapshots_duplicate += 1
+                _raise_rejected(result)
+        stage_pending()
+    except InvariantViolation as error:
+        raise ImportFailure(
+            "import_invariant_failed",
+            "Imported history violates a canonical invariant.",
+        ) from error
+    finally:
+        deferred.restore()
+    _durable_checkpoint(database)
+    database.validate_integrity()
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Import exported Agent snapshot frames into canonical SQLite."
+    )
+    parser.add_argument("--canonical-path", type=Path, required=True)
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=Path,
+        help="NDJSON files (one ingest.snapshot envelope per line) or JSON arrays.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    try:
+        summary = import_history(arguments.canonical_path, arguments.inputs)
+    except ImportFailure as error:
+        raise SystemExit(f"{error.code}: {error.public_message}") from error
+    except (MigrationError, SQLiteConfigurationError, sqlite3.Error) as error:
+        raise SystemExit(
+            "canonical_database_invalid: The canonical database could not be imported into."
+        ) from error
+    print(json.dumps(summary.as_dict(), sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - exercised through main()
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+"""Scheduled WAL, planner and free-page maintenance for local SQLite files."""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.persistence.database import LocalSQLite
+
+
+WAL_PASSIVE_CHECKPOINT_BYTES = 16 * 1024 * 1024
+WAL_TRUNCATE_CHECKPOINT_BYTES = 64 * 1024 * 1024
+OPTIMIZE_AFTER_BULK_ROWS = 10_000
+OPTIMIZE_INTERVAL_SECONDS = 6 * 60 * 60
+OPTIMIZE_ANALYSIS_LIMIT = 400
+VACUUM_PAGES_PER_RUN = 1024
+AUTO_VACUUM_CONVERT_BYTES = 64 * 1024 * 1024
+LONG_READER_SECONDS = 5 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceReport:
+    """What one maintenance pass did to one database file.
+
+    ``stalled_seconds`` is set once checkpoints have been unable to reach the
+    end of the WAL for ``long_reader_seconds``: some reader is holding an old
+    snapshot. ``oldest_reader_seconds`` is the age of the oldest connection
+    this process holds on the file, which names the culprit when it is local.
+    """
+
+    store_name: str
+    path: Path
+    wal_bytes: int
+    checkpoint: str | None = None
+    log_frames: int = 0
+    checkpointed_frames: int = 0
+    optimized: bool = False
+    vacuumed_pages: int = 0
+    auto_vacuum_converted: bool = False
+    stalled_seconds: float | None = None
+    oldest_reader_seconds: float | None = None
+
+
+@dataclass(slots=True)
+class _DatabaseState:
+    database: LocalSQLite
+    bulk_rows: int = 0
+    optimized_at: float = field(default_factory=time.monotonic)
+    stalled_since: float | None = None
+
+
+class SQLiteMaintenance:
+    """Keep WAL size, planner statistics and free pages bounded over long uptimes.
+
+    Each :meth:`run` makes one bounded pass over every registered file; a
+    passive checkpoint never waits for readers or writers, and the WAL is only
+    truncated after a passive checkpoint reached its end, so truncation does
+    not hold the writer while a reader drains. Callers schedule passes; every
+    step is a short statement of its own, so live writes interleave with it,
+    except the one-time rebuild of a file that predates incremental mode.
+    """
+
+    def __init__(
+        self,
+        databases: list[LocalSQLite] | None = None,
+        *,
+        passive_bytes: int = WAL_PASSIVE_CHECKPOINT_BYTES,
+        truncate_bytes: int = WAL_TRUNCATE_CHECKPOINT_BYTES,
+        optimize_after_rows: int = OPTIMIZE_AFTER_BULK_ROWS,
+        optimize_interval_seconds: float = OPTIMIZE_INTERVAL_SECONDS,
+        vacuum_pages: int = VACUUM_PAGES_PER_RUN,
+        long_reader_seconds: float = LONG_READER_SECONDS,
+        convert_free_bytes: int = AUTO_VACUUM_CONVERT_BYTES,
+    ) -> None:
+        if passive_bytes < 0 or truncate_bytes < passive_bytes:
+            raise ValueError("truncate_bytes must be at least passive_bytes")
+        if vacuum_pages < 1:
+            raise ValueError("vacuum_pages must be positive")
+        self.passive_bytes = passive_bytes
+        self.truncate_bytes = truncate_bytes
+        self.optimize_after_rows = optimize_after_rows
+        self.optimize_interval_seconds = optimize_interval_seconds
+        self.vacuum_pages = vacuum_pages
+        self.long_reader_seconds = long_reader_seconds
+        self.convert_free_bytes = convert_free_bytes
+        self._states: dict[Path, _DatabaseState] = {}
+        for database in databases or []:
+            self.register(database)
+
+    def register(self, database: LocalSQLite) -> None:
+        self._states.setdefault(database.path, _DatabaseState(database))
+
+    def run(self) -> list[MaintenanceReport]:
+        """Make one maintenance pass over every registered file that exists."""
+        return [
+            self._maintain(state)
+            for state in list(self._states.values())
+            # Never create a file the owning store has not initialized yet.
+            if state.database.path.exists()
+        ]
+
+    def _maintain(self, state: _DatabaseState) -> MaintenanceReport:
+        database = state.database
+        now = time.monotonic()
+        state.bulk_rows += database.take_bulk_writes()
+        optimized = False
+        if (
+            state.bulk_rows >= self.optimize_after_rows
+            or now - state.optimized_at >= self.optimize_interval_seconds
+        ):
+            with database.read() as connection, database.writer("maintenance"):
+                connection.execute(f"PRAGMA analysis_limit = {OPTIMIZE_ANALYSIS_LIMIT}")
+                connection.execute("PRAGMA optimize")
+            state.bulk_rows = 0
+            state.optimized_at = now
+            optimized = True
+        # A file created before its store chose incremental mode is rebuilt
+        # once, when enough space is free to be worth the full rewrite.
+        converted = database.convert_auto_vacuum(min_free_bytes=self.convert_free_bytes)
+        vacuumed = 0 if converted else database.incremental_vacuum(self.vacuum_pages)
+
+        # Checkpoint last so the pass's own writes are folded back as well.
+        oldest_reader = LocalSQLite.oldest_connection_age(database.path)
+        wal_bytes = _wal_bytes(database.path)
+        checkpoint = None
+        log_frames = checkpointed = 0
+        if wal_bytes >= self.passive_bytes:
+            checkpoint = "PASSIVE"
+            log_frames, checkpointed = self._checkpoint(database, checkpoint)
+            if log_frames == checkpointed:
+                state.stalled_since = None
+                if wal_bytes >= self.truncate_bytes:
+                    checkpoint = "TRUNCATE"
+                    log_frames, checkpointed = self._checkpoint(database, checkpoint)
+            elif state.stalled_since is None:
+                state.stalled_since = now
+        else:
+            state.stalled_since = None
+        stalled = None
+        if (
+            state.stalled_since is not None
+            and now - state.stalled_since >= self.long_reader_seconds
+        ):
+            stalled = now - state.stalled_since
+
+        return MaintenanceReport(
+            store_name=database.store_name,
+            path=database.path,
+            wal_bytes=wal_bytes,
+            checkpoint=checkpoint,
+            log_frames=log_frames,
+            checkpointed_frames=checkpointed,
+            optimized=optimized,
+            vacuumed_pages=vacuumed,
+            auto_vacuum_converted=converted,
+            stalled_seconds=stalled,
+            oldest_reader_seconds=oldest_reader,
+        )
+
+    @staticmethod
+    def _checkpoint(database: LocalSQLite, mode: str) -> tuple[int, int]:
+        with database.read() as connection, database.writer("maintenance"):
+            # Give up at once rather than hold the writer while readers drain.
+            connection.execute("PRAGMA busy_timeout = 0")
+            row = connection.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        # (busy, frames in the WAL, frames checkpointed); -1 when not in WAL.
+        return max(int(row[1]), 0), max(int(row[2]), 0)
+
+
+def _wal_bytes(path: Path) -> int:
+    try:
+        return os.stat(f"{path}-wal").st_size
+    except FileNotFoundError:
+        return 0
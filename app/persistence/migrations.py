@@ -121,6 +121,20 @@ class InstallationMigrationLock:
         handle.close()
 
 
+def canonical_writer_lock(
+    database: LocalSQLite, *, timeout_seconds: float = 0.0
+) -> InstallationMigrationLock:
+    """Lock a running Brain holds for its lifetime.
+
+    Offline writers such as the bulk importer take the same lock, so they
+    refuse to run while a Brain has the canonical database open.
+    """
+    return InstallationMigrationLock(
+        database.path.parent / ".canonical-writer.lock",
+        timeout_seconds=timeout_seconds,
+    )
+
+
 def load_migration_catalog(
     migrations_dir: str | Path | None = None,
 ) -> list[Migration]:
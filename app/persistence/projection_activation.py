@@ -400,7 +400,7 @@ class SQLiteProjectionActivationRepository:
         scheduler_owner_id: str,
         capability_digest: str,
     ) -> None:
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             existing = connection.execute(
                 """
                 SELECT scheduler_owner_id,scheduler_capability_digest,state
@@ -496,23 +496,24 @@ class SQLiteProjectionActivationRepository:
                     return
                 connection = fence.connection
                 if connection is not None:
-                    try:
-                        connection.execute("BEGIN IMMEDIATE")
-                        self._revoke_publication_epoch_on_connection(
-                            connection,
-                            publication_epoch,
-                            scheduler_owner_id,
-                            capability_digest,
-                        )
-                        connection.commit()
-                    except BaseException:
-                        connection.rollback()
-                        raise
+                    with self.database.writer("projection"):
+                        try:
+                            connection.execute("BEGIN IMMEDIATE")
+                            self._revoke_publication_epoch_on_connection(
+                                connection,
+                                publication_epoch,
+                                scheduler_owner_id,
+                                capability_digest,
+                            )
+                            connection.commit()
+                        except BaseException:
+                            connection.rollback()
+                            raise
                     fence.revoked = True
                     fence.connection = None
                     connection.close()
                     return
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             self._revoke_publication_epoch_on_connection(
                 connection,
                 publication_epoch,
@@ -610,7 +611,7 @@ class SQLiteProjectionActivationRepository:
             writer_owner=writer_owner,
             publication_capability_digest=publication_capability_digest,
         )
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             existing = connection.execute(
                 "SELECT * FROM analytics_projection_activation_intents WHERE generation_id = ?",
                 (generation_id,),
@@ -747,7 +748,7 @@ class SQLiteProjectionActivationRepository:
     ) -> ProjectionActivationIntent:
         failure: str | None = None
         result: ProjectionActivationIntent | None = None
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             row = connection.execute(
                 "SELECT * FROM analytics_projection_activation_intents WHERE intent_id = ?",
                 (expected_intent.intent_id,),
@@ -840,7 +841,7 @@ class SQLiteProjectionActivationRepository:
         return result
 
     def cancel(self, intent_id: str) -> ProjectionActivationIntent:
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             row = connection.execute(
                 "SELECT * FROM analytics_projection_activation_intents WHERE intent_id = ?",
                 (intent_id,),
@@ -866,7 +867,7 @@ class SQLiteProjectionActivationRepository:
     def reconcile_completed(
         self, expected: ProjectionActivationIntent
     ) -> ProjectionActivationIntent:
-        with self.database.transaction() as connection:
+        with self.database.transaction(lane="projection") as connection:
             row = connection.execute(
                 "SELECT * FROM analytics_projection_activation_intents WHERE intent_id=?",
                 (expected.intent_id,),
@@ -26,7 +26,8 @@ def _identifier(kind: str, *parts: str) -> str:
     return f"{kind}:sha256:{hashlib.sha256(material).hexdigest()}"
 
 
-def _source_hash(message: "CanonicalProjectionMessage") -> str:
+def message_source_hash(message: "CanonicalProjectionMessage") -> str:
+    """Digest of every canonical field a message's projection is derived from."""
     material = {
         "conversation_id": message.conversation_id,
         "direction": message.direction,
@@ -158,7 +159,7 @@ class DeterministicProjectionPipeline:
                 MessageAnalysisProjection(
                     conversation_id=message.conversation_id,
                     message_id=message.message_id,
-                    source_hash=_source_hash(message),
+                    source_hash=message_source_hash(message),
                     status="unavailable",
                     sentiment="unknown",
                     analyzer_id=None,
@@ -0,0 +1,28 @@
+-- Copy-on-write bookkeeping for the lagging projection slot. When a generation
+-- is built into one slot, the other slot falls behind by exactly the
+-- conversations that generation wrote. They are recorded here instead of being
+-- replayed through the pipeline: the next build into the lagging slot, or the
+-- idle compactor before it, copies just those conversations from the source
+-- slot. A slot with an overlay holds its own rows plus, for each overridden
+-- conversation, a stale copy superseded by the source slot at through_revision.
+CREATE TABLE projection_slot_overlays (
+    creator_account_id TEXT NOT NULL,
+    projection_slot INTEGER NOT NULL CHECK (projection_slot IN (0, 1)),
+    source_slot INTEGER NOT NULL CHECK (source_slot IN (0, 1)),
+    through_revision INTEGER NOT NULL CHECK (through_revision >= 0),
+    PRIMARY KEY (creator_account_id, projection_slot),
+    CHECK (source_slot <> projection_slot),
+    FOREIGN KEY (creator_account_id, projection_slot)
+        REFERENCES projection_accounts (creator_account_id, projection_slot)
+        ON DELETE CASCADE
+);
+
+CREATE TABLE projection_slot_overrides (
+    creator_account_id TEXT NOT NULL,
+    projection_slot INTEGER NOT NULL CHECK (projection_slot IN (0, 1)),
+    conversation_id TEXT NOT NULL,
+    PRIMARY KEY (creator_account_id, projection_slot, conversation_id),
+    FOREIGN KEY (creator_account_id, projection_slot)
+        REFERENCES projection_slot_overlays (creator_account_id, projection_slot)
+        ON DELETE CASCADE
+) WITHOUT ROWID;
@@ -0,0 +1,7 @@
+-- How many canonical messages each generation re-projected (including
+-- removals) versus skipped because their source hash was unchanged.
+ALTER TABLE projection_change_log
+    ADD COLUMN messages_written INTEGER NOT NULL DEFAULT 0 CHECK (messages_written >= 0);
+
+ALTER TABLE projection_change_log
+    ADD COLUMN messages_skipped INTEGER NOT NULL DEFAULT 0 CHECK (messages_skipped >= 0);
@@ -0,0 +1,17 @@
+-- Point projection work leaves the lagging slot behind by individual messages
+-- rather than whole conversations. A partial override folds the conversation
+-- summary and node plus only the listed messages.
+ALTER TABLE projection_slot_overrides
+    ADD COLUMN whole_conversation INTEGER NOT NULL DEFAULT 1
+    CHECK (whole_conversation IN (0, 1));
+
+CREATE TABLE projection_slot_message_overrides (
+    creator_account_id TEXT NOT NULL,
+    projection_slot INTEGER NOT NULL CHECK (projection_slot IN (0, 1)),
+    conversation_id TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    PRIMARY KEY (creator_account_id, projection_slot, conversation_id, message_id),
+    FOREIGN KEY (creator_account_id, projection_slot, conversation_id)
+        REFERENCES projection_slot_overrides (creator_account_id, projection_slot, conversation_id)
+        ON DELETE CASCADE
+) WITHOUT ROWID;
@@ -0,0 +1,42 @@
+-- Typed copies of the summary fields conversation listings sort and filter on,
+-- written with document_json in the same statement. Sort keys are NOT NULL so
+-- a keyset cursor is a plain row-value range on one index: a conversation
+-- without messages has last_message_at '' (it lists last by recency) and an
+-- unnamed one has display_name '' (it lists first by name).
+ALTER TABLE conversation_summaries
+    ADD COLUMN last_message_at TEXT NOT NULL DEFAULT '';
+
+ALTER TABLE conversation_summaries
+    ADD COLUMN display_name TEXT NOT NULL DEFAULT '' COLLATE NOCASE;
+
+ALTER TABLE conversation_summaries
+    ADD COLUMN unread_count INTEGER NOT NULL DEFAULT 0 CHECK (unread_count >= 0);
+
+ALTER TABLE conversation_summaries
+    ADD COLUMN latest_direction TEXT CHECK (latest_direction IN ('inbound', 'outbound'));
+
+UPDATE conversation_summaries SET
+    last_message_at = COALESCE(json_extract(document_json, '$.last_message_at'), ''),
+    display_name = COALESCE(json_extract(document_json, '$.display_name'), ''),
+    unread_count = json_extract(document_json, '$.unread_count'),
+    latest_direction = json_extract(document_json, '$.latest_message.direction');
+
+-- Filter columns trail each index so filtered listings reject rows without
+-- reading their documents.
+CREATE INDEX conversation_summaries_recent
+    ON conversation_summaries (
+        creator_account_id, projection_slot, last_message_at DESC, conversation_id DESC,
+        unread_count, latest_direction
+    );
+
+CREATE INDEX conversation_summaries_unread
+    ON conversation_summaries (
+        creator_account_id, projection_slot, unread_count DESC, last_message_at DESC,
+        conversation_id DESC, latest_direction
+    );
+
+CREATE INDEX conversation_summaries_name
+    ON conversation_summaries (
+        creator_account_id, projection_slot, display_name, conversation_id,
+        unread_count, latest_direction
+    );
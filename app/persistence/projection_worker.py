@@ -0,0 +1,231 @@
+"""Out-of-process history projection worker and its Brain-side supervisor.
+
+Projection catch-up builds JSON, hashes and runs the NLP/LPG pipeline; in a
+thread it competes with the WebSocket event loop for the GIL. With the worker
+enabled the Brain instead asks one child process to advance an account over
+its stdin pipe, and the child answers with the activated view revision on its
+stdout pipe. The child opens its own connections to both SQLite files.
+
+Crash safety is the same as the threaded path: ``projection_work`` rows stay
+incomplete until the activation that covers them commits, so a replacement
+worker simply advances the account again. A lock file next to the canonical
+database keeps a second worker (an orphan of a killed Brain, for instance)
+from building the same slot concurrently.
+
+Requests and replies are single-line JSON documents::
+
+    {"request_id": 1, "account_id": "..."}
+    {"request_id": 1, "view_revision": 7}
+    {"request_id": 1, "error": "..."}
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from app.persistence.database import CanonicalSQLite
+from app.persistence.history import HistoryRepository, ProjectionRepository
+from app.persistence.migrations import InstallationMigrationLock
+from app.utils.logger import logger
+
+
+PROJECTION_WORKER_MAX_RESTARTS = 3
+PROJECTION_WORKER_LOCK_SECONDS = 10.0
+PROJECTION_WORKER_STOP_SECONDS = 5.0
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class ProjectionWorkerError(RuntimeError):
+    """Raised when the worker reports that advancing an account failed."""
+
+
+class ProjectionWorkerUnavailable(RuntimeError):
+    """Raised when the worker keeps exiting and cannot be restarted."""
+
+
+class _WorkerExited(Exception):
+    pass
+
+
+def projection_worker_lock(canonical_path: Path) -> InstallationMigrationLock:
+    return InstallationMigrationLock(
+        canonical_path.parent / ".projection-worker.lock",
+        timeout_seconds=PROJECTION_WORKER_LOCK_SECONDS,
+    )
+
+
+def serve(
+    canonical_path: Path,
+    projection_path: Path,
+    requests: BinaryIO,
+    replies: BinaryIO,
+) -> int:
+    """Advance accounts named on ``requests`` until the Brain closes the pipe."""
+    with projection_worker_lock(canonical_path):
+        history = HistoryRepository(CanonicalSQLite(canonical_path))
+        projection = ProjectionRepository(CanonicalSQLite(projection_path), history)
+        for line in requests:
+            request = json.loads(line)
+            reply: dict[str, Any] = {"request_id": request["request_id"]}
+            try:
+                reply["view_revision"] = projection.advance(str(request["account_id"]))
+            except Exception as error:
+                logger.exception("[PROJECTION] Worker failed to advance an account")
+                reply["error"] = f"{type(error).__name__}: {error}"
+            replies.write(json.dumps(reply).encode("utf-8") + b"\n")
+            replies.flush()
+    return 0
+
+
+class ProjectionWorkerProcess:
+    """Brain-side supervisor that starts, feeds and restarts the worker."""
+
+    def __init__(
+        self,
+        canonical_path: str | Path,
+        projection_path: str | Path,
+        *,
+        max_restarts: int = PROJECTION_WORKER_MAX_RESTARTS,
+    ) -> None:
+        self.canonical_path = Path(canonical_path).resolve()
+        self.projection_path = Path(projection_path).resolve()
+        self.max_restarts = max_restarts
+        self._process: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._request_ids = itertools.count(1)
+        self._spawn_lock = asyncio.Lock()
+        # Restarts since the worker last answered a request.
+        self._restarts = 0
+
+    @property
+    def pid(self) -> int | None:
+        process = self._process
+        return None if process is None or process.returncode is not None else process.pid
+
+    async def start(self) -> None:
+        async with self._spawn_lock:
+            await self._ensure_running()
+
+    async def advance(self, account_id: str) -> int | None:
+        """Have the worker activate the account's next generation.
+
+        A worker that exits mid-request is restarted and the request resent;
+        advancing is idempotent over the durable work table.
+        """
+        while True:
+            async with self._spawn_lock:
+                process = await self._ensure_running()
+                reader = self._reader
+            assert reader is not None
+            request_id = next(self._request_ids)
+            reply: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = reply
+            try:
+                assert process.stdin is not None
+                process.stdin.write(
+                    json.dumps({"request_id": request_id, "account_id": account_id}).encode(
+                        "utf-8"
+                    )
+                    + b"\n"
+                )
+                await process.stdin.drain()
+                # The reader finishing first means the worker exited before
+                # this request was registered with it.
+                await asyncio.wait((reply, reader), return_when=asyncio.FIRST_COMPLETED)
+                if not reply.done():
+                    raise _WorkerExited
+                result = reply.result()
+            except (_WorkerExited, ConnectionError):
+                logger.warning("[PROJECTION] Worker exited; restarting it")
+                continue
+            finally:
+                self._pending.pop(request_id, None)
+            self._restarts = 0
+            if "error" in result:
+                raise ProjectionWorkerError(str(result["error"]))
+            view_revision = result["view_revision"]
+            return None if view_revision is None else int(view_revision)
+
+    async def stop(self) -> None:
+        async with self._spawn_lock:
+            process = self._process
+            self._process = None
+            if process is not None and process.returncode is None:
+                assert process.stdin is not None
+                process.stdin.close()
+                try:
+                    await asyncio.wait_for(process.wait(), PROJECTION_WORKER_STOP_SECONDS)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+            reader = self._reader
+            self._reader = None
+            if reader is not None:
+                await reader
+
+    async def _ensure_running(self) -> asyncio.subprocess.Process:
+        process = self._process
+        if process is not None and process.returncode is None:
+            return process
+        if process is not None:
+            if self._restarts >= self.max_restarts:
+                raise ProjectionWorkerUnavailable(
+                    f"projection worker exited {self._restarts + 1} times without answering"
+                )
+            self._restarts += 1
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.pathsep.join(
+            filter(None, (str(_PROJECT_ROOT), environment.get("PYTHONPATH")))
+        )
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            __name__,
+            "--canonical",
+            str(self.canonical_path),
+            "--projection",
+            str(self.projection_path),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=environment,
+        )
+        self._process = process
+        self._reader = asyncio.create_task(
+            self._read_replies(process), name="projection-worker-replies"
+        )
+        return process
+
+    async def _read_replies(self, process: asyncio.subprocess.Process) -> None:
+        assert process.stdout is not None
+        while line := await process.stdout.readline():
+            reply = json.loads(line)
+            future = self._pending.get(int(reply["request_id"]))
+            if future is not None and not future.done():
+                future.set_result(reply)
+        await process.wait()
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(_WorkerExited())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--canonical", type=Path, required=True)
+    parser.add_argument("--projection", type=Path, required=True)
+    arguments = parser.parse_args(argv)
+    # Replies own the real stdout; anything else written to it goes to stderr.
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return serve(arguments.canonical, arguments.projection, sys.stdin.buffer, replies)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Collection
 from copy import deepcopy
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
@@ -17,11 +18,15 @@ from app.services.agent_configuration import (
     config_document_digest,
 )
 from app.services.command_execution import (
+    CommandCursor,
+    CommandPage,
     CommandRecord,
     CommandRepository,
     CommandResultReceipt,
     CommandResultRecord,
+    CommandState,
     CommandTransition,
+    validate_command_page_limit,
 )
 from app.transport.ingestion import (
     AccountReadModel,
@@ -51,6 +56,20 @@ def _datetime(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_microseconds(value: datetime) -> int:
+    if value.tzinfo is None or value.utcoffset() is None:
+        raise ValueError("persisted timestamps must include a timezone")
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_microseconds(value: int) -> datetime:
+    return _EPOCH + value * _MICROSECOND
+
+
 def _key(key: StreamKey) -> tuple[str, str, str]:
     return (
         key.creator_account_id,
@@ -658,6 +677,12 @@ class SQLiteAgentConfigRepository(AgentConfigRepository):
             connection.execute("DELETE FROM config_documents")
 
 
+# Spelled exactly as the commands_pending_expiry partial index predicate, which
+# expiry queries name explicitly; without statistics the planner would prefer
+# scanning every pending row through commands_by_state.
+_PENDING_COMMAND_STATES_SQL = "'issued', 'accepted'"
+
+
 class SQLiteCommandRepository(CommandRepository):
     """Copy-isolated command audit records persisted as one transaction per save."""
 
@@ -747,12 +772,14 @@ class SQLiteCommandRepository(CommandRepository):
                 INSERT INTO commands (
                     command_id, creator_account_id, action_json, deadline,
                     idempotency_policy, issued_at, state, connection_id,
-                    fencing_token, delivery_attempts, failure_reason, result_apply_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    fencing_token, delivery_attempts, failure_reason, result_apply_count,
+                    expires_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT (command_id) DO UPDATE SET
                     creator_account_id = excluded.creator_account_id,
                     action_json = excluded.action_json,
                     deadline = excluded.deadline,
+                    expires_at = excluded.expires_at,
                     idempotency_policy = excluded.idempotency_policy,
                     issued_at = excluded.issued_at,
                     state = excluded.state,
@@ -775,6 +802,7 @@ class SQLiteCommandRepository(CommandRepository):
                     record.delivery_attempts,
                     record.failure_reason,
                     record.result_apply_count,
+                    _epoch_microseconds(record.deadline),
                 ),
             )
             connection.execute(
@@ -871,6 +899,89 @@ class SQLiteCommandRepository(CommandRepository):
                 if (record := self._get(connection, UUID(row["command_id"]))) is not None
             ]
 
+    def page(
+        self,
+        *,
+        creator_account_id: str | None = None,
+        states: Collection[CommandState] | None = None,
+        after: CommandCursor | None = None,
+        limit: int = 100,
+    ) -> CommandPage:
+        validate_command_page_limit(limit)
+        clauses: list[str] = []
+        parameters: list[Any] = []
+        if creator_account_id is not None:
+            clauses.append("creator_account_id = ?")
+            parameters.append(creator_account_id)
+        if states is not None:
+            if not states:
+                return CommandPage([], None)
+            clauses.append(f"state IN ({', '.join('?' for _ in states)})")
+            parameters.extend(states)
+        if after is not None:
+            clauses.append("(issued_at, command_id) > (?, ?)")
+            parameters.extend((_timestamp(after[0]), str(after[1])))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.database.read() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT command_id FROM commands {where}
+                ORDER BY issued_at, command_id LIMIT ?
+                """,
+                (*parameters, limit + 1),
+            ).fetchall()
+            records = [
+                record
+                for row in rows[:limit]
+                if (record := self._get(connection, UUID(row["command_id"]))) is not None
+            ]
+        next_cursor = (
+            (records[-1].issued_at, records[-1].command_id) if len(rows) > limit else None
+        )
+        return CommandPage(records, next_cursor)
+
+    def pending_deadlines(self) -> list[tuple[UUID, datetime]]:
+        with self.database.read() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT command_id, expires_at FROM commands
+                INDEXED BY commands_pending_expiry
+                WHERE state IN ({_PENDING_COMMAND_STATES_SQL})
+                ORDER BY expires_at, command_id
+                """
+            ).fetchall()
+        return [
+            (UUID(row["command_id"]), _from_epoch_microseconds(row["expires_at"]))
+            for row in rows
+        ]
+
+    def expire_due(self, now: datetime, detail: str) -> list[UUID]:
+        with self.database.transaction() as connection:
+            rows = connection.execute(
+                f"""
+                UPDATE commands INDEXED BY commands_pending_expiry
+                SET state = 'unknown', failure_reason = ?
+                WHERE state IN ({_PENDING_COMMAND_STATES_SQL}) AND expires_at <= ?
+                RETURNING command_id
+                """,
+                (detail, _epoch_microseconds(now)),
+            ).fetchall()
+            command_ids = sorted(row["command_id"] for row in rows)
+            connection.executemany(
+                """
+                INSERT INTO command_transitions (
+                    command_id, transition_index, state, occurred_at, detail
+                )
+                SELECT ?, COALESCE(MAX(transition_index) + 1, 0), 'unknown', ?, ?
+                FROM command_transitions WHERE command_id = ?
+                """,
+                [
+                    (command_id, _timestamp(now), detail, command_id)
+                    for command_id in command_ids
+                ],
+            )
+        return [UUID(command_id) for command_id in command_ids]
+
     def reset(self) -> None:
         with self.database.transaction() as connection:
             connection.execute("DELETE FROM commands")
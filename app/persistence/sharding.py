@@ -0,0 +1,63 @@
+"""Routing creator accounts to independently locked sets of SQLite files."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+
+ShardMode = Literal["account", "hash"]
+DEFAULT_SHARD_BUCKETS = 16
+_SHARD_NAME = re.compile(r"^(account-[0-9a-f]{32}|bucket-[0-9]{4})$")
+
+
+@dataclass(frozen=True, slots=True)
+class ShardRouter:
+    """Map each account to the directory holding its shard's database files.
+
+    ``account`` gives every account files of its own; ``hash`` spreads
+    accounts over ``buckets`` fixed shards. Shard names are derived from a
+    digest of the account id, so any id maps to a safe file name, and the
+    mapping never changes for a given mode and bucket count: changing either
+    strands existing shards.
+    """
+
+    root: Path
+    mode: ShardMode = "account"
+    buckets: int = DEFAULT_SHARD_BUCKETS
+
+    def __post_init__(self) -> None:
+        if self.mode not in {"account", "hash"}:
+            raise ValueError(f"Unsupported shard mode {self.mode!r}")
+        if not 1 <= self.buckets <= 9999:
+            raise ValueError("buckets must be between 1 and 9999")
+        object.__setattr__(self, "root", Path(self.root).expanduser().resolve())
+
+    def shard_for(self, account_id: str) -> str:
+        if not account_id:
+            raise ValueError("account_id is required")
+        digest = hashlib.sha256(account_id.encode("utf-8")).hexdigest()
+        if self.mode == "account":
+            return f"account-{digest[:32]}"
+        return f"bucket-{int(digest[:16], 16) % self.buckets:04d}"
+
+    def directory(self, shard: str) -> Path:
+        if not _SHARD_NAME.match(shard):
+            raise ValueError(f"Invalid shard name {shard!r}")
+        return self.root / shard
+
+    def directory_for(self, account_id: str) -> Path:
+        return self.directory(self.shard_for(account_id))
+
+    def existing_shards(self) -> list[str]:
+        """Return the shards created on disk so far, in name order."""
+        if not self.root.is_dir():
+            return []
+        return sorted(
+            entry.name
+            for entry in self.root.iterdir()
+            if entry.is_dir() and _SHARD_NAME.match(entry.name)
+        )
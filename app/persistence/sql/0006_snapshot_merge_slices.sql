@@ -0,0 +1,67 @@
+-- Large snapshots merge in bounded write slices. Entities written by an
+-- unpublished slice carry their merge epoch and stay invisible to readers
+-- until the owning merge publishes in one short final transaction.
+ALTER TABLE account_chats ADD COLUMN merge_epoch INTEGER;
+ALTER TABLE account_messages ADD COLUMN merge_epoch INTEGER;
+
+CREATE INDEX account_chats_pending_merge
+    ON account_chats (creator_account_id, merge_epoch, chat_id)
+    WHERE merge_epoch IS NOT NULL;
+
+CREATE INDEX account_messages_pending_merge
+    ON account_messages (creator_account_id, merge_epoch, message_id)
+    WHERE merge_epoch IS NOT NULL;
+
+-- An open merge is owned by one worker through a renewable lease, so a
+-- second process (or the offline importer) never reuses another writer's
+-- staged rows. Post-publish phases are idempotent and need no owner.
+CREATE TABLE snapshot_merges (
+    creator_account_id TEXT NOT NULL,
+    merge_epoch INTEGER NOT NULL CHECK (merge_epoch > 0),
+    agent_installation_id TEXT NOT NULL,
+    agent_stream_id TEXT NOT NULL,
+    snapshot_id TEXT NOT NULL,
+    state TEXT NOT NULL CHECK (state IN ('merging', 'published', 'settled', 'aborted')),
+    phase TEXT NOT NULL CHECK (phase IN (
+        'chats', 'messages', 'publish',
+        'chat_membership', 'message_membership', 'prune_chat_membership',
+        'prune_message_membership', 'purge', 'settle', 'done'
+    )),
+    cursor TEXT,
+    owner TEXT,
+    lease_expires_at TEXT,
+    merged_chats INTEGER NOT NULL DEFAULT 0 CHECK (merged_chats >= 0),
+    merged_messages INTEGER NOT NULL DEFAULT 0 CHECK (merged_messages >= 0),
+    slice_count INTEGER NOT NULL DEFAULT 0 CHECK (slice_count >= 0),
+    started_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    published_at TEXT,
+    PRIMARY KEY (creator_account_id, merge_epoch),
+    FOREIGN KEY (creator_account_id, agent_installation_id, agent_stream_id, snapshot_id)
+        REFERENCES snapshot_uploads (
+            creator_account_id, agent_installation_id, agent_stream_id, snapshot_id
+        )
+        ON DELETE CASCADE
+);
+
+CREATE UNIQUE INDEX one_merging_snapshot_per_account
+    ON snapshot_merges (creator_account_id)
+    WHERE state = 'merging';
+
+CREATE INDEX snapshot_merges_by_state
+    ON snapshot_merges (state, creator_account_id, merge_epoch);
+
+-- Updates and tombstones found while slicing; the publish transaction
+-- applies only these rows instead of rescanning the staged snapshot.
+CREATE TABLE snapshot_merge_actions (
+    creator_account_id TEXT NOT NULL,
+    merge_epoch INTEGER NOT NULL,
+    entity_kind TEXT NOT NULL CHECK (entity_kind IN ('chat', 'message')),
+    entity_id TEXT NOT NULL,
+    chat_id TEXT NOT NULL,
+    action TEXT NOT NULL CHECK (action IN ('update', 'tombstone')),
+    PRIMARY KEY (creator_account_id, merge_epoch, entity_kind, entity_id),
+    FOREIGN KEY (creator_account_id, merge_epoch)
+        REFERENCES snapshot_merges (creator_account_id, merge_epoch)
+        ON DELETE CASCADE
+) WITHOUT ROWID;
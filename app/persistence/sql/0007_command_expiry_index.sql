@@ -0,0 +1,22 @@
+-- Command deadlines are also kept as integer UTC microseconds, so pending
+-- commands expire through one indexed range update however much settled
+-- command history is retained. Python writes deadlines with isoformat(), whose
+-- optional fraction is always six digits after the seconds.
+ALTER TABLE commands ADD COLUMN expires_at INTEGER;
+
+UPDATE commands
+SET expires_at = CAST(strftime('%s', deadline) AS INTEGER) * 1000000
+    + CASE WHEN substr(deadline, 20, 1) = '.'
+        THEN CAST(substr(deadline, 21, 6) AS INTEGER)
+        ELSE 0
+      END;
+
+CREATE INDEX commands_pending_expiry
+    ON commands (expires_at, command_id)
+    WHERE state IN ('issued', 'accepted');
+
+-- Keyset listing by status, with or without an account filter.
+CREATE INDEX commands_by_state ON commands (state, issued_at, command_id);
+
+CREATE INDEX commands_by_account_state
+    ON commands (creator_account_id, state, issued_at, command_id);
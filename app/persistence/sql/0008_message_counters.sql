@@ -0,0 +1,176 @@
+-- Maintained totals of settled canonical chats and messages. A row counts
+-- once it is live (is_deleted = 0) and settled (merge_epoch IS NULL); rows of
+-- a published but unsettled snapshot merge are added by readers from the
+-- pending-merge indexes. Triggers keep every write path, including the
+-- offline importer, inside the writing transaction.
+CREATE TABLE account_message_counters (
+    creator_account_id TEXT PRIMARY KEY,
+    chat_count INTEGER NOT NULL DEFAULT 0,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    inbound_count INTEGER NOT NULL DEFAULT 0,
+    outbound_count INTEGER NOT NULL DEFAULT 0,
+    text_bytes INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE conversation_message_counters (
+    creator_account_id TEXT NOT NULL,
+    chat_id TEXT NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    inbound_count INTEGER NOT NULL DEFAULT 0,
+    outbound_count INTEGER NOT NULL DEFAULT 0,
+    text_bytes INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (creator_account_id, chat_id)
+) WITHOUT ROWID;
+
+INSERT INTO conversation_message_counters (
+    creator_account_id, chat_id, message_count, inbound_count, outbound_count, text_bytes
+)
+SELECT creator_account_id, chat_id, COUNT(*), SUM(direction = 'inbound'),
+       SUM(direction = 'outbound'), SUM(length(CAST(text AS BLOB)))
+  FROM account_messages
+ WHERE is_deleted = 0 AND merge_epoch IS NULL
+ GROUP BY creator_account_id, chat_id;
+
+INSERT INTO account_message_counters (
+    creator_account_id, chat_count, message_count, inbound_count, outbound_count, text_bytes
+)
+SELECT h.creator_account_id,
+       (SELECT COUNT(*) FROM account_chats c
+         WHERE c.creator_account_id = h.creator_account_id
+           AND c.is_deleted = 0 AND c.merge_epoch IS NULL),
+       COALESCE(SUM(k.message_count), 0), COALESCE(SUM(k.inbound_count), 0),
+       COALESCE(SUM(k.outbound_count), 0), COALESCE(SUM(k.text_bytes), 0)
+  FROM account_heads h
+  LEFT JOIN conversation_message_counters k ON k.creator_account_id = h.creator_account_id
+ GROUP BY h.creator_account_id;
+
+CREATE TRIGGER account_chats_count_insert
+AFTER INSERT ON account_chats
+WHEN new.is_deleted = 0 AND new.merge_epoch IS NULL
+BEGIN
+    INSERT INTO account_message_counters (creator_account_id, chat_count)
+    VALUES (new.creator_account_id, 1)
+    ON CONFLICT (creator_account_id) DO UPDATE SET chat_count = chat_count + 1;
+END;
+
+CREATE TRIGGER account_chats_count_update_old
+AFTER UPDATE OF is_deleted, merge_epoch ON account_chats
+WHEN old.is_deleted = 0 AND old.merge_epoch IS NULL
+BEGIN
+    UPDATE account_message_counters SET chat_count = chat_count - 1
+     WHERE creator_account_id = old.creator_account_id;
+END;
+
+CREATE TRIGGER account_chats_count_update_new
+AFTER UPDATE OF is_deleted, merge_epoch ON account_chats
+WHEN new.is_deleted = 0 AND new.merge_epoch IS NULL
+BEGIN
+    INSERT INTO account_message_counters (creator_account_id, chat_count)
+    VALUES (new.creator_account_id, 1)
+    ON CONFLICT (creator_account_id) DO UPDATE SET chat_count = chat_count + 1;
+END;
+
+CREATE TRIGGER account_chats_count_delete
+AFTER DELETE ON account_chats
+WHEN old.is_deleted = 0 AND old.merge_epoch IS NULL
+BEGIN
+    UPDATE account_message_counters SET chat_count = chat_count - 1
+     WHERE creator_account_id = old.creator_account_id;
+END;
+
+CREATE TRIGGER account_messages_count_insert
+AFTER INSERT ON account_messages
+WHEN new.is_deleted = 0 AND new.merge_epoch IS NULL
+BEGIN
+    INSERT INTO conversation_message_counters (
+        creator_account_id, chat_id, message_count, inbound_count, outbound_count, text_bytes
+    ) VALUES (
+        new.creator_account_id, new.chat_id, 1, new.direction = 'inbound',
+        new.direction = 'outbound', length(CAST(new.text AS BLOB))
+    )
+    ON CONFLICT (creator_account_id, chat_id) DO UPDATE SET
+        message_count = message_count + 1,
+        inbound_count = inbound_count + excluded.inbound_count,
+        outbound_count = outbound_count + excluded.outbound_count,
+        text_bytes = text_bytes + excluded.text_bytes;
+    INSERT INTO account_message_counters (
+        creator_account_id, message_count, inbound_count, outbound_count, text_bytes
+    ) VALUES (
+        new.creator_account_id, 1, new.direction = 'inbound',
+        new.direction = 'outbound', length(CAST(new.text AS BLOB))
+    )
+    ON CONFLICT (creator_account_id) DO UPDATE SET
+        message_count = message_count + 1,
+        inbound_count = inbound_count + excluded.inbound_count,
+        outbound_count = outbound_count + excluded.outbound_count,
+        text_bytes = text_bytes + excluded.text_bytes;
+END;
+
+CREATE TRIGGER account_messages_count_update_old
+AFTER UPDATE OF is_deleted, merge_epoch, chat_id, direction, text ON account_messages
+WHEN old.is_deleted = 0 AND old.merge_epoch IS NULL
+BEGIN
+    UPDATE conversation_message_counters SET
+        message_count = message_count - 1,
+        inbound_count = inbound_count - (old.direction = 'inbound'),
+        outbound_count = outbound_count - (old.direction = 'outbound'),
+        text_bytes = text_bytes - length(CAST(old.text AS BLOB))
+     WHERE creator_account_id = old.creator_account_id AND chat_id = old.chat_id;
+    UPDATE account_message_counters SET
+        message_count = message_count - 1,
+        inbound_count = inbound_count - (old.direction = 'inbound'),
+        outbound_count = outbound_count - (old.direction = 'outbound'),
+        text_bytes = text_bytes - length(CAST(old.text AS BLOB))
+     WHERE creator_account_id = old.creator_account_id;
+END;
+
+CREATE TRIGGER account_messages_count_update_new
+AFTER UPDATE OF is_deleted, merge_epoch, chat_id, direction, text ON account_messages
+WHEN new.is_deleted = 0 AND new.merge_epoch IS NULL
+BEGIN
+    INSERT INTO conversation_message_counters (
+        creator_account_id, chat_id, message_count, inbound_count, outbound_count, text_bytes
+    ) VALUES (
+        new.creator_account_id, new.chat_id, 1, new.direction = 'inbound',
+        new.direction = 'outbound', length(CAST(new.text AS BLOB))
+    )
+    ON CONFLICT (creator_account_id, chat_id) DO UPDATE SET
+        message_count = message_count + 1,
+        inbound_count = inbound_count + excluded.inbound_count,
+        outbound_count = outbound_count + excluded.outbound_count,
+        text_bytes = text_bytes + excluded.text_bytes;
+    INSERT INTO account_message_counters (
+        creator_account_id, message_count, inbound_count, outbound_count, text_bytes
+    ) VALUES (
+        new.creator_account_id, 1, new.direction = 'inbound',
+        new.direction = 'outbound', length(CAST(new.text AS BLOB))
+    )
+    ON CONFLICT (creator_account_id) DO UPDATE SET
+        message_count = message_count + 1,
+        inbound_count = inbound_count + excluded.inbound_count,
+        outbound_count = outbound_count + excluded.outbound_count,
+        text_bytes = text_bytes + excluded.text_bytes;
+END;
+
+CREATE TRIGGER account_messages_count_delete
+AFTER DELETE ON account_messages
+WHEN old.is_deleted = 0 AND old.merge_epoch IS NULL
+BEGIN
+    UPDATE conversation_message_counters SET
+        message_count = message_count - 1,
+        inbound_count = inbound_count - (old.direction = 'inbound'),
+        outbound_count = outbound_count - (old.direction = 'outbound'),
+        text_bytes = text_bytes - length(CAST(old.text AS BLOB))
+     WHERE creator_account_id = old.creator_account_id AND chat_id = old.chat_id;
+    UPDATE account_message_counters SET
+        message_count = message_count - 1,
+        inbound_count = inbound_count - (old.direction = 'inbound'),
+        outbound_count = outbound_count - (old.direction = 'outbound'),
+        text_bytes = text_bytes - length(CAST(old.text AS BLOB))
+     WHERE creator_account_id = old.creator_account_id;
+END;
+
+-- The observed range reads the earliest and latest live message from here.
+CREATE INDEX account_messages_by_sent_at
+    ON account_messages (creator_account_id, sent_at)
+    WHERE is_deleted = 0;
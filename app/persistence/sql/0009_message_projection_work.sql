@@ -0,0 +1,9 @@
+-- Delta commits describe what they changed so projection can apply point
+-- writes. A 'message_upsert' or 'message_tombstone' item names the one message
+-- it touched, 'summary' changes only the conversation row and node, and
+-- 'conversation' (every item written before this migration) rebuilds the whole
+-- conversation. Coverage and reseed items keep the 'conversation' scope.
+ALTER TABLE projection_work ADD COLUMN work_scope TEXT NOT NULL DEFAULT 'conversation'
+    CHECK (work_scope IN ('conversation', 'summary', 'message_upsert', 'message_tombstone'));
+
+ALTER TABLE projection_work ADD COLUMN message_id TEXT;
@@ -0,0 +1,25 @@
+-- Raw delta events older than the retention horizon are folded into one
+-- checkpoint summary per stream and deleted. The fold chains each batch's
+-- event fingerprints onto the previous digest in source order, so the summary
+-- still attests exactly which events were committed through
+-- folded_through_seq. Redelivery of a folded event stays a duplicate because
+-- its source_seq is at or behind the stream checkpoint.
+CREATE TABLE raw_ingest_folds (
+    creator_account_id TEXT NOT NULL,
+    agent_installation_id TEXT NOT NULL,
+    agent_stream_id TEXT NOT NULL,
+    folded_through_seq INTEGER NOT NULL CHECK (folded_through_seq > 0),
+    folded_event_count INTEGER NOT NULL CHECK (folded_event_count > 0),
+    folded_digest TEXT NOT NULL,
+    first_committed_at TEXT NOT NULL,
+    last_committed_at TEXT NOT NULL,
+    folded_at TEXT NOT NULL,
+    PRIMARY KEY (creator_account_id, agent_installation_id, agent_stream_id),
+    FOREIGN KEY (creator_account_id, agent_installation_id, agent_stream_id)
+        REFERENCES ingest_streams (creator_account_id, agent_installation_id, agent_stream_id)
+        ON DELETE CASCADE
+);
+
+-- Retention finds expired uploads without scanning every stream's history.
+CREATE INDEX snapshot_uploads_by_state
+    ON snapshot_uploads (state, created_at);
@@ -2,6 +2,13 @@
 
 from .config import AgentConfigDocumentResponse, AgentConfigGetRequest
 from .common import MAX_SNAPSHOT_FRAME_BYTES
+from .encoding import (
+    BRIDGE_DEFLATE_ENCODING,
+    BRIDGE_JSON_ENCODING,
+    BridgeFrameBody,
+    BridgeFrameEncoding,
+    negotiate_bridge_encoding,
+)
 from .messages import (
     AGENT_TO_BRAIN_ADAPTER,
     BRAIN_TO_AGENT_ADAPTER,
@@ -18,11 +25,16 @@ __all__ = [
     "BRAIN_TO_AGENT_ADAPTER",
     "BRAIN_TO_BRIDGE_ADAPTER",
     "BRIDGE_TO_BRAIN_ADAPTER",
+    "BRIDGE_DEFLATE_ENCODING",
+    "BRIDGE_JSON_ENCODING",
     "AgentConfigDocumentResponse",
     "AgentConfigGetRequest",
     "MAX_SNAPSHOT_FRAME_BYTES",
     "AgentToBrainMessage",
     "BrainToAgentMessage",
     "BrainToBridgeMessage",
+    "BridgeFrameBody",
+    "BridgeFrameEncoding",
     "BridgeToBrainMessage",
+    "negotiate_bridge_encoding",
 ]
@@ -12,6 +12,8 @@ PROTOCOL_VERSION = "2"
 MAX_SNAPSHOT_RECORDS_PER_CHUNK = 100
 MAX_SNAPSHOT_FRAME_BYTES = 512 * 1024
 MAX_SNAPSHOT_RECORD_BYTES = 384 * 1024
+MAX_SUBSCRIBED_CONVERSATIONS = 500
+MAX_SNAPSHOT_PART_CONVERSATIONS = 100
 
 NonNegativeInt = Annotated[int, Field(ge=0)]
 PositiveInt = Annotated[int, Field(gt=0)]
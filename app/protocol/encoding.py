@@ -0,0 +1,108 @@
+"""Negotiated wire encodings for Brain-to-Bridge frames.
+
+The Bridge offers WebSocket subprotocols at the handshake; each names the
+protocol schema version and a frame encoding. ``json`` sends the validated
+envelope as a text frame, ``deflate`` sends the same bytes zlib-compressed in
+a binary frame (the browser inflates it with ``DecompressionStream``). A
+Bridge that offers nothing, or nothing the Brain knows, gets JSON text.
+Bridge-to-Brain frames are always JSON text.
+
+A large fragment shared by many frames (the conversation list of a full
+snapshot) is wrapped in a ``BridgeFrameBody``. It is deflated at most once, as
+an independent run of deflate blocks, and spliced between each frame's own
+compressed envelope head and tail.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .common import PROTOCOL_VERSION
+
+BRIDGE_DEFLATE_LEVEL = 3
+_ZLIB_HEADER = zlib.compress(b"", BRIDGE_DEFLATE_LEVEL)[:2]
+
+
+def _raw_deflate(data: bytes, mode: int) -> bytes:
+    # A fresh raw compressor never refers back into another segment, and a
+    # sync flush ends byte-aligned, so segments concatenate into one stream.
+    compressor = zlib.compressobj(BRIDGE_DEFLATE_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(mode)
+
+
+class BridgeFrameBody:
+    """A serialized fragment shared by many frames, compressed at most once."""
+
+    __slots__ = ("text", "data", "_deflated")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.data = text.encode("utf-8")
+        self._deflated: bytes | None = None
+
+    def deflated(self) -> bytes:
+        if self._deflated is None:
+            self._deflated = _raw_deflate(self.data, zlib.Z_SYNC_FLUSH)
+        return self._deflated
+
+
+@dataclass(frozen=True, slots=True)
+class BridgeFrameEncoding:
+    name: str
+    subprotocol: str
+    binary: bool
+
+    def encode(self, text: str) -> str | bytes:
+        """Turn one serialized envelope into the frame sent on the socket."""
+        if not self.binary:
+            return text
+        return zlib.compress(text.encode("utf-8"), BRIDGE_DEFLATE_LEVEL)
+
+    def encode_spliced(self, head: str, body: BridgeFrameBody, tail: str) -> str | bytes:
+        """Encode ``head + body.text + tail`` reusing the body's compressed bytes."""
+        if not self.binary:
+            return head + body.text + tail
+        head_data = head.encode("utf-8")
+        tail_data = tail.encode("utf-8")
+        checksum = zlib.adler32(tail_data, zlib.adler32(body.data, zlib.adler32(head_data)))
+        return b"".join(
+            (
+                _ZLIB_HEADER,
+                _raw_deflate(head_data, zlib.Z_SYNC_FLUSH),
+                body.deflated(),
+                _raw_deflate(tail_data, zlib.Z_FINISH),
+                checksum.to_bytes(4, "big"),
+            )
+        )
+
+    def decode(self, frame: str | bytes) -> str:
+        if isinstance(frame, str):
+            return frame
+        return zlib.decompress(frame).decode("utf-8")
+
+
+BRIDGE_JSON_ENCODING = BridgeFrameEncoding(
+    "json", f"onlyfans-bridge.v{PROTOCOL_VERSION}.json", binary=False
+)
+BRIDGE_DEFLATE_ENCODING = BridgeFrameEncoding(
+    "deflate", f"onlyfans-bridge.v{PROTOCOL_VERSION}.deflate", binary=True
+)
+BRIDGE_ENCODINGS = {
+    encoding.subprotocol: encoding
+    for encoding in (BRIDGE_DEFLATE_ENCODING, BRIDGE_JSON_ENCODING)
+}
+
+
+def negotiate_bridge_encoding(offered: Iterable[str]) -> BridgeFrameEncoding | None:
+    """Pick the Bridge's first offered encoding this Brain supports.
+
+    ``None`` means the Bridge offered no known subprotocol; it is accepted
+    without one and receives JSON text.
+    """
+    for subprotocol in offered:
+        encoding = BRIDGE_ENCODINGS.get(subprotocol.strip())
+        if encoding is not None:
+            return encoding
+    return None
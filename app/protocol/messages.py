@@ -35,10 +35,15 @@ IngestDeltaMessage = _message("IngestDeltaMessage", "ingest.delta", IngestDeltaP
 IngestAckMessage = _message("IngestAckMessage", "ingest.ack", IngestAckPayload)
 IngestRejectedMessage = _message("IngestRejectedMessage", "ingest.rejected", IngestRejectedPayload)
 StateSnapshotMessage = _message("StateSnapshotMessage", "state.snapshot", StateSnapshotPayload)
+StateSnapshotPartMessage = _message(
+    "StateSnapshotPartMessage", "state.snapshot.part", StateSnapshotPartPayload
+)
 StateDeltaMessage = _message("StateDeltaMessage", "state.delta", StateDeltaPayload)
 StateResyncMessage = _message("StateResyncMessage", "state.resync", StateResyncPayload)
+StateSubscribeMessage = _message("StateSubscribeMessage", "state.subscribe", StateSubscribePayload)
 PresenceObservedMessage = _message("PresenceObservedMessage", "presence.observed", PresenceObservedPayload)
 PresenceStateMessage = _message("PresenceStateMessage", "presence.state", PresenceStatePayload)
+PresenceDeltaMessage = _message("PresenceDeltaMessage", "presence.delta", PresenceDeltaPayload)
 AgentStateMessage = _message("AgentStateMessage", "agent.state", AgentStatePayload)
 SystemStateMessage = _message("SystemStateMessage", "system.state", SystemStatePayload)
 ProtocolErrorMessage = _message("ProtocolErrorMessage", "protocol.error", ProtocolErrorPayload)
@@ -56,10 +61,13 @@ BrainToAgentMessage: TypeAlias = Annotated[Union[
     AgentSessionMessage, SyncRequiredMessage, IngestAckMessage, IngestRejectedMessage,
     ProtocolErrorMessage, ConfigAvailableMessage, CommandExecuteMessage, CommandResultAckMessage,
 ], Field(discriminator="type")]
-BridgeToBrainMessage: TypeAlias = Annotated[Union[BridgeHelloMessage, StateResyncMessage], Field(discriminator="type")]
+BridgeToBrainMessage: TypeAlias = Annotated[
+    Union[BridgeHelloMessage, StateResyncMessage, StateSubscribeMessage], Field(discriminator="type")
+]
 BrainToBridgeMessage: TypeAlias = Annotated[Union[
-    BridgeSessionMessage, StateSnapshotMessage, StateDeltaMessage, PresenceStateMessage,
-    AgentStateMessage, SystemStateMessage, ProtocolErrorMessage,
+    BridgeSessionMessage, StateSnapshotMessage, StateSnapshotPartMessage, StateDeltaMessage,
+    PresenceStateMessage, PresenceDeltaMessage, AgentStateMessage, SystemStateMessage,
+    ProtocolErrorMessage,
 ], Field(discriminator="type")]
 
 AGENT_TO_BRAIN_ADAPTER = TypeAdapter(AgentToBrainMessage)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from typing import Annotated, Literal, Union
 from uuid import UUID
@@ -12,15 +13,18 @@ from .common import (
     AnalyticsView, CapabilityStatus, CommandAction, CommandError, CommandOutput,
     ConversationSummary, HealthSummary, HistoricalCoverage, LastPresenceObservation,
     LiveFreshness, MAX_SNAPSHOT_FRAME_BYTES, MAX_SNAPSHOT_RECORD_BYTES,
-    MAX_SNAPSHOT_RECORDS_PER_CHUNK, NonEmptyString, NonNegativeInt, ProjectionState,
-    RawIngestChange, SnapshotChatRecord, SnapshotMessageRecordUnion, StateChange,
-    StrictModel, Timestamp,
+    MAX_SNAPSHOT_PART_CONVERSATIONS, MAX_SNAPSHOT_RECORDS_PER_CHUNK,
+    MAX_SUBSCRIBED_CONVERSATIONS, NonEmptyString,
+    NonNegativeInt, ProjectionState, RawIngestChange, SnapshotChatRecord,
+    SnapshotMessageRecordUnion, StateChange, StrictModel, Timestamp,
 )
 
 AgentCapability = Literal[
     "capture.chats", "capture.messages", "capture.presence", "history.sync", "command.message.send"
 ]
-BridgeCapability = Literal["state.snapshot", "state.delta", "presence.state", "message.page"]
+BridgeCapability = Literal[
+    "state.snapshot", "state.snapshot.parts", "state.delta", "presence.state", "message.page"
+]
 
 
 class AgentHelloPayload(StrictModel):
@@ -122,6 +126,25 @@ class IngestSnapshotBeginPayload(SnapshotIdentity):
     max_frame_bytes: Literal[524288]
 
 
+@functools.cache
+def _snapshot_record_adapter(entity_kind: str) -> TypeAdapter:
+    if entity_kind == "chat":
+        return TypeAdapter(list[SnapshotChatRecord])
+    if entity_kind == "message":
+        return TypeAdapter(list[SnapshotMessageRecordUnion])
+    from .common import CoverageEvidence
+
+    return TypeAdapter(list[CoverageEvidence])
+
+
+def normalize_snapshot_records(entity_kind: str, records: list[dict]) -> list[dict]:
+    """Validate raw snapshot records and return their UTC-normalized JSON form."""
+    # The records arrive as JSON. Validate in JSON mode so strict timestamp
+    # fields can parse their RFC 3339 representation before UTC normalization.
+    validated = _snapshot_record_adapter(entity_kind).validate_json(json.dumps(records))
+    return [item.model_dump(mode="json") for item in validated]
+
+
 class IngestSnapshotChunkPayload(SnapshotIdentity):
     frame_kind: Literal["chunk"]
     chunk_index: NonNegativeInt
@@ -132,18 +155,7 @@ class IngestSnapshotChunkPayload(SnapshotIdentity):
     def validate_records(self) -> "IngestSnapshotChunkPayload":
         if not 1 <= len(self.records) <= MAX_SNAPSHOT_RECORDS_PER_CHUNK:
             raise ValueError("snapshot chunks require 1..100 records")
-        if self.entity_kind == "chat":
-            adapter = TypeAdapter(list[SnapshotChatRecord])
-        elif self.entity_kind == "message":
-            adapter = TypeAdapter(list[SnapshotMessageRecordUnion])
-        else:
-            from .common import CoverageEvidence
-
-            adapter = TypeAdapter(list[CoverageEvidence])
-        # The records arrive as JSON. Validate in JSON mode so strict timestamp
-        # fields can parse their RFC 3339 representation before UTC normalization.
-        validated = adapter.validate_json(json.dumps(self.records))
-        normalized = [item.model_dump(mode="json") for item in validated]
+        normalized = normalize_snapshot_records(self.entity_kind, self.records)
         for record in normalized:
             size = len(json.dumps(record, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8"))
             if size > MAX_SNAPSHOT_RECORD_BYTES:
@@ -212,6 +224,26 @@ class StateSnapshotPayload(StrictModel):
     coverage: HistoricalCoverage
     projection: ProjectionState
     live_freshness: LiveFreshness
+    # Set when the conversations were streamed ahead of this frame as that many
+    # state.snapshot.part frames of the same view_revision; the list here is
+    # then empty and the frame only marks the snapshot complete.
+    part_count: NonNegativeInt | None = None
+
+    @model_validator(mode="after")
+    def validate_parts(self) -> "StateSnapshotPayload":
+        if self.part_count is not None and self.conversations:
+            raise ValueError("a streamed snapshot carries its conversations in parts")
+        return self
+
+
+class StateSnapshotPartPayload(StrictModel):
+    creator_account_id: NonEmptyString
+    view_revision: NonNegativeInt
+    part_index: NonNegativeInt
+    conversations: Annotated[
+        list[ConversationSummary],
+        Field(min_length=1, max_length=MAX_SNAPSHOT_PART_CONVERSATIONS),
+    ]
 
 
 class StateDeltaPayload(StrictModel):
@@ -219,6 +251,15 @@ class StateDeltaPayload(StrictModel):
     view_revision: Annotated[int, Field(gt=0)]
     committed_at: Timestamp
     changes: Annotated[list[StateChange], Field(min_length=1, max_length=100)]
+    # A batched delta covers (base_view_revision, view_revision]; omitted means
+    # the single revision view_revision - 1 -> view_revision.
+    base_view_revision: NonNegativeInt | None = None
+
+    @model_validator(mode="after")
+    def validate_revision_range(self) -> "StateDeltaPayload":
+        if self.base_view_revision is not None and self.base_view_revision >= self.view_revision:
+            raise ValueError("base_view_revision must precede view_revision")
+        return self
 
 
 class StateResyncPayload(StrictModel):
@@ -229,6 +270,27 @@ class StateResyncPayload(StrictModel):
     reason: Literal["revision_gap", "invalid_delta", "reconnect", "manual"]
 
 
+class StateSubscribePayload(StrictModel):
+    connection_id: UUID
+    bridge_session_id: UUID
+    creator_account_id: NonEmptyString
+    # None subscribes to every conversation of the account.
+    conversation_ids: Annotated[
+        list[NonEmptyString], Field(max_length=MAX_SUBSCRIBED_CONVERSATIONS)
+    ] | None
+    aggregates: list[Literal["analytics", "coverage", "projection", "live_freshness"]]
+
+    @model_validator(mode="after")
+    def validate_unique(self) -> "StateSubscribePayload":
+        if self.conversation_ids is not None and len(set(self.conversation_ids)) != len(
+            self.conversation_ids
+        ):
+            raise ValueError("conversation_ids must be unique")
+        if len(set(self.aggregates)) != len(self.aggregates):
+            raise ValueError("aggregates must be unique")
+        return self
+
+
 class PresenceObservedPayload(StrictModel):
     connection_id: UUID
     fencing_token: NonEmptyString
@@ -240,6 +302,9 @@ class PresenceObservedPayload(StrictModel):
 
 class PresenceStatePayload(StrictModel):
     creator_account_id: NonEmptyString
+    # Advances with every broadcast presence transition; presence.delta
+    # frames apply on top of the version the Bridge holds.
+    version: NonNegativeInt
     freshness: Literal["current", "unknown"]
     online_platform_user_ids: list[NonEmptyString]
     server_received_at: Timestamp | None
@@ -247,6 +312,26 @@ class PresenceStatePayload(StrictModel):
     last_observation: LastPresenceObservation | None
 
 
+class PresenceDeltaPayload(StrictModel):
+    creator_account_id: NonEmptyString
+    base_version: NonNegativeInt
+    version: Annotated[int, Field(gt=0)]
+    freshness: Literal["current", "unknown"]
+    joined_platform_user_ids: list[NonEmptyString]
+    left_platform_user_ids: list[NonEmptyString]
+    server_received_at: Timestamp | None
+    expires_at: Timestamp | None
+    last_observation: LastPresenceObservation | None
+
+    @model_validator(mode="after")
+    def validate_transition(self) -> "PresenceDeltaPayload":
+        if self.base_version >= self.version:
+            raise ValueError("base_version must precede version")
+        if set(self.joined_platform_user_ids) & set(self.left_platform_user_ids):
+            raise ValueError("a platform user cannot both join and leave")
+        return self
+
+
 class AgentStatePayload(StrictModel):
     creator_account_id: NonEmptyString
     status: Literal["connected", "stale", "disconnected"]
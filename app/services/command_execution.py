@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Literal
 from uuid import UUID, uuid4
 
+from app.core.deadlines import DeadlineScheduler
 from app.protocol.common import MessageSendAction
 
 
@@ -16,6 +18,10 @@ CommandState = Literal["issued", "accepted", "succeeded", "failed", "unknown"]
 IdempotencyPolicy = Literal["deduplicate"]
 CommandSender = Callable[[dict[str, Any]], Awaitable[None]]
 ALLOWED_COMMAND_ACTIONS = frozenset({"message.send"})
+PENDING_COMMAND_STATES = frozenset({"issued", "accepted"})
+COMMAND_PAGE_MAX_LIMIT = 500
+# Keyset position of a command page: the last row's (issued_at, command_id).
+CommandCursor = tuple[datetime, UUID]
 
 
 def utc_now() -> datetime:
@@ -75,6 +81,12 @@ class CommandRecord:
     receipts: list[CommandResultReceipt] = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class CommandPage:
+    records: list[CommandRecord]
+    next_cursor: CommandCursor | None
+
+
 @dataclass(frozen=True, slots=True)
 class RecordedResult:
     command_id: UUID
@@ -107,11 +119,37 @@ class CommandRepository(ABC):
     def list(self, creator_account_id: str | None = None) -> list[CommandRecord]:
         raise NotImplementedError
 
+    @abstractmethod
+    def page(
+        self,
+        *,
+        creator_account_id: str | None = None,
+        states: Collection[CommandState] | None = None,
+        after: CommandCursor | None = None,
+        limit: int = 100,
+    ) -> CommandPage:
+        """Commands ordered by ``(issued_at, command_id)``, strictly after ``after``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def pending_deadlines(self) -> list[tuple[UUID, datetime]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def expire_due(self, now: datetime, detail: str) -> list[UUID]:
+        """Move every pending command due at ``now`` to ``unknown`` in one write."""
+        raise NotImplementedError
+
     @abstractmethod
     def reset(self) -> None:
         raise NotImplementedError
 
 
+def validate_command_page_limit(limit: int) -> None:
+    if not 1 <= limit <= COMMAND_PAGE_MAX_LIMIT:
+        raise ValueError(f"Command page limit must be between 1 and {COMMAND_PAGE_MAX_LIMIT}")
+
+
 class InMemoryCommandRepository(CommandRepository):
     """Copy-isolated command repository used until shared storage is selected."""
 
@@ -135,6 +173,51 @@ class InMemoryCommandRepository(CommandRepository):
             )
         return [deepcopy(record) for record in records]
 
+    def page(
+        self,
+        *,
+        creator_account_id: str | None = None,
+        states: Collection[CommandState] | None = None,
+        after: CommandCursor | None = None,
+        limit: int = 100,
+    ) -> CommandPage:
+        validate_command_page_limit(limit)
+        matching = sorted(
+            (
+                record
+                for record in self._records.values()
+                if (creator_account_id is None or record.creator_account_id == creator_account_id)
+                and (states is None or record.state in states)
+                and (
+                    after is None
+                    or (record.issued_at, str(record.command_id)) > (after[0], str(after[1]))
+                )
+            ),
+            key=lambda record: (record.issued_at, str(record.command_id)),
+        )
+        records = [deepcopy(record) for record in matching[:limit]]
+        next_cursor = (
+            (records[-1].issued_at, records[-1].command_id) if len(matching) > limit else None
+        )
+        return CommandPage(records, next_cursor)
+
+    def pending_deadlines(self) -> list[tuple[UUID, datetime]]:
+        return [
+            (record.command_id, record.deadline)
+            for record in self._records.values()
+            if record.state in PENDING_COMMAND_STATES
+        ]
+
+    def expire_due(self, now: datetime, detail: str) -> list[UUID]:
+        expired: list[UUID] = []
+        for record in self._records.values():
+            if record.state in PENDING_COMMAND_STATES and record.deadline <= now:
+                record.state = "unknown"
+                record.failure_reason = detail
+                record.transitions.append(CommandTransition("unknown", now, detail))
+                expired.append(record.command_id)
+        return expired
+
     def reset(self) -> None:
         self._records.clear()
 
@@ -144,6 +227,11 @@ class CommandService:
 
     def __init__(self, repository: CommandRepository) -> None:
         self.repository = repository
+        # Deadlines of commands still awaiting a result; expiry touches only
+        # the due ones. Commands persisted by an earlier process are loaded once.
+        self._deadlines: DeadlineScheduler[UUID] = DeadlineScheduler()
+        for command_id, deadline in repository.pending_deadlines():
+            self._deadlines.schedule(command_id, deadline)
 
     async def issue(
         self,
@@ -179,6 +267,7 @@ class CommandService:
             transitions=[CommandTransition("issued", issued_at)],
         )
         self.repository.save(record)
+        self._track(record)
 
         if deadline <= issued_at:
             self._transition(record, "unknown", issued_at, "deadline_expired")
@@ -217,7 +306,7 @@ class CommandService:
             raise CommandReissueError(
                 "Non-idempotent commands cannot be reissued without deduplication"
             )
-        if record.state not in {"issued", "accepted"}:
+        if record.state not in PENDING_COMMAND_STATES:
             raise CommandReissueError(
                 f"Command in {record.state} state cannot be reissued"
             )
@@ -302,6 +391,7 @@ class CommandService:
             )
         )
         self.repository.save(record)
+        self._track(record)
         return RecordedResult(
             command_id=command_id,
             result_id=result_id,
@@ -312,12 +402,16 @@ class CommandService:
 
     def expire(self, now: datetime | None = None) -> list[CommandRecord]:
         current_time = now or utc_now()
+        if not self._deadlines.pop_due(current_time):
+            return []
+        # One repository write expires everything due, including commands
+        # another process issued after this one loaded its deadlines.
         expired: list[CommandRecord] = []
-        for record in self.repository.list():
-            if record.state in {"issued", "accepted"} and record.deadline <= current_time:
-                self._transition(record, "unknown", current_time, "deadline_expired")
-                self.repository.save(record)
-                expired.append(deepcopy(record))
+        for command_id in self.repository.expire_due(current_time, "deadline_expired"):
+            self._deadlines.cancel(command_id)
+            record = self.repository.get(command_id)
+            if record is not None:
+                expired.append(record)
         return expired
 
     def get(self, command_id: UUID) -> CommandRecord | None:
@@ -326,8 +420,21 @@ class CommandService:
     def list(self, creator_account_id: str | None = None) -> list[CommandRecord]:
         return self.repository.list(creator_account_id)
 
+    def page(
+        self,
+        *,
+        creator_account_id: str | None = None,
+        states: Collection[CommandState] | None = None,
+        after: CommandCursor | None = None,
+        limit: int = 100,
+    ) -> CommandPage:
+        return self.repository.page(
+            creator_account_id=creator_account_id, states=states, after=after, limit=limit
+        )
+
     def reset(self) -> None:
         self.repository.reset()
+        self._deadlines.clear()
 
     @staticmethod
     def _validate_action(action: dict[str, Any]) -> dict[str, Any]:
@@ -372,8 +479,15 @@ class CommandService:
             raise LookupError(f"Unknown command {command_id}")
         return record
 
+    def _track(self, record: CommandRecord) -> None:
+        if record.state in PENDING_COMMAND_STATES:
+            self._deadlines.schedule(record.command_id, record.deadline)
+        else:
+            self._deadlines.cancel(record.command_id)
+
     def _save_and_get(self, record: CommandRecord) -> CommandRecord:
         self.repository.save(record)
+        self._track(record)
         saved = self.repository.get(record.command_id)
         if saved is None:  # pragma: no cover - repository contract invariant
             raise RuntimeError("Command repository lost a saved record")
@@ -7,8 +7,10 @@ import logging
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, time, timezone
+from pathlib import Path
 from statistics import mean
 from threading import RLock
+from typing import Callable
 
 from app.analytics.factory import create_analytics_stores
 from app.analytics.identity import canonical_identity
@@ -51,6 +53,8 @@ from app.models.insights import (
     TopicMetricsCollection,
     TopicMetricsResponse,
 )
+from app.persistence.factory import CanonicalRepositories
+from app.persistence.projection_activation import ProjectionActivationRepository
 from app.transport.ingestion import AccountReadModel
 
 
@@ -90,11 +94,100 @@ def analytics_runtime(
 ) -> AnalyticsRuntime:
     """Return the process-local derived runtime for one canonical repository."""
 
-    use_default_runtime = source is None
+    if source is not None:
+        return _cached_runtime(source, lambda: AnalyticsPipeline(source))
+    from app.core.config import settings
+    from app.transport import transport_manager
+
+    default_source = transport_manager.ingestion
+
+    def pipeline() -> AnalyticsPipeline:
+        if settings.canonical_persistence_backend != "sqlite":
+            return AnalyticsPipeline(default_source)
+        return _sqlite_pipeline(
+            default_source,
+            projections_path=settings.analytics_projection_database_path,
+            canonical_path=settings.canonical_database_path,
+            activation=transport_manager.projection_activation,
+        )
+
+    return _cached_runtime(default_source, pipeline)
+
+
+def account_runtime(
+    creator_account_id: str,
+    source: CanonicalReadModelSource | None = None,
+) -> AnalyticsRuntime:
+    """Return the runtime reading the canonical store that holds one account.
+
+    Unsharded this is the default runtime; with sharded canonical storage
+    each shard has a runtime of its own over the shard's files.
+    """
+
     if source is None:
         from app.transport import transport_manager
 
-        source = transport_manager.ingestion
+        if transport_manager.shards is not None:
+            return _shard_runtime(
+                transport_manager.repositories_for(creator_account_id)
+            )
+    return analytics_runtime(source)
+
+
+def _shard_runtime(repositories: CanonicalRepositories) -> AnalyticsRuntime:
+    source = repositories.ingestion
+    return _cached_runtime(
+        source,
+        lambda: _sqlite_pipeline(
+            source,
+            projections_path=repositories.analytics_projection_path,
+            canonical_path=repositories.database.path,
+            activation=repositories.projection_activation,
+        ),
+    )
+
+
+def _default_runtimes() -> list[AnalyticsRuntime]:
+    from app.transport import transport_manager
+
+    if transport_manager.shards is None:
+        return [analytics_runtime()]
+    return [
+        _shard_runtime(repositories)
+        for repositories in transport_manager.account_repositories()
+    ]
+
+
+def _sqlite_pipeline(
+    source: CanonicalReadModelSource,
+    *,
+    projections_path: Path,
+    canonical_path: Path,
+    activation: ProjectionActivationRepository,
+) -> AnalyticsPipeline:
+    stores = create_analytics_stores(
+        "sqlite",
+        projections_path=projections_path,
+        canonical_path=canonical_path,
+        activation=activation,
+        canonical_identity_reader=lambda account_id: (
+            canonical_identity(source.account_read_model(account_id))
+            if source.account_exists(account_id)
+            else None
+        ),
+        lazy=True,
+    )
+    return AnalyticsPipeline(
+        source,
+        projections=stores.projections,
+        graph=stores.graph,
+    )
+
+
+def _cached_runtime(
+    source: CanonicalReadModelSource,
+    pipeline: Callable[[], AnalyticsPipeline],
+) -> AnalyticsRuntime:
     key = id(source)
     with _RUNTIME_LOCK:
         existing = _RUNTIMES.get(key)
@@ -104,36 +197,11 @@ def analytics_runtime(
             and not existing.scheduler.closed
         ):
             return existing
-        if use_default_runtime:
-            from app.core.config import settings
-            from app.transport import transport_manager
-
-            if settings.canonical_persistence_backend == "sqlite":
-                stores = create_analytics_stores(
-                    "sqlite",
-                    projections_path=settings.analytics_projection_database_path,
-                    canonical_path=settings.canonical_database_path,
-                    activation=transport_manager.projection_activation,
-                    canonical_identity_reader=lambda account_id: (
-                        canonical_identity(source.account_read_model(account_id))
-                        if source.account_exists(account_id)
-                        else None
-                    ),
-                    lazy=True,
-                )
-                pipeline = AnalyticsPipeline(
-                    source,
-                    projections=stores.projections,
-                    graph=stores.graph,
-                )
-            else:
-                pipeline = AnalyticsPipeline(source)
-        else:
-            pipeline = AnalyticsPipeline(source)
+        built = pipeline()
         runtime = AnalyticsRuntime(
             source=source,
-            pipeline=pipeline,
-            scheduler=InProcessProjectionScheduler(pipeline),
+            pipeline=built,
+            scheduler=InProcessProjectionScheduler(built),
         )
         _RUNTIMES[key] = runtime
         return runtime
@@ -169,25 +237,28 @@ def launch_default_projection_scheduler() -> asyncio.Task[None]:
     """Launch derived recovery after transport readiness without blocking it."""
 
     global _STARTUP_TASK
-    scheduler = configure_default_projection_scheduler()
+    schedulers = [runtime.scheduler for runtime in _default_runtimes()]
     if _STARTUP_TASK is not None and not _STARTUP_TASK.done():
         return _STARTUP_TASK
 
     async def start() -> None:
-        try:
-            await scheduler.start(recover=True)
-        except (ProjectionCoordinatorClosed, ProjectionStorageUnavailable):
-            LOGGER.warning(
-                "analytics_scheduler_event "
-                "reason_code=analytics_projection_start_unavailable "
-                "event_type=startup count=1"
-            )
-        except Exception:
-            LOGGER.exception(
-                "analytics_scheduler_event "
-                "reason_code=analytics_projection_start_failed "
-                "event_type=startup count=1"
-            )
+        # Each canonical shard recovers on its own scheduler; one shard's
+        # unavailable storage does not hold back the others.
+        for scheduler in schedulers:
+            try:
+                await scheduler.start(recover=True)
+            except (ProjectionCoordinatorClosed, ProjectionStorageUnavailable):
+                LOGGER.warning(
+                    "analytics_scheduler_event "
+                    "reason_code=analytics_projection_start_unavailable "
+                    "event_type=startup count=1"
+                )
+            except Exception:
+                LOGGER.exception(
+                    "analytics_scheduler_event "
+                    "reason_code=analytics_projection_start_failed "
+                    "event_type=startup count=1"
+                )
 
     _STARTUP_TASK = asyncio.create_task(
         start(), name="analytics-projection-startup"
@@ -216,7 +287,7 @@ async def request_projection_rebuild(
 
         if settings.canonical_persistence_backend != "sqlite":
             return False
-    runtime = analytics_runtime(source)
+    runtime = account_runtime(creator_account_id, source)
     if runtime.scheduler.closed:
         return False
     account = await _canonical_account(runtime, creator_account_id)
@@ -231,21 +302,34 @@ async def shutdown_default_projection_scheduler(*, timeout: float = 5.0) -> bool
 
     from app.transport import transport_manager
 
-    source = transport_manager.ingestion
-    key = id(source)
+    if transport_manager.shards is None:
+        sources = [transport_manager.ingestion]
+    else:
+        sources = [
+            repositories.ingestion
+            for repositories in transport_manager.account_repositories()
+        ]
     with _RUNTIME_LOCK:
-        runtime = _RUNTIMES.get(key)
-    if runtime is None or runtime.source is not source:
+        runtimes = [
+            runtime
+            for source in sources
+            if (runtime := _RUNTIMES.get(id(source))) is not None
+            and runtime.source is source
+        ]
+    if not runtimes:
         return True
-    drained = await runtime.scheduler.close(timeout=timeout)
+    drained = True
+    for runtime in runtimes:
+        drained = await runtime.scheduler.close(timeout=timeout) and drained
     global _STARTUP_TASK
     startup_task = _STARTUP_TASK
     _STARTUP_TASK = None
     if startup_task is not None and not startup_task.done():
         startup_task.cancel()
     with _RUNTIME_LOCK:
-        if _RUNTIMES.get(key) is runtime:
-            _RUNTIMES.pop(key, None)
+        for runtime in runtimes:
+            if _RUNTIMES.get(id(runtime.source)) is runtime:
+                _RUNTIMES.pop(id(runtime.source), None)
     return drained
 
 
@@ -625,7 +709,7 @@ async def active_projection(
 ) -> AnalyticsProjection:
     """Return current active state without mutating coordinator or projections."""
 
-    runtime = analytics_runtime(source)
+    runtime = account_runtime(creator_account_id, source)
     account = await _canonical_account(runtime, creator_account_id)
     try:
         projection = await runtime.scheduler.active_projection(
@@ -978,7 +1062,7 @@ async def fetch_conversations_for_account(
     source: CanonicalReadModelSource | None = None,
 ) -> list[ExtendedConversationNode]:
     projection = await active_projection(creator_account_id, source=source)
-    runtime = analytics_runtime(source)
+    runtime = account_runtime(creator_account_id, source)
     account = await _canonical_account(runtime, creator_account_id)
     if account.view_revision != projection.source_revision:
         state = runtime.scheduler.state(
@@ -1009,7 +1093,7 @@ async def get_full_snapshot(
     *,
     source: CanonicalReadModelSource | None = None,
 ) -> FullSyncResponse:
-    runtime = analytics_runtime(source)
+    runtime = account_runtime(creator_account_id, source)
     for _ in range(2):
         projection = await active_projection(creator_account_id, source=source)
         account = await _canonical_account(runtime, creator_account_id)
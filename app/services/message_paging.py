@@ -0,0 +1,281 @@
+"""Projection message and conversation paging with cached activation authority."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from app.persistence.history import ProjectionRepository
+from app.services.paging_cursor import (
+    ConversationCursor,
+    InvalidMessageCursor,
+    MessageCursor,
+    MessageCursorCodec,
+)
+
+
+READ_AHEAD_CAPACITY = 256
+
+
+class MessagePageNotFound(LookupError):
+    """Raised when no readable generation holds the requested conversation."""
+
+
+@dataclass(frozen=True, slots=True)
+class _ReadAheadPage:
+    items: list[dict[str, Any]]
+    has_more: bool
+
+
+class MessagePagingService:
+    """Serve conversation pages with one projection read per request.
+
+    Activation authority is cached per account and view revision, so a page
+    costs one canonical head lookup instead of the activation-intent query.
+    With read-ahead each range read also fetches the next page and keeps it
+    under the cursor token that requests it; cursors are bound to one
+    immutable generation, so a kept page never needs revalidating beyond the
+    generation check every request already makes.
+    """
+
+    def __init__(
+        self,
+        codec: MessageCursorCodec,
+        *,
+        read_ahead: bool = True,
+        capacity: int = READ_AHEAD_CAPACITY,
+    ) -> None:
+        self.codec = codec
+        self.read_ahead = read_ahead
+        self.capacity = capacity
+        self._authority: dict[str, tuple[int, dict[str, Any]]] = {}
+        self._pages: OrderedDict[tuple[str, str, str, int], _ReadAheadPage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._authority.clear()
+            self._pages.clear()
+
+    def page(
+        self,
+        projection: ProjectionRepository,
+        account_id: str,
+        conversation_id: str,
+        *,
+        before: str | None,
+        limit: int,
+    ) -> dict[str, Any]:
+        """Return the page document for the endpoint.
+
+        Raises ``MessagePageNotFound`` before ``InvalidMessageCursor``, and
+        ``ProjectionCursorStale`` when the cursor's generation is no longer
+        active.
+        """
+        cursor: MessageCursor | None = None
+        cursor_error: InvalidMessageCursor | None = None
+        if before is not None:
+            try:
+                cursor = self.codec.decode(before)
+            except InvalidMessageCursor as error:
+                cursor_error = error
+            else:
+                if cursor.account_id != account_id or cursor.conversation_id != conversation_id:
+                    cursor_error = InvalidMessageCursor("cursor belongs to another conversation")
+        if cursor_error is not None:
+            # Unknown conversations answer 404 whatever the cursor says.
+            if not projection.conversation_exists(account_id, conversation_id):
+                raise MessagePageNotFound(conversation_id)
+            raise cursor_error
+
+        key = (account_id, conversation_id, before or "", limit)
+        kept = None
+        if cursor is not None:
+            with self._lock:
+                kept = self._pages.pop(key, None)
+        page = projection.message_page(
+            account_id,
+            conversation_id,
+            before=None if cursor is None else (cursor.sent_at, cursor.message_id),
+            limit=limit,
+            expected_generation=None if cursor is None else cursor.projection_generation,
+            expected_revision=None if cursor is None else cursor.projection_revision,
+            fetch_rows=kept is None,
+            read_ahead=self.read_ahead,
+            authority_cache=self._authority,
+        )
+        if page is None:
+            raise MessagePageNotFound(conversation_id)
+        if kept is not None:
+            items, has_more = kept.items, kept.has_more
+        else:
+            assert page.items is not None
+            items, has_more = page.items, page.has_more
+        generation = page.generation
+
+        older_cursor = None
+        if has_more and items:
+            oldest = items[0]
+            older_cursor = self.codec.encode(
+                MessageCursor(
+                    account_id=account_id,
+                    conversation_id=conversation_id,
+                    projection_generation=generation["generation_id"],
+                    projection_revision=generation["projected_revision"],
+                    sent_at=oldest["sent_at"],
+                    message_id=oldest["message_id"],
+                )
+            )
+            if page.read_ahead is not None:
+                self._keep((account_id, conversation_id, older_cursor, limit), page.read_ahead)
+
+        return {
+            "creator_account_id": account_id,
+            "conversation_id": conversation_id,
+            "projection_generation": generation["generation_id"],
+            "read_revision": generation["read_revision"],
+            "generated_at": generation["generated_at"],
+            "items": items,
+            "older_cursor": older_cursor,
+            "has_older_stored_items": has_more,
+            "conversation_coverage": projection.canonical.conversation_coverage(
+                account_id, conversation_id
+            ),
+            "projection": page.projection,
+        }
+
+    def tails(
+        self,
+        projection: ProjectionRepository,
+        account_id: str,
+        conversation_ids: list[str],
+        *,
+        limit: int,
+    ) -> dict[str, Any]:
+        """Return the newest messages of several conversations from one generation.
+
+        Conversations absent from the generation are listed in
+        ``missing_conversation_ids``; each tail carries the cursor that pages
+        further back exactly as the single-conversation endpoint would.
+        """
+        requested = list(dict.fromkeys(conversation_ids))
+        tails = projection.message_tails(
+            account_id, requested, limit=limit, authority_cache=self._authority
+        )
+        if tails is None:
+            raise MessagePageNotFound(account_id)
+        generation = tails.generation
+        conversations = []
+        for conversation_id, (items, has_more) in tails.tails.items():
+            older_cursor = None
+            if has_more and items:
+                older_cursor = self.codec.encode(
+                    MessageCursor(
+                        account_id=account_id,
+                        conversation_id=conversation_id,
+                        projection_generation=generation["generation_id"],
+                        projection_revision=generation["projected_revision"],
+                        sent_at=items[0]["sent_at"],
+                        message_id=items[0]["message_id"],
+                    )
+                )
+            conversations.append({
+                "conversation_id": conversation_id,
+                "items": items,
+                "older_cursor": older_cursor,
+                "has_older_stored_items": has_more,
+            })
+        return {
+            "creator_account_id": account_id,
+            "projection_generation": generation["generation_id"],
+            "read_revision": generation["read_revision"],
+            "generated_at": generation["generated_at"],
+            "conversations": conversations,
+            "missing_conversation_ids": [
+                conversation_id
+                for conversation_id in requested
+                if conversation_id not in tails.tails
+            ],
+            "projection": tails.projection,
+        }
+
+    def conversations(
+        self,
+        projection: ProjectionRepository,
+        account_id: str,
+        *,
+        order: str,
+        after: str | None,
+        limit: int,
+        unread_only: bool = False,
+        direction: str | None = None,
+        name_prefix: str | None = None,
+    ) -> dict[str, Any]:
+        """Return one keyset page of the account's conversation list.
+
+        The cursor binds the order, the filters and the generation; it raises
+        ``InvalidMessageCursor`` when reused with others and
+        ``ProjectionCursorStale`` once its generation is superseded.
+        """
+        filters = json.dumps([unread_only, direction, name_prefix or None])
+        cursor: ConversationCursor | None = None
+        if after is not None:
+            cursor = self.codec.decode_conversations(after)
+            if (
+                cursor.account_id != account_id
+                or cursor.order != order
+                or cursor.filters != filters
+            ):
+                raise InvalidMessageCursor("cursor belongs to another listing")
+        page = projection.conversation_page(
+            account_id,
+            order=order,
+            after=None if cursor is None else tuple(cursor.after),
+            limit=limit,
+            unread_only=unread_only,
+            direction=direction,
+            name_prefix=name_prefix,
+            expected_generation=None if cursor is None else cursor.projection_generation,
+            expected_revision=None if cursor is None else cursor.projection_revision,
+            authority_cache=self._authority,
+        )
+        if page is None:
+            raise MessagePageNotFound(account_id)
+        generation = page.generation
+        next_cursor = None
+        if page.next_after is not None:
+            next_cursor = self.codec.encode_conversations(
+                ConversationCursor(
+                    account_id=account_id,
+                    projection_generation=generation["generation_id"],
+                    projection_revision=generation["projected_revision"],
+                    order=order,
+                    filters=filters,
+                    after=list(page.next_after),
+                )
+            )
+        return {
+            "creator_account_id": account_id,
+            "projection_generation": generation["generation_id"],
+            "read_revision": generation["read_revision"],
+            "generated_at": generation["generated_at"],
+            "order": order,
+            "items": page.items,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+            "projection": page.projection,
+        }
+
+    def _keep(
+        self,
+        key: tuple[str, str, str, int],
+        read_ahead: tuple[list[dict[str, Any]], bool],
+    ) -> None:
+        with self._lock:
+            self._pages[key] = _ReadAheadPage(items=read_ahead[0], has_more=read_ahead[1])
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.capacity:
+                self._pages.popitem(last=False)
@@ -1,4 +1,4 @@
-"""Opaque HMAC-authenticated cursors for stable projection message paging."""
+"""Opaque HMAC-authenticated cursors for stable projection paging."""
 
 from __future__ import annotations
 
@@ -46,6 +46,20 @@ class MessageCursor:
     version: int = 1
 
 
+@dataclass(frozen=True, slots=True)
+class ConversationCursor:
+    account_id: str
+    projection_generation: str
+    projection_revision: int
+    order: str
+    filters: str
+    after: list[str | int]
+    version: int = 1
+
+
+CONVERSATION_CURSOR_KEYS = {"recent": 2, "unread": 3, "name": 2}
+
+
 class MessageCursorCodec:
     def __init__(self, secret: str) -> None:
         if len(secret.encode("utf-8")) < 32:
@@ -53,13 +67,19 @@ class MessageCursorCodec:
         self._secret = secret.encode("utf-8")
 
     def encode(self, cursor: MessageCursor) -> str:
+        return self._sign(asdict(cursor))
+
+    def encode_conversations(self, cursor: ConversationCursor) -> str:
+        return self._sign(asdict(cursor))
+
+    def _sign(self, document: dict[str, Any]) -> str:
         payload = json.dumps(
-            asdict(cursor), ensure_ascii=False, separators=(",", ":"), sort_keys=True
+            document, ensure_ascii=False, separators=(",", ":"), sort_keys=True
         ).encode("utf-8")
         signature = hmac.new(self._secret, payload, hashlib.sha256).digest()
         return f"{_encode_base64(payload)}.{_encode_base64(signature)}"
 
-    def decode(self, token: str) -> MessageCursor:
+    def _verify(self, token: str) -> Any:
         try:
             encoded_payload, encoded_signature = token.split(".", 1)
         except ValueError as error:
@@ -73,6 +93,24 @@ class MessageCursorCodec:
             document: Any = json.loads(payload)
         except (json.JSONDecodeError, UnicodeDecodeError) as error:
             raise InvalidMessageCursor("cursor payload is invalid") from error
+        return document
+
+    @staticmethod
+    def _check_generation(document: dict[str, Any]) -> None:
+        if document["version"] != 1:
+            raise InvalidMessageCursor("cursor version is unsupported")
+        for field in ("account_id", "projection_generation"):
+            if not isinstance(document[field], str) or not document[field]:
+                raise InvalidMessageCursor(f"cursor {field} is invalid")
+        if (
+            isinstance(document["projection_revision"], bool)
+            or not isinstance(document["projection_revision"], int)
+            or document["projection_revision"] < 0
+        ):
+            raise InvalidMessageCursor("cursor projection_revision is invalid")
+
+    def decode(self, token: str) -> MessageCursor:
+        document = self._verify(token)
         expected_keys = {
             "account_id",
             "conversation_id",
@@ -84,23 +122,10 @@ class MessageCursorCodec:
         }
         if not isinstance(document, dict) or set(document) != expected_keys:
             raise InvalidMessageCursor("cursor payload shape is invalid")
-        if document["version"] != 1:
-            raise InvalidMessageCursor("cursor version is unsupported")
-        for field in (
-            "account_id",
-            "conversation_id",
-            "projection_generation",
-            "sent_at",
-            "message_id",
-        ):
+        self._check_generation(document)
+        for field in ("conversation_id", "sent_at", "message_id"):
             if not isinstance(document[field], str) or not document[field]:
                 raise InvalidMessageCursor(f"cursor {field} is invalid")
-        if (
-            isinstance(document["projection_revision"], bool)
-            or not isinstance(document["projection_revision"], int)
-            or document["projection_revision"] < 0
-        ):
-            raise InvalidMessageCursor("cursor projection_revision is invalid")
         try:
             sent_at = datetime.fromisoformat(document["sent_at"].replace("Z", "+00:00"))
         except ValueError as error:
@@ -108,3 +133,30 @@ class MessageCursorCodec:
         if sent_at.tzinfo is None or sent_at.utcoffset() is None:
             raise InvalidMessageCursor("cursor sent_at must include a UTC offset")
         return MessageCursor(**document)
+
+    def decode_conversations(self, token: str) -> ConversationCursor:
+        document = self._verify(token)
+        expected_keys = {
+            "account_id",
+            "projection_generation",
+            "projection_revision",
+            "order",
+            "filters",
+            "after",
+            "version",
+        }
+        if not isinstance(document, dict) or set(document) != expected_keys:
+            raise InvalidMessageCursor("cursor payload shape is invalid")
+        self._check_generation(document)
+        if document["order"] not in CONVERSATION_CURSOR_KEYS:
+            raise InvalidMessageCursor("cursor order is invalid")
+        if not isinstance(document["filters"], str):
+            raise InvalidMessageCursor("cursor filters are invalid")
+        after = document["after"]
+        if (
+            not isinstance(after, list)
+            or len(after) != CONVERSATION_CURSOR_KEYS[document["order"]]
+            or any(isinstance(value, bool) or not isinstance(value, (str, int)) for value in after)
+        ):
+            raise InvalidMessageCursor("cursor position is invalid")
+        return ConversationCursor(**document)
@@ -0,0 +1,124 @@
+"""Coalescing of queued Bridge ``state.delta`` change sets.
+
+Deltas queued during one flush tick are merged into as few frames as the
+protocol allows. Every change addresses one key (a conversation, a
+conversation's coverage, one tail message, or a replaceable global), and the
+last change to a key inside a batch supersedes the earlier ones. A merged
+frame carries ``base_view_revision`` so the Bridge applies the whole revision
+range atomically on top of the revision it already holds. Before delivery a
+delta is scoped to each Bridge's subscription.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+STATE_DELTA_MAX_CHANGES = 100
+_REPLACEABLE_CHANGES = frozenset(
+    {"analytics.replace", "coverage.replace", "projection.replace", "live_freshness.replace"}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BridgeSubscription:
+    """What one Bridge renders: a conversation set (``None`` is all) and aggregates."""
+
+    conversation_ids: frozenset[str] | None
+    aggregates: frozenset[str]
+
+    def includes(self, change: dict[str, Any]) -> bool:
+        kind = change["type"]
+        if kind in _REPLACEABLE_CHANGES:
+            return kind.removesuffix(".replace") in self.aggregates
+        if self.conversation_ids is None:
+            return True
+        if kind == "conversation.upsert":
+            return change["conversation"]["conversation_id"] in self.conversation_ids
+        return change["conversation_id"] in self.conversation_ids
+
+
+def scope_state_delta(
+    delta: dict[str, Any], subscription: BridgeSubscription, base_view_revision: int | None
+) -> dict[str, Any] | None:
+    """Keep only the subscribed changes of a delta, rebased for one Bridge.
+
+    A Bridge is not sent deltas that carry nothing it subscribed to, so its
+    next delta starts from the last revision it actually received. ``None``
+    means there is nothing to send.
+    """
+    changes = [change for change in delta["changes"] if subscription.includes(change)]
+    if not changes:
+        return None
+    base = delta.get("base_view_revision")
+    if base is None:
+        base = delta["view_revision"] - 1
+    if base_view_revision is not None and base_view_revision < base:
+        base = base_view_revision
+    return {**delta, "base_view_revision": base, "changes": changes}
+
+
+def _change_key(change: dict[str, Any]) -> str:
+    kind = change["type"]
+    if kind in _REPLACEABLE_CHANGES:
+        return kind
+    if kind == "conversation.upsert":
+        return f"conversation:{change['conversation']['conversation_id']}"
+    if kind == "conversation.delete":
+        return f"conversation:{change['conversation_id']}"
+    if kind == "conversation.coverage.replace":
+        return f"conversation-coverage:{change['conversation_id']}"
+    message_id = (
+        change["message_id"] if kind == "message.tail.delete" else change["message"]["message_id"]
+    )
+    return f"message-tail:{change['conversation_id']}:{message_id}"
+
+
+def _merge_changes(
+    merged: dict[str, dict[str, Any]], changes: list[dict[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    merged = dict(merged)
+    for change in changes:
+        if change["type"] == "conversation.delete":
+            # Coverage of a deleted conversation has nothing left to apply to.
+            merged.pop(f"conversation-coverage:{change['conversation_id']}", None)
+        # Reassignment keeps the key's first position, so an upsert still
+        # precedes coverage for the conversation it introduced.
+        merged[_change_key(change)] = change
+    return merged
+
+
+def coalesce_state_deltas(deltas: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Merge consecutive deltas into batched frames with a revision range.
+
+    A batch only absorbs the next delta when that delta continues the batch's
+    revision without a gap and the merged change set stays within the
+    protocol's per-frame limit; otherwise a new frame starts.
+    """
+    frames: list[dict[str, Any]] = []
+    batch: dict[str, Any] | None = None
+    changes: dict[str, dict[str, Any]] = {}
+    for delta in deltas:
+        base = delta.get("base_view_revision")
+        if base is None:
+            base = delta["view_revision"] - 1
+        if batch is not None and base == batch["view_revision"]:
+            merged = _merge_changes(changes, delta["changes"])
+            if len(merged) <= STATE_DELTA_MAX_CHANGES:
+                batch["view_revision"] = delta["view_revision"]
+                batch["committed_at"] = delta["committed_at"]
+                changes = merged
+                continue
+        if batch is not None:
+            frames.append({**batch, "changes": list(changes.values())})
+        batch = {
+            "creator_account_id": delta["creator_account_id"],
+            "base_view_revision": base,
+            "view_revision": delta["view_revision"],
+            "committed_at": delta["committed_at"],
+        }
+        changes = _merge_changes({}, delta["changes"])
+    if batch is not None:
+        frames.append({**batch, "changes": list(changes.values())})
+    return frames
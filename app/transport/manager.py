@@ -9,19 +9,31 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import contextlib
+import functools
 import hashlib
 import hmac
 import json
 import secrets
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Literal
 from uuid import UUID, uuid4
 
 from fastapi import WebSocket
+from pydantic import TypeAdapter
 
 from app.core.config import settings
-from app.protocol import BRAIN_TO_AGENT_ADAPTER, BRAIN_TO_BRIDGE_ADAPTER
+from app.core.deadlines import DeadlineScheduler
+from app.protocol import (
+    BRAIN_TO_AGENT_ADAPTER,
+    BRAIN_TO_BRIDGE_ADAPTER,
+    BRIDGE_JSON_ENCODING,
+    BridgeFrameBody,
+    BridgeFrameEncoding,
+)
+from app.protocol.common import MAX_SNAPSHOT_PART_CONVERSATIONS, ConversationSummary
 from app.services.agent_configuration import (
     BOOTSTRAP_CONFIG_REVISION,
     AgentConfigurationAuthority,
@@ -31,8 +43,34 @@ from app.services.command_execution import (
     CommandRecord,
     CommandService,
 )
-from app.persistence.factory import CanonicalRepositories, create_canonical_repositories
-from app.persistence.history import IngestResult, InvariantViolation, StreamKey
+from app.persistence.database import ProjectionsSQLite
+from app.persistence.factory import (
+    CanonicalRepositories,
+    ShardedCanonicalRepositories,
+    create_canonical_repositories,
+    create_sharded_canonical_repositories,
+)
+from app.persistence.history import (
+    HistoryRepository,
+    IngestResult,
+    InvariantViolation,
+    ProjectionCursorStale,
+    ProjectionRepository,
+    ProjectionSnapshotStream,
+    StreamKey,
+)
+from app.persistence.maintenance import SQLiteMaintenance
+from app.persistence.migrations import canonical_writer_lock
+from app.persistence.projection_worker import (
+    ProjectionWorkerProcess,
+    ProjectionWorkerUnavailable,
+)
+from app.transport.deltas import (
+    STATE_DELTA_MAX_CHANGES,
+    BridgeSubscription,
+    coalesce_state_deltas,
+    scope_state_delta,
+)
 from app.utils.logger import logger
 
 
@@ -46,6 +84,30 @@ LEASE_TIMEOUT_SECONDS = settings.agent_lease_timeout_seconds
 LEASE_EXPIRED_CLOSE_CODE = 4001
 PRESENCE_TTL_SECONDS = 120
 STATE_DELTA_FLUSH_SECONDS = 0.1
+BRIDGE_OUTBOX_LIMIT = 256
+MESSAGE_COUNTER_AUDIT_SECONDS = 6 * 60 * 60
+INGEST_RETENTION_SECONDS = 60 * 60
+SQLITE_MAINTENANCE_SECONDS = 60
+# Queued in place of a dropped backlog; the sender answers it with fresh state.
+_BRIDGE_RESYNC = object()
+_REVISIONED_BRIDGE_FRAMES = frozenset({"state.snapshot", "state.delta"})
+_CONVERSATIONS_ADAPTER = TypeAdapter(list[ConversationSummary])
+_EMPTY_CONVERSATIONS = '"conversations":[]'
+
+
+@dataclass(slots=True)
+class _StreamedSnapshot:
+    """A full snapshot the Bridge sender streams as ``state.snapshot.part`` frames."""
+
+    stream: ProjectionSnapshotStream
+    correlation_id: str | None
+
+
+async def _send_bridge_frame(websocket: WebSocket, frame: str | bytes) -> None:
+    if isinstance(frame, bytes):
+        await websocket.send_bytes(frame)
+    else:
+        await websocket.send_text(frame)
 
 
 def utc_now() -> datetime:
@@ -75,6 +137,18 @@ class BridgeBinding:
     creator_account_id: str
     connection_id: UUID
     bridge_session_id: UUID
+    outbox: asyncio.Queue[Any] | None = None
+    sender: asyncio.Task[None] | None = None
+    resync_pending: bool = False
+    resync_correlation_id: str | None = None
+    overflow_count: int = 0
+    # Revision of the last state.snapshot/state.delta queued to this Bridge.
+    view_revision: int | None = None
+    encoding: BridgeFrameEncoding = BRIDGE_JSON_ENCODING
+    # None until the Bridge sends state.subscribe; it then receives only this scope.
+    subscription: BridgeSubscription | None = None
+    # Offered "state.snapshot.parts": full snapshots arrive as part frames.
+    snapshot_parts: bool = False
 
 
 @dataclass(slots=True)
@@ -86,6 +160,9 @@ class PresenceRecord:
     expires_at: datetime
     online_platform_user_ids: list[str]
     freshness: Literal["current", "unknown"] = "current"
+    # Presence version last broadcast, and the expiry Bridges were told.
+    version: int = 0
+    announced_expires_at: datetime | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -113,7 +190,15 @@ class AuthorizationError(ValueError):
 class InMemoryTransportManager:
     """Account-partitioned sessions, leases, presence, and ingestion cursors."""
 
-    def __init__(self, repositories: CanonicalRepositories | None = None) -> None:
+    def __init__(
+        self,
+        repositories: CanonicalRepositories | None = None,
+        *,
+        projection_worker: ProjectionWorkerProcess | None = None,
+        shards: ShardedCanonicalRepositories | None = None,
+    ) -> None:
+        if shards is not None and projection_worker is not None:
+            raise ValueError("A projection worker process serves one unsharded file pair")
         repositories = repositories or create_canonical_repositories("memory")
         # Retain the repository aggregate so its disposable TemporaryDirectory
         # remains alive for the full manager lifetime in isolated tests.
@@ -134,12 +219,71 @@ class InMemoryTransportManager:
         self.projection_database = repositories.projection_database
         self._agent_command_lock = asyncio.Lock()
         self._sweeper_task: asyncio.Task[None] | None = None
+        self._counter_audit_task: asyncio.Task[None] | None = None
+        self._retention_task: asyncio.Task[None] | None = None
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self.maintenance = SQLiteMaintenance(
+            [self.canonical_database, self.projection_database]
+        )
+        self._writer_lock: contextlib.ExitStack | None = None
+        # With shards, ``repositories`` keeps installation configuration and
+        # commands while each account's history and projections live in its
+        # shard; see ``repositories_for``.
+        self.shards = shards
+        self._open_shards: list[CanonicalRepositories] = []
+        self._shard_lock = threading.Lock()
         self._state_delta_queues: dict[str, list[dict[str, Any]]] = {}
         self._state_delta_tasks: dict[str, asyncio.Task[None]] = {}
         self._projection_tasks: dict[
-            str, asyncio.Task[dict[str, Any] | None]
+            str, asyncio.Task[int | None]
         ] = {}
         self._projection_pending_accounts: set[str] = set()
+        # Optional child process that advances projections; ``None`` uses a thread.
+        self.projection_worker = projection_worker
+        # Serialized conversation list of each account's latest full snapshot,
+        # keyed by (generation_id, view_revision, projection_slot).
+        self._snapshot_bodies: dict[str, tuple[tuple[str, int, int], BridgeFrameBody]] = {}
+        # Next lease-status and presence-expiry deadline per account.
+        self._deadlines: DeadlineScheduler[
+            tuple[Literal["lease", "presence"], str]
+        ] = DeadlineScheduler()
+        if shards is not None:
+            shards.add_open_listener(self._shard_opened)
+
+    def repositories_for(self, account_id: str) -> CanonicalRepositories:
+        """Return the stores holding one account's history and projections."""
+        if self.shards is None:
+            return self._repositories
+        return self.shards.for_account(account_id)
+
+    def history_for(self, account_id: str) -> HistoryRepository:
+        return self.repositories_for(account_id).history
+
+    def projection_for(self, account_id: str) -> ProjectionRepository:
+        return self.repositories_for(account_id).projection
+
+    def account_repositories(self) -> list[CanonicalRepositories]:
+        """Return every store set holding accounts, opening each shard on disk."""
+        if self.shards is None:
+            return [self._repositories]
+        return [self.shards.shard(name) for name in self.shards.migrate()]
+
+    def _shard_opened(self, name: str, repositories: CanonicalRepositories) -> None:
+        """Maintain a newly opened shard's files and hold its writer lock."""
+        self.maintenance.register(repositories.database)
+        self.maintenance.register(repositories.projection_database)
+        if repositories.analytics_projection_path is not None:
+            # Opened lazily by the shard's analytics runtime, like the
+            # unsharded file registered in ``start``.
+            self.maintenance.register(
+                ProjectionsSQLite(repositories.analytics_projection_path)
+            )
+        with self._shard_lock:
+            self._open_shards.append(repositories)
+            if self._writer_lock is not None:
+                self._writer_lock.enter_context(
+                    canonical_writer_lock(repositories.database)
+                )
 
     def _development_stub_allowed(self) -> bool:
         auth_mode = settings.websocket_auth_mode
@@ -495,49 +639,161 @@ class InMemoryTransportManager:
 
     async def start(self) -> None:
         self.validate_auth_configuration()
+        if self._writer_lock is None:
+            writer_lock = contextlib.ExitStack()
+            writer_lock.enter_context(canonical_writer_lock(self.canonical_database))
+            with self._shard_lock:
+                for repositories in self._open_shards:
+                    writer_lock.enter_context(canonical_writer_lock(repositories.database))
+                self._writer_lock = writer_lock
         if self._sweeper_task is None or self._sweeper_task.done():
             self._sweeper_task = asyncio.create_task(self._sweep(), name="phase2-transport-expiry")
-        pending_accounts = await asyncio.to_thread(self.projection.pending_accounts)
-        for account_id in pending_accounts:
-            self.schedule_projection(account_id)
+        if self._counter_audit_task is None or self._counter_audit_task.done():
+            self._counter_audit_task = asyncio.create_task(
+                self._audit_message_counters(), name="message-counter-audit"
+            )
+        if self._retention_task is None or self._retention_task.done():
+            self._retention_task = asyncio.create_task(
+                self._retain_ingest_history(), name="ingest-retention"
+            )
+        if settings.canonical_persistence_backend == "sqlite":
+            # The analytics runtime opens its file lazily; maintenance skips it
+            # until it exists.
+            self.maintenance.register(
+                ProjectionsSQLite(settings.analytics_projection_database_path)
+            )
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.create_task(
+                self._maintain_databases(), name="sqlite-maintenance"
+            )
+        # Finish snapshot merges a previous process left mid-flight before
+        # projection picks up the work they enqueue.
+        account_repositories = await asyncio.to_thread(self.account_repositories)
+        for repositories in account_repositories:
+            await asyncio.to_thread(repositories.history.recover_snapshot_merges)
+        if self.projection_worker is not None:
+            await self.projection_worker.start()
+        for repositories in account_repositories:
+            pending_accounts = await asyncio.to_thread(
+                repositories.projection.pending_accounts
+            )
+            for account_id in pending_accounts:
+                self.schedule_projection(account_id)
 
     async def stop(self) -> None:
-        task = self._sweeper_task
+        for task in (
+            self._sweeper_task,
+            self._counter_audit_task,
+            self._retention_task,
+            self._maintenance_task,
+        ):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         self._sweeper_task = None
-        if task is not None:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        self._counter_audit_task = None
+        self._retention_task = None
+        self._maintenance_task = None
         projection_tasks = list(self._projection_tasks.values())
         if projection_tasks:
             await asyncio.gather(*projection_tasks, return_exceptions=True)
+        if self.projection_worker is not None:
+            await self.projection_worker.stop()
+        writer_lock = self._writer_lock
+        self._writer_lock = None
+        if writer_lock is not None:
+            writer_lock.close()
 
     async def _sweep(self) -> None:
         while True:
             await asyncio.sleep(1)
             await self.expire(utc_now())
 
+    async def _audit_message_counters(self) -> None:
+        """Periodically reconcile maintained message counters with real counts."""
+        while True:
+            await asyncio.sleep(MESSAGE_COUNTER_AUDIT_SECONDS)
+            try:
+                for repositories in await asyncio.to_thread(self.account_repositories):
+                    history = repositories.history
+                    for account_id in await asyncio.to_thread(history.account_ids):
+                        repaired = await asyncio.to_thread(
+                            history.reconcile_message_counters, account_id
+                        )
+                        if repaired:
+                            logger.warning(
+                                "[HISTORY] Repaired %s drifted message counter rows",
+                                repaired,
+                            )
+            except Exception:
+                logger.exception("[HISTORY] Message counter audit failed")
+
+    async def _retain_ingest_history(self) -> None:
+        """Periodically fold expired raw events and purge expired snapshot staging.
+
+        Every batch is its own short write, so live ingest interleaves with
+        retention instead of waiting behind it; the freed pages are returned
+        by the maintenance pass.
+        """
+        horizon = timedelta(days=settings.ingest_retention_days)
+        while True:
+            await asyncio.sleep(INGEST_RETENTION_SECONDS)
+            try:
+                for repositories in await asyncio.to_thread(self.account_repositories):
+                    history = repositories.history
+                    while (
+                        await asyncio.to_thread(history.compact_ingest_history, horizon=horizon)
+                    ).total:
+                        pass
+            except Exception:
+                logger.exception("[HISTORY] Ingest retention failed")
+
+    async def _maintain_databases(self) -> None:
+        """Checkpoint, optimize and vacuum every local database on a fixed cadence."""
+        while True:
+            await asyncio.sleep(SQLITE_MAINTENANCE_SECONDS)
+            try:
+                for report in await asyncio.to_thread(self.maintenance.run):
+                    if report.auto_vacuum_converted:
+                        logger.info(
+                            "[SQLITE] Rebuilt %s in incremental auto-vacuum mode",
+                            report.store_name,
+                        )
+                    if report.stalled_seconds is not None:
+                        logger.warning(
+                            "[SQLITE] %s WAL checkpoint stalled for %.0fs at %s of %s "
+                            "frames; oldest local connection %s",
+                            report.store_name,
+                            report.stalled_seconds,
+                            report.checkpointed_frames,
+                            report.log_frames,
+                            "none"
+                            if report.oldest_reader_seconds is None
+                            else f"{report.oldest_reader_seconds:.0f}s old",
+                        )
+            except Exception:
+                logger.exception("[SQLITE] Database maintenance failed")
+
     def reset(self) -> None:
         """Clear replaceable state between isolated application/test runs."""
         self.active_agents.clear()
         self.agent_connections.clear()
+        for binding in self.bridges.values():
+            self._cancel_task(binding.sender)
         self.bridges.clear()
         self.presence.clear()
         self._agent_pairing_grants.clear()
         self._agent_config_grants.clear()
-        self.projection.reset()
-        self.history.reset()
+        for repositories in self.account_repositories():
+            repositories.projection.reset()
+            repositories.history.reset()
         self.commands.reset()
         self.config_authority.reset()
         for task in self._state_delta_tasks.values():
-            if not task.done():
-                if task.get_loop().is_closed():
-                    task._log_destroy_pending = False
-                    task.get_coro().close()
-                else:
-                    task.cancel()
+            self._cancel_task(task)
         self._state_delta_tasks.clear()
         self._state_delta_queues.clear()
         for task in self._projection_tasks.values():
@@ -545,6 +801,18 @@ class InMemoryTransportManager:
                 task.cancel()
         self._projection_tasks.clear()
         self._projection_pending_accounts.clear()
+        self._snapshot_bodies.clear()
+        self._deadlines.clear()
+
+    @staticmethod
+    def _cancel_task(task: asyncio.Task[Any] | None) -> None:
+        if task is None or task.done():
+            return
+        if task.get_loop().is_closed():
+            task._log_destroy_pending = False
+            task.get_coro().close()
+        else:
+            task.cancel()
 
     async def bind_agent(
         self,
@@ -563,9 +831,10 @@ class InMemoryTransportManager:
             agent_installation_id,
             applied_config_revision,
         )
-        history_settings = self.history.history_settings(creator_account_id)
+        history = self.history_for(creator_account_id)
+        history_settings = history.history_settings(creator_account_id)
         if history_settings["required_config_revision"] is None:
-            self.history.bind_history_config(
+            history.bind_history_config(
                 creator_account_id,
                 settings_revision=int(history_settings["settings_revision"]),
                 config_revision=config_record.required_config_revision,
@@ -574,7 +843,7 @@ class InMemoryTransportManager:
             config_record.applied_config_revision
             == config_record.required_config_revision
         ):
-            self.history.mark_history_config_applied(
+            history.mark_history_config_applied(
                 creator_account_id, config_record.required_config_revision
             )
         lease = AgentLease(
@@ -595,6 +864,7 @@ class InMemoryTransportManager:
                 previous.status = "disconnected"
             self.active_agents[creator_account_id] = lease
             self.agent_connections[lease.connection_id] = lease
+            self._schedule_lease(lease, lease.last_heartbeat_at)
         await self.broadcast_agent_state(creator_account_id)
         return lease
 
@@ -605,6 +875,8 @@ class InMemoryTransportManager:
         principal_id: str,
         creator_account_id: str,
         bridge_session_id: UUID,
+        encoding: BridgeFrameEncoding = BRIDGE_JSON_ENCODING,
+        snapshot_parts: bool = False,
     ) -> BridgeBinding:
         binding = BridgeBinding(
             websocket=websocket,
@@ -612,6 +884,13 @@ class InMemoryTransportManager:
             creator_account_id=creator_account_id,
             connection_id=uuid4(),
             bridge_session_id=bridge_session_id,
+            outbox=asyncio.Queue(),
+            encoding=encoding,
+            snapshot_parts=snapshot_parts,
+        )
+        binding.sender = asyncio.create_task(
+            self._run_bridge_sender(binding),
+            name=f"bridge-sender-{binding.connection_id}",
         )
         self.bridges[binding.connection_id] = binding
         return binding
@@ -633,6 +912,7 @@ class InMemoryTransportManager:
         binding = self.bridges.pop(connection_id, None)
         if binding is None:
             return
+        self._cancel_task(binding.sender)
         has_account_bridge = any(
             candidate.creator_account_id == binding.creator_account_id
             for candidate in self.bridges.values()
@@ -661,44 +941,163 @@ class InMemoryTransportManager:
         )
 
     def checkpoint_for(self, lease: AgentLease) -> int | None:
-        return self.history.checkpoint(self.stream_key(lease))
+        return self.history_for(lease.creator_account_id).checkpoint(self.stream_key(lease))
 
     def pending_snapshot_for(self, lease: AgentLease) -> tuple[UUID, int] | None:
-        return self.history.pending_snapshot(self.stream_key(lease))
+        return self.history_for(lease.creator_account_id).pending_snapshot(
+            self.stream_key(lease)
+        )
 
     def ingest_snapshot(self, lease: AgentLease, payload: Any) -> IngestResult:
         key = self.stream_key(lease)
+        history = self.history_for(key.creator_account_id)
         if payload.frame_kind == "begin":
-            return self.history.begin_snapshot(key, payload)
+            return history.begin_snapshot(key, payload)
         if payload.frame_kind == "chunk":
-            return self.history.add_snapshot_chunk(key, payload)
+            return history.add_snapshot_chunk(key, payload)
         if payload.frame_kind == "commit":
-            return self.history.commit_snapshot(key, payload)
+            return history.commit_snapshot(key, payload)
         raise InvariantViolation(f"unsupported snapshot frame {payload.frame_kind!r}")
 
     def ingest_delta(self, lease: AgentLease, payload: Any) -> IngestResult:
-        return self.history.commit_delta(self.stream_key(lease), payload)
+        return self.history_for(lease.creator_account_id).commit_delta(
+            self.stream_key(lease), payload
+        )
 
-    async def _run_projection_worker(self, account_id: str) -> dict[str, Any] | None:
-        latest: dict[str, Any] | None = None
+    async def _run_projection_worker(self, account_id: str) -> int | None:
+        latest: int | None = None
         while True:
             self._projection_pending_accounts.discard(account_id)
-            snapshot = await asyncio.to_thread(self.projection.catch_up, account_id)
-            if snapshot is None:
+            view_revision = await self._advance_projection(account_id)
+            if view_revision is None:
+                if account_id not in self._projection_pending_accounts:
+                    await self._compact_projection(account_id)
                 if account_id in self._projection_pending_accounts:
                     continue
                 return latest
-            latest = snapshot
-            await self._broadcast_bridge(account_id, "state.snapshot", snapshot)
+            latest = view_revision
+            await self._publish_projection(account_id, view_revision)
             # The newly activated generation makes readiness recover; system.state
             # is otherwise a bind-only one-shot, so without this the Bridge keeps
             # rendering the freshly delivered data under a stale "unavailable" /
             # "degraded" readiness that never corrects itself.
             await self.broadcast_system_state(account_id)
 
+    async def _advance_projection(self, account_id: str) -> int | None:
+        worker = self.projection_worker
+        if worker is not None:
+            try:
+                return await worker.advance(account_id)
+            except ProjectionWorkerUnavailable:
+                # The durable work is still pending; finish it in-process.
+                logger.exception("[PROJECTION] Worker unavailable; projecting in a thread")
+                if self.projection_worker is worker:
+                    self.projection_worker = None
+        return await asyncio.to_thread(self.projection_for(account_id).advance, account_id)
+
+    async def _compact_projection(self, account_id: str) -> None:
+        """Fold the lagging slot forward in short slices while no work is queued."""
+        try:
+            projection = self.projection_for(account_id)
+            while account_id not in self._projection_pending_accounts:
+                if not await asyncio.to_thread(projection.compact_overlays, account_id):
+                    return
+        except Exception:
+            logger.exception("[PROJECTION] Slot overlay compaction failed")
+
+    async def _publish_projection(self, account_id: str, view_revision: int) -> None:
+        """Bring every account Bridge to the active generation's revision.
+
+        Bridges are grouped by the revision they last received and their
+        subscription; each group gets one ``state.delta`` built from the
+        projection change log, or a ``state.snapshot`` when the range has no
+        delta form. A group whose subscription saw no change is sent nothing.
+        """
+        groups: dict[tuple[int | None, BridgeSubscription | None], list[BridgeBinding]] = {}
+        for binding in self.bridges.values():
+            if (
+                binding.creator_account_id == account_id
+                and not binding.resync_pending
+                # A Bridge bound after activation already holds this revision.
+                and (binding.view_revision is None or binding.view_revision < view_revision)
+            ):
+                key = (binding.view_revision, binding.subscription)
+                groups.setdefault(key, []).append(binding)
+        snapshots: dict[frozenset[str] | None, tuple[str, int, dict[str, str | bytes]]] = {}
+        full_snapshot: tuple[str, BridgeFrameBody, str, int] | None = None
+        for (after, subscription), bindings in groups.items():
+            conversation_ids = None if subscription is None else subscription.conversation_ids
+            delta = None
+            if after is not None:
+                delta = await asyncio.to_thread(
+                    functools.partial(
+                        self.projection_for(account_id).state_delta,
+                        account_id,
+                        after,
+                        max_changes=STATE_DELTA_MAX_CHANGES,
+                        conversation_ids=conversation_ids,
+                    )
+                )
+            if delta is not None:
+                if subscription is not None:
+                    delta = scope_state_delta(delta, subscription, after)
+                    if delta is None:
+                        continue
+                message_type = "state.delta"
+                text = self._encode(
+                    BRAIN_TO_BRIDGE_ADAPTER, message_type, delta, correlation_id=None
+                )
+                revision = int(delta["view_revision"])
+                frames: dict[str, str | bytes] = {}
+            else:
+                message_type = "state.snapshot"
+                if conversation_ids is None:
+                    streaming = [binding for binding in bindings if binding.snapshot_parts]
+                    for binding in streaming:
+                        stream = await asyncio.to_thread(
+                            self.projection_for(account_id).snapshot_stream,
+                            account_id,
+                            part_size=MAX_SNAPSHOT_PART_CONVERSATIONS,
+                        )
+                        binding.view_revision = stream.view_revision
+                        self._enqueue_bridge(
+                            binding,
+                            _StreamedSnapshot(stream, None),
+                            message_type=message_type,
+                        )
+                    bindings = [binding for binding in bindings if not binding.snapshot_parts]
+                    if not bindings:
+                        continue
+                    if full_snapshot is None:
+                        full_snapshot = await asyncio.to_thread(
+                            self._full_snapshot_parts, account_id, None
+                        )
+                    head, body, tail, revision = full_snapshot
+                    text = head + body.text + tail
+                    frames = {
+                        binding.encoding.name: binding.encoding.encode_spliced(head, body, tail)
+                        for binding in bindings
+                    }
+                elif conversation_ids not in snapshots:
+                    payload = await asyncio.to_thread(
+                        self.state_snapshot_payload, account_id, conversation_ids
+                    )
+                    snapshots[conversation_ids] = (
+                        self._encode(
+                            BRAIN_TO_BRIDGE_ADAPTER, message_type, payload, correlation_id=None
+                        ),
+                        int(payload["view_revision"]),
+                        {},
+                    )
+                if conversation_ids is not None:
+                    text, revision, frames = snapshots[conversation_ids]
+            for binding in bindings:
+                binding.view_revision = revision
+            self._enqueue_encoded(bindings, text, frames, message_type=message_type)
+
     def schedule_projection(
         self, account_id: str
-    ) -> asyncio.Task[dict[str, Any] | None]:
+    ) -> asyncio.Task[int | None]:
         """Serialize one account's durable projection work outside the event loop."""
         self._projection_pending_accounts.add(account_id)
         existing = self._projection_tasks.get(account_id)
@@ -710,7 +1109,7 @@ class InMemoryTransportManager:
         )
         self._projection_tasks[account_id] = task
 
-        def completed(done: asyncio.Task[dict[str, Any] | None]) -> None:
+        def completed(done: asyncio.Task[int | None]) -> None:
             if self._projection_tasks.get(account_id) is done:
                 self._projection_tasks.pop(account_id, None)
                 self._projection_pending_accounts.discard(account_id)
@@ -724,7 +1123,7 @@ class InMemoryTransportManager:
         task.add_done_callback(completed)
         return task
 
-    async def project_committed_state(self, account_id: str) -> dict[str, Any] | None:
+    async def project_committed_state(self, account_id: str) -> int | None:
         """Compatibility awaitable for callers that explicitly need activation completion."""
         return await asyncio.shield(self.schedule_projection(account_id))
 
@@ -824,6 +1223,7 @@ class InMemoryTransportManager:
         now: datetime | None = None,
     ) -> None:
         lease.last_heartbeat_at = now or utc_now()
+        self._schedule_lease(lease, lease.last_heartbeat_at)
         previous_record = self.config_authority.installation(
             lease.creator_account_id, lease.agent_installation_id
         )
@@ -840,7 +1240,7 @@ class InMemoryTransportManager:
         lease.applied_config_revision = record.applied_config_revision
         lease.status = "connected"
         if record.applied_config_revision is not None:
-            self.history.mark_history_config_applied(
+            self.history_for(lease.creator_account_id).mark_history_config_applied(
                 lease.creator_account_id, record.applied_config_revision
             )
         if changed:
@@ -874,14 +1274,54 @@ class InMemoryTransportManager:
             expires_at=received_at + timedelta(seconds=PRESENCE_TTL_SECONDS),
             online_platform_user_ids=list(online_platform_user_ids),
         )
+        previous_ids: list[str] = []
+        if existing is not None:
+            record.version = existing.version
+            record.announced_expires_at = existing.announced_expires_at
+            if existing.freshness == "current":
+                previous_ids = existing.online_platform_user_ids
         self.presence[lease.creator_account_id] = record
-        await self.broadcast_presence_state(lease.creator_account_id)
+        self._deadlines.schedule(("presence", lease.creator_account_id), record.expires_at)
+        unchanged = (
+            existing is not None
+            and existing.freshness == "current"
+            and set(previous_ids) == set(record.online_platform_user_ids)
+        )
+        # An unchanged observation is only announced once the expiry Bridges
+        # hold comes within half a TTL, so they never expire current presence
+        # early while a steady Agent costs one frame per half TTL at most.
+        if unchanged and record.announced_expires_at is not None and (
+            record.announced_expires_at - received_at
+            > timedelta(seconds=PRESENCE_TTL_SECONDS / 2)
+        ):
+            return True
+        await self._broadcast_presence_delta(record, previous_ids)
         return True
 
+    def _schedule_lease(self, lease: AgentLease, now: datetime) -> None:
+        """Register the lease's next status deadline: stale, then hard expiry."""
+        if self.active_agents.get(lease.creator_account_id) is not lease:
+            return
+        timeout = timedelta(seconds=lease.lease_timeout_seconds)
+        stale_at = lease.last_heartbeat_at + timeout
+        self._deadlines.schedule(
+            ("lease", lease.creator_account_id),
+            stale_at if now < stale_at else stale_at + timeout,
+        )
+
     async def expire(self, now: datetime) -> None:
+        """Apply every lease, presence, and command deadline due at ``now``.
+
+        Only registered deadlines that have fallen due are inspected, so an
+        idle sweep costs nothing per connected Agent or pending command.
+        """
         self.commands.expire(now)
+        due = self._deadlines.pop_due(now)
         expired_leases: list[tuple[str, AgentLease]] = []
-        for account_id, lease in list(self.active_agents.items()):
+        for account_id in [account_id for kind, account_id in due if kind == "lease"]:
+            lease = self.active_agents.get(account_id)
+            if lease is None:
+                continue
             age = (now - lease.last_heartbeat_at).total_seconds()
             if age >= lease.lease_timeout_seconds * 2:
                 hard_expired = False
@@ -897,6 +1337,7 @@ class InMemoryTransportManager:
                         hard_expired = True
                 if hard_expired:
                     continue
+            self._schedule_lease(lease, now)
 
             # A transport-level disconnect is authoritative until the lease is
             # hard-retired. Only a fresh handshake can make that Agent live again.
@@ -923,15 +1364,17 @@ class InMemoryTransportManager:
                 pass
             await self.broadcast_agent_state(account_id)
 
-        for account_id, record in list(self.presence.items()):
-            if record.freshness == "current" and now >= record.expires_at:
+        for account_id in [account_id for kind, account_id in due if kind == "presence"]:
+            record = self.presence.get(account_id)
+            if record is not None and record.freshness == "current" and now >= record.expires_at:
+                previous_ids = record.online_platform_user_ids
                 record.freshness = "unknown"
                 record.online_platform_user_ids = []
-                await self.broadcast_presence_state(account_id)
+                await self._broadcast_presence_delta(record, previous_ids)
 
     def agent_state_payload(self, account_id: str) -> dict[str, Any]:
         lease = self.active_agents.get(account_id)
-        history_settings = self.history.history_settings(account_id)
+        history_settings = self.history_for(account_id).history_settings(account_id)
         if lease is None:
             return {
                 "creator_account_id": account_id,
@@ -990,6 +1433,7 @@ class InMemoryTransportManager:
         if record is None:
             return {
                 "creator_account_id": account_id,
+                "version": 0,
                 "freshness": "unknown",
                 "online_platform_user_ids": [],
                 "server_received_at": None,
@@ -998,6 +1442,7 @@ class InMemoryTransportManager:
             }
         return {
             "creator_account_id": account_id,
+            "version": record.version,
             "freshness": record.freshness,
             "online_platform_user_ids": list(record.online_platform_user_ids),
             "server_received_at": record.server_received_at.isoformat(),
@@ -1008,14 +1453,197 @@ class InMemoryTransportManager:
             },
         }
 
-    def state_snapshot_payload(self, account_id: str) -> dict[str, Any]:
-        return self.projection.snapshot(account_id)
+    def state_snapshot_payload(
+        self, account_id: str, conversation_ids: frozenset[str] | None = None
+    ) -> dict[str, Any]:
+        return self.projection_for(account_id).snapshot(
+            account_id, conversation_ids=conversation_ids
+        )
+
+    def bridge_snapshot_payload(self, binding: BridgeBinding) -> dict[str, Any]:
+        """Render the snapshot one Bridge is entitled to under its subscription."""
+        subscription = binding.subscription
+        return self.state_snapshot_payload(
+            binding.creator_account_id,
+            None if subscription is None else subscription.conversation_ids,
+        )
+
+    def _full_snapshot_parts(
+        self, account_id: str, correlation_id: UUID | str | None
+    ) -> tuple[str, BridgeFrameBody, str, int]:
+        """Split a full ``state.snapshot`` frame around its conversation list.
+
+        The conversation list is validated and serialized once per projection
+        version and shared by every frame until the next activation; only the
+        small remainder of the envelope is rendered per frame. A reconnect
+        burst of many Bridges therefore reads the summaries once.
+        """
+        cached = self._snapshot_bodies.get(account_id)
+        payload, version = self.projection_for(account_id).versioned_snapshot(
+            account_id, cached_version=None if cached is None else cached[0]
+        )
+        if cached is not None and version == cached[0]:
+            body = cached[1]
+        else:
+            conversations = _CONVERSATIONS_ADAPTER.validate_json(
+                json.dumps(payload["conversations"])
+            )
+            body = BridgeFrameBody(_CONVERSATIONS_ADAPTER.dump_json(conversations).decode())
+            # A slower concurrent render must not replace a newer version.
+            if version is not None and (cached is None or cached[0][1] <= version[1]):
+                self._snapshot_bodies[account_id] = (version, body)
+        text = self._encode(
+            BRAIN_TO_BRIDGE_ADAPTER,
+            "state.snapshot",
+            {**payload, "conversations": []},
+            correlation_id=correlation_id,
+        )
+        head, tail = text.split(_EMPTY_CONVERSATIONS, 1)
+        return head + '"conversations":', body, tail, int(payload["view_revision"])
+
+    def _snapshot_frame(
+        self, binding: BridgeBinding, correlation_id: UUID | str | None
+    ) -> tuple[str | bytes | _StreamedSnapshot, int]:
+        subscription = binding.subscription
+        if subscription is not None and subscription.conversation_ids is not None:
+            payload = self.bridge_snapshot_payload(binding)
+            text = self._encode(
+                BRAIN_TO_BRIDGE_ADAPTER,
+                "state.snapshot",
+                payload,
+                correlation_id=correlation_id,
+            )
+            return binding.encoding.encode(text), int(payload["view_revision"])
+        if binding.snapshot_parts:
+            stream = self.projection_for(binding.creator_account_id).snapshot_stream(
+                binding.creator_account_id, part_size=MAX_SNAPSHOT_PART_CONVERSATIONS
+            )
+            return (
+                _StreamedSnapshot(stream, None if correlation_id is None else str(correlation_id)),
+                stream.view_revision,
+            )
+        head, body, tail, revision = self._full_snapshot_parts(
+            binding.creator_account_id, correlation_id
+        )
+        return binding.encoding.encode_spliced(head, body, tail), revision
+
+    async def _send_streamed_snapshot(
+        self, binding: BridgeBinding, snapshot: _StreamedSnapshot
+    ) -> None:
+        """Send a full snapshot as part frames followed by its revision marker.
+
+        Parts are read one short transaction at a time, off the event loop,
+        and each is on the socket before the next is read. If the generation
+        is superseded mid-stream the snapshot restarts at part 0 under the
+        current one; the closing ``state.snapshot`` carries the aggregates and
+        the part count and is the frame that completes the revision.
+        """
+        stream = snapshot.stream
+        try:
+            while True:
+                part_count = 0
+                try:
+                    while (
+                        conversations := await asyncio.to_thread(next, stream.parts, None)
+                    ) is not None:
+                        await _send_bridge_frame(
+                            binding.websocket,
+                            binding.encoding.encode(
+                                self._encode(
+                                    BRAIN_TO_BRIDGE_ADAPTER,
+                                    "state.snapshot.part",
+                                    {
+                                        "creator_account_id": binding.creator_account_id,
+                                        "view_revision": stream.view_revision,
+                                        "part_index": part_count,
+                                        "conversations": conversations,
+                                    },
+                                    correlation_id=None,
+                                )
+                            ),
+                        )
+                        part_count += 1
+                except ProjectionCursorStale:
+                    stream.close()
+                    stream = await asyncio.to_thread(
+                        self.projection_for(binding.creator_account_id).snapshot_stream,
+                        binding.creator_account_id,
+                        part_size=MAX_SNAPSHOT_PART_CONVERSATIONS,
+                    )
+                    binding.view_revision = stream.view_revision
+                    continue
+                break
+            await _send_bridge_frame(
+                binding.websocket,
+                binding.encoding.encode(
+                    self._encode(
+                        BRAIN_TO_BRIDGE_ADAPTER,
+                        "state.snapshot",
+                        {**stream.payload, "part_count": part_count},
+                        correlation_id=snapshot.correlation_id,
+                    )
+                ),
+            )
+        finally:
+            stream.close()
+
+    async def _send_bridge_item(
+        self, binding: BridgeBinding, frame: str | bytes | _StreamedSnapshot
+    ) -> None:
+        if isinstance(frame, _StreamedSnapshot):
+            await self._send_streamed_snapshot(binding, frame)
+        else:
+            await _send_bridge_frame(binding.websocket, frame)
+
+    async def queue_bridge_snapshot(
+        self, binding: BridgeBinding, *, correlation_id: UUID | str | None = None
+    ) -> None:
+        """Deliver the snapshot a Bridge is entitled to, reusing cached summaries.
+
+        The frame is rendered off the event loop: a reconnect burst reads
+        SQLite once per Bridge and must not stall every other socket.
+        """
+        if correlation_id is not None and binding.resync_pending:
+            binding.resync_correlation_id = str(correlation_id)
+            return
+        frame, revision = await asyncio.to_thread(self._snapshot_frame, binding, correlation_id)
+        if correlation_id is not None and binding.resync_pending:
+            # An overflow while rendering queued a resync that answers instead.
+            if isinstance(frame, _StreamedSnapshot):
+                frame.stream.close()
+            binding.resync_correlation_id = str(correlation_id)
+            return
+        binding.view_revision = revision
+        self._enqueue_bridge(
+            binding,
+            frame,
+            message_type="state.snapshot",
+            correlation_id=None if correlation_id is None else str(correlation_id),
+        )
+
+    async def subscribe_bridge(
+        self, binding: BridgeBinding, payload: Any, *, correlation_id: UUID
+    ) -> None:
+        """Scope a Bridge's state stream and answer with a snapshot of that scope.
+
+        Later deltas carry only changes to the subscribed conversations and
+        aggregates, so a dashboard's traffic follows what it shows.
+        """
+        binding.subscription = BridgeSubscription(
+            conversation_ids=(
+                None if payload.conversation_ids is None else frozenset(payload.conversation_ids)
+            ),
+            aggregates=frozenset(payload.aggregates),
+        )
+        await self.queue_bridge_snapshot(binding, correlation_id=correlation_id)
 
     def system_state_payload(self, account_id: str) -> dict[str, Any]:
-        coverage = self.history.coverage(account_id)
-        projection = self.projection.state(account_id)
-        freshness = self.history.live_freshness(account_id)
-        history_settings = self.history.history_settings(account_id)
+        repositories = self.repositories_for(account_id)
+        history = repositories.history
+        coverage = history.coverage(account_id)
+        projection = repositories.projection.state(account_id)
+        freshness = history.live_freshness(account_id)
+        history_settings = history.history_settings(account_id)
         configuration_aligned = (
             history_settings["desired_state"] == history_settings["effective_state"]
             and history_settings["required_config_revision"] is not None
@@ -1025,7 +1653,7 @@ class InMemoryTransportManager:
             and int(history_settings["settings_revision"])
             == int(history_settings["effective_settings_revision"])
         )
-        if self.history.account_has_pending_snapshot(account_id):
+        if history.account_has_pending_snapshot(account_id):
             processing_mode = "processing_snapshot"
         elif projection["status"] == "pending":
             processing_mode = "resyncing"
@@ -1094,6 +1722,18 @@ class InMemoryTransportManager:
         *,
         correlation_id: UUID | str | None,
     ) -> dict[str, Any]:
+        text = self._encode(adapter, message_type, payload, correlation_id=correlation_id)
+        await websocket.send_text(text)
+        return json.loads(text)
+
+    @staticmethod
+    def _encode(
+        adapter: Any,
+        message_type: str,
+        payload: dict[str, Any],
+        *,
+        correlation_id: UUID | str | None,
+    ) -> str:
         document: dict[str, Any] = {
             "type": message_type,
             "protocol_version": "2",
@@ -1102,9 +1742,7 @@ class InMemoryTransportManager:
         }
         if correlation_id is not None:
             document["correlation_id"] = str(correlation_id)
-        model = adapter.validate_json(json.dumps(document))
-        await websocket.send_text(model.model_dump_json())
-        return json.loads(model.model_dump_json())
+        return adapter.validate_json(json.dumps(document)).model_dump_json()
 
     async def broadcast_agent_state(self, account_id: str) -> None:
         await self._broadcast_bridge(account_id, "agent.state", self.agent_state_payload(account_id))
@@ -1112,12 +1750,53 @@ class InMemoryTransportManager:
     async def broadcast_presence_state(self, account_id: str) -> None:
         await self._broadcast_bridge(account_id, "presence.state", self.presence_state_payload(account_id))
 
+    async def _broadcast_presence_delta(
+        self, record: PresenceRecord, previous_ids: list[str]
+    ) -> None:
+        """Announce one presence transition as the members that joined and left."""
+        base_version = record.version
+        record.version += 1
+        record.announced_expires_at = (
+            record.expires_at if record.freshness == "current" else None
+        )
+        previous = set(previous_ids)
+        current = set(record.online_platform_user_ids)
+        await self._broadcast_bridge(
+            record.creator_account_id,
+            "presence.delta",
+            {
+                "creator_account_id": record.creator_account_id,
+                "base_version": base_version,
+                "version": record.version,
+                "freshness": record.freshness,
+                "joined_platform_user_ids": [
+                    user_id
+                    for user_id in dict.fromkeys(record.online_platform_user_ids)
+                    if user_id not in previous
+                ],
+                "left_platform_user_ids": [
+                    user_id for user_id in previous_ids if user_id not in current
+                ],
+                "server_received_at": record.server_received_at.isoformat(),
+                "expires_at": record.expires_at.isoformat(),
+                "last_observation": {
+                    "observation_id": record.observation_id,
+                    "observed_at": record.observed_at.isoformat(),
+                },
+            },
+        )
+
     async def broadcast_system_state(self, account_id: str) -> None:
         """Re-emit the replaceable readiness signal after any input to it changes."""
         await self._broadcast_bridge(account_id, "system.state", self.system_state_payload(account_id))
 
     async def broadcast_state_delta(self, account_id: str, payload: dict[str, Any]) -> None:
-        """Queue ordered deltas without blocking independent presence delivery."""
+        """Queue ordered deltas without blocking independent presence delivery.
+
+        Deltas queued within one flush tick are coalesced into batched frames,
+        so a delta waits at most ``STATE_DELTA_FLUSH_SECONDS`` plus one flush
+        and the Bridge frame rate stays flat under ingest bursts.
+        """
         if not any(
             binding.creator_account_id == account_id for binding in self.bridges.values()
         ):
@@ -1133,9 +1812,10 @@ class InMemoryTransportManager:
     async def _flush_state_deltas(self, account_id: str) -> None:
         try:
             await asyncio.sleep(STATE_DELTA_FLUSH_SECONDS)
-            queue = self._state_delta_queues.setdefault(account_id, [])
-            while queue:
-                await self._broadcast_bridge(account_id, "state.delta", queue.pop(0))
+            # Take the whole tick at once; later deltas start the next tick.
+            queued = self._state_delta_queues.pop(account_id, [])
+            for payload in coalesce_state_deltas(queued):
+                await self._broadcast_bridge(account_id, "state.delta", payload)
         finally:
             self._state_delta_tasks.pop(account_id, None)
             if self._state_delta_queues.get(account_id):
@@ -1150,16 +1830,250 @@ class InMemoryTransportManager:
         message_type: str,
         payload: dict[str, Any],
     ) -> None:
-        stale: list[UUID] = []
-        for connection_id, binding in list(self.bridges.items()):
-            if binding.creator_account_id != account_id:
+        """Validate and serialize once, then enqueue to every account Bridge.
+
+        Delivery happens on each binding's sender task, so a slow dashboard
+        never delays other dashboards or the Agent path that triggered it.
+        A ``state.delta`` reaches subscribed Bridges only as its subscribed
+        part, serialized once per distinct scope.
+        """
+        recipients = [
+            binding
+            for binding in self.bridges.values()
+            if binding.creator_account_id == account_id
+        ]
+        if message_type == "state.delta":
+            scoped = [binding for binding in recipients if binding.subscription is not None]
+            recipients = [binding for binding in recipients if binding.subscription is None]
+            if scoped:
+                self._enqueue_scoped_delta(scoped, payload)
+        if not recipients:
+            return
+        text = self._encode(
+            BRAIN_TO_BRIDGE_ADAPTER, message_type, payload, correlation_id=None
+        )
+        if message_type in _REVISIONED_BRIDGE_FRAMES:
+            for binding in recipients:
+                binding.view_revision = payload["view_revision"]
+        self._enqueue_encoded(recipients, text, {}, message_type=message_type)
+
+    def _enqueue_scoped_delta(
+        self, bindings: list[BridgeBinding], payload: dict[str, Any]
+    ) -> None:
+        scopes: dict[tuple[BridgeSubscription, int | None], list[BridgeBinding]] = {}
+        for binding in bindings:
+            assert binding.subscription is not None
+            scopes.setdefault((binding.subscription, binding.view_revision), []).append(binding)
+        for (subscription, base), members in scopes.items():
+            delta = scope_state_delta(payload, subscription, base)
+            if delta is None:
                 continue
+            for binding in members:
+                binding.view_revision = delta["view_revision"]
+            text = self._encode(
+                BRAIN_TO_BRIDGE_ADAPTER, "state.delta", delta, correlation_id=None
+            )
+            self._enqueue_encoded(members, text, {}, message_type="state.delta")
+
+    def _enqueue_encoded(
+        self,
+        bindings: list[BridgeBinding],
+        text: str,
+        frames: dict[str, str | bytes],
+        *,
+        message_type: str,
+    ) -> None:
+        """Enqueue one serialized frame, encoding it once per negotiated encoding.
+
+        ``frames`` caches the encoded forms by encoding name, so callers that
+        deliver the same document to several groups compress it only once.
+        """
+        for binding in bindings:
+            encoding = binding.encoding
+            frame = frames.get(encoding.name)
+            if frame is None:
+                frame = frames[encoding.name] = encoding.encode(text)
+            self._enqueue_bridge(binding, frame, message_type=message_type)
+
+    async def queue_bridge(
+        self,
+        binding: BridgeBinding,
+        message_type: str,
+        payload: dict[str, Any],
+        *,
+        correlation_id: UUID | str | None = None,
+    ) -> None:
+        """Deliver one frame to a bound Bridge in order with its broadcasts.
+
+        Correlated replies are never dropped by overflow handling. A correlated
+        ``state.snapshot`` requested while a resync is pending is answered by
+        that resync's fresher snapshot instead of a second full document.
+        """
+        if correlation_id is not None and message_type == "state.snapshot":
+            if binding.resync_pending:
+                binding.resync_correlation_id = str(correlation_id)
+                return
+        if message_type in _REVISIONED_BRIDGE_FRAMES:
+            binding.view_revision = payload["view_revision"]
+        self._enqueue_bridge(
+            binding,
+            binding.encoding.encode(
+                self._encode(
+                    BRAIN_TO_BRIDGE_ADAPTER,
+                    message_type,
+                    payload,
+                    correlation_id=correlation_id,
+                )
+            ),
+            message_type=message_type,
+            correlation_id=None if correlation_id is None else str(correlation_id),
+        )
+
+    def _enqueue_bridge(
+        self,
+        binding: BridgeBinding,
+        frame: str | bytes | _StreamedSnapshot,
+        *,
+        message_type: str | None = None,
+        correlation_id: str | None = None,
+    ) -> None:
+        outbox = binding.outbox
+        if outbox is None:
+            if isinstance(frame, _StreamedSnapshot):
+                frame.stream.close()
+            return
+        loop = None if binding.sender is None else binding.sender.get_loop()
+        if loop is not None and not loop.is_closed():
             try:
-                await self.send_bridge(binding.websocket, message_type, payload)
-            except Exception:
-                stale.append(connection_id)
-        for connection_id in stale:
-            self.bridges.pop(connection_id, None)
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not loop:
+                # asyncio queues are loop-bound; hop to the binding's own loop.
+                loop.call_soon_threadsafe(
+                    functools.partial(
+                        self._enqueue_bridge,
+                        binding,
+                        frame,
+                        message_type=message_type,
+                        correlation_id=correlation_id,
+                    )
+                )
+                return
+        if correlation_id is not None:
+            outbox.put_nowait((frame, message_type, correlation_id))
+            return
+        if binding.resync_pending:
+            # The pending resync renders state after this frame's change.
+            if isinstance(frame, _StreamedSnapshot):
+                frame.stream.close()
+            return
+        if outbox.qsize() < BRIDGE_OUTBOX_LIMIT:
+            outbox.put_nowait((frame, message_type, None))
+            return
+        if isinstance(frame, _StreamedSnapshot):
+            frame.stream.close()
+        retained: list[tuple[str | bytes | _StreamedSnapshot, str | None, str]] = []
+        while not outbox.empty():
+            item = outbox.get_nowait()
+            outbox.task_done()
+            if item is not _BRIDGE_RESYNC and isinstance(item[0], _StreamedSnapshot):
+                if item[2] is not None:
+                    binding.resync_correlation_id = item[2]
+                item[0].stream.close()
+                continue
+            if item is _BRIDGE_RESYNC or item[2] is None:
+                continue
+            if item[1] == "state.snapshot":
+                binding.resync_correlation_id = item[2]
+            else:
+                retained.append(item)
+        for item in retained:
+            outbox.put_nowait(item)
+        binding.resync_pending = True
+        binding.overflow_count += 1
+        outbox.put_nowait(_BRIDGE_RESYNC)
+        logger.warning(
+            "[BRIDGE] Outbox overflow; replacing %s queued frames with a resync",
+            BRIDGE_OUTBOX_LIMIT,
+        )
+
+    async def _bridge_resync_frames(
+        self, binding: BridgeBinding, correlation_id: str | None
+    ) -> list[str | bytes | _StreamedSnapshot]:
+        account_id = binding.creator_account_id
+        # Snapshot, agent and system state read SQLite; render them off the loop.
+        snapshot, binding.view_revision = await asyncio.to_thread(
+            self._snapshot_frame, binding, correlation_id
+        )
+        frames = (
+            ("presence.state", self.presence_state_payload(account_id), None),
+            (
+                "agent.state",
+                await asyncio.to_thread(self.agent_state_payload, account_id),
+                None,
+            ),
+            (
+                "system.state",
+                await asyncio.to_thread(self.system_state_payload, account_id),
+                None,
+            ),
+        )
+        return [snapshot] + [
+            binding.encoding.encode(
+                self._encode(
+                    BRAIN_TO_BRIDGE_ADAPTER, message_type, payload, correlation_id=correlation
+                )
+            )
+            for message_type, payload, correlation in frames
+        ]
+
+    async def _run_bridge_sender(self, binding: BridgeBinding) -> None:
+        outbox = binding.outbox
+        assert outbox is not None
+        try:
+            while True:
+                item = await outbox.get()
+                try:
+                    if item is _BRIDGE_RESYNC:
+                        binding.resync_pending = False
+                        correlation_id = binding.resync_correlation_id
+                        binding.resync_correlation_id = None
+                        for frame in await self._bridge_resync_frames(binding, correlation_id):
+                            await self._send_bridge_item(binding, frame)
+                    else:
+                        await self._send_bridge_item(binding, item[0])
+                finally:
+                    outbox.task_done()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The transport disappeared; retire the binding like a failed send.
+            if self.bridges.get(binding.connection_id) is binding:
+                self.bridges.pop(binding.connection_id, None)
+        finally:
+            while not outbox.empty():
+                item = outbox.get_nowait()
+                if item is not _BRIDGE_RESYNC and isinstance(item[0], _StreamedSnapshot):
+                    item[0].stream.close()
+                outbox.task_done()
+
+    async def drain_bridge(
+        self, binding: BridgeBinding, *, timeout: float | None = None
+    ) -> bool:
+        """Wait until the binding's queued frames have been handed to its socket."""
+        if binding.outbox is None:
+            return True
+        try:
+            await asyncio.wait_for(binding.outbox.join(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def drain_bridges(self) -> None:
+        await asyncio.gather(
+            *(self.drain_bridge(binding) for binding in list(self.bridges.values()))
+        )
 
     async def record_config_applied(self, lease: AgentLease, payload: Any) -> None:
         record = self.config_authority.record_report(
@@ -1177,7 +2091,7 @@ class InMemoryTransportManager:
             payload.outcome == "applied"
             and record.applied_config_revision == payload.config_revision
         ):
-            self.history.mark_history_config_applied(
+            self.history_for(lease.creator_account_id).mark_history_config_applied(
                 lease.creator_account_id, payload.config_revision
             )
         await self.broadcast_agent_state(lease.creator_account_id)
@@ -1248,7 +2162,8 @@ class InMemoryTransportManager:
             },
             signal_available=False,
         )
-        self.history.bind_history_config(
+        history = self.history_for(account_id)
+        history.bind_history_config(
             account_id,
             settings_revision=int(history_settings["settings_revision"]),
             config_revision=document.config_revision,
@@ -1258,7 +2173,7 @@ class InMemoryTransportManager:
             lease is not None
             and lease.applied_config_revision == document.config_revision
         ):
-            self.history.mark_history_config_applied(
+            history.mark_history_config_applied(
                 account_id, document.config_revision
             )
         await self.signal_config_available(account_id)
@@ -1266,8 +2181,8 @@ class InMemoryTransportManager:
         return document
 
 
-transport_manager = InMemoryTransportManager(
-    create_canonical_repositories(
+def _create_transport_manager() -> InMemoryTransportManager:
+    repositories = create_canonical_repositories(
         settings.canonical_persistence_backend,
         canonical_path=(
             settings.canonical_database_path
@@ -1280,4 +2195,23 @@ transport_manager = InMemoryTransportManager(
             else None
         ),
     )
-)
+    projection_worker = (
+        ProjectionWorkerProcess(repositories.database.path, repositories.projection_database.path)
+        if settings.projection_worker_mode == "process"
+        else None
+    )
+    shards = (
+        create_sharded_canonical_repositories(
+            settings.canonical_shard_root,
+            mode=settings.canonical_shard_mode,
+            buckets=settings.canonical_shard_buckets,
+        )
+        if settings.canonical_shard_mode != "none"
+        else None
+    )
+    return InMemoryTransportManager(
+        repositories, projection_worker=projection_worker, shards=shards
+    )
+
+
+transport_manager = _create_transport_manager()
@@ -43,6 +43,7 @@ const agentCapability = literal(
 );
 const bridgeCapability = literal(
   'state.snapshot',
+  'state.snapshot.parts',
   'state.delta',
   'presence.state',
   'message.page',
@@ -269,22 +270,34 @@ const messagePayloadValidators: Record<string, Validator> = {
     retryable: boolean,
     detail: nonEmptyString,
   }),
-  'state.snapshot': object({
+  'state.snapshot': object(
+    {
+      creator_account_id: nonEmptyString,
+      view_revision: integer(0),
+      generated_at: isoDateTime,
+      conversations: array(conversationSummary),
+      analytics: analyticsView,
+      coverage: historicalCoverage,
+      projection: projectionState,
+      live_freshness: liveFreshness,
+    },
+    { part_count: nullable(integer(0)) },
+  ),
+  'state.snapshot.part': object({
     creator_account_id: nonEmptyString,
     view_revision: integer(0),
-    generated_at: isoDateTime,
-    conversations: array(conversationSummary),
-    analytics: analyticsView,
-    coverage: historicalCoverage,
-    projection: projectionState,
-    live_freshness: liveFreshness,
-  }),
-  'state.delta': object({
-    creator_account_id: nonEmptyString,
-    view_revision: integer(1),
-    committed_at: isoDateTime,
-    changes: array(stateChange, 1),
+    part_index: integer(0),
+    conversations: array(conversationSummary, 1, 100),
   }),
+  'state.delta': object(
+    {
+      creator_account_id: nonEmptyString,
+      view_revision: integer(1),
+      committed_at: isoDateTime,
+      changes: array(stateChange, 1),
+    },
+    { base_view_revision: nullable(integer(0)) },
+  ),
   'state.resync': object({
     connection_id: uuid,
     bridge_session_id: uuid,
@@ -292,6 +305,13 @@ const messagePayloadValidators: Record<string, Validator> = {
     last_applied_view_revision: integer(0),
     reason: literal('revision_gap', 'invalid_delta', 'reconnect', 'manual'),
   }),
+  'state.subscribe': object({
+    connection_id: uuid,
+    bridge_session_id: uuid,
+    creator_account_id: nonEmptyString,
+    conversation_ids: nullable(array(nonEmptyString, 0, 500)),
+    aggregates: array(literal('analytics', 'coverage', 'projection', 'live_freshness')),
+  }),
   'presence.observed': object({
     connection_id: uuid,
     fencing_token: nonEmptyString,
@@ -302,12 +322,24 @@ const messagePayloadValidators: Record<string, Validator> = {
   }),
   'presence.state': object({
     creator_account_id: nonEmptyString,
+    version: integer(0),
     freshness: literal('current', 'unknown'),
     online_platform_user_ids: array(nonEmptyString),
     server_received_at: nullable(isoDateTime),
     expires_at: nullable(isoDateTime),
     last_observation: nullable(lastPresenceObservation),
   }),
+  'presence.delta': object({
+    creator_account_id: nonEmptyString,
+    base_version: integer(0),
+    version: integer(1),
+    freshness: literal('current', 'unknown'),
+    joined_platform_user_ids: array(nonEmptyString),
+    left_platform_user_ids: array(nonEmptyString),
+    server_received_at: nullable(isoDateTime),
+    expires_at: nullable(isoDateTime),
+    last_observation: nullable(lastPresenceObservation),
+  }),
   'agent.state': object({
     creator_account_id: nonEmptyString,
     status: literal('connected', 'stale', 'disconnected'),
@@ -405,12 +437,14 @@ const brainToAgentTypes = new Set([
   'command.execute',
   'command.result.ack',
 ]);
-const bridgeToBrainTypes = new Set(['bridge.hello', 'state.resync']);
+const bridgeToBrainTypes = new Set(['bridge.hello', 'state.resync', 'state.subscribe']);
 const brainToBridgeTypes = new Set([
   'bridge.session',
   'state.snapshot',
+  'state.snapshot.part',
   'state.delta',
   'presence.state',
+  'presence.delta',
   'agent.state',
   'system.state',
   'protocol.error',
@@ -245,7 +245,13 @@ export interface BridgeHelloPayload {
   auth_ticket: string;
   bridge_session_id: UUID;
   requested_creator_account_id: string;
-  capabilities: ('state.snapshot' | 'state.delta' | 'presence.state' | 'message.page')[];
+  capabilities: (
+    | 'state.snapshot'
+    | 'state.snapshot.parts'
+    | 'state.delta'
+    | 'presence.state'
+    | 'message.page'
+  )[];
   client_version: string;
   last_view_revision: number | null;
 }
@@ -383,6 +389,15 @@ export interface StateSnapshotPayload {
   coverage: HistoricalCoverage;
   projection: ProjectionState;
   live_freshness: LiveFreshness;
+  /** Set when the conversations arrived as that many preceding state.snapshot.part frames. */
+  part_count?: number | null;
+}
+
+export interface StateSnapshotPartPayload {
+  creator_account_id: string;
+  view_revision: number;
+  part_index: number;
+  conversations: ConversationSummary[];
 }
 
 export interface StateDeltaPayload {
@@ -390,6 +405,8 @@ export interface StateDeltaPayload {
   view_revision: number;
   committed_at: IsoDateTime;
   changes: StateChange[];
+  /** Batched deltas cover (base_view_revision, view_revision]; omitted means one revision. */
+  base_view_revision?: number | null;
 }
 
 export interface StateResyncPayload {
@@ -400,6 +417,16 @@ export interface StateResyncPayload {
   reason: 'revision_gap' | 'invalid_delta' | 'reconnect' | 'manual';
 }
 
+export type StateSubscriptionAggregate = 'analytics' | 'coverage' | 'projection' | 'live_freshness';
+
+export interface StateSubscribePayload {
+  connection_id: UUID;
+  bridge_session_id: UUID;
+  creator_account_id: string;
+  conversation_ids: string[] | null;
+  aggregates: StateSubscriptionAggregate[];
+}
+
 export interface PresenceObservedPayload {
   connection_id: UUID;
   fencing_token: string;
@@ -411,6 +438,7 @@ export interface PresenceObservedPayload {
 
 export interface PresenceStatePayload {
   creator_account_id: string;
+  version: number;
   freshness: 'current' | 'unknown';
   online_platform_user_ids: string[];
   server_received_at: IsoDateTime | null;
@@ -418,6 +446,18 @@ export interface PresenceStatePayload {
   last_observation: LastPresenceObservation | null;
 }
 
+export interface PresenceDeltaPayload {
+  creator_account_id: string;
+  base_version: number;
+  version: number;
+  freshness: 'current' | 'unknown';
+  joined_platform_user_ids: string[];
+  left_platform_user_ids: string[];
+  server_received_at: IsoDateTime | null;
+  expires_at: IsoDateTime | null;
+  last_observation: LastPresenceObservation | null;
+}
+
 export interface AgentStatePayload {
   creator_account_id: string;
   status: 'connected' | 'stale' | 'disconnected';
@@ -513,10 +553,13 @@ export type IngestDeltaMessage = Envelope<'ingest.delta', IngestDeltaPayload>;
 export type IngestAckMessage = Envelope<'ingest.ack', IngestAckPayload>;
 export type IngestRejectedMessage = Envelope<'ingest.rejected', IngestRejectedPayload>;
 export type StateSnapshotMessage = Envelope<'state.snapshot', StateSnapshotPayload>;
+export type StateSnapshotPartMessage = Envelope<'state.snapshot.part', StateSnapshotPartPayload>;
 export type StateDeltaMessage = Envelope<'state.delta', StateDeltaPayload>;
 export type StateResyncMessage = Envelope<'state.resync', StateResyncPayload>;
+export type StateSubscribeMessage = Envelope<'state.subscribe', StateSubscribePayload>;
 export type PresenceObservedMessage = Envelope<'presence.observed', PresenceObservedPayload>;
 export type PresenceStateMessage = Envelope<'presence.state', PresenceStatePayload>;
+export type PresenceDeltaMessage = Envelope<'presence.delta', PresenceDeltaPayload>;
 export type AgentStateMessage = Envelope<'agent.state', AgentStatePayload>;
 export type SystemStateMessage = Envelope<'system.state', SystemStatePayload>;
 export type ProtocolErrorMessage = Envelope<'protocol.error', ProtocolErrorPayload>;
@@ -528,8 +571,8 @@ export type CommandResultAckMessage = Envelope<'command.result.ack', CommandResu
 
 export type AgentToBrainMessage = AgentHelloMessage | AgentHeartbeatMessage | IngestSnapshotMessage | IngestDeltaMessage | PresenceObservedMessage | ConfigAppliedMessage | CommandResultMessage;
 export type BrainToAgentMessage = AgentSessionMessage | SyncRequiredMessage | IngestAckMessage | IngestRejectedMessage | ProtocolErrorMessage | ConfigAvailableMessage | CommandExecuteMessage | CommandResultAckMessage;
-export type BridgeToBrainMessage = BridgeHelloMessage | StateResyncMessage;
-export type BrainToBridgeMessage = BridgeSessionMessage | StateSnapshotMessage | StateDeltaMessage | PresenceStateMessage | AgentStateMessage | SystemStateMessage | ProtocolErrorMessage;
+export type BridgeToBrainMessage = BridgeHelloMessage | StateResyncMessage | StateSubscribeMessage;
+export type BrainToBridgeMessage = BridgeSessionMessage | StateSnapshotMessage | StateSnapshotPartMessage | StateDeltaMessage | PresenceStateMessage | PresenceDeltaMessage | AgentStateMessage | SystemStateMessage | ProtocolErrorMessage;
 
 export interface AgentConfigGetRequest {
   operation: 'agent.config.get';
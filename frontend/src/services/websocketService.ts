@@ -4,10 +4,14 @@ import {
   type BrainToBridgeMessage,
   type BridgeSessionMessage,
   type BridgeToBrainMessage,
-  type PresenceStateMessage,
+  type ConversationSummary,
+  type PresenceDeltaMessage,
   type ProtocolVersion,
   type ProtocolErrorMessage,
   type StateDeltaMessage,
+  type StateSnapshotMessage,
+  type StateSnapshotPartMessage,
+  type StateSubscriptionAggregate,
 } from '../protocol';
 import {
   bridgeTransportStore,
@@ -16,6 +20,10 @@ import {
 
 const OPEN = 1;
 const DEFAULT_URL = 'ws://bridge.localhost:17871/ws/bridge';
+// Negotiated Brain-to-Bridge frame encodings, most preferred first. The Brain
+// falls back to JSON text frames when it accepts neither.
+export const BRIDGE_DEFLATE_SUBPROTOCOL = 'onlyfans-bridge.v2.deflate';
+export const BRIDGE_JSON_SUBPROTOCOL = 'onlyfans-bridge.v2.json';
 
 interface MessageEventLike {
   data: unknown;
@@ -23,6 +31,7 @@ interface MessageEventLike {
 
 export interface WebSocketLike {
   readyState: number;
+  binaryType?: string;
   onopen: (() => void) | null;
   onmessage: ((event: MessageEventLike) => void) | null;
   onerror: (() => void) | null;
@@ -42,7 +51,8 @@ export interface BridgeWebSocketOptions {
   authTicket?: string;
   bridgeSessionId?: string;
   clientVersion?: string;
-  webSocketFactory?: (url: string) => WebSocketLike;
+  webSocketFactory?: (url: string, protocols?: string[]) => WebSocketLike;
+  compression?: boolean;
   store?: BridgeTransportStore;
   scheduler?: Scheduler;
   random?: () => number;
@@ -62,6 +72,17 @@ function defaultIdFactory(): string {
   return crypto.randomUUID();
 }
 
+function supportsCompression(): boolean {
+  return typeof DecompressionStream !== 'undefined';
+}
+
+async function inflateFrame(data: unknown): Promise<string> {
+  if (typeof data === 'string') return data;
+  const bytes = data instanceof Blob ? data : new Blob([data as ArrayBuffer]);
+  const stream = bytes.stream().pipeThrough(new DecompressionStream('deflate'));
+  return new Response(stream).text();
+}
+
 function normalizeUrl(url: string): string {
   return url
     .replace(/\/api\/ws\/frontend\/[^/]+$/, '/ws/bridge')
@@ -77,7 +98,8 @@ export class BridgeWebSocketService {
   private authTicket: string;
   private readonly bridgeSessionId: string;
   private readonly clientVersion: string;
-  private readonly webSocketFactory: (url: string) => WebSocketLike;
+  private readonly webSocketFactory: (url: string, protocols?: string[]) => WebSocketLike;
+  private readonly compression: boolean;
   private readonly store: BridgeTransportStore;
   private readonly scheduler: Scheduler;
   private readonly random: () => number;
@@ -87,6 +109,20 @@ export class BridgeWebSocketService {
   private readonly reconnectMaxMs: number;
   private readonly protocolVersion: ProtocolVersion;
   private reconnectAttempt = 0;
+  // Binary frames inflate asynchronously; later frames wait behind them so
+  // the store still sees Brain frames in send order.
+  private inbound: Promise<void> = Promise.resolve();
+  private pendingFrames = 0;
+  // Conversations of a streamed snapshot received ahead of its closing frame.
+  private snapshotParts: {
+    viewRevision: number;
+    partCount: number;
+    conversations: ConversationSummary[];
+  } | null = null;
+  private subscription: {
+    conversationIds: string[] | null;
+    aggregates: StateSubscriptionAggregate[];
+  } | null = null;
   private manuallyStopped = true;
   private reconnectAllowed = true;
 
@@ -97,7 +133,9 @@ export class BridgeWebSocketService {
     this.bridgeSessionId = options.bridgeSessionId ?? (options.idFactory ?? defaultIdFactory)();
     this.clientVersion = options.clientVersion ?? '0.7.1';
     this.webSocketFactory =
-      options.webSocketFactory ?? ((url) => new WebSocket(url) as unknown as WebSocketLike);
+      options.webSocketFactory ??
+      ((url, protocols) => new WebSocket(url, protocols) as unknown as WebSocketLike);
+    this.compression = options.compression ?? supportsCompression();
     this.store = options.store ?? bridgeTransportStore;
     this.scheduler = options.scheduler ?? defaultScheduler;
     this.random = options.random ?? Math.random;
@@ -119,7 +157,10 @@ export class BridgeWebSocketService {
     const normalizedUrl = normalizeUrl(url);
     const bindingChanged =
       creatorAccountId !== this.creatorAccountId || authTicket !== this.authTicket;
-    if (bindingChanged) this.disconnect();
+    if (bindingChanged) {
+      this.disconnect();
+      this.subscription = null;
+    }
     this.url = normalizedUrl;
     this.creatorAccountId = creatorAccountId;
     this.authTicket = authTicket;
@@ -162,9 +203,45 @@ export class BridgeWebSocketService {
     return true;
   }
 
+  /**
+   * Scope this Bridge's state stream to what is on screen. The Brain answers
+   * with a snapshot of the scope; later deltas carry only subscribed changes.
+   * `null` conversation ids subscribe to every conversation again.
+   */
+  subscribe(
+    conversationIds: string[] | null,
+    aggregates: StateSubscriptionAggregate[] = ['analytics', 'coverage', 'projection', 'live_freshness'],
+  ): boolean {
+    // Remembered so a reconnected socket is scoped again after its handshake.
+    this.subscription = { conversationIds, aggregates };
+    const session = this.store.getState().session;
+    if (!session || !this.socket || this.socket.readyState !== OPEN) return false;
+    const message: BridgeToBrainMessage = {
+      type: 'state.subscribe',
+      protocol_version: session.negotiated_protocol_version,
+      message_id: this.idFactory(),
+      payload: {
+        connection_id: session.connection_id,
+        bridge_session_id: session.bridge_session_id,
+        creator_account_id: session.creator_account_id,
+        conversation_ids: conversationIds,
+        aggregates,
+      },
+    };
+    this.socket.send(JSON.stringify(parseBridgeToBrainMessage(message)));
+    return true;
+  }
+
   private openSocket(reconnecting: boolean): void {
     this.store.setConnection(reconnecting ? 'reconnecting' : 'connecting');
-    const socket = this.webSocketFactory(this.url);
+    this.snapshotParts = null;
+    const socket = this.webSocketFactory(
+      this.url,
+      this.compression
+        ? [BRIDGE_DEFLATE_SUBPROTOCOL, BRIDGE_JSON_SUBPROTOCOL]
+        : [BRIDGE_JSON_SUBPROTOCOL],
+    );
+    socket.binaryType = 'arraybuffer';
     this.socket = socket;
     socket.onopen = () => {
       if (this.socket !== socket) return;
@@ -177,20 +254,47 @@ export class BridgeWebSocketService {
           auth_ticket: this.authTicket,
           bridge_session_id: this.bridgeSessionId,
           requested_creator_account_id: this.creatorAccountId,
-          capabilities: ['state.snapshot', 'state.delta', 'presence.state', 'message.page'],
+          capabilities: [
+            'state.snapshot',
+            'state.snapshot.parts',
+            'state.delta',
+            'presence.state',
+            'message.page',
+          ],
           client_version: this.clientVersion,
           last_view_revision: this.store.getState().viewRevision,
         },
       };
       socket.send(JSON.stringify(parseBridgeToBrainMessage(hello)));
     };
-    socket.onmessage = (event) => this.handleRawMessage(socket, event.data);
+    socket.onmessage = (event) => this.receiveFrame(socket, event.data);
     socket.onerror = () => {
       if (this.socket === socket) this.store.setConnection('error');
     };
     socket.onclose = () => this.handleClose(socket);
   }
 
+  private receiveFrame(socket: WebSocketLike, data: unknown): void {
+    if (typeof data === 'string' && this.pendingFrames === 0) {
+      this.handleRawMessage(socket, data);
+      return;
+    }
+    this.pendingFrames += 1;
+    this.inbound = this.inbound
+      .then(() => inflateFrame(data))
+      .then(
+        (text) => this.handleRawMessage(socket, text),
+        () => {
+          if (socket !== this.socket) return;
+          this.store.setConnection('error');
+          socket.close(1002, 'Malformed compressed frame from Brain');
+        },
+      )
+      .finally(() => {
+        this.pendingFrames -= 1;
+      });
+  }
+
   private handleRawMessage(socket: WebSocketLike, data: unknown): void {
     if (socket !== this.socket) return;
     let decoded: unknown;
@@ -210,7 +314,12 @@ export class BridgeWebSocketService {
         typeof decoded === 'object' &&
         decoded !== null &&
         (decoded as Record<string, unknown>).type;
-      if (invalidType === 'state.delta' || invalidType === 'state.snapshot') {
+      if (
+        invalidType === 'state.delta' ||
+        invalidType === 'state.snapshot' ||
+        invalidType === 'state.snapshot.part'
+      ) {
+        this.snapshotParts = null;
         this.requestResync('invalid_delta');
       } else {
         this.store.setConnection('error');
@@ -259,6 +368,9 @@ export class BridgeWebSocketService {
     }
     this.reconnectAttempt = 0;
     this.store.acceptSession(payload);
+    if (this.subscription) {
+      this.subscribe(this.subscription.conversationIds, this.subscription.aggregates);
+    }
   }
 
   private dispatchBoundMessage(
@@ -266,15 +378,20 @@ export class BridgeWebSocketService {
   ): void {
     switch (message.type) {
       case 'state.snapshot':
-        if (!this.store.applySnapshot(message.payload)) {
-          this.requestResync('invalid_delta');
-        }
+        this.handleSnapshot(message);
+        return;
+      case 'state.snapshot.part':
+        this.handleSnapshotPart(message);
         return;
       case 'state.delta':
         this.handleDelta(message);
         return;
       case 'presence.state':
-        this.handlePresence(message);
+        this.store.setPresence(message.payload);
+        this.schedulePresenceExpiry();
+        return;
+      case 'presence.delta':
+        this.handlePresenceDelta(message);
         return;
       case 'agent.state':
         this.store.setAgent(message.payload);
@@ -289,18 +406,67 @@ export class BridgeWebSocketService {
     }
   }
 
+  private handleSnapshot(message: StateSnapshotMessage): void {
+    const staged = this.snapshotParts;
+    this.snapshotParts = null;
+    let snapshot = message.payload;
+    const partCount = snapshot.part_count ?? null;
+    if (partCount !== null && partCount > 0) {
+      if (
+        staged === null ||
+        staged.viewRevision !== snapshot.view_revision ||
+        staged.partCount !== partCount
+      ) {
+        this.requestResync('invalid_delta');
+        return;
+      }
+      snapshot = { ...snapshot, conversations: staged.conversations };
+    }
+    if (!this.store.applySnapshot(snapshot)) this.requestResync('invalid_delta');
+  }
+
+  private handleSnapshotPart(message: StateSnapshotPartMessage): void {
+    const part = message.payload;
+    const staged = this.snapshotParts;
+    if (part.part_index === 0) {
+      this.snapshotParts = {
+        viewRevision: part.view_revision,
+        partCount: 1,
+        conversations: [...part.conversations],
+      };
+    } else if (
+      staged !== null &&
+      staged.viewRevision === part.view_revision &&
+      staged.partCount === part.part_index
+    ) {
+      staged.partCount += 1;
+      staged.conversations.push(...part.conversations);
+    } else {
+      this.snapshotParts = null;
+      this.requestResync('invalid_delta');
+      return;
+    }
+    this.store.previewSnapshotConversations(this.snapshotParts?.conversations ?? []);
+  }
+
   private handleDelta(message: StateDeltaMessage): void {
     const result = this.store.applyDelta(message.payload);
     if (result === 'gap') this.requestResync('revision_gap');
     else if (result === 'invalid') this.requestResync('invalid_delta');
   }
 
-  private handlePresence(message: PresenceStateMessage): void {
+  private handlePresenceDelta(message: PresenceDeltaMessage): void {
+    const result = this.store.applyPresenceDelta(message.payload);
+    if (result === 'gap') this.requestResync('revision_gap');
+    else if (result === 'applied') this.schedulePresenceExpiry();
+  }
+
+  private schedulePresenceExpiry(): void {
     this.clearPresenceTimer();
-    this.store.setPresence(message.payload);
-    if (message.payload.freshness !== 'current' || message.payload.expires_at === null) return;
-    const delay = Math.max(0, Date.parse(message.payload.expires_at) - this.now());
-    const expectedExpiry = message.payload.expires_at;
+    const presence = this.store.getState().presence;
+    if (presence?.freshness !== 'current' || presence.expires_at === null) return;
+    const delay = Math.max(0, Date.parse(presence.expires_at) - this.now());
+    const expectedExpiry = presence.expires_at;
     this.presenceTimer = this.scheduler.setTimeout(() => {
       this.presenceTimer = null;
       this.store.expirePresence(expectedExpiry);
@@ -9,6 +9,7 @@ import type {
   LiveFreshness,
   MessagePageResponse,
   MessageView,
+  PresenceDeltaPayload,
   PresenceStatePayload,
   ProjectionState,
   ProtocolErrorPayload,
@@ -85,6 +86,7 @@ export interface BridgeTransportStore {
   setConnection(connection: BridgeConnectionState): void;
   acceptSession(session: BridgeSessionPayload): void;
   applySnapshot(snapshot: StateSnapshotPayload): boolean;
+  previewSnapshotConversations(conversations: readonly ConversationSummary[]): void;
   applyDelta(delta: StateDeltaPayload): 'applied' | 'duplicate' | 'gap' | 'invalid';
   beginResync(): void;
   setActiveConversation(conversationId: string | null): void;
@@ -98,6 +100,7 @@ export interface BridgeTransportStore {
   clearMessagePage(conversationId: string): void;
   clearMessageCache(): void;
   setPresence(presence: PresenceStatePayload): void;
+  applyPresenceDelta(delta: PresenceDeltaPayload): 'applied' | 'duplicate' | 'gap';
   expirePresence(expectedExpiresAt: string): void;
   setAgent(agent: AgentStatePayload): void;
   setSystem(system: SystemStatePayload): void;
@@ -380,14 +383,21 @@ export function createBridgeTransportStore(): BridgeTransportStore {
       });
       return true;
     },
+    previewSnapshotConversations(conversations) {
+      // Only a first load renders a streamed snapshot as it arrives; a Bridge
+      // that already shows a revision keeps it until the snapshot completes.
+      if (state.viewRevision !== null || !validConversations(conversations)) return;
+      publish({ conversations: conversations.map(cloneConversation) });
+    },
     applyDelta(delta) {
       assertAccount(delta.creator_account_id);
       const currentRevision = state.viewRevision;
+      const baseRevision = delta.base_view_revision ?? delta.view_revision - 1;
       if (currentRevision !== null && delta.view_revision <= currentRevision) return 'duplicate';
       if (
         currentRevision === null ||
         state.readModelState === 'resyncing' ||
-        delta.view_revision !== currentRevision + 1
+        baseRevision !== currentRevision
       ) return 'gap';
 
       const conversations = state.conversations.map(cloneConversation);
@@ -627,6 +637,29 @@ export function createBridgeTransportStore(): BridgeTransportStore {
       assertAccount(presence.creator_account_id);
       publish({ presence: { ...presence } });
     },
+    applyPresenceDelta(delta) {
+      assertAccount(delta.creator_account_id);
+      const current = state.presence;
+      if (current !== null && delta.version <= current.version) return 'duplicate';
+      if (current === null || delta.base_version !== current.version) return 'gap';
+      const left = new Set(delta.left_platform_user_ids);
+      const online = current.freshness === 'current' ? current.online_platform_user_ids : [];
+      const retained = online.filter((userId) => !left.has(userId));
+      const joined = delta.joined_platform_user_ids.filter((userId) => !retained.includes(userId));
+      publish({
+        presence: {
+          creator_account_id: delta.creator_account_id,
+          version: delta.version,
+          freshness: delta.freshness,
+          online_platform_user_ids:
+            delta.freshness === 'current' ? [...retained, ...joined] : [],
+          server_received_at: delta.server_received_at,
+          expires_at: delta.expires_at,
+          last_observation: delta.last_observation,
+        },
+      });
+      return 'applied';
+    },
     expirePresence(expectedExpiresAt) {
       if (
         state.presence?.freshness === 'current' &&
@@ -48,6 +48,19 @@ describe('durable protocol-v2 Bridge read model', () => {
     expect(store.getState().viewRevision).toBe(43);
   });
 
+  it('applies a batched delta only on top of its base revision', () => {
+    const store = createBridgeTransportStore();
+    store.bindAccount('dev-creator-account');
+    store.applySnapshot(payload<StateSnapshotPayload>('state.snapshot'));
+    const batched = payload<StateDeltaPayload>('state.delta');
+    batched.view_revision = 45;
+
+    expect(store.applyDelta({ ...batched, base_view_revision: 43 })).toBe('gap');
+    expect(store.applyDelta({ ...batched, base_view_revision: 42 })).toBe('applied');
+    expect(store.getState().viewRevision).toBe(45);
+    expect(store.applyDelta({ ...batched, base_view_revision: 42 })).toBe('duplicate');
+  });
+
   it('rejects a duplicate atomic change target without changing any published state', () => {
     const store = createBridgeTransportStore();
     store.bindAccount('dev-creator-account');
@@ -33,12 +33,14 @@ const brainToAgent = new Set([
   'command.execute',
   'command.result.ack',
 ]);
-const bridgeToBrain = new Set(['bridge.hello', 'state.resync']);
+const bridgeToBrain = new Set(['bridge.hello', 'state.resync', 'state.subscribe']);
 const brainToBridge = new Set([
   'bridge.session',
   'state.snapshot',
+  'state.snapshot.part',
   'state.delta',
   'presence.state',
+  'presence.delta',
   'agent.state',
   'system.state',
 ]);
@@ -61,7 +63,7 @@ describe('protocol v2 golden fixtures', () => {
   const validFixtures = readdirSync(fixtureRoot).filter((name) => name.endsWith('.json')).sort();
 
   it('contains and validates one fixture for every matrix operation', () => {
-    expect(validFixtures).toHaveLength(25);
+    expect(validFixtures).toHaveLength(28);
     for (const fixture of validFixtures) {
       const operation = fixture.slice(0, -'.json'.length);
       expect(validatesOperation(operation, readJson(`${fixtureRoot}/${fixture}`)), fixture).toBe(true);
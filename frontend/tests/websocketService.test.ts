@@ -1,9 +1,12 @@
 import { readFileSync } from 'node:fs';
 import { resolve } from 'node:path';
+import { deflateSync } from 'node:zlib';
 import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
 
 import { parseBridgeToBrainMessage } from '../src/protocol';
 import {
+  BRIDGE_DEFLATE_SUBPROTOCOL,
+  BRIDGE_JSON_SUBPROTOCOL,
   BridgeWebSocketService,
   type WebSocketLike,
 } from '../src/services/websocketService';
@@ -44,6 +47,13 @@ class MockSocket implements WebSocketLike {
     this.onmessage?.({ data: JSON.stringify(document) });
   }
 
+  receiveCompressed(document: unknown): void {
+    const bytes = deflateSync(Buffer.from(JSON.stringify(document)));
+    this.onmessage?.({
+      data: bytes.buffer.slice(bytes.byteOffset, bytes.byteOffset + bytes.byteLength),
+    });
+  }
+
   drop(): void {
     this.readyState = 3;
     this.onclose?.();
@@ -111,6 +121,37 @@ describe('Bridge WebSocket lifecycle', () => {
     expect(state.system?.readiness).toBe('ready');
   });
 
+  it('offers compressed frames and applies them in order with JSON text frames', async () => {
+    const protocols: (string[] | undefined)[] = [];
+    const sockets: MockSocket[] = [];
+    const store = createBridgeTransportStore();
+    const service = new BridgeWebSocketService({
+      authTicket: 'test-bridge-auth-ticket',
+      bridgeSessionId: BRIDGE_SESSION_ID,
+      creatorAccountId: 'dev-creator-account',
+      store,
+      compression: true,
+      idFactory: () => '90000000-0000-4000-8000-000000000001',
+      webSocketFactory: (_url, offered) => {
+        protocols.push(offered);
+        const socket = new MockSocket();
+        sockets.push(socket);
+        return socket;
+      },
+    });
+    service.connect();
+    expect(protocols[0]).toEqual([BRIDGE_DEFLATE_SUBPROTOCOL, BRIDGE_JSON_SUBPROTOCOL]);
+    const socket = sockets[0];
+    socket.open();
+    socket.receiveCompressed(fixture('bridge.session'));
+    socket.receiveCompressed(fixture('state.snapshot'));
+    // A text frame sent after compressed ones still waits for them.
+    socket.receive(fixture('state.delta'));
+
+    await vi.waitFor(() => expect(store.getState().viewRevision).toBe(43));
+    expect(store.getState().connection).toBe('connected');
+  });
+
   it('applies only contiguous deltas and sends state.resync on a gap', () => {
     const { service, sockets, store } = harness();
     service.connect();
@@ -134,6 +175,28 @@ describe('Bridge WebSocket lifecycle', () => {
     expect(store.getState().readModelState).toBe('resyncing');
   });
 
+  it('sends state.subscribe and scopes the stream again after a reconnect', () => {
+    const { service, sockets } = harness();
+    service.connect();
+    sockets[0].open();
+    completeHandshake(sockets[0]);
+
+    expect(service.subscribe(['chat-1'])).toBe(true);
+    const subscribe = parseBridgeToBrainMessage(JSON.parse(sockets[0].sent.at(-1)!));
+    expect(subscribe.type).toBe('state.subscribe');
+    expect(subscribe.payload).toMatchObject({
+      conversation_ids: ['chat-1'],
+      aggregates: ['analytics', 'coverage', 'projection', 'live_freshness'],
+    });
+
+    sockets[0].drop();
+    vi.advanceTimersByTime(500);
+    sockets[1].open();
+    completeHandshake(sockets[1], '10000000-0000-4000-8000-000000000099');
+    const resubscribe = parseBridgeToBrainMessage(JSON.parse(sockets[1].sent.at(-1)!));
+    expect(resubscribe.type).toBe('state.subscribe');
+  });
+
   it('turns the invalid state.snapshot fixture into resync without crashing', () => {
     const { service, sockets, store } = harness();
     service.connect();
@@ -166,6 +229,67 @@ describe('Bridge WebSocket lifecycle', () => {
     expect(store.getState().presence?.last_observation).not.toBeNull();
   });
 
+  it('applies presence.delta on its base version and resyncs on a gap', () => {
+    const { service, sockets, store } = harness();
+    service.connect();
+    const socket = sockets[0];
+    socket.open();
+    completeHandshake(socket);
+    socket.receive(fixture('state.snapshot'));
+    socket.receive(fixture('presence.state'));
+
+    socket.receive(fixture('presence.delta'));
+    expect(store.getState().presence?.version).toBe(5);
+    expect(store.getState().presence?.online_platform_user_ids).toEqual(['fan-2', 'fan-3']);
+    expect(store.getState().presence?.expires_at).toBe('2026-07-19T10:07:01Z');
+
+    const skipped = fixture('presence.delta');
+    skipped.payload = { ...skipped.payload, base_version: 7, version: 8 };
+    socket.receive(skipped);
+    const resync = parseBridgeToBrainMessage(JSON.parse(socket.sent.at(-1)!));
+    expect(resync.type).toBe('state.resync');
+    expect(resync.payload.reason).toBe('revision_gap');
+    expect(store.getState().presence?.version).toBe(5);
+  });
+
+  it('renders streamed snapshot parts on first load and completes on the marker', () => {
+    const { service, sockets, store } = harness();
+    service.connect();
+    const socket = sockets[0];
+    socket.open();
+    completeHandshake(socket);
+    const hello = parseBridgeToBrainMessage(JSON.parse(socket.sent[0]));
+    expect(hello.type === 'bridge.hello' && hello.payload.capabilities).toContain(
+      'state.snapshot.parts',
+    );
+
+    const part = fixture('state.snapshot.part');
+    socket.receive(part);
+    expect(store.getState().conversations.map((item) => item.conversation_id)).toEqual(['chat-1']);
+    expect(store.getState().viewRevision).toBeNull();
+
+    const second = fixture('state.snapshot.part');
+    second.payload = {
+      ...second.payload,
+      part_index: 1,
+      conversations: [{ ...second.payload.conversations[0], conversation_id: 'chat-2' }],
+    };
+    socket.receive(second);
+    const marker = fixture('state.snapshot');
+    marker.payload = { ...marker.payload, conversations: [], part_count: 2 };
+    socket.receive(marker);
+    expect(store.getState().viewRevision).toBe(42);
+    expect(store.getState().conversations.map((item) => item.conversation_id)).toEqual([
+      'chat-1',
+      'chat-2',
+    ]);
+
+    marker.payload = { ...marker.payload, part_count: 3 };
+    socket.receive(marker);
+    const resync = parseBridgeToBrainMessage(JSON.parse(socket.sent.at(-1)!));
+    expect(resync.type).toBe('state.resync');
+  });
+
   it('reconnects with backoff and repeats the hello/session handshake', () => {
     const { service, sockets, store } = harness();
     service.connect();
@@ -296,3 +296,71 @@ async def test_command_identity_deadline_result_dedup_and_receipt_contract(
     assert await _handle_agent_message(socket, lease, message)
     assert socket.sent[-1]["type"] == "command.result.ack"
     assert socket.sent[-1]["payload"]["result_id"] == str(result_id)
+
+
+
+@pytest.mark.asyncio
+async def test_command_keyset_paging_and_bulk_expiry_contract(
+    repositories: CanonicalRepositories,
+) -> None:
+    service = CommandService(repositories.commands)
+    other_account = "other-creator-account"
+    issued = []
+    for index in range(5):
+        account = ACCOUNT_ID if index % 2 == 0 else other_account
+        issued.append(
+            await service.issue(
+                creator_account_id=account,
+                action=ACTION,
+                deadline=NOW + timedelta(seconds=10 + index),
+                target=CommandDeliveryTarget(uuid4(), "fence-1", account),
+                sender=lambda _: asyncio.sleep(0),
+                now=NOW + timedelta(seconds=index),
+            )
+        )
+    service.record_result(
+        {
+            "creator_account_id": ACCOUNT_ID,
+            "command_id": issued[0].command_id,
+            "result_id": uuid4(),
+            "status": "succeeded",
+            "completed_at": NOW + timedelta(seconds=1),
+            "output": {"external_message_id": "message-1"},
+            "error": None,
+        },
+        received_at=NOW + timedelta(seconds=1),
+    )
+
+    first = service.page(limit=2)
+    second = service.page(after=first.next_cursor, limit=2)
+    last = service.page(after=second.next_cursor, limit=2)
+    assert [record.command_id for record in first.records + second.records + last.records] == [
+        record.command_id for record in issued
+    ]
+    assert last.next_cursor is None
+    pending_mine = service.page(
+        creator_account_id=ACCOUNT_ID, states={"issued", "accepted"}, limit=10
+    )
+    assert [record.command_id for record in pending_mine.records] == [
+        issued[2].command_id,
+        issued[4].command_id,
+    ]
+    with pytest.raises(ValueError):
+        service.page(limit=0)
+
+    # A second process sees only what was persisted, and expires it in bulk.
+    restarted = CommandService(repositories.commands)
+    expired = restarted.expire(NOW + timedelta(seconds=13))
+    assert sorted(record.command_id for record in expired) == sorted(
+        record.command_id for record in issued[1:4]
+    )
+    for record in expired:
+        assert record.state == "unknown"
+        assert record.failure_reason == "deadline_expired"
+        assert [transition.state for transition in record.transitions] == ["issued", "unknown"]
+        assert record.transitions[-1].occurred_at == NOW + timedelta(seconds=13)
+    assert restarted.expire(NOW + timedelta(seconds=13)) == []
+    assert repositories.commands.pending_deadlines() == [
+        (issued[4].command_id, NOW + timedelta(seconds=14))
+    ]
+    assert service.get(issued[0].command_id).state == "succeeded"
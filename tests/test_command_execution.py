@@ -11,7 +11,10 @@ from app.api.endpoints.transport_ws import _handle_agent_message
 from app.protocol import AGENT_TO_BRAIN_ADAPTER
 from app.services.command_execution import (
     CommandAlreadyExistsError,
+    CommandDeliveryTarget,
     CommandReissueError,
+    CommandService,
+    InMemoryCommandRepository,
 )
 from app.transport.manager import DEV_ACCOUNT_ID, transport_manager
 
@@ -252,3 +255,45 @@ def test_every_persisted_command_result_status_is_acknowledged(status: str) -> N
         assert socket.sent[-1]["payload"]["command_id"] == str(command.command_id)
 
     asyncio.run(scenario())
+
+
+def test_deadline_sweep_touches_only_due_commands_and_reloads_pending_ones() -> None:
+    repository = InMemoryCommandRepository()
+    service = CommandService(repository)
+    target = CommandDeliveryTarget(uuid4(), "fence-1", DEV_ACCOUNT_ID)
+
+    async def sender(_: dict) -> None:
+        return None
+
+    async def issue(seconds: int):
+        return await service.issue(
+            creator_account_id=DEV_ACCOUNT_ID,
+            action=ACTION,
+            deadline=NOW + timedelta(seconds=seconds),
+            target=target,
+            sender=sender,
+            now=NOW,
+        )
+
+    commands = [asyncio.run(issue(seconds)) for seconds in range(10, 60)]
+    reads: list = []
+    get = repository.get
+
+    def counting_get(command_id):
+        reads.append(command_id)
+        return get(command_id)
+
+    repository.get = counting_get
+    assert service.expire(NOW + timedelta(seconds=5)) == []
+    assert reads == []
+
+    expired = service.expire(NOW + timedelta(seconds=11))
+    assert [record.command_id for record in expired] == [
+        command.command_id for command in commands[:2]
+    ]
+    assert reads == [command.command_id for command in commands[:2]]
+
+    # A restarted service picks the still-pending deadlines up from storage.
+    restarted = CommandService(repository)
+    assert len(restarted.expire(NOW + timedelta(seconds=59))) == 48
+
@@ -548,6 +548,204 @@ def test_hmac_cursor_pages_ties_and_old_generation_returns_409() -> None:
         assert stale.json()["detail"] == "cursor_stale"
 
 
+
+def test_message_pages_are_read_ahead_under_the_next_cursor(monkeypatch) -> None:
+    seed_projection()
+    projection = transport_manager.projection
+    range_reads: list[tuple[str, ...]] = []
+    message_page = projection.message_page
+
+    def counted_message_page(*args, **kwargs):
+        if kwargs.get("fetch_rows", True):
+            range_reads.append(args)
+        return message_page(*args, **kwargs)
+
+    monkeypatch.setattr(projection, "message_page", counted_message_page)
+    pages: list[list[str]] = []
+    with TestClient(app) as client:
+        cursor = None
+        while True:
+            params = {"limit": 2} if cursor is None else {"limit": 2, "before": cursor}
+            page = client.get("/api/v1/conversations/chat-1/messages", params=params)
+            assert page.status_code == 200
+            pages.append([item["message_id"] for item in page.json()["items"]])
+            cursor = page.json()["older_cursor"]
+            if cursor is None:
+                break
+        assert pages == [["message-4", "message-5"], ["message-2", "message-3"], ["message-1"]]
+        # The first read covered two pages; only the third needed another.
+        assert len(range_reads) == 2
+
+        first = client.get("/api/v1/conversations/chat-1/messages", params={"limit": 2})
+        kept_cursor = first.json()["older_cursor"]
+        key = StreamKey(DEV_ACCOUNT_ID, INSTALLATION_ID, STREAM_ID)
+        delta = envelope(
+            "ingest.delta",
+            {
+                "connection_id": "10000000-0000-4000-8000-000000000001",
+                "fencing_token": "fence-test",
+                "creator_account_id": DEV_ACCOUNT_ID,
+                "agent_installation_id": str(INSTALLATION_ID),
+                "event_id": str(uuid4()),
+                "agent_stream_id": str(STREAM_ID),
+                "source_seq": 1,
+                "acquisition_origin": "passive",
+                "change": {
+                    "type": "message.upsert",
+                    "message": {
+                        "message_id": "message-6",
+                        "chat_id": "chat-1",
+                        "sender_platform_user_id": "fan-chat-1",
+                        "text": "Message 6",
+                        "sent_at": "2026-07-19T10:01:00Z",
+                        "direction": "inbound",
+                    },
+                },
+            },
+        ).payload
+        assert transport_manager.history.commit_delta(key, delta).status == "accepted"
+        transport_manager.projection.catch_up(DEV_ACCOUNT_ID)
+        # A page read ahead under an old generation is never served.
+        stale = client.get(
+            "/api/v1/conversations/chat-1/messages",
+            params={"limit": 2, "before": kept_cursor},
+        )
+        assert stale.status_code == 409
+        assert client.get(
+            "/api/v1/conversations/missing/messages",
+            params={"before": kept_cursor},
+        ).status_code == 404
+
+
+def test_conversation_tails_read_several_conversations_from_one_generation() -> None:
+    seed_projection()
+    with TestClient(app) as client:
+        tails = client.get(
+            "/api/v1/conversations/tails",
+            params={"conversation_id": ["chat-2", "chat-1", "missing", "chat-1"], "limit": 2},
+        )
+        assert tails.status_code == 200
+        assert tails.headers["cache-control"] == "no-store"
+        document = tails.json()
+        assert [item["conversation_id"] for item in document["conversations"]] == [
+            "chat-2",
+            "chat-1",
+        ]
+        assert document["missing_conversation_ids"] == ["missing"]
+        chat_two, chat_one = document["conversations"]
+        assert chat_two["items"] == []
+        assert chat_two["older_cursor"] is None
+        assert [item["message_id"] for item in chat_one["items"]] == ["message-4", "message-5"]
+        assert chat_one["has_older_stored_items"] is True
+
+        # A tail cursor continues through the single-conversation endpoint.
+        older = client.get(
+            "/api/v1/conversations/chat-1/messages",
+            params={"limit": 2, "before": chat_one["older_cursor"]},
+        )
+        assert older.status_code == 200
+        assert older.json()["projection_generation"] == document["projection_generation"]
+        assert [item["message_id"] for item in older.json()["items"]] == [
+            "message-2",
+            "message-3",
+        ]
+        assert client.get(
+            "/api/v1/conversations/tails",
+            params={"conversation_id": [f"chat-{index}" for index in range(51)]},
+        ).status_code == 422
+
+
+def test_conversation_list_sorts_filters_and_pages_on_typed_summary_columns() -> None:
+    seed_projection()
+    with TestClient(app) as client:
+        first = client.get("/api/v1/conversations", params={"limit": 1})
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "no-store"
+        document = first.json()
+        # chat-2 has no messages, so it lists after chat-1 by recency.
+        assert [item["conversation_id"] for item in document["items"]] == ["chat-1"]
+        assert document["order"] == "recent"
+        assert document["has_more"] is True
+        second = client.get(
+            "/api/v1/conversations", params={"limit": 1, "after": document["next_cursor"]}
+        ).json()
+        assert [item["conversation_id"] for item in second["items"]] == ["chat-2"]
+        assert second["next_cursor"] is None
+        assert second["projection_generation"] == document["projection_generation"]
+
+        by_name = client.get(
+            "/api/v1/conversations", params={"order": "name", "name_prefix": "CHAT-"}
+        ).json()
+        assert [item["conversation_id"] for item in by_name["items"]] == ["chat-1", "chat-2"]
+        inbound = client.get("/api/v1/conversations", params={"direction": "inbound"}).json()
+        assert [item["conversation_id"] for item in inbound["items"]] == ["chat-1"]
+        assert client.get("/api/v1/conversations", params={"unread": True}).json()["items"] == []
+
+        # A cursor is bound to the order and filters it was issued for.
+        assert client.get(
+            "/api/v1/conversations",
+            params={"order": "name", "limit": 1, "after": document["next_cursor"]},
+        ).json() == {"detail": "cursor_invalid"}
+
+    with transport_manager.projection.database.read() as connection:
+        rows = connection.execute(
+            """SELECT conversation_id,document_json,last_message_at,display_name,
+                      unread_count,latest_direction
+                 FROM conversation_summaries ORDER BY conversation_id,projection_slot"""
+        ).fetchall()
+        plan = connection.execute(
+            """EXPLAIN QUERY PLAN
+               SELECT document_json FROM conversation_summaries
+                WHERE creator_account_id=? AND projection_slot=0
+                  AND (last_message_at,conversation_id)<(?,?)
+                ORDER BY last_message_at DESC,conversation_id DESC LIMIT 50""",
+            (DEV_ACCOUNT_ID, "2026-07-19T10:00:00Z", "chat-1"),
+        ).fetchall()
+    assert rows
+    for row in rows:
+        summary = json.loads(row[1])
+        assert row[2] == (summary["last_message_at"] or "")
+        assert row[3] == (summary["display_name"] or "")
+        assert row[4] == summary["unread_count"]
+        assert row[5] == (summary["latest_message"] or {}).get("direction")
+    assert "conversation_summaries_recent" in plan[0][3]
+    assert "(last_message_at,conversation_id)<(?,?)" in plan[0][3]
+
+def test_bridge_offering_snapshot_parts_receives_a_streamed_snapshot(monkeypatch) -> None:
+    seed_projection()
+    monkeypatch.setattr("app.transport.manager.MAX_SNAPSHOT_PART_CONVERSATIONS", 1)
+    hello = {
+        "type": "bridge.hello",
+        "protocol_version": "2",
+        "message_id": str(uuid4()),
+        "payload": {
+            "auth_ticket": DEV_BRIDGE_AUTH_TICKET,
+            "bridge_session_id": str(uuid4()),
+            "requested_creator_account_id": DEV_ACCOUNT_ID,
+            "capabilities": ["state.snapshot", "state.snapshot.parts", "state.delta"],
+            "client_version": "test",
+            "last_view_revision": None,
+        },
+    }
+    with TestClient(app) as client, client.websocket_connect("/ws/bridge") as bridge:
+        bridge.send_json(hello)
+        assert bridge.receive_json()["type"] == "bridge.session"
+        parts = [bridge.receive_json(), bridge.receive_json()]
+        marker = bridge.receive_json()
+        assert bridge.receive_json()["type"] == "presence.state"
+    assert [part["type"] for part in parts] == ["state.snapshot.part"] * 2
+    assert [part["payload"]["part_index"] for part in parts] == [0, 1]
+    assert [
+        part["payload"]["conversations"][0]["conversation_id"] for part in parts
+    ] == ["chat-1", "chat-2"]
+    assert marker["type"] == "state.snapshot"
+    assert marker["payload"]["part_count"] == 2
+    assert marker["payload"]["conversations"] == []
+    assert {part["payload"]["view_revision"] for part in parts} == {
+        marker["payload"]["view_revision"]
+    }
+    assert marker["payload"]["view_revision"] > 0
+
 def test_websocket_rejects_snapshot_frame_over_512_kib() -> None:
     with TestClient(app) as client, client.websocket_connect("/ws/agent") as agent:
         agent.send_json(agent_hello(DEV_AGENT_AUTH_TICKET))
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.analytics.canonical_source import HistoryAnalyticsSource
+from app.persistence.factory import create_canonical_repositories
+from app.persistence.history import StreamKey
+from app.persistence import history_import
+from app.persistence.history_import import ImportFailure, import_history, main
+from app.protocol import AGENT_TO_BRAIN_ADAPTER
+from app.transport.manager import InMemoryTransportManager
+
+
+ACCOUNT_ID = "dev-creator-account"
+INSTALLATION_ID = UUID("20000000-0000-4000-8000-000000000001")
+STREAM_ID = UUID("30000000-0000-4000-8000-000000000001")
+
+
+def envelope(payload: dict) -> dict:
+    return {
+        "type": "ingest.snapshot",
+        "protocol_version": "2",
+        "message_id": str(uuid4()),
+        "payload": {
+            "connection_id": "10000000-0000-4000-8000-000000000001",
+            "fencing_token": "fence-test",
+            "creator_account_id": ACCOUNT_ID,
+            "agent_installation_id": str(INSTALLATION_ID),
+            "agent_stream_id": str(STREAM_ID),
+            **payload,
+        },
+    }
+
+
+def exported_frames(chat_count: int = 3, messages_per_chat: int = 40) -> list[dict]:
+    snapshot_id = str(uuid4())
+    chats = [
+        {
+            "tombstone": False,
+            "chat": {
+                "record_kind": "full",
+                "chat_id": f"chat-{index}",
+                "platform_user_id": f"fan-{index}",
+                "display_name": f"Fan {index}",
+                "updated_at": "2026-07-19T10:00:00Z",
+            },
+        }
+        for index in range(chat_count)
+    ]
+    messages = [
+        {
+            "tombstone": False,
+            "message": {
+                "message_id": f"message-{chat}-{index}",
+                "chat_id": f"chat-{chat}",
+                "sender_platform_user_id": f"fan-{chat}",
+                "text": f"hello {index}",
+                "sent_at": f"2026-07-19T10:{index % 60:02d}:00+02:00",
+                "direction": "inbound",
+            },
+        }
+        for chat in range(chat_count)
+        for index in range(messages_per_chat)
+    ]
+    message_chunks = [messages[start:start + 100] for start in range(0, len(messages), 100)]
+    frames = [
+        envelope(
+            {
+                "snapshot_id": snapshot_id,
+                "frame_kind": "begin",
+                "through_seq": 0,
+                "chunk_count": 1 + len(message_chunks),
+                "record_counts": {
+                    "chats": len(chats),
+                    "messages": len(messages),
+                    "coverage_evidence": 0,
+                },
+                "max_frame_bytes": 524288,
+            }
+        ),
+        envelope(
+            {
+                "snapshot_id": snapshot_id,
+                "frame_kind": "chunk",
+                "chunk_index": 0,
+                "entity_kind": "chat",
+                "records": chats,
+            }
+        ),
+    ]
+    for index, records in enumerate(message_chunks, 1):
+        frames.append(
+            envelope(
+                {
+                    "snapshot_id": snapshot_id,
+                    "frame_kind": "chunk",
+                    "chunk_index": index,
+                    "entity_kind": "message",
+                    "records": records,
+                }
+            )
+        )
+    frames.append(
+        envelope(
+            {
+                "snapshot_id": snapshot_id,
+                "frame_kind": "commit",
+                "chunk_count": 1 + len(message_chunks),
+            }
+        )
+    )
+    return frames
+
+
+def canonical_fingerprint(database) -> dict:
+    with database.read() as connection:
+        return {
+            "heads": [
+                tuple(row)
+                for row in connection.execute(
+                    "SELECT creator_account_id,canonical_revision FROM account_heads"
+                )
+            ],
+            "chunks": [
+                tuple(row)
+                for row in connection.execute(
+                    """SELECT snapshot_id,chunk_index,entity_kind,record_count,fingerprint
+                       FROM snapshot_chunks ORDER BY snapshot_id,chunk_index"""
+                )
+            ],
+            "chats": [
+                tuple(row)
+                for row in connection.execute(
+                    """SELECT chat_id,content_hash,winning_source_seq,is_deleted,merge_epoch
+                       FROM account_chats ORDER BY chat_id"""
+                )
+            ],
+            "messages": [
+                tuple(row)
+                for row in connection.execute(
+                    """SELECT message_id,chat_id,sent_at,content_hash,winning_source_seq,
+                              is_deleted,merge_epoch
+                       FROM account_messages ORDER BY message_id"""
+                )
+            ],
+            "work": [
+                tuple(row)
+                for row in connection.execute(
+                    "SELECT canonical_revision,work_kind,conversation_id FROM projection_work"
+                )
+            ],
+        }
+
+
+def write_export(path: Path, frames: list[dict]) -> Path:
+    path.write_text("\n".join(json.dumps(frame) for frame in frames) + "\n", encoding="utf-8")
+    return path
+
+
+def replay_online(canonical_path: Path, export: Path):
+    """Feed an export through the live per-frame Agent ingestion path."""
+    online = create_canonical_repositories("sqlite", canonical_path=canonical_path)
+    key = StreamKey(ACCOUNT_ID, INSTALLATION_ID, STREAM_ID)
+    for line in export.read_text(encoding="utf-8").splitlines():
+        payload = AGENT_TO_BRAIN_ADAPTER.validate_json(line).payload
+        if payload.frame_kind == "begin":
+            assert online.history.begin_snapshot(key, payload).status == "accepted"
+        elif payload.frame_kind == "chunk":
+            assert online.history.add_snapshot_chunk(key, payload).status == "accepted"
+        else:
+            assert online.history.commit_snapshot(key, payload).status == "accepted"
+    return online
+
+
+def test_offline_import_matches_the_online_snapshot_path(tmp_path: Path) -> None:
+    frames = exported_frames()
+    export = write_export(tmp_path / "export.ndjson", frames)
+
+    online = replay_online(tmp_path / "online" / "canonical.sqlite3", export)
+
+    offline_path = tmp_path / "offline" / "canonical.sqlite3"
+    summary = import_history(offline_path, [export])
+    assert summary.as_dict() == {
+        "frames": len(frames),
+        "snapshots_committed": 1,
+        "snapshots_duplicate": 0,
+        "records": 123,
+        "canonical_revisions": {ACCOUNT_ID: 1},
+    }
+    offline = create_canonical_repositories("sqlite", canonical_path=offline_path)
+    assert canonical_fingerprint(offline.database) == canonical_fingerprint(online.database)
+    assert HistoryAnalyticsSource(offline.history).account_read_model(ACCOUNT_ID) == (
+        HistoryAnalyticsSource(online.history).account_read_model(ACCOUNT_ID)
+    )
+    with offline.database.read() as connection:
+        assert connection.execute(
+            "SELECT 1 FROM sqlite_schema WHERE type='index' AND name='snapshot_messages_by_chat'"
+        ).fetchone() is not None
+        assert connection.execute("PRAGMA synchronous").fetchone()[0] == 2
+    assert not Path(f"{offline_path}-wal").exists() or Path(f"{offline_path}-wal").stat().st_size == 0
+
+    # Replaying the same export is idempotent.
+    again = import_history(offline_path, [export])
+    assert (again.snapshots_committed, again.snapshots_duplicate) == (0, 1)
+
+
+def test_import_cli_accepts_json_array_exports_and_rejects_foreign_frames(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    export = tmp_path / "export.json"
+    export.write_text(json.dumps(exported_frames(chat_count=1, messages_per_chat=2)), encoding="utf-8")
+    canonical_path = tmp_path / "canonical.sqlite3"
+    assert main(["--canonical-path", str(canonical_path), str(export)]) == 0
+    assert json.loads(capsys.readouterr().out)["snapshots_committed"] == 1
+
+    foreign = tmp_path / "foreign.ndjson"
+    frame = envelope({"event_id": str(uuid4()), "source_seq": 1, "acquisition_origin": "signer",
+                      "change": {"type": "chat.delete", "chat_id": "chat-0"}})
+    frame["type"] = "ingest.delta"
+    foreign.write_text(json.dumps(frame) + "\n", encoding="utf-8")
+    with pytest.raises(ImportFailure) as failure:
+        import_history(canonical_path, [foreign])
+    assert failure.value.code == "import_frame_invalid"
+
+
+def test_json_array_exports_are_decoded_incrementally(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    frames = exported_frames(chat_count=2, messages_per_chat=30)
+    export = tmp_path / "export.json"
+    export.write_text(json.dumps(frames, indent=1), encoding="utf-8")
+    # Buffers far smaller than one envelope force every element across reads.
+    monkeypatch.setattr(history_import, "IMPORT_READ_BYTES", 97)
+    documents = list(history_import._frame_documents(export))
+    assert documents == frames
+
+    export.write_text(json.dumps(frames)[:-40], encoding="utf-8")
+    with pytest.raises(ImportFailure) as failure:
+        import_history(tmp_path / "canonical.sqlite3", [export])
+    assert failure.value.code == "import_frame_invalid"
+
+
+def test_import_restores_deferred_indexes_left_by_a_killed_import(tmp_path: Path) -> None:
+    canonical_path = tmp_path / "canonical.sqlite3"
+    repositories = create_canonical_repositories("sqlite", canonical_path=canonical_path)
+    with repositories.database.transaction() as connection:
+        connection.execute("DROP INDEX snapshot_messages_by_chat")
+
+    # A later import that has nothing to stage still repairs the schema.
+    summary = import_history(canonical_path, [write_export(tmp_path / "empty.ndjson", [])])
+    assert summary.frames == 0
+    with repositories.database.read() as connection:
+        assert connection.execute(
+            "SELECT 1 FROM sqlite_schema WHERE type='index' AND name='snapshot_messages_by_chat'"
+        ).fetchone() is not None
+
+
+async def test_import_refuses_while_a_brain_holds_the_canonical_database(tmp_path: Path) -> None:
+    canonical_path = tmp_path / "canonical.sqlite3"
+    export = write_export(tmp_path / "export.ndjson", exported_frames(chat_count=1, messages_per_chat=2))
+    manager = InMemoryTransportManager(
+        create_canonical_repositories("sqlite", canonical_path=canonical_path)
+    )
+    await manager.start()
+    try:
+        with pytest.raises(ImportFailure) as failure:
+            import_history(canonical_path, [export])
+        assert failure.value.code == "import_brain_running"
+    finally:
+        await manager.stop()
+    assert import_history(canonical_path, [export]).snapshots_committed == 1
+
+
+@pytest.mark.slow
+def test_offline_import_outpaces_online_replay(tmp_path: Path) -> None:
+    export = write_export(
+        tmp_path / "export.ndjson", exported_frames(chat_count=100, messages_per_chat=400)
+    )
+    started = time.perf_counter()
+    replay_online(tmp_path / "online" / "canonical.sqlite3", export)
+    online_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    summary = import_history(tmp_path / "offline" / "canonical.sqlite3", [export])
+    offline_seconds = time.perf_counter() - started
+
+    assert summary.records == 40_100
+    print(
+        f"online={online_seconds:.2f}s offline={offline_seconds:.2f}s "
+        f"speedup={online_seconds / offline_seconds:.2f}x"
+    )
+    assert offline_seconds * 1.5 < online_seconds
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from uuid import UUID, uuid4
 
@@ -558,3 +559,298 @@ def test_snapshot_entity_conflict_is_durable_and_idempotent() -> None:
         ).fetchall()
     assert [tuple(row) for row in rows] == [("message", "message-1", 0)]
     assert history.checkpoint(repair_key) is None
+
+
+def stage_snapshot(history, key: StreamKey, chats: list[dict], messages: list[dict]) -> UUID:
+    snapshot_id = uuid4()
+    stream_id = key.agent_stream_id
+    assert history.begin_snapshot(
+        key,
+        begin(snapshot_id, stream_id=stream_id, chats=len(chats), messages=len(messages)),
+    ).status == "accepted"
+    assert history.add_snapshot_chunk(
+        key,
+        chunk(snapshot_id, 0, "chat", [{"tombstone": False, "chat": item} for item in chats], stream_id=stream_id),
+    ).status == "accepted"
+    assert history.add_snapshot_chunk(
+        key,
+        chunk(snapshot_id, 1, "message", [{"tombstone": False, "message": item} for item in messages], stream_id=stream_id),
+    ).status == "accepted"
+    return snapshot_id
+
+
+def visible_message_ids(history) -> set[str]:
+    from app.analytics.canonical_source import HistoryAnalyticsSource
+
+    model = HistoryAnalyticsSource(history).account_read_model(ACCOUNT_ID)
+    return {
+        item["message_id"]
+        for conversation in model.conversations.values()
+        for item in conversation["messages"]
+    }
+
+
+def test_snapshot_merge_slices_interleave_live_deltas_and_publish_atomically() -> None:
+    repositories = create_canonical_repositories("memory")
+    history = repositories.history
+    history.merge_slice_rows = 2
+    live_key, _ = commit_base_snapshot(history)
+    repair_stream = uuid4()
+    repair_key = StreamKey(ACCOUNT_ID, INSTALLATION_ID, repair_stream)
+    staged = [raw_message(f"staged-{index}", f"chat-{index % 3}") for index in range(7)]
+    snapshot_id = stage_snapshot(
+        history,
+        repair_key,
+        [chat(f"chat-{index}") for index in range(3)],
+        staged,
+    )
+
+    slice_once = history._merge_snapshot_slice
+    observed: list[set[str]] = []
+
+    def slice_and_deliver_live(*args):
+        more = slice_once(*args)
+        sequence = len(observed) + 1
+        assert history.commit_delta(
+            live_key,
+            delta(sequence, {"type": "message.upsert", "message": raw_message(f"live-{sequence}")}),
+        ).status == "accepted"
+        observed.append(visible_message_ids(history))
+        return more
+
+    history._merge_snapshot_slice = slice_and_deliver_live
+    result = history.commit_snapshot(repair_key, commit(snapshot_id, 2, stream_id=repair_stream))
+
+    assert result.status == "accepted" and result.canonical_revision is not None
+    # 2 chat slices + 4 message slices, each followed by a committed live delta
+    # that never observed partially merged snapshot material.
+    assert len(observed) == 6
+    for sequence, visible in enumerate(observed, 1):
+        assert visible == {"message-1", *(f"live-{index}" for index in range(1, sequence + 1))}
+    assert visible_message_ids(history) == {
+        "message-1",
+        *(f"live-{index}" for index in range(1, 7)),
+        *(item["message_id"] for item in staged),
+    }
+    with repositories.database.read() as connection:
+        merge = connection.execute(
+            """SELECT state,merged_chats,merged_messages,slice_count
+               FROM snapshot_merges WHERE snapshot_id=?""",
+            (str(snapshot_id),),
+        ).fetchone()
+        unsettled = connection.execute(
+            "SELECT COUNT(*) FROM account_messages WHERE merge_epoch IS NOT NULL"
+        ).fetchone()[0]
+    assert tuple(merge) == ("settled", 2, 7, 6)
+    assert unsettled == 0
+
+
+def test_interrupted_snapshot_merge_resumes_from_durable_cursor() -> None:
+    repositories = create_canonical_repositories("memory")
+    history = repositories.history
+    history.merge_slice_rows = 2
+    commit_base_snapshot(history)
+    repair_stream = uuid4()
+    repair_key = StreamKey(ACCOUNT_ID, INSTALLATION_ID, repair_stream)
+    staged = [raw_message(f"staged-{index}") for index in range(5)]
+    snapshot_id = stage_snapshot(history, repair_key, [chat()], staged)
+
+    slice_once = history._merge_snapshot_slice
+    calls = 0
+
+    def crash_after_two_slices(*args):
+        nonlocal calls
+        calls += 1
+        if calls > 2:
+            raise OSError("simulated worker crash")
+        return slice_once(*args)
+
+    history._merge_snapshot_slice = crash_after_two_slices
+    with pytest.raises(OSError):
+        history.commit_snapshot(repair_key, commit(snapshot_id, 2, stream_id=repair_stream))
+    assert visible_message_ids(history) == {"message-1"}
+    assert history.pending_snapshot(repair_key) == (snapshot_id, 2)
+    with repositories.database.read() as connection:
+        progress = connection.execute(
+            "SELECT state,phase,cursor,merged_messages FROM snapshot_merges WHERE snapshot_id=?",
+            (str(snapshot_id),),
+        ).fetchone()
+    assert tuple(progress) == ("merging", "messages", "staged-1", 2)
+
+    history._merge_snapshot_slice = slice_once
+    result = history.commit_snapshot(repair_key, commit(snapshot_id, 2, stream_id=repair_stream))
+    assert result.status == "accepted"
+    assert visible_message_ids(history) == {"message-1", *(item["message_id"] for item in staged)}
+    with repositories.database.read() as connection:
+        merges = connection.execute(
+            """SELECT COUNT(*),MAX(state),MAX(merged_messages),MAX(slice_count)
+               FROM snapshot_merges WHERE snapshot_id=?""",
+            (str(snapshot_id),),
+        ).fetchone()
+    assert tuple(merges) == (1, "settled", 5, 4)
+
+
+def test_live_delete_mid_merge_wins_over_unpublished_staged_copy() -> None:
+    repositories = create_canonical_repositories("memory")
+    history = repositories.history
+    history.merge_slice_rows = 2
+    live_key, _ = commit_base_snapshot(
+        history,
+        chats=[chat("chat-1"), chat("chat-2")],
+        messages=[raw_message("message-1", "chat-1")],
+    )
+    repair_stream = uuid4()
+    repair_key = StreamKey(ACCOUNT_ID, INSTALLATION_ID, repair_stream)
+    staged = [raw_message(f"staged-{index}", "chat-2") for index in range(4)]
+    snapshot_id = stage_snapshot(history, repair_key, [chat("chat-1"), chat("chat-2")], staged)
+
+    slice_once = history._merge_snapshot_slice
+    calls = 0
+
+    def slice_then_delete(*args):
+        nonlocal calls
+        more = slice_once(*args)
+        calls += 1
+        if calls == 3:
+            # staged-0 is staged under chat-2 but not yet published; the live
+            # tombstone names chat-1 and must not collide with it.
+            assert history.commit_delta(
+                live_key,
+                delta(1, {"type": "message.delete", "message_id": "staged-0", "chat_id": "chat-1"}),
+            ).status == "accepted"
+        return more
+
+    history._merge_snapshot_slice = slice_then_delete
+    result = history.commit_snapshot(repair_key, commit(snapshot_id, 2, stream_id=repair_stream))
+
+    assert result.status == "accepted"
+    assert visible_message_ids(history) == {"message-1", "staged-1", "staged-2", "staged-3"}
+
+
+def test_startup_recovers_merge_abandoned_by_a_dead_worker() -> None:
+    repositories = create_canonical_repositories("memory")
+    history = repositories.history
+    history.merge_slice_rows = 2
+    commit_base_snapshot(history)
+    repair_stream = uuid4()
+    repair_key = StreamKey(ACCOUNT_ID, INSTALLATION_ID, repair_stream)
+    staged = [raw_message(f"staged-{index}") for index in range(5)]
+    snapshot_id = stage_snapshot(history, repair_key, [chat()], staged)
+
+    slice_once = history._merge_snapshot_slice
+    release_once = history._release_snapshot_merge
+    calls = 0
+
+    def killed_after_two_slices(*args):
+        nonlocal calls
+        calls += 1
+        if calls > 2:
+            raise OSError("simulated process kill")
+        return slice_once(*args)
+
+    # A killed process never releases its lease.
+    history._merge_snapshot_slice = killed_after_two_slices
+    history._release_snapshot_merge = lambda *args: None
+    with pytest.raises(OSError):
+        history.commit_snapshot(repair_key, commit(snapshot_id, 2, stream_id=repair_stream))
+    history._merge_snapshot_slice = slice_once
+    history._release_snapshot_merge = release_once
+
+    busy = history.commit_snapshot(repair_key, commit(snapshot_id, 2, stream_id=repair_stream))
+    assert busy.status == "rejected" and busy.retryable
+    assert history.recover_snapshot_merges() == 0
+    assert visible_message_ids(history) == {"message-1"}
+
+    with repositories.database.transaction() as connection:
+        connection.execute(
+            "UPDATE snapshot_merges SET lease_expires_at=? WHERE state='merging'",
+            ("2000-01-01T00:00:00+00:00",),
+        )
+    assert history.recover_snapshot_merges() == 1
+    assert visible_message_ids(history) == {"message-1", *(item["message_id"] for item in staged)}
+    assert history.pending_snapshot(repair_key) is None
+    with repositories.database.read() as connection:
+        merges = connection.execute(
+            """SELECT COUNT(*),MAX(state),MAX(merged_messages),MAX(owner)
+               FROM snapshot_merges WHERE snapshot_id=?""",
+            (str(snapshot_id),),
+        ).fetchone()
+        leftovers = connection.execute(
+            "SELECT COUNT(*) FROM snapshot_message_records WHERE snapshot_id=?",
+            (str(snapshot_id),),
+        ).fetchone()[0]
+    assert tuple(merges) == (1, "settled", 5, None)
+    assert leftovers == 0
+
+
+def test_retention_folds_acknowledged_raw_events_and_purges_expired_staging() -> None:
+    repositories = create_canonical_repositories("memory")
+    history = repositories.history
+    live_key, _ = commit_base_snapshot(history)
+    for sequence in range(1, 6):
+        assert history.commit_delta(
+            live_key,
+            delta(sequence, {"type": "message.upsert", "message": raw_message(f"live-{sequence}")}),
+        ).status == "accepted"
+    abandoned_key = StreamKey(ACCOUNT_ID, INSTALLATION_ID, uuid4())
+    stage_snapshot(history, abandoned_key, [chat("chat-2")], [raw_message("staged", "chat-2")])
+    repair_stream = uuid4()
+    _, superseded_id = commit_base_snapshot(history, stream_id=repair_stream)
+    _, latest_id = commit_base_snapshot(history, stream_id=repair_stream)
+    later = datetime.now(timezone.utc) + timedelta(days=2)
+
+    def counts(connection) -> dict[str, int]:
+        return {
+            table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("raw_ingest_events", "snapshot_uploads", "snapshot_chunks")
+        }
+
+    # Projection has not acknowledged the events yet, so none are folded;
+    # expired staging does not wait for projection.
+    blocked = history.compact_ingest_history(horizon=timedelta(days=1), now=later, limit=100)
+    assert blocked.folded_events == 0 and blocked.purged_uploads == 2
+    with repositories.database.read() as connection:
+        assert counts(connection)["raw_ingest_events"] == 5
+
+    repositories.projection.advance(ACCOUNT_ID)
+    batches = [blocked]
+    while (batch := history.compact_ingest_history(
+        horizon=timedelta(days=1), now=later, limit=2
+    )).total:
+        assert batch.total <= 2
+        batches.append(batch)
+    assert sum(batch.folded_events for batch in batches) == 5
+    assert sum(batch.purged_uploads for batch in batches) == 2
+
+    with repositories.database.read() as connection:
+        remaining = counts(connection)
+        fold = connection.execute(
+            """SELECT folded_through_seq,folded_event_count FROM raw_ingest_folds
+                WHERE agent_stream_id=?""",
+            (str(STREAM_ID),),
+        ).fetchone()
+        uploads = {
+            str(row[0])
+            for row in connection.execute(
+                "SELECT snapshot_id FROM snapshot_uploads WHERE agent_stream_id=?",
+                (str(repair_stream),),
+            )
+        }
+        auto_vacuum = connection.execute("PRAGMA auto_vacuum").fetchone()[0]
+    assert remaining["raw_ingest_events"] == 0
+    assert tuple(fold) == (5, 5)
+    # The latest committed snapshot of each stream keeps its chunk fingerprints.
+    assert uploads == {str(latest_id)}
+    assert superseded_id != latest_id
+    assert history.pending_snapshot(abandoned_key) is None
+    assert auto_vacuum == 2
+    assert repositories.database.incremental_vacuum(1024) >= 0
+
+    # A redelivered folded event is still a duplicate; new events still commit.
+    assert history.commit_delta(
+        live_key, delta(3, {"type": "message.upsert", "message": raw_message("live-3")})
+    ).status == "duplicate"
+    assert history.commit_delta(
+        live_key, delta(6, {"type": "message.upsert", "message": raw_message("live-6")})
+    ).status == "accepted"
+    assert visible_message_ids(history) >= {f"live-{index}" for index in range(1, 7)}
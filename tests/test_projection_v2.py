@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import signal
 import threading
 import time
 import tracemalloc
@@ -11,14 +12,21 @@ from uuid import UUID, uuid4
 
 import pytest
 
-from app.persistence.factory import CanonicalRepositories, create_canonical_repositories
+from app.persistence.factory import (
+    CanonicalRepositories,
+    create_canonical_repositories,
+    create_sharded_canonical_repositories,
+)
 from app.persistence.history import (
     CONVERSATION_BATCH_SIZE,
     PROJECTION_BATCH_SIZE,
+    ProjectionCursorStale,
     StreamKey,
 )
+from app.persistence.migrations import MigrationLockError, canonical_writer_lock
 from app.persistence.projection_pipeline import DeterministicProjectionPipeline
-from app.protocol import AGENT_TO_BRAIN_ADAPTER
+from app.persistence.projection_worker import ProjectionWorkerProcess
+from app.protocol import AGENT_TO_BRAIN_ADAPTER, BRIDGE_DEFLATE_ENCODING, BRIDGE_JSON_ENCODING
 from app.transport.manager import InMemoryTransportManager
 
 
@@ -456,6 +464,232 @@ def test_projection_slots_alternate_and_replay_lagging_work() -> None:
     assert {item["message_id"] for item in chat_two} == {"message-2", "message-4"}
 
 
+def test_lagging_slot_copies_changed_conversations_and_the_compactor_folds_them() -> None:
+    repositories = create_canonical_repositories("memory")
+
+    def slot_messages(slot: int) -> dict[str, set[str]]:
+        with repositories.projection_database.read() as connection:
+            rows = connection.execute(
+                """SELECT conversation_id,message_id FROM projection_messages
+                    WHERE creator_account_id=? AND projection_slot=?""",
+                (ACCOUNT, slot),
+            ).fetchall()
+        messages: dict[str, set[str]] = {}
+        for row in rows:
+            messages.setdefault(str(row[0]), set()).add(str(row[1]))
+        return messages
+
+    def overrides() -> set[tuple[int, str]]:
+        with repositories.projection_database.read() as connection:
+            return {
+                (int(row[0]), str(row[1]))
+                for row in connection.execute(
+                    """SELECT projection_slot,conversation_id FROM projection_slot_overrides
+                        WHERE creator_account_id=?""",
+                    (ACCOUNT,),
+                )
+            }
+
+    key = commit_seed(
+        repositories,
+        chats=[chat("chat-1"), chat("chat-2"), chat("chat-3")],
+        messages=[
+            raw_message("message-1", "chat-1"),
+            raw_message("message-2", "chat-2"),
+            raw_message("message-3", "chat-3"),
+        ],
+    )
+    assert repositories.projection.advance(ACCOUNT) is not None
+    commit_message_delta(
+        repositories, key, sequence=1, origin="passive", message=raw_message("message-4", "chat-1")
+    )
+    assert repositories.projection.advance(ACCOUNT) is not None
+    second = repositories.projection.active_generation(ACCOUNT)
+    assert second is not None
+    with repositories.projection_database.read() as connection:
+        second_slot = int(
+            connection.execute(
+                """SELECT projection_slot FROM projection_accounts
+                    WHERE creator_account_id=? AND generation_id=?""",
+                (ACCOUNT, second["generation_id"]),
+            ).fetchone()[0]
+        )
+    lagging_slot = 1 - second_slot
+    assert overrides() == {(lagging_slot, "chat-1")}
+
+    # The third generation copies chat-1 forward from the active slot and runs
+    # only the newly changed chat-2 through the pipeline.
+    tracker = TrackingPipeline()
+    repositories.projection.pipeline = tracker
+    commit_message_delta(
+        repositories, key, sequence=2, origin="signer", message=raw_message("message-5", "chat-2")
+    )
+    assert repositories.projection.advance(ACCOUNT) is not None
+    assert tracker.conversation_ids == {"chat-2"}
+    assert slot_messages(lagging_slot) == {
+        "chat-1": {"message-1", "message-4"},
+        "chat-2": {"message-2", "message-5"},
+        "chat-3": {"message-3"},
+    }
+    assert overrides() == {(second_slot, "chat-2")}
+    assert slot_messages(second_slot)["chat-2"] == {"message-2"}
+
+    assert repositories.projection.compact_overlays(ACCOUNT) == 1
+    assert repositories.projection.compact_overlays(ACCOUNT) == 0
+    assert overrides() == set()
+    assert slot_messages(second_slot) == slot_messages(lagging_slot)
+
+    # With the overlay already folded the next build copies nothing further.
+    tracker.conversation_ids.clear()
+    commit_message_delta(
+        repositories, key, sequence=3, origin="passive", message=raw_message("message-6", "chat-3")
+    )
+    assert repositories.projection.advance(ACCOUNT) is not None
+    assert tracker.conversation_ids == {"chat-3"}
+    assert slot_messages(second_slot)["chat-3"] == {"message-3", "message-6"}
+    assert overrides() == {(lagging_slot, "chat-3")}
+
+
+def test_reseed_reprojects_only_messages_whose_source_hash_changed() -> None:
+    repositories = create_canonical_repositories("memory")
+    messages = [raw_message(f"message-{index}") for index in range(1, 21)]
+    key = commit_seed(repositories, messages=messages)
+    assert repositories.projection.advance(ACCOUNT) is not None
+    commit_message_delta(
+        repositories, key, sequence=1, origin="passive", message=raw_message("message-21")
+    )
+    assert repositories.projection.advance(ACCOUNT) is not None
+    assert repositories.projection.compact_overlays(ACCOUNT) == 1
+
+    tracker = TrackingPipeline()
+    repositories.projection.pipeline = tracker
+    commit_seed(
+        repositories,
+        messages=[*messages, raw_message("message-21"), raw_message("message-22")],
+        stream_id=UUID("30000000-0000-4000-8000-000000000077"),
+    )
+    assert repositories.projection.advance(ACCOUNT) is not None
+
+    assert tracker.max_messages == 1
+    with repositories.projection_database.read() as connection:
+        log = connection.execute(
+            """SELECT change_kind,messages_written,messages_skipped
+                 FROM projection_change_log WHERE creator_account_id=?
+                ORDER BY read_revision DESC LIMIT 1""",
+            (ACCOUNT,),
+        ).fetchone()
+    assert tuple(log) == ("reseed", 1, 21)
+    items, _, _ = repositories.projection.message_rows(ACCOUNT, "chat-1", before=None, limit=50)
+    assert {item["message_id"] for item in items} == {
+        f"message-{index}" for index in range(1, 23)
+    }
+
+
+def test_message_work_is_applied_as_point_writes_without_reading_the_thread() -> None:
+    repositories = create_canonical_repositories("memory")
+    messages = [raw_message(f"message-{index:03d}") for index in range(300)]
+    key = commit_seed(repositories, messages=messages)
+    assert repositories.projection.advance(ACCOUNT) is not None
+
+    def last_counts() -> tuple:
+        with repositories.projection_database.read() as connection:
+            return tuple(
+                connection.execute(
+                    """SELECT change_kind,messages_written,messages_skipped
+                         FROM projection_change_log WHERE creator_account_id=?
+                        ORDER BY read_revision DESC LIMIT 1""",
+                    (ACCOUNT,),
+                ).fetchone()
+            )
+
+    tracker = TrackingPipeline()
+    repositories.projection.pipeline = tracker
+    latest = {**raw_message("message-300"), "sent_at": "2026-07-19T11:00:00Z"}
+    commit_message_delta(repositories, key, sequence=1, origin="passive", message=latest)
+    assert repositories.projection.advance(ACCOUNT) is not None
+    assert last_counts() == ("incremental", 1, 0)
+    assert tracker.max_messages == 1
+    summary = repositories.projection.snapshot(ACCOUNT)["conversations"][0]
+    assert summary["latest_message"]["message_id"] == "message-300"
+
+    deletion = envelope(
+        "ingest.delta",
+        {
+            **identity(key.agent_stream_id),
+            "event_id": str(uuid4()),
+            "source_seq": 2,
+            "acquisition_origin": "passive",
+            "change": {"type": "message.delete", "message_id": "message-300", "chat_id": "chat-1"},
+        },
+    )
+    assert repositories.history.commit_delta(key, deletion).status == "accepted"
+    renamed = {**chat("chat-1"), "display_name": "Renamed", "updated_at": "2026-07-19T12:00:00Z"}
+    rename = envelope(
+        "ingest.delta",
+        {
+            **identity(key.agent_stream_id),
+            "event_id": str(uuid4()),
+            "source_seq": 3,
+            "acquisition_origin": "passive",
+            "change": {"type": "chat.upsert", "chat": renamed},
+        },
+    )
+    assert repositories.history.commit_delta(key, rename).status == "accepted"
+    with repositories.database.read() as connection:
+        scopes = [
+            tuple(row)
+            for row in connection.execute(
+                """SELECT work_scope,message_id FROM projection_work
+                    WHERE creator_account_id=? ORDER BY work_id""",
+                (ACCOUNT,),
+            )
+        ]
+    assert scopes[-3:] == [
+        ("message_upsert", "message-300"),
+        ("message_tombstone", "message-300"),
+        ("summary", None),
+    ]
+    assert repositories.projection.advance(ACCOUNT) is not None
+    assert last_counts() == ("incremental", 1, 0)
+    summary = repositories.projection.snapshot(ACCOUNT)["conversations"][0]
+    assert summary["display_name"] == "Renamed"
+    assert summary["latest_message"]["message_id"] == "message-299"
+
+    # The lagging slot is patched with the same handful of rows.
+    with repositories.projection_database.read() as connection:
+        partial = connection.execute(
+            """SELECT o.whole_conversation,COUNT(m.message_id)
+                 FROM projection_slot_overrides o
+                 LEFT JOIN projection_slot_message_overrides m
+                   ON m.creator_account_id=o.creator_account_id
+                  AND m.projection_slot=o.projection_slot
+                  AND m.conversation_id=o.conversation_id
+                WHERE o.creator_account_id=? GROUP BY o.conversation_id""",
+            (ACCOUNT,),
+        ).fetchall()
+    assert [tuple(row) for row in partial] == [(0, 1)]
+    assert repositories.projection.compact_overlays(ACCOUNT) == 1
+    with repositories.projection_database.read() as connection:
+        slots = [
+            connection.execute(
+                """SELECT COUNT(*),MAX(message_id) FROM projection_messages
+                    WHERE creator_account_id=? AND projection_slot=?""",
+                (ACCOUNT, slot),
+            ).fetchone()
+            for slot in (0, 1)
+        ]
+        summaries = {
+            str(row[0])
+            for row in connection.execute(
+                """SELECT document_json FROM conversation_summaries
+                    WHERE creator_account_id=?""",
+                (ACCOUNT,),
+            )
+        }
+    assert tuple(slots[0]) == tuple(slots[1]) == (300, "message-299")
+    assert len(summaries) == 1
+
+
 def test_projection_slots_are_account_partitioned() -> None:
     other_account = "projection-account-2"
     repositories = create_canonical_repositories("memory")
@@ -561,6 +795,76 @@ def test_reseed_keeps_prior_slot_readable_until_recovery_activation() -> None:
         ) == 2
 
 
+def test_catch_up_totals_come_from_counters_that_the_auditor_reconciles() -> None:
+    repositories = create_canonical_repositories("memory")
+    outbound = {**raw_message("message-2", "chat-2"), "direction": "outbound", "text": "héllo"}
+    key = commit_seed(
+        repositories,
+        chats=[chat("chat-1"), chat("chat-2")],
+        messages=[raw_message("message-1", "chat-1"), outbound],
+    )
+    commit_message_delta(
+        repositories, key, sequence=1, origin="passive", message=raw_message("message-3")
+    )
+    deletion = envelope(
+        "ingest.delta",
+        {
+            **identity(key.agent_stream_id),
+            "event_id": str(uuid4()),
+            "source_seq": 2,
+            "acquisition_origin": "passive",
+            "change": {"type": "message.delete", "message_id": "message-2", "chat_id": "chat-2"},
+        },
+    )
+    assert repositories.history.commit_delta(key, deletion).status == "accepted"
+
+    def recount() -> dict[str, tuple[int, int, int, int]]:
+        with repositories.database.read() as connection:
+            return {
+                str(row[0]): tuple(row[1:])
+                for row in connection.execute(
+                    """SELECT chat_id,COUNT(*),SUM(direction='inbound'),
+                              SUM(direction='outbound'),SUM(length(CAST(text AS BLOB)))
+                         FROM account_messages WHERE is_deleted=0 GROUP BY chat_id"""
+                )
+            }
+
+    def counters() -> tuple[tuple, dict[str, tuple[int, int, int, int]]]:
+        with repositories.database.read() as connection:
+            account = connection.execute(
+                """SELECT chat_count,message_count,inbound_count,outbound_count,text_bytes
+                     FROM account_message_counters WHERE creator_account_id=?""",
+                (ACCOUNT,),
+            ).fetchone()
+            conversations = {
+                str(row[0]): tuple(row[1:])
+                for row in connection.execute(
+                    """SELECT chat_id,message_count,inbound_count,outbound_count,text_bytes
+                         FROM conversation_message_counters WHERE message_count>0"""
+                )
+            }
+        return tuple(account), conversations
+
+    assert counters() == ((2, 2, 2, 0, 28), recount())
+    assert repositories.projection.catch_up(ACCOUNT) is not None
+    with repositories.projection_database.read() as connection:
+        analytics = json.loads(
+            connection.execute("SELECT document_json FROM projection_analytics").fetchone()[0]
+        )
+    assert analytics["total_conversations"]["value"] == 2
+    assert analytics["total_messages"]["value"] == 2
+    assert analytics["outbound_messages"]["value"] == 0
+
+    with repositories.database.transaction() as connection:
+        connection.execute(
+            "UPDATE conversation_message_counters SET message_count=99 WHERE chat_id='chat-1'"
+        )
+        connection.execute("UPDATE account_message_counters SET chat_count=7")
+    assert repositories.history.reconcile_message_counters(ACCOUNT) == 2
+    assert counters() == ((2, 2, 2, 0, 28), recount())
+    assert repositories.history.reconcile_message_counters(ACCOUNT) == 0
+
+
 def test_manager_start_resumes_durable_projection_work_without_new_ingest() -> None:
     repositories = create_canonical_repositories("memory")
     commit_seed(repositories, messages=[raw_message("message-1")])
@@ -581,6 +885,56 @@ def test_manager_start_resumes_durable_projection_work_without_new_ingest() -> N
     assert [item["conversation_id"] for item in snapshot["conversations"]] == ["chat-1"]
 
 
+def test_sharded_manager_routes_each_account_to_its_own_shard(tmp_path) -> None:
+    other_account = "projection-account-2"
+    primary = create_canonical_repositories(
+        "sqlite", canonical_path=tmp_path / "canonical.sqlite3"
+    )
+    shards = create_sharded_canonical_repositories(tmp_path / "shards")
+    commit_seed(shards.for_account(ACCOUNT), messages=[raw_message("message-1")])
+    manager = InMemoryTransportManager(primary, shards=shards)
+    assert manager.history_for(ACCOUNT) is shards.for_account(ACCOUNT).history
+    # A shard opened after the manager exists is routed and maintained too.
+    second_key = commit_seed(
+        manager.repositories_for(other_account),
+        chats=[chat("chat-2")],
+        messages=[raw_message("message-2", "chat-2")],
+        stream_id=UUID("30000000-0000-4000-8000-000000000099"),
+        account_id=other_account,
+    )
+
+    async def exercise() -> None:
+        await manager.start()
+        for account_id in (ACCOUNT, other_account):
+            task = manager._projection_tasks.get(account_id)
+            assert task is not None
+            await task
+        for account_id in (ACCOUNT, other_account):
+            with pytest.raises(MigrationLockError):
+                with canonical_writer_lock(manager.repositories_for(account_id).database):
+                    pass
+        await manager.stop()
+
+    asyncio.run(exercise())
+    assert [
+        item["conversation_id"]
+        for item in manager.state_snapshot_payload(ACCOUNT)["conversations"]
+    ] == ["chat-1"]
+    assert [
+        item["conversation_id"]
+        for item in manager.state_snapshot_payload(other_account)["conversations"]
+    ] == ["chat-2"]
+    assert manager.history_for(other_account).checkpoint(second_key) == 0
+    assert primary.history.account_ids() == []
+    maintained = {report.path for report in manager.maintenance.run()}
+    for account_id in (ACCOUNT, other_account):
+        repositories = shards.for_account(account_id)
+        assert {
+            repositories.database.path,
+            repositories.projection_database.path,
+        } <= maintained
+
+
 def test_manager_start_finishes_a_committed_projection_activation_intent() -> None:
     repositories = create_canonical_repositories("memory")
     commit_seed(repositories, messages=[raw_message("message-1")])
@@ -616,6 +970,45 @@ def test_manager_start_finishes_a_committed_projection_activation_intent() -> No
     assert repositories.projection.snapshot(ACCOUNT)["view_revision"] == initial["view_revision"]
 
 
+def test_projection_worker_process_advances_and_survives_a_killed_worker() -> None:
+    repositories = create_canonical_repositories("memory")
+    key = commit_seed(repositories, messages=[raw_message("message-1")])
+    worker = ProjectionWorkerProcess(
+        repositories.database.path, repositories.projection_database.path
+    )
+    manager = InMemoryTransportManager(repositories, projection_worker=worker)
+
+    async def exercise() -> None:
+        await manager.start()
+        task = manager._projection_tasks.get(ACCOUNT)
+        assert task is not None
+        first = await task
+        assert first is not None
+        pid = worker.pid
+        assert pid is not None and pid != os.getpid()
+
+        # Killing the worker leaves the new work incomplete in projection_work;
+        # the supervisor restarts it and the replacement finishes the work.
+        os.kill(pid, signal.SIGKILL)
+        commit_message_delta(
+            repositories,
+            key,
+            sequence=1,
+            origin="passive",
+            message=raw_message("message-2"),
+        )
+        assert await manager.project_committed_state(ACCOUNT) == first + 1
+        assert worker.pid not in {None, pid}
+        await manager.stop()
+        assert worker.pid is None
+
+    asyncio.run(exercise())
+    assert repositories.projection.pending_accounts() == []
+    snapshot = repositories.projection.snapshot(ACCOUNT)
+    assert snapshot["projection"]["status"] == "current"
+    assert snapshot["conversations"][0]["latest_message"]["message_id"] == "message-2"
+
+
 class BlockingPipeline:
     def __init__(self) -> None:
         self.delegate = DeterministicProjectionPipeline()
@@ -679,6 +1072,9 @@ class _RecordingBridge:
     async def send_text(self, text: str) -> None:
         self._sent.append(json.loads(text))
 
+    async def send_bytes(self, data: bytes) -> None:
+        self._sent.append(json.loads(BRIDGE_DEFLATE_ENCODING.decode(data)))
+
     async def close(self, code: int, reason: str) -> None:  # pragma: no cover - unused
         pass
 
@@ -715,6 +1111,7 @@ def test_projection_catch_up_rebroadcasts_recovered_system_state() -> None:
         sent.clear()
         # The commit handler serializes durable projection work per account.
         await manager.schedule_projection(ACCOUNT)
+        await manager.drain_bridges()
 
     asyncio.run(exercise())
 
@@ -728,6 +1125,272 @@ def test_projection_catch_up_rebroadcasts_recovered_system_state() -> None:
     assert system["payload"]["readiness"] in {"ready", "degraded"}
 
 
+def test_state_delta_covers_change_log_range_and_falls_back_when_uncovered() -> None:
+    repositories = create_canonical_repositories("memory")
+    key = commit_seed(
+        repositories,
+        chats=[chat("chat-1"), chat("chat-2")],
+        messages=[raw_message("message-1")],
+    )
+    initial = repositories.projection.catch_up(ACCOUNT)
+    assert initial is not None
+    base = initial["view_revision"]
+    for sequence, message_id in enumerate(("message-2", "message-3"), start=1):
+        commit_message_delta(
+            repositories,
+            key,
+            sequence=sequence,
+            origin="passive",
+            message=raw_message(message_id),
+        )
+        assert repositories.projection.advance(ACCOUNT) == base + sequence
+
+    delta = repositories.projection.state_delta(ACCOUNT, base, max_changes=100)
+    assert delta is not None
+    assert delta["base_view_revision"] == base
+    assert delta["view_revision"] == base + 2
+    assert [change["type"] for change in delta["changes"]] == [
+        "conversation.upsert",
+        "analytics.replace",
+        "coverage.replace",
+        "projection.replace",
+        "live_freshness.replace",
+    ]
+    assert delta["changes"][0]["conversation"]["conversation_id"] == "chat-1"
+    snapshot = repositories.projection.snapshot(ACCOUNT)
+    assert delta["changes"][0]["conversation"] == snapshot["conversations"][0]
+    assert delta["changes"][1]["analytics"] == snapshot["analytics"]
+    scoped = repositories.projection.state_delta(
+        ACCOUNT, base, max_changes=100, conversation_ids=frozenset({"chat-2"})
+    )
+    assert scoped is not None
+    assert "conversation.upsert" not in [change["type"] for change in scoped["changes"]]
+    assert [
+        item["conversation_id"]
+        for item in repositories.projection.snapshot(
+            ACCOUNT, conversation_ids=frozenset({"chat-2", "missing"})
+        )["conversations"]
+    ] == ["chat-2"]
+
+    # The seed revision was a reseed, so it has no delta form.
+    assert repositories.projection.state_delta(ACCOUNT, base - 1, max_changes=100) is None
+    assert repositories.projection.state_delta(ACCOUNT, base, max_changes=4) is None
+    assert repositories.projection.state_delta(ACCOUNT, base + 2, max_changes=100) is None
+
+
+def test_projection_worker_sends_deltas_to_current_bridges_and_snapshots_to_unknown() -> None:
+    repositories = create_canonical_repositories("memory")
+    key = commit_seed(repositories, messages=[raw_message("message-1")])
+    initial = repositories.projection.catch_up(ACCOUNT)
+    assert initial is not None
+    manager = InMemoryTransportManager(repositories)
+    current: list[dict] = []
+    unknown: list[dict] = []
+
+    async def exercise() -> None:
+        binding = await manager.bind_bridge(
+            _RecordingBridge(current),
+            principal_id="principal",
+            creator_account_id=ACCOUNT,
+            bridge_session_id=uuid4(),
+        )
+        await manager.queue_bridge(
+            binding, "state.snapshot", manager.state_snapshot_payload(ACCOUNT)
+        )
+        # A Bridge that never received a revision can only be given a snapshot.
+        await manager.bind_bridge(
+            _RecordingBridge(unknown),
+            principal_id="principal",
+            creator_account_id=ACCOUNT,
+            bridge_session_id=uuid4(),
+        )
+        commit_message_delta(
+            repositories,
+            key,
+            sequence=1,
+            origin="passive",
+            message=raw_message("message-2"),
+        )
+        await manager.drain_bridges()
+        current.clear()
+        unknown.clear()
+        await manager.schedule_projection(ACCOUNT)
+        await manager.drain_bridges()
+
+    asyncio.run(exercise())
+
+    delta = next(message for message in current if message["type"] == "state.delta")
+    assert "state.snapshot" not in [message["type"] for message in current]
+    assert delta["payload"]["base_view_revision"] == initial["view_revision"]
+    assert delta["payload"]["view_revision"] == initial["view_revision"] + 1
+    snapshot = next(message for message in unknown if message["type"] == "state.snapshot")
+    assert snapshot["payload"]["view_revision"] == initial["view_revision"] + 1
+
+
+def test_reconnecting_bridges_share_one_serialized_snapshot_per_projection_version() -> None:
+    repositories = create_canonical_repositories("memory")
+    key = commit_seed(repositories, messages=[raw_message("message-1")])
+    assert repositories.projection.catch_up(ACCOUNT) is not None
+    manager = InMemoryTransportManager(repositories)
+    render = repositories.projection.versioned_snapshot
+    summary_reads: list[tuple] = []
+    reader_threads: set[int] = set()
+
+    def counting_snapshot(account_id, **kwargs):
+        reader_threads.add(threading.get_ident())
+        payload, version = render(account_id, **kwargs)
+        # Only the manager's cache passes cached_version; catch_up renders too.
+        if "cached_version" in kwargs and version != kwargs["cached_version"]:
+            summary_reads.append(version)
+        return payload, version
+
+    repositories.projection.versioned_snapshot = counting_snapshot
+    sent: list[dict] = []
+
+    async def reconnect(count: int) -> None:
+        for index in range(count):
+            binding = await manager.bind_bridge(
+                _RecordingBridge(sent),
+                principal_id="principal",
+                creator_account_id=ACCOUNT,
+                bridge_session_id=uuid4(),
+                encoding=BRIDGE_DEFLATE_ENCODING if index % 2 else BRIDGE_JSON_ENCODING,
+            )
+            await manager.queue_bridge_snapshot(binding)
+        await manager.drain_bridges()
+
+    asyncio.run(reconnect(4))
+
+    # Snapshot reads never run on the event loop's thread.
+    assert threading.get_ident() not in reader_threads
+    expected, _ = render(ACCOUNT)
+    snapshots = [message for message in sent if message["type"] == "state.snapshot"]
+    assert len(snapshots) == 4
+    assert len(summary_reads) == 1
+    assert len({message["message_id"] for message in snapshots}) == 4
+    for message in snapshots:
+        assert message["payload"]["conversations"] == expected["conversations"]
+        assert message["payload"]["view_revision"] == expected["view_revision"]
+
+    commit_message_delta(
+        repositories, key, sequence=1, origin="passive", message=raw_message("message-2")
+    )
+    assert repositories.projection.catch_up(ACCOUNT) is not None
+    sent.clear()
+    asyncio.run(reconnect(2))
+
+    assert len(summary_reads) == 2
+    assert [message["payload"]["view_revision"] for message in sent] == [
+        expected["view_revision"] + 1
+    ] * 2
+    assert sent[0]["payload"] == {
+        **sent[1]["payload"],
+        "generated_at": sent[0]["payload"]["generated_at"],
+    }
+
+
+def test_streamed_snapshot_holds_no_read_between_parts_and_restarts_when_superseded() -> None:
+    repositories = create_canonical_repositories("memory")
+    key = commit_seed(
+        repositories,
+        chats=[chat("chat-1"), chat("chat-2")],
+        messages=[raw_message("message-1")],
+    )
+    assert repositories.projection.catch_up(ACCOUNT) is not None
+    stream = repositories.projection.snapshot_stream(ACCOUNT, part_size=1)
+    assert [summary["conversation_id"] for summary in next(stream.parts)] == ["chat-1"]
+    # No read transaction spans the parts, so a checkpoint can reach the end.
+    with repositories.projection_database.read() as connection:
+        assert connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()[0] == 0
+    commit_message_delta(
+        repositories, key, sequence=1, origin="passive", message=raw_message("message-2")
+    )
+    assert repositories.projection.catch_up(ACCOUNT) is not None
+    with pytest.raises(ProjectionCursorStale):
+        next(stream.parts)
+    stream.close()
+
+    manager = InMemoryTransportManager(repositories)
+    sent: list[dict] = []
+
+    async def exercise() -> int | None:
+        binding = await manager.bind_bridge(
+            _RecordingBridge(sent),
+            principal_id="principal",
+            creator_account_id=ACCOUNT,
+            bridge_session_id=uuid4(),
+            snapshot_parts=True,
+        )
+        await manager.queue_bridge_snapshot(binding)
+        # Supersede the queued stream's generation before its first part.
+        commit_message_delta(
+            repositories, key, sequence=2, origin="passive", message=raw_message("message-3")
+        )
+        assert repositories.projection.catch_up(ACCOUNT) is not None
+        await manager.drain_bridges()
+        return binding.view_revision
+
+    view_revision = asyncio.run(exercise())
+
+    parts = [message for message in sent if message["type"] == "state.snapshot.part"]
+    (marker,) = [message for message in sent if message["type"] == "state.snapshot"]
+    assert [part["payload"]["part_index"] for part in parts] == [0]
+    assert marker["payload"]["part_count"] == 1
+    assert {part["payload"]["view_revision"] for part in parts} == {
+        marker["payload"]["view_revision"]
+    }
+    assert marker["payload"]["view_revision"] == view_revision
+    assert view_revision == repositories.projection.snapshot(ACCOUNT)["view_revision"]
+
+
+def test_advance_runs_only_the_scope_helpers_its_work_needs() -> None:
+    repositories = create_canonical_repositories("memory")
+    projection = repositories.projection
+    calls: list[tuple[str, object]] = []
+
+    def spy(name: str, record=lambda args, kwargs: None) -> None:
+        original = getattr(projection, name)
+
+        def wrapper(*args, **kwargs):
+            calls.append((name, record(args, kwargs)))
+            return original(*args, **kwargs)
+
+        setattr(projection, name, wrapper)
+
+    for name in (
+        "_catch_up_from_active",
+        "_reseed_conversations",
+        "_project_touched_conversations",
+        "_refresh_conversation_coverage",
+        "_write_projection_analytics",
+        "_log_projection_change",
+    ):
+        spy(name)
+    spy("_record_active_slot_overlay", lambda args, kwargs: kwargs["whole_account"])
+
+    key = commit_seed(repositories, messages=[raw_message("message-1")])
+    assert projection.advance(ACCOUNT) is not None
+    assert [name for name, _ in calls] == [
+        "_catch_up_from_active",
+        "_reseed_conversations",
+        "_write_projection_analytics",
+        "_log_projection_change",
+    ]
+
+    calls.clear()
+    commit_message_delta(
+        repositories, key, sequence=1, origin="passive", message=raw_message("message-2")
+    )
+    assert projection.advance(ACCOUNT) is not None
+    assert calls == [
+        ("_catch_up_from_active", None),
+        ("_project_touched_conversations", None),
+        ("_write_projection_analytics", None),
+        ("_record_active_slot_overlay", False),
+        ("_log_projection_change", None),
+    ]
+
+
 def test_schema_drifted_projection_db_is_quarantined_and_rebuilt(tmp_path) -> None:
     from app.persistence.history import ProjectionRepository
 
@@ -34,12 +34,14 @@ BRAIN_TO_AGENT = {
     "command.execute",
     "command.result.ack",
 }
-BRIDGE_TO_BRAIN = {"bridge.hello", "state.resync"}
+BRIDGE_TO_BRAIN = {"bridge.hello", "state.resync", "state.subscribe"}
 BRAIN_TO_BRIDGE = {
     "bridge.session",
     "state.snapshot",
+    "state.snapshot.part",
     "state.delta",
     "presence.state",
+    "presence.delta",
     "agent.state",
     "system.state",
 }
@@ -68,7 +70,7 @@ VALID_FIXTURES = sorted(path for path in FIXTURE_ROOT.glob("*.json"))
 
 @pytest.mark.parametrize("fixture", VALID_FIXTURES, ids=lambda path: path.stem)
 def test_every_operation_has_a_valid_golden_fixture(fixture: Path) -> None:
-    assert len(VALID_FIXTURES) == 25
+    assert len(VALID_FIXTURES) == 28
     assert parse_valid_fixture(fixture) is not None
 
 
@@ -11,6 +11,7 @@ from uuid import UUID
 
 import pytest
 
+from app.analytics.database import ShardedProjectionsDatabase
 from app.analytics.factory import AnalyticsStores, create_analytics_stores
 from app.analytics.identity import canonical_identity
 from app.analytics.opaque_refs import account_ref
@@ -22,11 +23,17 @@ from app.persistence.backup import (
     SQLiteBackupError,
     backup_canonical_database,
     backup_projections_database,
+    BackupThrottle,
+    refresh_backup_copy,
     restore_backup,
     restore_backup_pair,
     verify_backup,
 )
-from app.persistence.factory import CanonicalRepositories, create_canonical_repositories
+from app.persistence.factory import (
+    CanonicalRepositories,
+    create_canonical_repositories,
+    create_sharded_canonical_repositories,
+)
 from app.persistence.history import HistoryRepository, StreamKey
 from app.persistence.private_files import _windows_acl_is_owner_only
 from app.protocol.payloads import (
@@ -172,7 +179,13 @@ async def seeded_runtime(tmp_path: Path) -> Runtime:
 def refresh_external_hash(backup_path: Path) -> None:
     manifest_path = backup_path.with_name(backup_path.name + ".manifest.json")
     document = json.loads(manifest_path.read_text(encoding="utf-8"))
-    document["file_sha256"] = hashlib.sha256(backup_path.read_bytes()).hexdigest()
+    content = backup_path.read_bytes()
+    document["file_sha256"] = hashlib.sha256(content).hexdigest()
+    chunk_bytes = document["page_size"] * document["pages_per_chunk"]
+    document["chunk_sha256"] = [
+        hashlib.sha256(content[start : start + chunk_bytes]).hexdigest()
+        for start in range(0, len(content), chunk_bytes)
+    ]
     manifest_path.write_text(
         json.dumps(document, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
         encoding="utf-8",
@@ -250,6 +263,61 @@ async def test_canonical_only_restore_discards_projection_and_rebuilds(
     assert rebuilt == runtime.artifact
 
 
+def test_sharded_projections_migrate_list_and_back_up_each_shard(
+    tmp_path: Path,
+) -> None:
+    shards = create_sharded_canonical_repositories(tmp_path / "shards")
+    artifacts = {}
+    for fixture_name in ("creator-alpha", "creator-beta"):
+        document = json.loads(
+            (FIXTURES / f"{fixture_name}.snapshot.json").read_text(encoding="utf-8")
+        )
+        repositories = shards.for_account(document["creator_account_id"])
+        creator_account_id = seed_canonical_snapshot(repositories.history, fixture_name)
+        assert repositories.analytics_projection_path is not None
+        stores = create_analytics_stores(
+            "sqlite",
+            projections_path=repositories.analytics_projection_path,
+            canonical_path=repositories.database.path,
+            activation=repositories.projection_activation,
+            canonical_identity_reader=identity_reader(repositories),
+        )
+        artifacts[creator_account_id] = AnalyticsPipeline(
+            repositories.ingestion,
+            projections=stores.projections,
+            graph=stores.graph,
+        ).project_account(creator_account_id).artifact
+    # A shard holding canonical state but no analytics file yet stays closed.
+    empty = shards.router.shard_for("creator-without-projections")
+    shards.shard(empty)
+
+    projections = ShardedProjectionsDatabase(shards.router)
+    projected = {
+        shards.router.shard_for(account_id): account_id for account_id in artifacts
+    }
+    assert projections.migrate() == sorted(projected)
+    assert not (
+        shards.router.directory(empty) / ShardedProjectionsDatabase.PROJECTIONS_FILE
+    ).exists()
+
+    active = projections.active_generations()
+    assert set(active) == {account_ref(account_id) for account_id in artifacts}
+    for account_id in artifacts:
+        generation = projections.active_generation(account_id)
+        assert generation is not None
+        assert active[account_ref(account_id)].generation_id == generation.generation_id
+
+    manifests = projections.backup(tmp_path / "backup")
+    assert set(manifests) == set(projected)
+    for name, account_id in projected.items():
+        backup_path = tmp_path / "backup" / name / ShardedProjectionsDatabase.PROJECTIONS_FILE
+        assert verify_backup(backup_path, expected_store="projections") == manifests[name]
+        assert [
+            item["generation_id"]
+            for item in manifests[name].high_water["active_generations"]
+        ] == [active[account_ref(account_id)].generation_id]
+
+
 @pytest.mark.asyncio
 async def test_matching_backup_pair_round_trips_full_completed_witness(
     tmp_path: Path,
@@ -702,6 +770,56 @@ async def test_windows_raw_open_handle_refuses_restore(tmp_path: Path) -> None:
         raw.close()
 
 
+@pytest.mark.asyncio
+async def test_stepped_backup_reads_one_snapshot_and_copies_only_changed_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    runtime = await seeded_runtime(tmp_path / "source")
+    assert runtime.repositories.database is not None
+    monkeypatch.setattr(backup_module, "BACKUP_PAGES_PER_CHUNK", 1)
+    backup_path = tmp_path / "canonical.backup.sqlite3"
+    events = []
+
+    def write_during_copy(event) -> None:
+        # Ingestion keeps committing between steps; the copy stays on the
+        # snapshot its high water was read from.
+        if event.phase == "copy" and not any(item.phase == "copy" for item in events):
+            seed_canonical_snapshot(runtime.repositories.history, "creator-alpha")
+        events.append(event)
+
+    manifest = backup_canonical_database(
+        runtime.repositories.database,
+        backup_path,
+        throttle=BackupThrottle(pages_per_step=4),
+        progress=write_during_copy,
+    )
+    copies = [event for event in events if event.phase == "copy"]
+    assert len(copies) > 1
+    assert copies[-1].completed_pages == copies[-1].total_pages
+    assert list(manifest.high_water["account_identities"]) == [runtime.creator_account_id]
+    assert len(manifest.chunk_sha256) == backup_path.stat().st_size // manifest.page_size
+    assert verify_backup(backup_path, expected_store="canonical") == manifest
+
+    replica = tmp_path / "offsite" / "canonical.backup.sqlite3"
+    first = refresh_backup_copy(backup_path, replica)
+    assert first.chunks_copied == first.chunks_total
+    again = refresh_backup_copy(backup_path, replica)
+    assert again.chunks_copied == 0
+
+    later_path = tmp_path / "canonical.later.backup.sqlite3"
+    backup_canonical_database(runtime.repositories.database, later_path)
+    refreshed = refresh_backup_copy(later_path, replica)
+    assert 0 < refreshed.chunks_copied < refreshed.chunks_total
+    assert replica.read_bytes() == later_path.read_bytes()
+    assert verify_backup(replica, expected_store="canonical") == refreshed.manifest
+
+    with replica.open("r+b") as handle:
+        handle.seek(manifest.page_size * (refreshed.chunks_total - 1))
+        handle.write(b"\xff" * 16)
+    with pytest.raises(SQLiteBackupError, match="external backup hash differs"):
+        verify_backup(replica)
+
+
 @pytest.mark.skipif(os.name != "nt", reason="Windows DACL semantics")
 @pytest.mark.asyncio
 async def test_windows_canonical_projection_and_backup_files_are_private(
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import json
 import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from uuid import uuid4
@@ -10,7 +12,11 @@ from uuid import uuid4
 import pytest
 
 from app.persistence.database import CanonicalSQLite
-from app.persistence.factory import create_canonical_repositories
+from app.persistence.factory import (
+    CanonicalRepositories,
+    create_canonical_repositories,
+    create_sharded_canonical_repositories,
+)
 from app.persistence.migrations import (
     InstallationMigrationLock,
     MigrationChecksumError,
@@ -87,6 +93,80 @@ def test_authoritative_connection_uses_wal_full_sync_foreign_keys_and_timeout(
         assert connection.execute("PRAGMA busy_timeout").fetchone()[0] == 7_500
 
 
+def test_read_only_connections_refuse_writes_and_writers_queue_by_lane(
+    tmp_path: Path,
+) -> None:
+    database = CanonicalSQLite(tmp_path / "canonical.sqlite3", busy_timeout_ms=2_000)
+    MigrationRunner(database).run()
+    with database.read_only() as connection:
+        assert connection.execute("PRAGMA query_only").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            connection.execute("CREATE TABLE scratch(id INTEGER)")
+
+    admitted: list[str] = []
+    queued = threading.Barrier(3)
+
+    def write(lane: str) -> None:
+        queued.wait()
+        with database.writer(lane):
+            admitted.append(lane)
+
+    # Hold the slot until both waiters have queued; ingest is admitted first
+    # whichever of them asked first.
+    with database.writer("projection"):
+        maintenance = threading.Thread(target=write, args=("maintenance",))
+        maintenance.start()
+        ingest = threading.Thread(target=write, args=("ingest",))
+        ingest.start()
+        queued.wait()
+        time.sleep(0.1)
+    maintenance.join()
+    ingest.join()
+    assert admitted == ["ingest", "maintenance"]
+
+
+def test_sharded_accounts_write_independently_and_list_and_back_up_per_shard(
+    tmp_path: Path,
+) -> None:
+    shards = create_sharded_canonical_repositories(tmp_path / "shards")
+    first = shards.for_account("creator-a")
+    second = shards.for_account("creator-b")
+    assert first.database.path != second.database.path
+    assert first.database.path.parent == shards.router.directory_for("creator-a")
+
+    def add_account(repositories: CanonicalRepositories, account_id: str) -> None:
+        with repositories.database.transaction() as connection:
+            connection.execute(
+                "INSERT INTO account_heads(creator_account_id, updated_at) VALUES (?, ?)",
+                (account_id, NOW.isoformat()),
+            )
+
+    # A long write on one account's shard never blocks another account.
+    with first.database.transaction() as connection:
+        connection.execute(
+            "INSERT INTO account_heads(creator_account_id, updated_at) VALUES (?, ?)",
+            ("creator-a", NOW.isoformat()),
+        )
+        add_account(second, "creator-b")
+
+    reopened = create_sharded_canonical_repositories(tmp_path / "shards")
+    assert reopened.account_shards() == {
+        "creator-a": reopened.router.shard_for("creator-a"),
+        "creator-b": reopened.router.shard_for("creator-b"),
+    }
+    manifests = reopened.backup(tmp_path / "backup")
+    assert set(manifests) == set(reopened.router.existing_shards())
+    for name in manifests:
+        assert (tmp_path / "backup" / name / "canonical.sqlite3").exists()
+
+    buckets = create_sharded_canonical_repositories(
+        tmp_path / "buckets", mode="hash", buckets=1
+    )
+    assert buckets.for_account("creator-a") is buckets.for_account("creator-b")
+    with pytest.raises(ValueError):
+        buckets.router.directory("../escape")
+
+
 def test_fresh_sqlite_bootstrap_is_hard_cut_to_config_8(
     tmp_path: Path,
 ) -> None:
@@ -158,6 +238,59 @@ async def test_configuration_and_commands_survive_fresh_repository_connections(
     assert restarted_command.result_apply_count == 1
 
 
+def test_command_expiry_migration_backfills_deadlines_and_uses_partial_index(
+    tmp_path: Path,
+) -> None:
+    migration_dir = tmp_path / "migrations"
+    catalog = sorted((Path(__file__).parents[1] / "app" / "persistence" / "sql").glob("*.sql"))
+    expiry = next(path for path in catalog if path.name == "0007_command_expiry_index.sql")
+    for migration in catalog[: catalog.index(expiry)]:
+        write_migration(migration_dir, migration.name, migration.read_text(encoding="utf-8"))
+    database = CanonicalSQLite(tmp_path / "canonical.sqlite3")
+    MigrationRunner(database, migrations_dir=migration_dir).run()
+    deadlines = {
+        "00000000-0000-0000-0000-000000000001": "2026-07-18T10:05:00+00:00",
+        "00000000-0000-0000-0000-000000000002": "2026-07-18T12:05:00.250001+02:00",
+    }
+    with database.transaction() as connection:
+        connection.executemany(
+            """
+            INSERT INTO commands (
+                command_id, creator_account_id, action_json, deadline,
+                idempotency_policy, issued_at, state, delivery_attempts, result_apply_count
+            ) VALUES (?, ?, '{}', ?, 'deduplicate', ?, 'issued', 1, 0)
+            """,
+            [
+                (command_id, ACCOUNT_ID, deadline, NOW.isoformat())
+                for command_id, deadline in deadlines.items()
+            ],
+        )
+
+    write_migration(migration_dir, expiry.name, expiry.read_text(encoding="utf-8"))
+    MigrationRunner(database, migrations_dir=migration_dir).run()
+    with database.read() as connection:
+        backfilled = dict(connection.execute("SELECT command_id, expires_at FROM commands"))
+        plan = " ".join(
+            row[-1]
+            for row in connection.execute(
+                """
+                EXPLAIN QUERY PLAN
+                UPDATE commands INDEXED BY commands_pending_expiry SET state = 'unknown'
+                WHERE state IN ('issued', 'accepted') AND expires_at <= ?
+                """,
+                (0,),
+            )
+        )
+    assert {
+        command_id: datetime.fromtimestamp(0, timezone.utc) + timedelta(microseconds=value)
+        for command_id, value in backfilled.items()
+    } == {
+        command_id: datetime.fromisoformat(deadline)
+        for command_id, deadline in deadlines.items()
+    }
+    assert plan == "SEARCH commands USING INDEX commands_pending_expiry (expires_at<?)"
+
+
 def test_migrations_are_idempotent_checksummed_and_backed_up(tmp_path: Path) -> None:
     migration_dir = tmp_path / "migrations"
     write_migration(
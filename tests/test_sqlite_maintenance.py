@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+from app.persistence.database import CanonicalSQLite
+from app.persistence.maintenance import SQLiteMaintenance
+
+
+def fill(database: CanonicalSQLite, rows: int) -> None:
+    with database.transaction() as connection:
+        connection.executemany(
+            "INSERT INTO scratch(payload) VALUES (zeroblob(2000))", [()] * rows
+        )
+
+
+def test_maintenance_checkpoints_around_readers_optimizes_and_vacuums(tmp_path: Path) -> None:
+    database = CanonicalSQLite(tmp_path / "canonical.sqlite3")
+    with database.transaction() as connection:
+        connection.execute("CREATE TABLE scratch(id INTEGER PRIMARY KEY, payload BLOB)")
+    # An idle connection keeps the WAL from being removed on last close.
+    idle = database.connect()
+    idle.execute("SELECT COUNT(*) FROM scratch").fetchone()
+    fill(database, 200)
+    maintenance = SQLiteMaintenance(
+        [database],
+        passive_bytes=1,
+        truncate_bytes=1,
+        optimize_after_rows=100,
+        vacuum_pages=50,
+        long_reader_seconds=0,
+    )
+    wal = Path(f"{database.path}-wal")
+
+    # A reader holding an old snapshot keeps the checkpoint from reaching the
+    # end of the WAL; the pass reports the stall instead of waiting on it.
+    reader = database.connect()
+    try:
+        reader.execute("BEGIN")
+        reader.execute("SELECT COUNT(*) FROM scratch").fetchone()
+        fill(database, 50)
+        (stalled,) = maintenance.run()
+        assert stalled.checkpoint == "PASSIVE"
+        assert stalled.checkpointed_frames < stalled.log_frames
+        assert stalled.stalled_seconds is not None
+        assert stalled.oldest_reader_seconds is not None
+        assert os.stat(wal).st_size > 0
+    finally:
+        reader.close()
+
+    database.note_bulk_write(100)
+    with database.transaction() as connection:
+        connection.execute("DELETE FROM scratch")
+    (drained,) = maintenance.run()
+    assert drained.checkpoint == "TRUNCATE"
+    assert drained.stalled_seconds is None
+    assert drained.optimized
+    assert drained.vacuumed_pages == 50
+    assert os.stat(wal).st_size == 0
+
+    # Free pages keep draining in bounded steps; nothing left to optimize.
+    (following,) = maintenance.run()
+    assert following.vacuumed_pages > 0 and not following.optimized
+    idle.close()
+
+
+def test_maintenance_rebuilds_a_file_that_predates_incremental_vacuum_once(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "canonical.sqlite3"
+    legacy = sqlite3.connect(path)
+    legacy.execute("PRAGMA journal_mode = WAL")
+    legacy.execute("CREATE TABLE scratch(id INTEGER PRIMARY KEY, payload BLOB)")
+    legacy.commit()
+    legacy.close()
+    database = CanonicalSQLite(path)
+    fill(database, 200)
+    with database.transaction() as connection:
+        connection.execute("DELETE FROM scratch")
+    with database.read() as connection:
+        assert connection.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    # Nothing to give back from a legacy file without incremental mode.
+    assert database.incremental_vacuum(50) == 0
+
+    maintenance = SQLiteMaintenance([database], convert_free_bytes=64 * 1024)
+    (converted,) = maintenance.run()
+    assert converted.auto_vacuum_converted
+    with database.read() as connection:
+        assert connection.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert connection.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    (following,) = maintenance.run()
+    assert not following.auto_vacuum_converted
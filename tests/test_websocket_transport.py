@@ -13,8 +13,10 @@ from starlette.websockets import WebSocketDisconnect
 
 from app.core.config import Settings, settings
 from app.main import app
+from app.protocol import BRIDGE_DEFLATE_ENCODING, BRIDGE_TO_BRAIN_ADAPTER
 from app.transport import DEV_ACCOUNT_ID, DEV_AGENT_AUTH_TICKET, transport_manager
 from app.transport.manager import (
+    BRIDGE_OUTBOX_LIMIT,
     HEARTBEAT_INTERVAL_SECONDS,
     LEASE_EXPIRED_CLOSE_CODE,
     LEASE_TIMEOUT_SECONDS,
@@ -23,6 +25,7 @@ from app.transport.manager import (
     InMemoryTransportManager,
     utc_now,
 )
+from app.transport.deltas import STATE_DELTA_MAX_CHANGES, coalesce_state_deltas
 
 
 FIXTURES = Path(__file__).parents[1] / "shared" / "fixtures" / "protocol" / "v2"
@@ -228,12 +231,13 @@ def test_valid_fixture_exchange_routes_ack_and_presence_end_to_end() -> None:
             observed["payload"]["observed_at"] = utc_now().isoformat()
             agent.send_json(observed)
             presence = bridge.receive_json()
-            while presence["type"] != "presence.state":
+            while presence["type"] != "presence.delta":
                 assert presence["type"] in {"state.snapshot", "state.delta"}
                 presence = bridge.receive_json()
-            assert presence["type"] == "presence.state"
+            assert presence["payload"]["base_version"] == 0
             assert presence["payload"]["freshness"] == "current"
-            assert presence["payload"]["online_platform_user_ids"] == ["fan-1", "fan-2"]
+            assert presence["payload"]["joined_platform_user_ids"] == ["fan-1", "fan-2"]
+            assert presence["payload"]["left_platform_user_ids"] == []
 
 
 def test_invalid_ingest_fixture_is_rejected_without_crashing_connection() -> None:
@@ -383,10 +387,12 @@ async def test_hard_lease_expiry_closes_then_broadcasts_disconnected() -> None:
         applied_config_revision=REQUIRED_CONFIG_REVISION,
     )
 
+    await manager.drain_bridges()
     events.clear()
     await manager.expire(
         lease.last_heartbeat_at + timedelta(seconds=lease.lease_timeout_seconds)
     )
+    await manager.drain_bridges()
     assert events[-1][2]["type"] == "agent.state"
     assert events[-1][2]["payload"]["status"] == "stale"
 
@@ -394,6 +400,7 @@ async def test_hard_lease_expiry_closes_then_broadcasts_disconnected() -> None:
     await manager.expire(
         lease.last_heartbeat_at + timedelta(seconds=lease.lease_timeout_seconds * 2)
     )
+    await manager.drain_bridges()
     assert DEV_ACCOUNT_ID not in manager.active_agents
     assert lease.connection_id not in manager.agent_connections
     assert events[0] == (
@@ -407,6 +414,292 @@ async def test_hard_lease_expiry_closes_then_broadcasts_disconnected() -> None:
     assert events[1][2]["payload"]["status"] == "disconnected"
 
 
+class BlockingWebSocket(RecordingWebSocket):
+    def __init__(self, name: str, events: list[tuple]) -> None:
+        super().__init__(name, events)
+        self.release = asyncio.Event()
+
+    async def send_text(self, text: str) -> None:
+        await self.release.wait()
+        await super().send_text(text)
+
+
+async def bind_recording_bridge(manager, websocket):
+    return await manager.bind_bridge(
+        websocket,
+        principal_id="principal",
+        creator_account_id=DEV_ACCOUNT_ID,
+        bridge_session_id=uuid4(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_presence_broadcasts_only_transitions_as_versioned_deltas() -> None:
+    manager = InMemoryTransportManager()
+    events: list[tuple] = []
+    await bind_recording_bridge(manager, RecordingWebSocket("bridge", events))
+    lease = await manager.bind_agent(
+        RecordingWebSocket("agent", events),
+        principal_id="principal",
+        creator_account_id=DEV_ACCOUNT_ID,
+        agent_installation_id=uuid4(),
+        agent_stream_id=uuid4(),
+        applied_config_revision=REQUIRED_CONFIG_REVISION,
+    )
+    await manager.drain_bridges()
+    events.clear()
+    started = utc_now()
+
+    async def observe(seconds: int, online: list[str]) -> list[dict]:
+        at = started + timedelta(seconds=seconds)
+        assert await manager.observe_presence(
+            lease,
+            observation_id=seconds + 1,
+            observed_at=at,
+            online_platform_user_ids=online,
+            now=at,
+        )
+        await manager.drain_bridges()
+        sent = [event[2]["payload"] for event in events if event[0] == "bridge"]
+        events.clear()
+        return sent
+
+    joined = await observe(0, ["fan-1", "fan-2"])
+    assert [(delta["base_version"], delta["version"]) for delta in joined] == [(0, 1)]
+    assert joined[0]["joined_platform_user_ids"] == ["fan-1", "fan-2"]
+    # Idle steady state: the same set re-observed within half a TTL is silent.
+    assert await observe(20, ["fan-2", "fan-1"]) == []
+    assert await observe(40, ["fan-1", "fan-2"]) == []
+    assert manager.presence_state_payload(DEV_ACCOUNT_ID)["version"] == 1
+
+    moved = await observe(50, ["fan-2", "fan-3"])
+    assert moved == [
+        {
+            **moved[0],
+            "base_version": 1,
+            "version": 2,
+            "joined_platform_user_ids": ["fan-3"],
+            "left_platform_user_ids": ["fan-1"],
+        }
+    ]
+    # An unchanged set still renews the Bridge's expiry before it lapses.
+    assert await observe(100, ["fan-2", "fan-3"]) == []
+    renewed = await observe(115, ["fan-2", "fan-3"])
+    assert [(delta["version"], delta["joined_platform_user_ids"]) for delta in renewed] == [
+        (3, [])
+    ]
+    assert renewed[0]["expires_at"] > moved[0]["expires_at"]
+
+    await manager.expire(manager.presence[DEV_ACCOUNT_ID].expires_at)
+    await manager.drain_bridges()
+    expired = [
+        event[2]["payload"]
+        for event in events
+        if event[1] == "send" and event[2]["type"] == "presence.delta"
+    ]
+    assert expired[0]["freshness"] == "unknown"
+    assert expired[0]["left_platform_user_ids"] == ["fan-2", "fan-3"]
+    assert manager.presence_state_payload(DEV_ACCOUNT_ID)["version"] == 4
+
+
+@pytest.mark.asyncio
+async def test_bridge_broadcast_serializes_once_and_slow_bridge_does_not_stall_others(
+    monkeypatch,
+) -> None:
+    manager = InMemoryTransportManager()
+    events: list[tuple] = []
+    slow = BlockingWebSocket("slow", events)
+    await bind_recording_bridge(manager, slow)
+    fast = [
+        await bind_recording_bridge(manager, RecordingWebSocket(f"fast-{index}", events))
+        for index in range(3)
+    ]
+    encodes = 0
+    encode = manager._encode
+
+    def counting_encode(*args, **kwargs):
+        nonlocal encodes
+        encodes += 1
+        return encode(*args, **kwargs)
+
+    monkeypatch.setattr(manager, "_encode", counting_encode)
+    await manager.broadcast_presence_state(DEV_ACCOUNT_ID)
+    assert encodes == 1
+
+    for binding in fast:
+        assert await manager.drain_bridge(binding, timeout=1)
+    delivered = [event for event in events if event[1] == "send"]
+    assert sorted(event[0] for event in delivered) == ["fast-0", "fast-1", "fast-2"]
+    assert len({event[2]["message_id"] for event in delivered}) == 1
+
+    slow.release.set()
+    await manager.drain_bridges()
+    assert [event[0] for event in events if event[1] == "send"][-1] == "slow"
+
+
+@pytest.mark.asyncio
+async def test_bridge_outbox_overflow_switches_client_to_correlated_resync() -> None:
+    manager = InMemoryTransportManager()
+    events: list[tuple] = []
+    slow = BlockingWebSocket("slow", events)
+    binding = await bind_recording_bridge(manager, slow)
+
+    await manager.broadcast_presence_state(DEV_ACCOUNT_ID)
+    await asyncio.sleep(0)  # the sender now holds the first frame in send_text
+    for _ in range(BRIDGE_OUTBOX_LIMIT):
+        await manager.broadcast_presence_state(DEV_ACCOUNT_ID)
+    assert not binding.resync_pending
+    assert binding.outbox.qsize() == BRIDGE_OUTBOX_LIMIT
+
+    await manager.broadcast_agent_state(DEV_ACCOUNT_ID)
+    assert binding.resync_pending
+    assert binding.overflow_count == 1
+    assert binding.outbox.qsize() == 1
+    await manager.broadcast_presence_state(DEV_ACCOUNT_ID)
+    assert binding.outbox.qsize() == 1
+
+    resync_id = uuid4()
+    await manager.queue_bridge(
+        binding,
+        "state.snapshot",
+        manager.state_snapshot_payload(DEV_ACCOUNT_ID),
+        correlation_id=resync_id,
+    )
+    assert binding.outbox.qsize() == 1
+
+    slow.release.set()
+    await manager.drain_bridges()
+    sent = [event[2] for event in events if event[1] == "send"]
+    assert [message["type"] for message in sent] == [
+        "presence.state",
+        "state.snapshot",
+        "presence.state",
+        "agent.state",
+        "system.state",
+    ]
+    assert sent[1]["correlation_id"] == str(resync_id)
+    assert not binding.resync_pending
+    await manager.disconnect_bridge(binding.connection_id)
+
+
+def conversation_delta(revision: int, conversation_id: str, unread: int) -> dict:
+    conversation = json.loads(json.dumps(fixture("state.snapshot")["payload"]["conversations"][0]))
+    conversation.update(conversation_id=conversation_id, unread_count=unread)
+    return {
+        "creator_account_id": DEV_ACCOUNT_ID,
+        "view_revision": revision,
+        "committed_at": "2026-07-19T10:03:00Z",
+        "changes": [{"type": "conversation.upsert", "conversation": conversation}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_state_delta_burst_is_coalesced_into_one_batched_frame(monkeypatch) -> None:
+    monkeypatch.setattr("app.transport.manager.STATE_DELTA_FLUSH_SECONDS", 0.01)
+    manager = InMemoryTransportManager()
+    events: list[tuple] = []
+    binding = await bind_recording_bridge(manager, RecordingWebSocket("bridge", events))
+    for revision in range(1, 501):
+        await manager.broadcast_state_delta(
+            DEV_ACCOUNT_ID, conversation_delta(revision, f"chat-{revision % 5}", revision)
+        )
+    await manager._state_delta_tasks[DEV_ACCOUNT_ID]
+    assert await manager.drain_bridge(binding, timeout=1)
+
+    frames = [event[2] for event in events if event[2]["type"] == "state.delta"]
+    assert len(frames) == 1
+    payload = frames[0]["payload"]
+    assert (payload["base_view_revision"], payload["view_revision"]) == (0, 500)
+    assert [
+        (change["conversation"]["conversation_id"], change["conversation"]["unread_count"])
+        for change in payload["changes"]
+    ] == [("chat-1", 496), ("chat-2", 497), ("chat-3", 498), ("chat-4", 499), ("chat-0", 500)]
+
+
+def test_state_delta_coalescing_splits_on_gaps_and_the_change_limit() -> None:
+    wide = [
+        conversation_delta(revision, f"chat-{revision}", 1)
+        for revision in range(1, STATE_DELTA_MAX_CHANGES + 2)
+    ]
+    gapped = conversation_delta(STATE_DELTA_MAX_CHANGES + 5, "chat-1", 2)
+    deleted = {
+        **conversation_delta(STATE_DELTA_MAX_CHANGES + 6, "chat-1", 2),
+        "changes": [{"type": "conversation.delete", "conversation_id": "chat-1"}],
+    }
+    coverage = fixture("state.snapshot")["payload"]["conversations"][0]["coverage"]
+    gapped["changes"].append(
+        {"type": "conversation.coverage.replace", "conversation_id": "chat-1", "coverage": coverage}
+    )
+
+    frames = coalesce_state_deltas([*wide, gapped, deleted])
+
+    assert [(frame["base_view_revision"], frame["view_revision"]) for frame in frames] == [
+        (0, STATE_DELTA_MAX_CHANGES),
+        (STATE_DELTA_MAX_CHANGES, STATE_DELTA_MAX_CHANGES + 1),
+        (STATE_DELTA_MAX_CHANGES + 4, STATE_DELTA_MAX_CHANGES + 6),
+    ]
+    assert len(frames[0]["changes"]) == STATE_DELTA_MAX_CHANGES
+    # The delete supersedes the upsert and drops coverage for the same conversation.
+    assert frames[2]["changes"] == [{"type": "conversation.delete", "conversation_id": "chat-1"}]
+
+
+@pytest.mark.asyncio
+async def test_subscribed_bridge_receives_only_its_scope_rebased_over_skipped_revisions(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr("app.transport.manager.STATE_DELTA_FLUSH_SECONDS", 0)
+    manager = InMemoryTransportManager()
+    events: list[tuple] = []
+    watching = await bind_recording_bridge(manager, RecordingWebSocket("watching", events))
+    await bind_recording_bridge(manager, RecordingWebSocket("everything", events))
+    subscribe = fixture("state.subscribe")
+    subscribe["payload"]["aggregates"] = ["projection"]
+    message = BRIDGE_TO_BRAIN_ADAPTER.validate_json(json.dumps(subscribe))
+    await manager.subscribe_bridge(watching, message.payload, correlation_id=message.message_id)
+    assert watching.view_revision == 0
+    projection = fixture("state.snapshot")["payload"]["projection"]
+    for revision, conversation_id in enumerate(("chat-2", "chat-3", "chat-1"), start=1):
+        delta = conversation_delta(revision, conversation_id, revision)
+        if revision == 3:
+            delta["changes"].append({"type": "projection.replace", "projection": projection})
+        await manager.broadcast_state_delta(DEV_ACCOUNT_ID, delta)
+        await manager._state_delta_tasks[DEV_ACCOUNT_ID]
+    await manager.drain_bridges()
+
+    def deltas(name: str) -> list[dict]:
+        return [
+            event[2]["payload"]
+            for event in events
+            if event[0] == name and event[1] == "send" and event[2]["type"] == "state.delta"
+        ]
+
+    assert [payload["view_revision"] for payload in deltas("everything")] == [1, 2, 3]
+    [scoped] = deltas("watching")
+    assert (scoped["base_view_revision"], scoped["view_revision"]) == (0, 3)
+    assert [change["type"] for change in scoped["changes"]] == [
+        "conversation.upsert",
+        "projection.replace",
+    ]
+    assert scoped["changes"][0]["conversation"]["conversation_id"] == "chat-1"
+
+
+def test_bridge_subscription_is_answered_with_a_scoped_snapshot() -> None:
+    client = TestClient(app)
+    with client.websocket_connect("/ws/bridge") as bridge:
+        hello, session, _ = bridge_handshake(bridge)
+        subscribe = fixture("state.subscribe")
+        subscribe["payload"].update(
+            connection_id=session["payload"]["connection_id"],
+            bridge_session_id=hello["payload"]["bridge_session_id"],
+            conversation_ids=[],
+        )
+        bridge.send_json(subscribe)
+        snapshot = bridge.receive_json()
+        assert snapshot["type"] == "state.snapshot"
+        assert snapshot["correlation_id"] == subscribe["message_id"]
+        assert snapshot["payload"]["conversations"] == []
+
+
 @pytest.mark.asyncio
 async def test_hard_expiry_does_not_retire_a_lease_refreshed_while_waiting() -> None:
     manager = InMemoryTransportManager()
@@ -441,6 +734,35 @@ async def test_hard_expiry_does_not_retire_a_lease_refreshed_while_waiting() ->
     assert not any(event[1] == "close" for event in events)
 
 
+@pytest.mark.asyncio
+async def test_heartbeat_reschedules_the_lease_deadline_the_sweep_acts_on() -> None:
+    manager = InMemoryTransportManager()
+    events: list[tuple] = []
+    started = utc_now()
+    lease = await manager.bind_agent(
+        RecordingWebSocket("agent", events),
+        principal_id="principal",
+        creator_account_id=DEV_ACCOUNT_ID,
+        agent_installation_id=uuid4(),
+        agent_stream_id=uuid4(),
+        applied_config_revision=REQUIRED_CONFIG_REVISION,
+        now=started,
+    )
+    timeout = timedelta(seconds=lease.lease_timeout_seconds)
+    renewed = started + timeout - timedelta(seconds=1)
+    await manager.heartbeat(lease, REQUIRED_CONFIG_REVISION, now=renewed)
+
+    # The bind-time stale deadline was superseded by the heartbeat.
+    await manager.expire(started + timeout)
+    assert lease.status == "connected"
+    await manager.expire(renewed + timeout)
+    assert lease.status == "stale"
+    await manager.expire(renewed + timeout * 2)
+    assert lease.status == "disconnected"
+    assert DEV_ACCOUNT_ID not in manager.active_agents
+    assert ("agent", "close", LEASE_EXPIRED_CLOSE_CODE, "Agent heartbeat lease expired") in events
+
+
 @pytest.mark.asyncio
 async def test_expiry_sweeper_does_not_resurrect_a_disconnected_socket() -> None:
     manager = InMemoryTransportManager()
@@ -506,6 +828,50 @@ def test_bridge_resync_returns_correlated_snapshot() -> None:
         snapshot = bridge.receive_json()
         assert snapshot["type"] == "state.snapshot"
         assert snapshot["correlation_id"] == resync["message_id"]
+        # The resync doubles as the Bridge's request for a full presence refresh.
+        assert bridge.receive_json()["type"] == "presence.state"
+
+
+def test_bridge_negotiates_compressed_frames_and_falls_back_to_json() -> None:
+    client = TestClient(app)
+    with client.websocket_connect(
+        "/ws/bridge",
+        subprotocols=["onlyfans-bridge.v9.cbor", BRIDGE_DEFLATE_ENCODING.subprotocol],
+    ) as bridge:
+        assert bridge.accepted_subprotocol == BRIDGE_DEFLATE_ENCODING.subprotocol
+        bridge.send_json(fixture("bridge.hello"))
+        received = [
+            json.loads(BRIDGE_DEFLATE_ENCODING.decode(bridge.receive_bytes()))
+            for _ in range(5)
+        ]
+        assert [message["type"] for message in received] == [
+            "bridge.session",
+            "state.snapshot",
+            "presence.state",
+            "agent.state",
+            "system.state",
+        ]
+    with client.websocket_connect("/ws/bridge", subprotocols=["unknown"]) as bridge:
+        assert bridge.accepted_subprotocol is None
+        bridge_handshake(bridge)
+
+
+def test_bridge_protocol_error_is_ordered_after_queued_frames() -> None:
+    client = TestClient(app)
+    with client.websocket_connect("/ws/bridge") as bridge:
+        hello = fixture("bridge.hello")
+        bridge.send_json(hello)
+        bridge.send_json(hello)
+        received = [bridge.receive_json() for _ in range(6)]
+        assert [message["type"] for message in received] == [
+            "bridge.session",
+            "state.snapshot",
+            "presence.state",
+            "agent.state",
+            "system.state",
+            "protocol.error",
+        ]
+        assert received[-1]["payload"]["fatal"] is True
 
 
 def test_agent_config_transport_validates_stub_auth_and_etag() -> None:
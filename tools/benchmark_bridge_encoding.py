@@ -0,0 +1,119 @@
+"""Synthetic Bridge frame encoding benchmark.
+
+A ``state.snapshot`` with ``--conversations`` synthetic summaries and a
+single-conversation ``state.delta`` are serialized through the Brain's
+envelope validation once, then encoded with every negotiable Bridge wire
+encoding. Bytes on the wire and per-frame encode/decode time are reported.
+No platform identifiers or content are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from app.protocol import BRAIN_TO_BRIDGE_ADAPTER
+from app.protocol.encoding import BRIDGE_ENCODINGS
+
+
+FIXTURES = Path(__file__).parents[1] / "shared" / "fixtures" / "protocol" / "v2"
+
+
+def snapshot_payload(conversations: int) -> dict[str, Any]:
+    payload = json.loads((FIXTURES / "state.snapshot.json").read_text())["payload"]
+    template = payload["conversations"][0]
+    items = []
+    for index in range(conversations):
+        item = copy.deepcopy(template)
+        item["conversation_id"] = f"synthetic-chat-{index:06d}"
+        item["platform_user_id"] = f"synthetic-fan-{index:06d}"
+        item["display_name"] = f"Synthetic {index}"
+        item["unread_count"] = index % 7
+        item["latest_message"]["message_id"] = f"synthetic-message-{index:06d}"
+        item["latest_message"]["text"] = f"Synthetic preview text number {index} for sizing."
+        items.append(item)
+    payload["conversations"] = items
+    return payload
+
+
+def delta_payload(snapshot: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "creator_account_id": snapshot["creator_account_id"],
+        "base_view_revision": snapshot["view_revision"],
+        "view_revision": snapshot["view_revision"] + 1,
+        "committed_at": snapshot["generated_at"],
+        "changes": [
+            {"type": "conversation.upsert", "conversation": snapshot["conversations"][0]},
+            {"type": "projection.replace", "projection": snapshot["projection"]},
+        ],
+    }
+
+
+def serialize(message_type: str, payload: dict[str, Any]) -> str:
+    """Mirror the Brain's envelope validation and serialization."""
+    document = {
+        "type": message_type,
+        "protocol_version": "2",
+        "message_id": str(uuid.uuid4()),
+        "payload": payload,
+    }
+    return BRAIN_TO_BRIDGE_ADAPTER.validate_json(json.dumps(document)).model_dump_json()
+
+
+def timed(action: Callable[[], Any], repeat: int) -> tuple[Any, float]:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = action()
+        samples.append(time.perf_counter() - started)
+    return result, statistics.median(samples)
+
+
+def measure(message_type: str, payload: dict[str, Any], repeat: int) -> dict[str, Any]:
+    text, serialize_seconds = timed(lambda: serialize(message_type, payload), repeat)
+    result: dict[str, Any] = {"serialize_milliseconds": round(serialize_seconds * 1000, 3)}
+    for encoding in BRIDGE_ENCODINGS.values():
+        frame, encode_seconds = timed(lambda: encoding.encode(text), repeat)
+        decoded, decode_seconds = timed(lambda: encoding.decode(frame), repeat)
+        assert decoded == text
+        size = len(frame.encode("utf-8")) if isinstance(frame, str) else len(frame)
+        result[encoding.name] = {
+            "bytes": size,
+            "encode_milliseconds": round(encode_seconds * 1000, 3),
+            "decode_milliseconds": round(decode_seconds * 1000, 3),
+        }
+    result["deflate_ratio"] = round(result["json"]["bytes"] / result["deflate"]["bytes"], 2)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--conversations", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    if arguments.conversations < 1:
+        raise SystemExit("--conversations must be at least 1")
+    if arguments.repeat < 1:
+        raise SystemExit("--repeat must be at least 1")
+    snapshot = snapshot_payload(arguments.conversations)
+    result = {
+        "conversations": arguments.conversations,
+        "state.snapshot": measure("state.snapshot", snapshot, arguments.repeat),
+        "state.delta": measure("state.delta", delta_payload(snapshot), arguments.repeat),
+    }
+    print(json.dumps(result, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())